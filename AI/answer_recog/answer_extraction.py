@@ -6,7 +6,9 @@ answer_extraction.py - Row 이미지에서 정답 추출
 
 기능:
 1. Row 이미지 전처리 (텍스트 강조)
-2. PaddleOCR 수행
+2. OCR 수행
+   - full: PaddleOCR 전체 파이프라인 (텍스트 검출 + 방향 분류 + 인식)
+   - rec_only: 인식 전용 모델(PP-OCRv5_mobile_rec)만 사용 (검출/방향 분류 생략)
 3. 답안 패턴 매칭 (객관식/단답형)
 """
 
@@ -15,15 +17,23 @@ import numpy as np
 import re
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
-from paddleocr import PaddleOCR
+
+from .image_context import ImageLike, as_context
+from .roi_extraction import extract_roi_from_row
 
 # OCR 모델 전역 인스턴스 (Lazy loading)
 _ocr_model = None
 
+# PP-OCRv5 인식 모델 입력 높이 (모델 내부에서도 이 높이로 resize)
+REC_INPUT_HEIGHT = 48
+
 def get_ocr_model():
     """PaddleOCR 모델 로드 및 반환"""
     global _ocr_model
     if _ocr_model is None:
+        # full 모드에서만 필요하므로 처음 사용할 때 import
+        from paddleocr import PaddleOCR
+        
         # 영문/숫자 인식에 최적화된 모델 사용
         # use_angle_cls=True: 텍스트 방향 보정
         # lang='en': 영문/숫자 위주 (한글이 섞여있어도 인식 가능)
@@ -42,13 +52,10 @@ class AnswerResult:
     meta: Dict[str, Any]     # 디버깅용 메타 데이터
 
 
-def preprocess_for_ocr(image: np.ndarray) -> np.ndarray:
-    """OCR 인식률을 높이기 위한 이미지 전처리"""
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
-        
+def preprocess_for_ocr(image: ImageLike) -> np.ndarray:
+    """OCR 인식률을 높이기 위한 이미지 전처리 (ImageContext면 캐시된 gray 사용)"""
+    gray = as_context(image).gray
+    
     # Contrast Limited HIM
     clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
     enhanced = clahe.apply(gray)
@@ -59,7 +66,7 @@ def preprocess_for_ocr(image: np.ndarray) -> np.ndarray:
     return enhanced_bgr
 
 
-def extract_text_from_row(row_image: np.ndarray) -> Tuple[str, float]:
+def extract_text_from_row(row_image: ImageLike) -> Tuple[str, float]:
     """Row 이미지에서 텍스트와 평균 confidence 추출"""
     ocr = get_ocr_model()
     
@@ -106,6 +113,107 @@ def extract_text_from_row(row_image: np.ndarray) -> Tuple[str, float]:
     return "", 0.0
 
 
+def prepare_row_for_rec(
+    row_image: ImageLike,
+    tighten_roi: bool = True,
+    target_height: Optional[int] = REC_INPUT_HEIGHT
+) -> np.ndarray:
+    """
+    인식 전용 모델 입력용 Row 이미지 준비 (ROI 공백 제거 + 전처리 + 높이 정규화)
+    
+    Args:
+        row_image: Row 이미지 또는 ImageContext (BGR)
+        tighten_roi: True면 extract_roi_from_row로 좌우/테두리 공백을 제거
+        target_height: 인식 모델 입력 높이로 미리 축소 (None이면 원본 높이 유지)
+            모델도 같은 높이로 resize하므로 결과는 같고, 배치 전달 시 메모리만 줄어듦
+        
+    Returns:
+        3채널 uint8 이미지 (gray를 3채널로 복제, 빈 이미지면 size 0 배열)
+    """
+    ctx = as_context(row_image)
+    if ctx.image.size == 0:
+        return ctx.image
+    
+    target: ImageLike = ctx
+    if tighten_roi:
+        roi, bbox = extract_roi_from_row(ctx)
+        # 내용을 찾지 못한 경우(bbox 크기 0)는 Row 전체로 인식
+        if bbox[2] > 0 and bbox[3] > 0:
+            target = roi
+    
+    # 전처리 결과는 gray를 3채널로 복제한 이미지이므로 채널 순서(RGB/BGR)와 무관
+    processed_img = preprocess_for_ocr(target)
+    
+    h, w = processed_img.shape[:2]
+    if target_height and h > target_height:
+        new_w = max(1, int(round(w * target_height / h)))
+        processed_img = cv2.resize(processed_img, (new_w, target_height), interpolation=cv2.INTER_AREA)
+    
+    return processed_img
+
+
+def extract_text_from_row_rec(
+    row_image: ImageLike,
+    rec_model: Any,
+    tighten_roi: bool = True
+) -> Tuple[str, float]:
+    """
+    인식 전용 모델로 Row 이미지에서 텍스트와 confidence 추출
+    
+    Row는 이미 가로선 기준으로 분할되어 수평이고 짧은 답안 한 줄만 포함하므로
+    텍스트 검출/방향 분류 없이 Row(또는 공백을 제거한 ROI) 전체를 한 줄로 인식합니다.
+    
+    Args:
+        row_image: Row 이미지 또는 ImageContext (BGR)
+        rec_model: PaddleX 인식 모델 (PP-OCRv5_mobile_rec, ModelStore.ocr_model)
+        tighten_roi: True면 extract_roi_from_row로 좌우/테두리 공백을 제거한 뒤 인식
+        
+    Returns:
+        (텍스트, confidence) 튜플, 실패 시 ("", 0.0)
+    """
+    return extract_texts_from_rows_rec([row_image], rec_model, tighten_roi=tighten_roi)[0]
+
+
+def extract_texts_from_rows_rec(
+    row_images: List[ImageLike],
+    rec_model: Any,
+    tighten_roi: bool = True,
+    batch_size: int = 16
+) -> List[Tuple[str, float]]:
+    """
+    여러 Row를 인식 전용 모델로 한꺼번에 인식합니다.
+    
+    각 Row를 prepare_row_for_rec으로 높이 정규화한 뒤,
+    id_recog.ocr.ppocr_extract_batch로 가로세로 비율이 비슷한 Row끼리 묶어 배치 인식합니다.
+    
+    Args:
+        row_images: Row 이미지 또는 ImageContext 리스트 (BGR)
+        rec_model: PaddleX 인식 모델 (PP-OCRv5_mobile_rec)
+        tighten_roi: True면 공백을 제거한 ROI로 인식
+        batch_size: 한 번에 인식할 최대 Row 수
+        
+    Returns:
+        입력 순서와 동일한 (텍스트, confidence) 리스트 (빈 Row / 실패는 ("", 0.0))
+    """
+    # 학번 인식과 같은 array 입력 / 파일 fallback / 비율별 배치 로직 재사용
+    from id_recog.ocr import ppocr_extract_batch
+    
+    results: List[Tuple[str, float]] = [("", 0.0)] * len(row_images)
+    prepared = []
+    indices = []
+    for idx, row_image in enumerate(row_images):
+        processed_img = prepare_row_for_rec(row_image, tighten_roi=tighten_roi)
+        if processed_img.size == 0:
+            continue
+        prepared.append(processed_img)
+        indices.append(idx)
+    
+    for idx, res in zip(indices, ppocr_extract_batch(prepared, rec_model, batch_size=batch_size)):
+        results[idx] = res
+    
+    return results
+
+
 def refined_answer(text: str) -> Tuple[str, bool]:
     """
     OCR 텍스트를 정제하여 최종 답안 형식으로 변환
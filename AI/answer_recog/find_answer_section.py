@@ -23,6 +23,14 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from id_recog.schemas import BBox
 from id_recog.layout import detect_all_bboxes, get_table_boxes, crop_bbox, LayoutBox
+from id_recog.metrics import ANSWER_STAGE_SECONDS
+
+try:
+    from . import profile_analysis
+    from .image_context import ImageContext, ImageLike, as_context
+except ImportError:
+    import profile_analysis
+    from image_context import ImageContext, ImageLike, as_context
 
 
 @dataclass
@@ -35,25 +43,23 @@ class AnswerSectionResult:
     answer_column_x_start: Optional[int] = None        # Answer 컬럼 시작 x좌표 (table crop 기준)
     rotation_angle: Optional[float] = None             # 적용된 회전 각도 (도)
     meta: dict = field(default_factory=dict)           # 디버깅/로그용 메타정보
+    answer_section_context: Optional[ImageContext] = field(default=None, repr=False)  # Answer 섹션 전처리 캐시 (table view)
 
 
-def detect_skew_angle(image: np.ndarray, max_angle: float = 5.0) -> float:
+def detect_skew_angle(image: ImageLike, max_angle: float = 5.0) -> float:
     """
     이미지의 기울기 각도를 탐지합니다.
     Hough Line Transform으로 긴 가로선들을 탐지하고, 그 선들의 평균 각도를 계산합니다.
     
     Args:
-        image: 입력 이미지 (BGR 또는 grayscale)
+        image: 입력 이미지 (BGR 또는 grayscale, 또는 ImageContext)
         max_angle: 탐지할 최대 각도 (이보다 큰 각도는 무시)
         
     Returns:
         기울기 각도 (도, 시계 방향 양수). 탐지 실패 시 0.0
     """
-    # Grayscale 변환
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
+    # Grayscale (캐시)
+    gray = as_context(image).gray
     
     # Edge detection (Canny)
     edges = cv2.Canny(gray, 50, 150, apertureSize=3)
@@ -166,25 +172,19 @@ def deskew_image(
     return rotated, angle
 
 
-def compute_x_projection_profile(image: np.ndarray) -> np.ndarray:
+def compute_x_projection_profile(image: ImageLike) -> np.ndarray:
     """
     이미지의 X축 projection profile을 계산합니다.
     각 x좌표에서 세로 방향으로 검은 픽셀(또는 어두운 픽셀)의 합을 계산합니다.
     
     Args:
-        image: 입력 이미지 (grayscale 또는 BGR)
+        image: 입력 이미지 (grayscale 또는 BGR, 또는 ImageContext)
         
     Returns:
         x축 projection profile (1D array, 각 x 좌표의 dark pixel 밀도)
     """
-    # Grayscale로 변환
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
-    
-    # 이진화 (Otsu's method)
-    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    # 이진화 (Otsu's method, 캐시)
+    binary = as_context(image).otsu_binary()
     
     # X축 projection: 각 x좌표에서 세로 방향 합산
     x_profile = np.sum(binary, axis=0).astype(np.float32)
@@ -196,27 +196,19 @@ def compute_x_projection_profile(image: np.ndarray) -> np.ndarray:
     return x_profile
 
 
-def compute_vertical_lines_profile(image: np.ndarray) -> np.ndarray:
+def compute_vertical_lines_profile(image: ImageLike) -> np.ndarray:
     """
     Morphological 연산으로 세로선만 추출한 후 X축 projection profile을 계산합니다.
     테이블의 column separator를 더 정확하게 찾기 위한 함수입니다.
     
     Args:
-        image: 입력 이미지 (grayscale 또는 BGR)
+        image: 입력 이미지 (grayscale 또는 BGR, 또는 ImageContext)
         
     Returns:
         x축 projection profile (1D array, 세로선 위치에서 높은 값)
     """
-    # Grayscale로 변환
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
-    
-    h, w = gray.shape[:2]
-    
-    # 이진화 (Otsu's method)
-    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    ctx = as_context(image)
+    h, w = ctx.shape[:2]
     
     # Morphological 연산으로 세로선 추출
     # 세로로 긴 커널 (세로선만 남김)
@@ -224,7 +216,11 @@ def compute_vertical_lines_profile(image: np.ndarray) -> np.ndarray:
     vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, vertical_kernel_size))
     
     # Opening: erosion -> dilation (노이즈 제거 후 세로선만 남김)
-    vertical_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, vertical_kernel, iterations=2)
+    # 이진화(Otsu)와 opening 결과는 context에 캐시
+    vertical_lines = ctx.memo(
+        ("vertical_lines", vertical_kernel_size),
+        lambda: cv2.morphologyEx(ctx.otsu_binary(), cv2.MORPH_OPEN, vertical_kernel, iterations=2)
+    )
     
     # X축 projection: 각 x좌표에서 세로 방향 합산
     x_profile = np.sum(vertical_lines, axis=0).astype(np.float32)
@@ -254,30 +250,12 @@ def find_column_separators(
         separator 위치 리스트 [(start, end), ...]
     """
     # Profile에서 threshold 이상인 영역 찾기 (세로선 영역)
-    is_line = x_profile > threshold
-    
-    separators = []
-    in_separator = False
-    start_x = 0
-    
-    for x, val in enumerate(is_line):
-        if val and not in_separator:
-            # Separator 시작
-            in_separator = True
-            start_x = x
-        elif not val and in_separator:
-            # Separator 종료
-            in_separator = False
-            if x - start_x >= min_gap_width:
-                separators.append((start_x, x))
-    
-    # 마지막 separator 처리
-    if in_separator:
-        end_x = len(x_profile)
-        if end_x - start_x >= min_gap_width:
-            separators.append((start_x, end_x))
-    
-    return separators
+    starts, ends = profile_analysis.find_runs(np.asarray(x_profile) > threshold)
+    
+    # 너무 좁은 영역은 noise로 제외
+    keep = (ends - starts) >= min_gap_width
+    
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
 
 
 def find_vertical_line_peaks(
@@ -299,46 +277,26 @@ def find_vertical_line_peaks(
     Returns:
         peak 위치(x좌표) 리스트
     """
-    n = len(x_profile)
-    if n < 3:
+    x_profile = np.asarray(x_profile)
+    if len(x_profile) < 3:
         return []
     
-    peaks = []
+    # Local maximum 중 최소 높이 이상인 후보
+    candidates = profile_analysis.local_maxima(x_profile, strict=True)
+    candidates = candidates[x_profile[candidates] >= min_height]
     
-    for i in range(1, n - 1):
-        # Local maximum 확인
-        if x_profile[i] > x_profile[i-1] and x_profile[i] > x_profile[i+1]:
-            if x_profile[i] < min_height:
-                continue
-            
-            # Peak 너비 측정 (half-height에서)
-            half_height = x_profile[i] / 2
-            left = i
-            right = i
-            
-            while left > 0 and x_profile[left] > half_height:
-                left -= 1
-            while right < n - 1 and x_profile[right] > half_height:
-                right += 1
-            
-            width = right - left
-            
-            # Prominence 계산 (주변 최소값 대비)
-            search_range = min(50, i, n - i - 1)
-            local_min_left = min(x_profile[max(0, i-search_range):i]) if i > 0 else 0
-            local_min_right = min(x_profile[i+1:min(n, i+1+search_range)]) if i < n-1 else 0
-            local_baseline = max(local_min_left, local_min_right)
-            prominence = x_profile[i] - local_baseline
-            
-            # 세로선 조건: 좁고, 높고, prominent한 peak
-            if width <= max_width and prominence >= min_prominence:
-                peaks.append(i)
+    # Peak 너비 (half-height) / Prominence (좌우 50px 내 최소값 대비)
+    widths = profile_analysis.peak_half_widths(x_profile, candidates, max_width)
+    prominences = profile_analysis.peak_prominences(x_profile, candidates, window=50)
+    
+    # 세로선 조건: 좁고, 높고, prominent한 peak
+    keep = (widths <= max_width) & (prominences >= min_prominence)
     
-    return peaks
+    return candidates[keep].tolist()
 
 
 def find_last_column_separator(
-    image: np.ndarray,
+    image: ImageLike,
     min_separator_width: int = 3,
     edge_margin_ratio: float = 0.03,
     right_search_ratio: float = 0.5
@@ -353,7 +311,7 @@ def find_last_column_separator(
     3. 남은 peak 중 가장 우측 것이 Answer column separator
     
     Args:
-        image: 테이블 crop 이미지
+        image: 테이블 crop 이미지 (또는 ImageContext)
         min_separator_width: 최소 separator 너비 (deprecated, 호환성 유지)
         edge_margin_ratio: 이미지 가장자리 margin 비율 (테이블 경계 제외)
         right_search_ratio: 우측에서 검색할 영역 비율
@@ -464,20 +422,11 @@ def find_peaks_simple(arr: np.ndarray, min_distance: int = 10) -> list[int]:
     Returns:
         peak 위치 리스트
     """
-    peaks = []
-    n = len(arr)
-    
-    if n < 3:
-        return peaks
-    
-    for i in range(1, n - 1):
-        # Local maximum 확인
-        if arr[i] > arr[i-1] and arr[i] > arr[i+1]:
-            # 이전 peak와의 거리 확인
-            if len(peaks) == 0 or i - peaks[-1] >= min_distance:
-                peaks.append(i)
+    arr = np.asarray(arr)
+    candidates = profile_analysis.local_maxima(arr, strict=True)
     
-    return peaks
+    # 이전 peak와의 거리 확인 (가까운 peak는 버림)
+    return profile_analysis.suppress_close_peaks(arr, candidates, min_distance, keep_higher=False)
 
 
 def find_answer_section(
@@ -486,7 +435,9 @@ def find_answer_section(
     min_table_area_ratio: float = 0.1,
     answer_column_width_ratio: float = 0.15,
     enable_deskew: bool = True,
-    max_skew_angle: float = 5.0
+    max_skew_angle: float = 5.0,
+    layout_boxes: Optional[list[LayoutBox]] = None,
+    rotation_angle: Optional[float] = None
 ) -> AnswerSectionResult:
     """
     원본 이미지에서 Answer 섹션을 찾아 crop합니다.
@@ -505,6 +456,8 @@ def find_answer_section(
         answer_column_width_ratio: Answer column 최소 너비 비율 (fallback용)
         enable_deskew: 기울기 보정 활성화 여부
         max_skew_angle: 보정할 최대 기울기 각도 (도)
+        layout_boxes: 캐시된 레이아웃 결과 (주어지면 layout 모델 호출 생략)
+        rotation_angle: 캐시된 기울기 각도 (주어지면 기울기 탐지 생략)
         
     Returns:
         AnswerSectionResult
@@ -521,11 +474,17 @@ def find_answer_section(
         "stage": "layout"
     }
     
+    cached_angle = rotation_angle
     rotation_angle = 0.0
     
-    # 1. Layout detection
+    # 1. Layout detection (학번 인식 단계에서 캐시된 결과가 있으면 재사용)
     try:
-        all_boxes = detect_all_bboxes(image, layout_model)
+        if layout_boxes is not None:
+            all_boxes = layout_boxes
+            meta["layout_cached"] = True
+        else:
+            with ANSWER_STAGE_SECONDS.time(stage="layout"):
+                all_boxes = detect_all_bboxes(image, layout_model)
         meta["total_boxes"] = len(all_boxes)
     except Exception as e:
         meta["error"] = f"Layout detection failed: {str(e)}"
@@ -564,10 +523,19 @@ def find_answer_section(
     
     meta["table_crop_size_original"] = (table_image.shape[1], table_image.shape[0])
     
+    # Table 전처리 캐시 (gray / 이진화를 기울기 탐지와 컬럼 탐지에서 공유)
+    table_ctx = ImageContext(table_image)
+    
     # 5. 기울기 보정 (가로선 기준)
     if enable_deskew:
         meta["stage"] = "deskew"
-        table_image, rotation_angle = deskew_image(table_image, max_angle=max_skew_angle)
+        with ANSWER_STAGE_SECONDS.time(stage="deskew"):
+            angle = cached_angle if cached_angle is not None else detect_skew_angle(table_ctx, max_skew_angle)
+            
+            # 각도가 너무 작으면 회전하지 않고 기존 context를 그대로 사용 (deskew_image와 같은 기준)
+            if abs(angle) >= 0.1:
+                table_image, rotation_angle = deskew_image(table_image, angle=angle, max_angle=max_skew_angle)
+                table_ctx = ImageContext(table_image)
         meta["rotation_angle"] = rotation_angle
         meta["table_crop_size_after_deskew"] = (table_image.shape[1], table_image.shape[0])
     
@@ -575,7 +543,7 @@ def find_answer_section(
     meta["stage"] = "column_detection"
     
     # 6. X축 projection profile로 Answer column 위치 찾기
-    answer_column_x = find_last_column_separator(table_image)
+    answer_column_x = find_last_column_separator(table_ctx)
     
     table_h, table_w = table_image.shape[:2]
     
@@ -598,8 +566,9 @@ def find_answer_section(
     
     meta["answer_column_width"] = answer_column_width
     
-    # 7. Answer section crop
-    answer_section_image = table_image[:, answer_column_x:].copy()
+    # 7. Answer section crop (table의 zero-copy view, gray도 table 결과를 slice하여 재사용)
+    answer_section_context = table_ctx.view(0, table_h, answer_column_x, table_w)
+    answer_section_image = answer_section_context.image
     
     meta["stage"] = "complete"
     meta["answer_section_size"] = (answer_section_image.shape[1], answer_section_image.shape[0])
@@ -611,7 +580,8 @@ def find_answer_section(
         table_bbox=table_bbox,
         answer_column_x_start=answer_column_x,
         rotation_angle=rotation_angle,
-        meta=meta
+        meta=meta,
+        answer_section_context=answer_section_context
     )
 
 
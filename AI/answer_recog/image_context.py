@@ -0,0 +1,109 @@
+"""
+image_context.py - 시험지 단위 이미지 전처리 캐시
+
+답안 인식 파이프라인의 각 단계(기울기 탐지, 세로선/가로선 profile, Row 분할,
+꼬리문제 분할, O/X 판별, OCR 전처리)가 같은 픽셀을 매번 grayscale 변환/이진화하지 않도록
+한 이미지(영역)에 대한 gray, Otsu 이진화, adaptive 이진화, morphology 결과를 lazy하게 memoize합니다.
+
+영역(view) 규칙:
+- image / gray는 부모 배열의 zero-copy slice (gray 변환은 픽셀 단위 연산이므로 slice 결과가 동일)
+- 이진화 결과는 영역마다 따로 계산 (Otsu 임계값과 adaptive 경계 처리는 영역에 따라 달라지므로
+  부모 결과를 slice하면 기존 결과와 달라짐)
+
+각 모듈 함수는 np.ndarray와 ImageContext를 모두 입력으로 받습니다.
+"""
+
+import cv2
+import numpy as np
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+
+
+class ImageContext:
+    """
+    한 이미지(또는 부모 이미지의 영역)에 대한 전처리 결과 캐시
+
+    사용법:
+        ctx = ImageContext(table_image)
+        binary = ctx.otsu_binary()              # 최초 1회만 계산
+        row_ctx = ctx.view(y_start, y_end)      # zero-copy 영역 view
+    """
+
+    def __init__(
+        self,
+        image: np.ndarray,
+        parent: Optional["ImageContext"] = None,
+        region: Optional[tuple] = None
+    ):
+        """
+        Args:
+            image: 이미지 (BGR 또는 grayscale)
+            parent: 부모 context (view로 생성된 경우)
+            region: 부모 기준 (y1, y2, x1, x2) slice 범위
+        """
+        self.image = image
+        self._parent = parent
+        self._region = region
+        self._gray: Optional[np.ndarray] = None
+        self._cache: Dict[Hashable, Any] = {}
+
+    @property
+    def shape(self) -> tuple:
+        return self.image.shape
+
+    @property
+    def gray(self) -> np.ndarray:
+        """Grayscale 이미지 (view면 부모 gray의 slice, 읽기 전용으로 사용)"""
+        if self._gray is None:
+            if self._parent is not None:
+                y1, y2, x1, x2 = self._region
+                self._gray = self._parent.gray[y1:y2, x1:x2]
+            elif len(self.image.shape) == 3:
+                self._gray = cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
+            else:
+                self._gray = self.image
+        return self._gray
+
+    def memo(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """key에 대한 결과가 없을 때만 compute()를 호출하여 저장"""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def otsu_binary(self) -> np.ndarray:
+        """Otsu 이진화 (THRESH_BINARY_INV, 글자/선 = 255)"""
+        return self.memo(
+            ("otsu",),
+            lambda: cv2.threshold(self.gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1]
+        )
+
+    def adaptive_binary(self, block_size: int, c: float) -> np.ndarray:
+        """Gaussian adaptive 이진화 (THRESH_BINARY_INV)"""
+        return self.memo(
+            ("adaptive", block_size, c),
+            lambda: cv2.adaptiveThreshold(
+                self.gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                cv2.THRESH_BINARY_INV, block_size, c
+            )
+        )
+
+    def view(self, y1: int, y2: int, x1: int = 0, x2: Optional[int] = None) -> "ImageContext":
+        """
+        영역 view 생성 (image / gray는 복사하지 않음)
+
+        Args:
+            y1, y2: 세로 범위 [y1, y2)
+            x1, x2: 가로 범위 [x1, x2) (x2가 None이면 끝까지)
+        """
+        if x2 is None:
+            x2 = self.image.shape[1]
+        return ImageContext(self.image[y1:y2, x1:x2], parent=self, region=(y1, y2, x1, x2))
+
+
+ImageLike = Union[np.ndarray, ImageContext]
+
+
+def as_context(image: ImageLike) -> ImageContext:
+    """np.ndarray면 새 ImageContext로 감싸고, ImageContext면 그대로 반환"""
+    if isinstance(image, ImageContext):
+        return image
+    return ImageContext(image)
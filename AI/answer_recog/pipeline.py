@@ -41,6 +41,7 @@ from .schemas import (
     SubQuestionSegment
 )
 from .find_answer_section import find_answer_section, AnswerSectionResult
+from .image_context import ImageContext, ImageLike, as_context
 from .row_segmentation import (
     segment_rows, 
     segment_rows_recursive, 
@@ -48,7 +49,8 @@ from .row_segmentation import (
     RowSegmentationResult
 )
 from .sub_question_segmentation import segment_sub_questions
-from .answer_extraction import extract_text_from_row, refined_answer
+from .answer_extraction import extract_text_from_row, extract_texts_from_rows_rec, refined_answer
+from id_recog.metrics import ANSWER_STAGE_SECONDS, ANSWER_OCR_ROWS
 
 
 # =============================================================================
@@ -76,6 +78,11 @@ class PipelineConfig:
     
     # OCR
     ocr_lang: str = "en"
+    # "rec_only": 인식 전용 모델(ocr_model)로 Row 전체를 한 줄로 인식 (검출/방향 분류 생략)
+    # "full": PaddleOCR 전체 파이프라인 (ocr_model이 없으면 rec_only도 이 모드로 동작)
+    ocr_mode: str = "rec_only"
+    ocr_tighten_roi: bool = True  # rec_only에서 extract_roi_from_row로 공백 제거 후 인식
+    ocr_batch_size: int = 16      # rec_only에서 한 번에 인식할 최대 Row 수
     
     # Debug
     debug_mode: bool = False
@@ -102,7 +109,8 @@ class AnswerRecognitionPipeline:
         """
         Args:
             layout_model: PP-DocLayout 모델 (None이면 내부에서 로드)
-            ocr_model: PaddleOCR 모델 (None이면 내부에서 로드)
+            ocr_model: PP-OCRv5_mobile_rec 인식 모델 (rec_only 모드,
+                       None이면 full 모드의 PaddleOCR을 내부에서 로드)
             config: 파이프라인 설정
         """
         self.layout_model = layout_model
@@ -113,19 +121,38 @@ class AnswerRecognitionPipeline:
         if self.config.debug_mode and self.config.debug_output_dir:
             os.makedirs(self.config.debug_output_dir, exist_ok=True)
     
+    def warm_up(self, row_image: ImageLike) -> Tuple[str, float]:
+        """
+        Row OCR 경로를 한 번 실행해 초기화 비용을 미리 치릅니다. (서버 시작 시)
+        
+        full 모드면 이 호출에서 PaddleOCR이 로드되므로 첫 답안지의 첫 Row가 느려지지 않습니다.
+        
+        Returns:
+            (OCR 텍스트, 신뢰도)
+        """
+        text, confidence, _ = self._recognize_rows([row_image])[0]
+        return text, confidence
+    
+    @ANSWER_STAGE_SECONDS.time(stage="total")
     def process(
         self,
         image: np.ndarray,
         metadata: AnswerSheetMeta,
-        student_id: Optional[str] = None
+        student_id: Optional[str] = None,
+        layout_boxes: Optional[list] = None,
+        rotation_angle: Optional[float] = None
     ) -> AnswerSheetResult:
         """
         답안지 이미지를 처리하여 답안을 인식합니다.
         
         Args:
-            image: 답안지 이미지 (BGR)
+            image: 답안지 이미지 (3채널 또는 grayscale, SQS 워커는 RGB 표준 표현을 전달
+                   - ImageContext.gray 등은 COLOR_BGR2GRAY라 R/B 가중치가 바뀐 채 계산됨:
+                     기존 PIL 경로(RGB 전달)와 같은 결과이나 채널 순서와 무관하지는 않음)
             metadata: 정답지 메타데이터
             student_id: 학생 학번 (선택)
+            layout_boxes: 캐시된 레이아웃 결과 (선택, 학번 인식 단계 결과 재사용)
+            rotation_angle: 캐시된 기울기 보정 각도 (선택)
             
         Returns:
             AnswerSheetResult
@@ -139,17 +166,23 @@ class AnswerRecognitionPipeline:
         
         try:
             # Step 1: Answer Section 추출
-            answer_section_result = self._extract_answer_section(image)
+            with ANSWER_STAGE_SECONDS.time(stage="section"):
+                answer_section_result = self._extract_answer_section(image, layout_boxes, rotation_angle)
+            result.rotation_angle = answer_section_result.rotation_angle
             
             if not answer_section_result.success:
                 result.success = False
                 result.error_message = "Failed to extract answer section"
                 return result
             
-            answer_image = answer_section_result.answer_section_image
+            # 시험지 단위 전처리 캐시 (gray / 이진화를 Row·꼬리문제·답안 추출 단계에서 공유)
+            answer_context = (
+                answer_section_result.answer_section_context
+                or ImageContext(answer_section_result.answer_section_image)
+            )
             
             # Step 2: Row Segmentation
-            row_result = self._segment_rows(answer_image, metadata)
+            row_result = self._segment_rows(answer_context, metadata)
             
             if not row_result.success:
                 result.success = False
@@ -165,7 +198,8 @@ class AnswerRecognitionPipeline:
             result.results = recognition_results
             
             # Step 4: 채점 (정답과 비교)
-            self._grade_answers(result, metadata)
+            with ANSWER_STAGE_SECONDS.time(stage="grading"):
+                self._grade_answers(result, metadata)
             
             # Step 5: 요약 정보 갱신
             result.update_summary()
@@ -190,23 +224,28 @@ class AnswerRecognitionPipeline:
     
     def _extract_answer_section(
         self, 
-        image: np.ndarray
+        image: np.ndarray,
+        layout_boxes: Optional[list] = None,
+        rotation_angle: Optional[float] = None
     ) -> AnswerSectionResult:
         """
         Answer Section 추출
         
         PP-DocLayout으로 Table을 탐지하고, X-axis Projection으로 Answer 컬럼을 추출합니다.
+        (layout_boxes가 있으면 레이아웃 탐지를 생략)
         """
         return find_answer_section(
             image,
             layout_model=self.layout_model,
             enable_deskew=self.config.enable_deskew,
-            max_skew_angle=self.config.max_skew_angle
+            max_skew_angle=self.config.max_skew_angle,
+            layout_boxes=layout_boxes,
+            rotation_angle=rotation_angle
         )
     
     def _segment_rows(
         self,
-        answer_image: np.ndarray,
+        answer_image: ImageLike,
         metadata: AnswerSheetMeta
     ) -> RowSegmentationResult:
         """
@@ -216,22 +255,24 @@ class AnswerRecognitionPipeline:
         Case 2 (모든 문제 가로선): 전체 가로선 기반 분할
         """
         # 1차 분할: Morphological 가로선 탐지
-        row_result = segment_rows_recursive(
-            answer_image,
-            min_row_height=self.config.min_row_height,
-            max_row_height=self.config.max_row_height
-        )
+        with ANSWER_STAGE_SECONDS.time(stage="rows"):
+            row_result = segment_rows_recursive(
+                answer_image,
+                min_row_height=self.config.min_row_height,
+                max_row_height=self.config.max_row_height
+            )
         
         if not row_result.success:
             return row_result
         
         # Case 1 처리: 꼬리문제가 있는 경우 2차 분할
         if metadata.layout_type == "case1":
-            row_result = self._apply_sub_question_segmentation(
-                row_result,
-                metadata,
-                answer_image
-            )
+            with ANSWER_STAGE_SECONDS.time(stage="sub_rows"):
+                row_result = self._apply_sub_question_segmentation(
+                    row_result,
+                    metadata,
+                    answer_image
+                )
         
         return row_result
     
@@ -239,7 +280,7 @@ class AnswerRecognitionPipeline:
         self,
         row_result: RowSegmentationResult,
         metadata: AnswerSheetMeta,
-        answer_image: np.ndarray
+        answer_image: ImageLike
     ) -> RowSegmentationResult:
         """
         Case 1: 꼬리문제 Y-Projection 분할 적용
@@ -269,8 +310,9 @@ class AnswerRecognitionPipeline:
                 final_rows.append(row)
             else:
                 # 꼬리문제 있음 → Y-Projection으로 2차 분할
+                row_context = row.context or ImageContext(row.row_image)
                 sub_segments, sub_meta = segment_sub_questions(
-                    row.row_image,
+                    row_context,
                     expected_count=sub_count,
                     min_sub_height=self.config.min_sub_height,
                     debug=self.config.debug_mode
@@ -281,13 +323,15 @@ class AnswerRecognitionPipeline:
                     # 절대 좌표로 변환
                     abs_y_start = row.y_start + seg.y_start
                     abs_y_end = row.y_start + seg.y_end
+                    sub_context = row_context.view(seg.y_start, seg.y_end)
                     
                     new_row = RowSegment(
                         row_number=len(final_rows),
                         y_start=abs_y_start,
                         y_end=abs_y_end,
-                        row_image=seg.image,
-                        valley_depth=seg.valley_depth
+                        row_image=sub_context.image,
+                        valley_depth=seg.valley_depth,
+                        context=sub_context
                     )
                     final_rows.append(new_row)
         
@@ -310,6 +354,8 @@ class AnswerRecognitionPipeline:
         각 Row → (question_number, sub_question_number)
         """
         results = []
+        # OCR 대상 Row는 모아 두었다가 시험지 단위로 한 번에 인식
+        ocr_targets: List[Tuple[int, ImageLike]] = []
         row_idx = 0
         
         for q_idx, question in enumerate(metadata.questions):
@@ -333,12 +379,18 @@ class AnswerRecognitionPipeline:
                 
                 row = rows[row_idx]
                 row_idx += 1
+                row_input = row.context or row.row_image
                 
-                # 채점 타입별 답안 추출
-                rec_answer, confidence, extract_meta = self._extract_answer_by_type(
-                    row.row_image,
-                    scoring_type
-                )
+                if scoring_type in (ScoringType.OTHERS, ScoringType.BINARY):
+                    # OCR이 필요 없는 타입은 바로 처리
+                    rec_answer, confidence, extract_meta = self._extract_answer_by_type(
+                        row_input,
+                        scoring_type
+                    )
+                else:
+                    # objective, short_answer: 배치 OCR 후 채움
+                    rec_answer, confidence, extract_meta = None, 0.0, {"scoring_type": scoring_type.value}
+                    ocr_targets.append((len(results), row_input))
                 
                 result = AnswerRecognitionResult(
                     question_number=question_number,
@@ -347,19 +399,79 @@ class AnswerRecognitionPipeline:
                     rec_answer=rec_answer,
                     confidence=confidence,
                     meta=extract_meta,
-                    roi_image=row.row_image.copy()  # ROI 이미지 저장 (복사본)
+                    # ROI 이미지 저장 (복사본: 결과가 섹션 전체 이미지를 붙잡아 두지 않도록)
+                    roi_image=row.row_image.copy()
                 )
                 results.append(result)
         
+        # 모은 Row를 한 번에 인식하여 (question_number, sub_question_number) 결과에 반영
+        with ANSWER_STAGE_SECONDS.time(stage="ocr"):
+            ocr_outputs = self._recognize_rows([row_input for _, row_input in ocr_targets])
+        ANSWER_OCR_ROWS.inc(len(ocr_targets))
+        for (result_idx, _), (raw_text, confidence, ocr_mode) in zip(ocr_targets, ocr_outputs):
+            result = results[result_idx]
+            result.rec_answer, result.confidence = self._finalize_ocr_answer(
+                raw_text, confidence, ocr_mode, result.meta
+            )
+        
         return results
     
+    def _recognize_rows(
+        self,
+        row_images: List[ImageLike]
+    ) -> List[Tuple[str, float, str]]:
+        """
+        Row OCR (rec_only 모드면 배치 인식, full 모드면 Row별 PaddleOCR)
+        
+        Returns:
+            입력 순서와 동일한 (OCR 텍스트, 신뢰도, ocr_mode) 리스트
+        """
+        if not row_images:
+            return []
+        
+        if self.config.ocr_mode == "rec_only" and self.ocr_model is not None:
+            outputs = extract_texts_from_rows_rec(
+                row_images,
+                self.ocr_model,
+                tighten_roi=self.config.ocr_tighten_roi,
+                batch_size=self.config.ocr_batch_size
+            )
+            return [(text, conf, "rec_only") for text, conf in outputs]
+        
+        return [(*extract_text_from_row(row_image), "full") for row_image in row_images]
+    
+    def _finalize_ocr_answer(
+        self,
+        raw_text: str,
+        confidence: float,
+        ocr_mode: str,
+        meta: dict
+    ) -> Tuple[str, float]:
+        """
+        OCR 텍스트를 정제하고 신뢰도 기준을 적용합니다. (meta에 OCR 정보 기록)
+        
+        Returns:
+            (인식된 답안 또는 "unknown", 신뢰도)
+        """
+        meta["ocr_mode"] = ocr_mode
+        meta["raw_ocr_text"] = raw_text
+        
+        # 답안 정제
+        cleaned_answer, is_valid = refined_answer(raw_text)
+        
+        if not is_valid or confidence < self.config.min_confidence:
+            meta["low_confidence"] = True
+            return "unknown", confidence
+        
+        return cleaned_answer, confidence
+    
     def _extract_answer_by_type(
         self,
-        row_image: np.ndarray,
+        row_image: ImageLike,
         scoring_type: ScoringType
     ) -> Tuple[Optional[str], float, dict]:
         """
-        채점 타입별 답안 추출
+        채점 타입별 답안 추출 (Row 1개)
         
         Returns:
             (인식된 답안, 신뢰도, 메타데이터)
@@ -377,21 +489,13 @@ class AnswerRecognitionPipeline:
             return answer, confidence, meta
         
         # objective, short_answer: OCR 수행
-        raw_text, confidence = extract_text_from_row(row_image)
-        meta["raw_ocr_text"] = raw_text
-        
-        # 답안 정제
-        cleaned_answer, is_valid = refined_answer(raw_text)
-        
-        if not is_valid or confidence < self.config.min_confidence:
-            meta["low_confidence"] = True
-            return "unknown", confidence, meta
-        
-        return cleaned_answer, confidence, meta
+        raw_text, confidence, ocr_mode = self._recognize_rows([row_image])[0]
+        answer, confidence = self._finalize_ocr_answer(raw_text, confidence, ocr_mode, meta)
+        return answer, confidence, meta
     
     def _detect_binary_mark(
         self,
-        row_image: np.ndarray
+        row_image: ImageLike
     ) -> Tuple[Optional[str], float]:
         """
         O/X, 체크마크 검출
@@ -399,14 +503,8 @@ class AnswerRecognitionPipeline:
         TODO: 실제 체크마크 검출 로직 구현
         현재는 간단한 픽셀 밀도 기반 판별
         """
-        # Grayscale 변환
-        if len(row_image.shape) == 3:
-            gray = cv2.cvtColor(row_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = row_image.copy()
-        
-        # 이진화
-        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        # 이진화 (Otsu, Row context에 캐시)
+        binary = as_context(row_image).otsu_binary()
         
         # 픽셀 밀도 계산
         density = np.sum(binary) / (binary.size * 255)
@@ -0,0 +1,297 @@
+"""
+profile_analysis.py - 1D Projection Profile 분석 공통 모듈
+
+row_segmentation / sub_question_segmentation / find_answer_section에서
+공통으로 사용하는 peak / valley / run 탐지를 NumPy 배열 연산으로 구현합니다.
+
+제공 기능:
+1. Run 탐지 (연속된 True 구간, 1D / 행 단위 2D)
+2. Local maximum 후보 추출 + 최소 거리 억제
+3. 인접 peak 사이 valley 및 depth ratio
+4. Peak 너비(half-height) / prominence (세로선 peak 판별용)
+
+Profile 전체를 도는 Python 루프 없이 배열 연산으로 후보를 계산하고,
+순서 의존적인 최소 거리 억제만 (소수의) 후보에 대해 순회합니다.
+각 함수의 결과는 기존 스칼라 루프 구현과 동일합니다.
+"""
+
+import numpy as np
+from typing import List, Tuple
+
+
+# =============================================================================
+# Run 탐지
+# =============================================================================
+
+def find_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    1D bool 배열에서 연속된 True 구간을 찾습니다.
+
+    Args:
+        mask: 1D bool array
+
+    Returns:
+        (starts, ends) - 각 구간의 [start, end) 위치 배열
+    """
+    padded = np.zeros(len(mask) + 2, dtype=np.int8)
+    padded[1:-1] = np.asarray(mask, dtype=bool)
+    edges = np.diff(padded)
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def find_row_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    2D bool 배열의 각 행에서 연속된 True 구간을 찾습니다.
+
+    Args:
+        mask: 2D bool array (h, w)
+
+    Returns:
+        (rows, starts, ends) - 각 구간의 행 번호와 [start, end) 위치 배열
+        (행 우선 순서)
+    """
+    h, w = mask.shape
+    padded = np.zeros((h, w + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    # np.nonzero는 행 우선 순서이므로 시작/끝이 같은 순서로 짝지어짐
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return rows, starts, ends
+
+
+# =============================================================================
+# Peak 탐지
+# =============================================================================
+
+def local_maxima(profile: np.ndarray, strict: bool = False) -> np.ndarray:
+    """
+    양 끝을 제외한 local maximum 위치를 찾습니다.
+
+    Args:
+        profile: 1D array
+        strict: True면 좌우 이웃보다 커야 함, False면 크거나 같으면 됨 (plateau 포함)
+
+    Returns:
+        local maximum 위치 배열 (오름차순)
+    """
+    profile = np.asarray(profile)
+    if len(profile) < 3:
+        return np.empty(0, dtype=np.intp)
+
+    center = profile[1:-1]
+    if strict:
+        is_max = (center > profile[:-2]) & (center > profile[2:])
+    else:
+        is_max = (center >= profile[:-2]) & (center >= profile[2:])
+    return np.flatnonzero(is_max) + 1
+
+
+def suppress_close_peaks(
+    profile: np.ndarray,
+    candidates: np.ndarray,
+    min_distance: int,
+    keep_higher: bool = True
+) -> List[int]:
+    """
+    앞에서부터 순서대로 최소 거리 조건을 적용합니다.
+
+    이전 peak와 min_distance 이상 떨어져 있으면 추가하고,
+    가까우면 keep_higher일 때 더 높은 후보로 이전 peak를 교체합니다.
+
+    Args:
+        profile: 1D array
+        candidates: peak 후보 위치 (오름차순)
+        min_distance: peak 간 최소 거리
+        keep_higher: 가까운 후보가 더 높으면 교체할지 여부
+
+    Returns:
+        peak 위치 리스트
+    """
+    if len(candidates) == 0:
+        return []
+
+    # 모든 후보 간격이 min_distance 이상이면 억제할 것이 없음
+    if len(candidates) == 1 or np.diff(candidates).min() >= min_distance:
+        return candidates.tolist()
+
+    values = profile[candidates].tolist()
+    peaks = []
+    peak_values = []
+    for i, value in zip(candidates.tolist(), values):
+        if not peaks or i - peaks[-1] >= min_distance:
+            peaks.append(i)
+            peak_values.append(value)
+        elif keep_higher and value > peak_values[-1]:
+            peaks[-1] = i
+            peak_values[-1] = value
+    return peaks
+
+
+def find_peaks(
+    profile: np.ndarray,
+    min_distance: int = 10,
+    min_height_ratio: float = 0.1
+) -> List[int]:
+    """
+    1D profile에서 peak(극대점)을 찾습니다.
+
+    Peak 조건:
+    - 좌우 이웃보다 크거나 같음
+    - 최대값의 min_height_ratio 이상
+    - 이전 peak와 min_distance 이상 떨어져 있음 (가까우면 더 높은 peak로 교체)
+
+    Args:
+        profile: 1D array
+        min_distance: peak 간 최소 거리
+        min_height_ratio: 최소 높이 비율 (max 대비)
+
+    Returns:
+        peak 위치 리스트
+    """
+    profile = np.asarray(profile)
+    if len(profile) < 3:
+        return []
+
+    min_height = profile.max() * min_height_ratio
+    candidates = local_maxima(profile)
+    candidates = candidates[profile[candidates] >= min_height]
+    return suppress_close_peaks(profile, candidates, min_distance)
+
+
+# =============================================================================
+# Valley 탐지
+# =============================================================================
+
+def find_valleys_between_peaks(
+    profile: np.ndarray,
+    peaks: List[int]
+) -> Tuple[List[int], List[float]]:
+    """
+    인접한 두 peak 사이 [peak_n, peak_{n+1}] 구간의 최솟값 위치와 depth ratio를 구합니다.
+
+    depth_ratio = valley_val / min(peak_n, peak_{n+1}) (두 peak 중 작은 값이 0 이하면 1.0)
+    최솟값이 여러 개면 가장 앞의 위치를 사용합니다 (np.argmin과 동일).
+
+    Args:
+        profile: 1D array
+        peaks: peak 위치 리스트 (오름차순)
+
+    Returns:
+        (valley 위치 리스트, depth ratio 리스트)
+    """
+    if len(peaks) < 2:
+        return [], []
+
+    profile = np.asarray(profile)
+    peaks = np.asarray(peaks, dtype=np.intp)
+    starts, ends = peaks[:-1], peaks[1:]
+    lengths = ends - starts
+
+    # peak가 오름차순이므로 구간 [start, end)들은 [peaks[0], peaks[-1])을 빈틈없이 나눔
+    # (끝점 end는 아래에서 따로 비교)
+    values = profile[peaks[0]:peaks[-1]]
+    seg_ids = np.repeat(np.arange(len(starts)), lengths)
+
+    seg_min = profile[ends].copy()
+    nonempty = lengths > 0
+    if nonempty.any():
+        seg_min[nonempty] = np.minimum(
+            np.minimum.reduceat(values, starts[nonempty] - peaks[0]),
+            seg_min[nonempty]
+        )
+
+    # 각 구간에서 최솟값이 처음 나타나는 위치 (구간 내부에 없으면 끝점)
+    valleys = ends.copy()
+    hit = np.flatnonzero(values == seg_min[seg_ids])
+    hit_segs, first = np.unique(seg_ids[hit], return_index=True)
+    valleys[hit_segs] = peaks[0] + hit[first]
+
+    valley_vals = profile[valleys]
+    peak_min = np.minimum(profile[starts], profile[ends])
+    positive = peak_min > 0
+    depths = np.where(positive, valley_vals / np.where(positive, peak_min, 1), 1.0)
+
+    return valleys.tolist(), depths.tolist()
+
+
+# =============================================================================
+# Peak 형태 (세로선 판별용)
+# =============================================================================
+
+def peak_half_widths(
+    profile: np.ndarray,
+    peaks: np.ndarray,
+    max_width: int
+) -> np.ndarray:
+    """
+    각 peak의 half-height 너비를 구합니다 (max_width 초과는 max_width + 1).
+
+    peak에서 좌우로 값이 peak 높이의 절반 이하가 되는 첫 위치(또는 배열 끝)까지의 거리 합입니다.
+
+    Args:
+        profile: 1D array
+        peaks: peak 위치 배열
+        max_width: 측정할 최대 너비
+
+    Returns:
+        너비 배열
+    """
+    profile = np.asarray(profile)
+    peaks = np.asarray(peaks, dtype=np.intp)
+    n = len(profile)
+    if len(peaks) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    half = profile[peaks] / 2
+    offsets = np.arange(1, max_width + 1)
+
+    def first_stop(idx: np.ndarray, at_edge: np.ndarray) -> np.ndarray:
+        # 배열 끝에 닿거나 half 이하가 되는 첫 offset (없으면 max_width + 1)
+        stop = at_edge | (profile[np.clip(idx, 0, n - 1)] <= half[:, None])
+        return np.where(stop.any(axis=1), stop.argmax(axis=1) + 1, max_width + 1)
+
+    left_idx = peaks[:, None] - offsets
+    right_idx = peaks[:, None] + offsets
+    left = first_stop(left_idx, left_idx <= 0)
+    right = first_stop(right_idx, right_idx >= n - 1)
+
+    widths = np.minimum(left + right, max_width + 1)
+    # peak 자체가 half 이하(값 0 이하)면 너비 0
+    return np.where(profile[peaks] <= half, 0, widths)
+
+
+def peak_prominences(
+    profile: np.ndarray,
+    peaks: np.ndarray,
+    window: int = 50
+) -> np.ndarray:
+    """
+    각 peak의 prominence를 구합니다.
+
+    좌우 window(배열 끝에서는 짧게 대칭 축소) 안의 최솟값 중 큰 값을 baseline으로 사용합니다.
+
+    Args:
+        profile: 1D array (peak는 양 끝이 아니어야 함)
+        peaks: peak 위치 배열
+        window: 좌우 탐색 범위
+
+    Returns:
+        prominence 배열 (peak 값 - baseline)
+    """
+    profile = np.asarray(profile)
+    peaks = np.asarray(peaks, dtype=np.intp)
+    n = len(profile)
+    if len(peaks) == 0:
+        return np.empty(0, dtype=profile.dtype)
+
+    search = np.minimum(window, np.minimum(peaks, n - peaks - 1))
+    offsets = np.arange(1, window + 1)
+    outside = offsets[None, :] > search[:, None]
+
+    left = np.where(outside, np.inf, profile[np.clip(peaks[:, None] - offsets, 0, n - 1)]).min(axis=1)
+    right = np.where(outside, np.inf, profile[np.clip(peaks[:, None] + offsets, 0, n - 1)]).min(axis=1)
+
+    # 기존 구현과 같은 dtype으로 뺄셈 (float32 profile의 반올림 결과까지 동일하게)
+    baseline = np.maximum(left, right).astype(profile.dtype)
+    return profile[peaks] - baseline
@@ -17,6 +17,11 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
+try:
+    from .image_context import ImageLike, as_context
+except ImportError:
+    from image_context import ImageLike, as_context
+
 
 # =============================================================================
 # ROI 데이터 구조
@@ -97,7 +102,7 @@ def pad_to_square(image: np.ndarray, background_color: int = 255) -> np.ndarray:
     return square_img
 
 def extract_roi_from_row(
-    row_image: np.ndarray,
+    row_image: ImageLike,
     padding: int = 15, # 넉넉하게 자르기 위해 (5 -> 15)
     threshold_ratio: float = 0.03,
     margin_crop: int = 5 
@@ -105,9 +110,15 @@ def extract_roi_from_row(
     """
     Row 이미지에서 상하좌우 공백을 제거하여 실제 컨텐츠 ROI를 추출합니다.
     추출된 ROI는 정사각형으로 패딩 처리되어 반환됩니다.
+    (ROI는 Row 이미지의 zero-copy view, ImageContext를 넘기면 캐시된 gray 사용)
     """
-    if row_image is None or row_image.size == 0:
+    if row_image is None:
         return row_image, (0, 0, 0, 0)
+    
+    # 두 번의 시도가 같은 이진화 결과를 공유하도록 context로 감싸서 전달
+    row_image = as_context(row_image)
+    if row_image.image.size == 0:
+        return row_image.image, (0, 0, 0, 0)
         
     # 1차 시도 (High Threshold -> Clean Crop)
     roi, bbox = _extract_roi_core(row_image, padding, threshold_ratio, margin_crop)
@@ -136,11 +147,13 @@ def extract_roi_from_row(
     return roi, bbox
 
 def _extract_roi_core(
-    row_image: np.ndarray,
+    row_image: ImageLike,
     padding: int,
     threshold_ratio: float,
     margin_crop: int
 ) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
+    ctx = as_context(row_image)
+    row_image = ctx.image
     h, w = row_image.shape[:2]
     
     # 0. 상하좌우 강제 Crop (테두리 노이즈 제거)
@@ -159,27 +172,25 @@ def _extract_roi_core(
         start_x = margin_crop
         end_x = w - margin_crop
         
-    working_img = row_image[start_y:end_y, start_x:end_x].copy()
+    # Working 영역 view (threshold_ratio만 다른 재시도는 같은 view / 이진화 결과 재사용)
+    working = ctx.memo(
+        ("roi_working", start_y, end_y, start_x, end_x),
+        lambda: ctx.view(start_y, end_y, start_x, end_x)
+    )
+    working_img = working.image
         
     wh, ww = working_img.shape[:2]
 
-    # 1. 전처리 & 노이즈 제거
-    if len(working_img.shape) == 3:
-        gray = cv2.cvtColor(working_img, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = working_img.copy()
+    # 1. 전처리 & 노이즈 제거 → 2. X-Projection (좌우 공백 제거만 수행)
+    def clean_x_projection() -> np.ndarray:
+        binary = working.adaptive_binary(15, 10)
         
-    binary = cv2.adaptiveThreshold(
-        gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-        cv2.THRESH_BINARY_INV, 15, 10
-    )
-    
-    # [강화] 미세 노이즈 제거 (Morph Open)
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
-    binary_clean = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=1)
+        # [강화] 미세 노이즈 제거 (Morph Open)
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+        binary_clean = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=1)
+        return np.sum(binary_clean, axis=0) / 255
     
-    # 2. X-Projection (좌우 공백 제거만 수행)
-    x_proj = np.sum(binary_clean, axis=0) / 255
+    x_proj = working.memo(("roi_x_projection",), clean_x_projection)
     
     # [강화] 동적 임계값: 절대 비율 + 상대 비율
     # 글자가 있는 곳은 밀도가 높으므로, 최대 밀도의 20% 미만인 곳은 노이즈로 간주 (0.1 -> 0.2 상향)
@@ -195,8 +206,8 @@ def _extract_roi_core(
         x_start_local = max(0, x_indices[0] - padding)
         x_end_local = min(ww, x_indices[-1] + 1 + padding)
         
-    # 최종 ROI: Working Image 기준 Crop
-    roi = working_img[:, x_start_local:x_end_local].copy()
+    # 최종 ROI: Working Image 기준 Crop (view)
+    roi = working_img[:, x_start_local:x_end_local]
     
     # bbox (원본 기준 좌표 변환)
     # x = start_x + x_start_local
@@ -245,7 +256,7 @@ def create_answer_rois(
             row_idx += 1
             
             # ROI 추출
-            roi_image, bbox = extract_roi_from_row(row.row_image)
+            roi_image, bbox = extract_roi_from_row(row.context or row.row_image)
             
             roi = AnswerROI(
                 question_number=q_num,
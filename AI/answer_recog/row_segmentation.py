@@ -22,6 +22,13 @@ import cv2
 from dataclasses import dataclass, field
 from typing import Optional, List, Tuple
 
+try:
+    from . import profile_analysis
+    from .image_context import ImageContext, ImageLike, as_context
+except ImportError:
+    import profile_analysis
+    from image_context import ImageContext, ImageLike, as_context
+
 
 @dataclass
 class RowSegment:
@@ -32,6 +39,7 @@ class RowSegment:
     row_image: Optional[np.ndarray] = None  # Row 이미지
     peak_y: Optional[int] = None  # Peak 위치 (row 중심)
     valley_depth: Optional[float] = None  # Valley 깊이 (상대값)
+    context: Optional[ImageContext] = field(default=None, repr=False)  # 전처리 캐시 (원본 섹션의 view)
     
     @property
     def height(self) -> int:
@@ -51,25 +59,19 @@ class RowSegmentationResult:
     meta: dict = field(default_factory=dict)
 
 
-def compute_y_projection_profile(image: np.ndarray) -> np.ndarray:
+def compute_y_projection_profile(image: ImageLike) -> np.ndarray:
     """
     이미지의 Y축 projection profile을 계산합니다.
     각 y좌표에서 가로 방향으로 검은 픽셀의 합을 계산합니다.
     
     Args:
-        image: 입력 이미지 (grayscale 또는 BGR)
+        image: 입력 이미지 (grayscale 또는 BGR, 또는 ImageContext)
         
     Returns:
         y축 projection profile (1D array)
     """
-    # Grayscale로 변환
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
-    
-    # 이진화 (Otsu's method)
-    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    # 이진화 (Otsu's method, 캐시)
+    binary = as_context(image).otsu_binary()
     
     # Y축 projection: 각 y좌표에서 가로 방향 합산
     y_profile = np.sum(binary, axis=1).astype(np.float32)
@@ -78,7 +80,7 @@ def compute_y_projection_profile(image: np.ndarray) -> np.ndarray:
 
 
 def compute_horizontal_lines_profile(
-    image: np.ndarray,
+    image: ImageLike,
     min_line_width_ratio: float = 0.7
 ) -> np.ndarray:
     """
@@ -89,22 +91,14 @@ def compute_horizontal_lines_profile(
     표 내부의 짧은 가로선은 무시됩니다.
     
     Args:
-        image: 입력 이미지 (grayscale 또는 BGR)
+        image: 입력 이미지 (grayscale 또는 BGR, 또는 ImageContext)
         min_line_width_ratio: 최소 가로선 길이 비율 (전체 너비 대비)
         
     Returns:
         y축 projection profile (1D array, 메인 가로선 위치에서 높은 값)
     """
-    # Grayscale로 변환
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
-    
-    h, w = gray.shape[:2]
-    
-    # 이진화 (Otsu's method)
-    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    ctx = as_context(image)
+    h, w = ctx.shape[:2]
     
     # Morphological 연산으로 가로선 추출
     # 가로로 긴 커널 (가로선만 남김)
@@ -112,42 +106,30 @@ def compute_horizontal_lines_profile(
     horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (horizontal_kernel_size, 1))
     
     # Opening: erosion -> dilation (노이즈 제거 후 가로선만 남김)
-    horizontal_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, horizontal_kernel, iterations=2)
+    # 이진화(Otsu)와 opening 결과는 context에 캐시 (min_line_width_ratio만 다른 호출은 재사용)
+    horizontal_lines = ctx.memo(
+        ("horizontal_lines", horizontal_kernel_size),
+        lambda: cv2.morphologyEx(ctx.otsu_binary(), cv2.MORPH_OPEN, horizontal_kernel, iterations=2)
+    )
     
     # =====================================================================
     # 메인 가로선 필터링: 전체 너비의 min_line_width_ratio 이상인 가로선만 남김
     # =====================================================================
     min_line_width = int(w * min_line_width_ratio)
     
-    # 각 행(y좌표)에서 가로선 길이 측정
-    # 연결된 컴포넌트(가로선 세그먼트)의 길이를 측정
-    filtered_lines = np.zeros_like(horizontal_lines)
+    # 각 행(y좌표)에서 가로선 세그먼트(연속된 흰색 픽셀)의 길이를 한 번에 측정
+    start_y, start_x, end_x = profile_analysis.find_row_runs(horizontal_lines > 0)
+    segment_lengths = end_x - start_x
     
-    for y in range(h):
-        row = horizontal_lines[y, :]
-        
-        # 연결된 흰색 픽셀 세그먼트 찾기
-        in_segment = False
-        segment_start = 0
-        
-        for x in range(w + 1):  # w+1까지 순회하여 마지막 세그먼트도 처리
-            if x < w and row[x] > 0:
-                if not in_segment:
-                    in_segment = True
-                    segment_start = x
-            else:
-                if in_segment:
-                    segment_end = x
-                    segment_length = segment_end - segment_start
-                    
-                    # 메인 가로선 조건: 전체 너비의 min_line_width_ratio 이상
-                    if segment_length >= min_line_width:
-                        filtered_lines[y, segment_start:segment_end] = 255
-                    
-                    in_segment = False
+    # 메인 가로선 조건: 전체 너비의 min_line_width_ratio 이상
+    keep = segment_lengths >= min_line_width
     
-    # Y축 projection: 각 y좌표에서 가로 방향 합산 (필터링된 가로선만)
-    y_profile = np.sum(filtered_lines, axis=1).astype(np.float32)
+    # Y축 projection: 각 y좌표에서 남은 세그먼트 픽셀(255) 합산
+    y_profile = np.bincount(
+        start_y[keep],
+        weights=segment_lengths[keep] * 255.0,
+        minlength=h
+    ).astype(np.float32)
     
     return y_profile
 
@@ -164,28 +146,7 @@ def find_peaks(profile: np.ndarray, min_distance: int = 10, min_height_ratio: fl
     Returns:
         peak 위치 리스트
     """
-    if len(profile) < 3:
-        return []
-    
-    max_val = profile.max()
-    min_height = max_val * min_height_ratio
-    
-    peaks = []
-    n = len(profile)
-    
-    for i in range(1, n - 1):
-        # Local maximum 확인
-        if profile[i] >= profile[i-1] and profile[i] >= profile[i+1]:
-            # 최소 높이 확인
-            if profile[i] >= min_height:
-                # 최소 거리 확인
-                if len(peaks) == 0 or i - peaks[-1] >= min_distance:
-                    peaks.append(i)
-                elif profile[i] > profile[peaks[-1]]:
-                    # 더 높은 peak면 교체
-                    peaks[-1] = i
-    
-    return peaks
+    return profile_analysis.find_peaks(profile, min_distance, min_height_ratio)
 
 
 def find_valleys_between_peaks(
@@ -206,41 +167,9 @@ def find_valleys_between_peaks(
     Returns:
         (valley 위치 리스트, valley 깊이 리스트)
     """
-    if len(peaks) < 2:
-        return [], []
-    
-    valleys = []
-    depths = []
-    
-    for i in range(len(peaks) - 1):
-        y_start = peaks[i]
-        y_end = peaks[i + 1]
-        
-        # 구간 [y_start, y_end]에서 최솟값 찾기
-        segment = profile[y_start:y_end+1]
-        min_idx = np.argmin(segment)
-        valley_y = y_start + min_idx
-        valley_val = profile[valley_y]
-        
-        # 깊이 계산 (두 peak 중 작은 값 대비)
-        peak_min = min(profile[y_start], profile[y_end])
-        
-        if peak_min > 0:
-            relative_depth = valley_val / peak_min
-        else:
-            relative_depth = 1.0
-        
-        # 깊이 조건 확인 (valley가 충분히 낮아야 함)
-        if relative_depth <= min_depth_ratio:
-            valleys.append(valley_y)
-            depths.append(relative_depth)
-        else:
-            # 조건 불충족시에도 중간점을 valley로 사용 (merge 방지)
-            # 이 경우 depth를 높게 표시하여 신뢰도가 낮음을 표시
-            valleys.append(valley_y)
-            depths.append(relative_depth)
-    
-    return valleys, depths
+    # 깊이 조건(relative_depth <= min_depth_ratio)을 만족하지 않아도 valley로 사용 (merge 방지)
+    # 이 경우 depth가 높게 표시되어 신뢰도가 낮음을 나타냄
+    return profile_analysis.find_valleys_between_peaks(profile, peaks)
 
 
 def normalize_row_heights(
@@ -300,7 +229,7 @@ def normalize_row_heights(
 
 
 def find_row_separators_morphological(
-    image: np.ndarray,
+    image: ImageLike,
     min_line_length_ratio: float = 0.6,  # 기본값 0.6 (60%) - 안전한 기준
     min_row_height: int = 30
 ) -> List[int]:
@@ -309,77 +238,51 @@ def find_row_separators_morphological(
     Dilation을 통해 흐린 선도 60% 이상으로 증폭시키고, 
     짧은 선은 60% 미만으로 유지하여 필터링합니다.
     """
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
-    
-    h, w = gray.shape[:2]
-    
-    # 이진화
-    binary = cv2.adaptiveThreshold(
-        gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-        cv2.THRESH_BINARY_INV, 31, 10
-    )
-    
-    # 1. Morphological Open: 텍스트 노이즈 제거
-    open_kernel_len = int(w * 0.2)
-    open_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (open_kernel_len, 1))
-    opened = cv2.morphologyEx(binary, cv2.MORPH_OPEN, open_kernel, iterations=1)
+    ctx = as_context(image)
+    h, w = ctx.shape[:2]
     
-    # 2. Dilation: 선 연결 및 강화
-    # 메인 가로선(약 100%) -> Dilation 후 60% 충분히 넘음
-    # 내부 가로선(약 25%) -> Dilation 후에도 60% 넘기 힘듦
-    dilate_len = int(w * 0.05)
-    dilate_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (dilate_len, 1))
-    dilated = cv2.dilate(opened, dilate_kernel, iterations=2)
+    def line_projection() -> np.ndarray:
+        # 이진화 (adaptive, 캐시)
+        binary = ctx.adaptive_binary(31, 10)
+        
+        # 1. Morphological Open: 텍스트 노이즈 제거
+        open_kernel_len = int(w * 0.2)
+        open_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (open_kernel_len, 1))
+        opened = cv2.morphologyEx(binary, cv2.MORPH_OPEN, open_kernel, iterations=1)
+        
+        # 2. Dilation: 선 연결 및 강화
+        # 메인 가로선(약 100%) -> Dilation 후 60% 충분히 넘음
+        # 내부 가로선(약 25%) -> Dilation 후에도 60% 넘기 힘듦
+        dilate_len = int(w * 0.05)
+        dilate_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (dilate_len, 1))
+        dilated = cv2.dilate(opened, dilate_kernel, iterations=2)
+        
+        # Projection
+        return np.sum(dilated, axis=1) / 255
     
-    # Projection
-    y_projection = np.sum(dilated, axis=1) / 255
+    # min_line_length_ratio / min_row_height만 다른 호출은 projection 재사용
+    y_projection = ctx.memo(("row_separator_projection",), line_projection)
     
     threshold = w * min_line_length_ratio
     
-    separators = []
-    in_line = False
-    line_start = 0
-    max_val_in_line = 0
+    # 임계값 이상인 연속 구간(가로선)의 중심을 separator로 사용
+    line_starts, line_ends = profile_analysis.find_runs(y_projection >= threshold)
     
-    for y in range(h):
-        val = y_projection[y]
+    separators = []
+    for line_start, line_end in zip(line_starts.tolist(), line_ends.tolist()):
+        line_center = (line_start + line_end) // 2
         
-        if val >= threshold:
-            if not in_line:
-                in_line = True
-                line_start = y
-                max_val_in_line = val
-            else:
-                max_val_in_line = max(max_val_in_line, val)
-        else:
-            if in_line:
-                in_line = False
-                line_end = y
-                
-                line_center = (line_start + line_end) // 2
-                
-                if len(separators) == 0:
-                    separators.append(line_center)
-                else:
-                    dist = line_center - separators[-1]
-                    if dist >= min_row_height:
-                        separators.append(line_center)
-                    else:
-                        separators[-1] = (separators[-1] + line_center) // 2
-    
-    if in_line:
-        line_center = (line_start + h) // 2
         if len(separators) == 0 or line_center - separators[-1] >= min_row_height:
             separators.append(line_center)
-            
+        elif line_end < h:
+            separators[-1] = (separators[-1] + line_center) // 2
+        # 이미지 끝까지 이어진 선이 이전 separator와 가까우면 무시
+    
     return separators
 
 
 def segment_rows(
-    image: np.ndarray,
+    image: ImageLike,
     min_row_height: int = 30,
     max_row_height: int = 200,
     min_depth_ratio: float = 0.3,
@@ -402,7 +305,7 @@ def segment_rows(
     4. Valley 깊이 필터링 + 정규화
     
     Args:
-        image: Answer 섹션 이미지
+        image: Answer 섹션 이미지 (또는 ImageContext)
         min_row_height: 최소 row 높이
         max_row_height: 최대 row 높이
         min_depth_ratio: valley 깊이 임계값 (낮을수록 엄격)
@@ -413,7 +316,10 @@ def segment_rows(
         
     Returns:
         RowSegmentationResult
+        (각 Row의 row_image / context는 원본 섹션의 zero-copy view)
     """
+    ctx = as_context(image)
+    image = ctx.image
     h, w = image.shape[:2]
     
     meta = {
@@ -423,12 +329,12 @@ def segment_rows(
     }
     
     # Y축 projection profile 계산 (시각화용)
-    y_profile = compute_y_projection_profile(image)
+    y_profile = compute_y_projection_profile(ctx)
     
     # 1차 시도: Morphological 가로선 탐지
     if use_morphological:
         separators = find_row_separators_morphological(
-            image,
+            ctx,
             min_line_length_ratio=min_line_length_ratio,
             min_row_height=min_row_height
         )
@@ -450,19 +356,20 @@ def segment_rows(
                 if row_height < min_row_height:
                     if len(rows) > 0:
                         rows[-1].y_end = y_end
-                        rows[-1].row_image = image[rows[-1].y_start:y_end, :].copy()
+                        rows[-1].row_image = image[rows[-1].y_start:y_end, :]
                     continue
                 
                 row = RowSegment(
                     row_number=len(rows),
                     y_start=y_start,
                     y_end=y_end,
-                    row_image=image[y_start:y_end, :].copy()
+                    row_image=image[y_start:y_end, :]
                 )
                 rows.append(row)
             
             if len(rows) >= 3:  # 최소 3개 row가 있어야 성공으로 판정
                 meta["final_row_count"] = len(rows)
+                _attach_row_contexts(rows, ctx)
                 
                 # Expected row count 검증
                 if expected_row_count is not None and len(rows) != expected_row_count:
@@ -504,7 +411,8 @@ def segment_rows(
             row_number=0,
             y_start=0,
             y_end=h,
-            row_image=image.copy()
+            row_image=image,
+            context=ctx
         )
         return RowSegmentationResult(
             success=True,
@@ -554,7 +462,7 @@ def segment_rows(
             # 너무 작으면 이전 row와 merge (또는 skip)
             if len(rows) > 0:
                 rows[-1].y_end = y_end
-                rows[-1].row_image = image[rows[-1].y_start:y_end, :].copy()
+                rows[-1].row_image = image[rows[-1].y_start:y_end, :]
             continue
         
         if row_height > max_row_height:
@@ -575,13 +483,14 @@ def segment_rows(
             row_number=len(rows),
             y_start=y_start,
             y_end=y_end,
-            row_image=image[y_start:y_end, :].copy(),
+            row_image=image[y_start:y_end, :],
             peak_y=peak_y,
             valley_depth=valley_depth
         )
         rows.append(row)
     
     meta["final_row_count"] = len(rows)
+    _attach_row_contexts(rows, ctx)
     
     # Expected row count 검증
     if expected_row_count is not None:
@@ -602,8 +511,15 @@ def segment_rows(
     )
 
 
+def _attach_row_contexts(rows: List[RowSegment], ctx: ImageContext):
+    """각 Row에 원본 섹션 context의 view를 연결 (gray 등 전처리 결과를 Row 단계에서 재사용)"""
+    for row in rows:
+        row.context = ctx.view(row.y_start, row.y_end)
+        row.row_image = row.context.image
+
+
 def segment_rows_recursive(
-    image: np.ndarray,
+    image: ImageLike,
     min_row_height: int = 30,
     max_row_height: int = 200,
     text_line_height: int = 25,
@@ -639,7 +555,7 @@ def segment_rows_recursive(
             
             # 2차 분할: Peak/Valley 방식 (use_morphological=False)
             sub_result = segment_rows(
-                row.row_image,
+                row.context or row.row_image,
                 min_row_height=text_line_height,
                 max_row_height=max_row_height,
                 min_depth_ratio=0.9,
@@ -659,7 +575,8 @@ def segment_rows_recursive(
                         y_end=abs_y_end,
                         row_image=sub_row.row_image,
                         peak_y=(row.y_start + sub_row.peak_y) if sub_row.peak_y else None,
-                        valley_depth=sub_row.valley_depth
+                        valley_depth=sub_row.valley_depth,
+                        context=sub_row.context
                     )
                     final_rows.append(new_row)
             else:
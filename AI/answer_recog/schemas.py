@@ -67,7 +67,7 @@ class AnswerSheetMeta:
             for q in data.get("questions", [])
         ]
         return cls(
-            exam_code=data.get("exam_code", ""),
+            exam_code=data.get("exam_code") or data.get("examCode", ""),
             questions=questions,
             layout_type=data.get("layout_type", "case2"),
             total_questions=len(questions)
@@ -118,6 +118,7 @@ class AnswerSheetResult:
     results: List[AnswerRecognitionResult] = field(default_factory=list)
     success: bool = True
     error_message: Optional[str] = None
+    rotation_angle: Optional[float] = None  # 답안 섹션 기울기 보정 각도 (레이아웃 캐시용)
     
     # 요약 정보
     total_questions: int = 0
@@ -20,37 +20,35 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Tuple
 
 from .schemas import SubQuestionSegment
+from . import profile_analysis
+from .image_context import ImageLike, as_context
 
 
 # =============================================================================
 # Y축 Projection Profile 계산
 # =============================================================================
 
-def compute_y_projection_profile(image: np.ndarray) -> np.ndarray:
+def compute_y_projection_profile(image: ImageLike) -> np.ndarray:
     """
     이미지의 Y축 Projection Profile을 계산합니다.
     각 y좌표에서 가로 방향으로 검은 픽셀(텍스트)의 합을 계산합니다.
     
     Args:
-        image: 입력 이미지 (grayscale 또는 BGR)
+        image: 입력 이미지 (grayscale 또는 BGR, 또는 ImageContext)
         
     Returns:
         y축 projection profile (1D array, 길이 = 이미지 높이)
     """
-    # Grayscale로 변환
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
+    ctx = as_context(image)
     
-    # 이진화 (Otsu's method)
-    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    # 이진화 (Otsu's method, 캐시)
+    binary = ctx.otsu_binary()
     
     # Y축 projection: 각 y좌표에서 가로 방향 합산
     y_profile = np.sum(binary, axis=1).astype(np.float32)
     
     # 너비로 정규화 (0~1 범위)
-    max_val = image.shape[1] * 255
+    max_val = ctx.shape[1] * 255
     if max_val > 0:
         y_profile = y_profile / max_val
     
@@ -106,28 +104,7 @@ def find_peaks_adaptive(
     Returns:
         peak 위치(y좌표) 리스트
     """
-    if len(profile) < 3:
-        return []
-    
-    max_val = profile.max()
-    min_height = max_val * min_height_ratio
-    
-    peaks = []
-    n = len(profile)
-    
-    for i in range(1, n - 1):
-        # Local maximum 확인
-        if profile[i] >= profile[i-1] and profile[i] >= profile[i+1]:
-            # 최소 높이 확인
-            if profile[i] >= min_height:
-                # 최소 거리 확인
-                if len(peaks) == 0 or i - peaks[-1] >= min_distance:
-                    peaks.append(i)
-                elif profile[i] > profile[peaks[-1]]:
-                    # 더 높은 peak면 교체
-                    peaks[-1] = i
-    
-    return peaks
+    return profile_analysis.find_peaks(profile, min_distance, min_height_ratio)
 
 
 def find_valleys_between_peaks(
@@ -151,34 +128,7 @@ def find_valleys_between_peaks(
     Returns:
         (valley 위치 리스트, depth ratio 리스트)
     """
-    if len(peaks) < 2:
-        return [], []
-    
-    valleys = []
-    depths = []
-    
-    for i in range(len(peaks) - 1):
-        y_start = peaks[i]
-        y_end = peaks[i + 1]
-        
-        # 구간 [y_start, y_end]에서 최솟값 찾기
-        segment = profile[y_start:y_end+1]
-        min_idx = np.argmin(segment)
-        valley_y = y_start + min_idx
-        valley_val = profile[valley_y]
-        
-        # Depth ratio 계산 (두 peak 중 작은 값 대비)
-        peak_min = min(profile[y_start], profile[y_end])
-        
-        if peak_min > 0:
-            depth_ratio = valley_val / peak_min
-        else:
-            depth_ratio = 1.0
-        
-        valleys.append(valley_y)
-        depths.append(depth_ratio)
-    
-    return valleys, depths
+    return profile_analysis.find_valleys_between_peaks(profile, peaks)
 
 
 def find_local_minimum_near(
@@ -270,7 +220,7 @@ def select_valleys_by_count(
 # =============================================================================
 
 def segment_sub_questions(
-    row_image: np.ndarray,
+    row_image: ImageLike,
     expected_count: int,
     min_sub_height: int = 15,
     smoothing_kernel: Optional[int] = None,
@@ -283,7 +233,7 @@ def segment_sub_questions(
     expected_count에 맞게 분할합니다.
     
     Args:
-        row_image: 분할할 Row 이미지
+        row_image: 분할할 Row 이미지 (또는 ImageContext)
         expected_count: 예상 꼬리문제 개수
         min_sub_height: 최소 sub-question 높이 (px)
         smoothing_kernel: 스무딩 커널 크기 (None이면 자동 계산)
@@ -291,7 +241,10 @@ def segment_sub_questions(
         
     Returns:
         (SubQuestionSegment 리스트, 메타데이터 dict)
+        (segment.image는 Row 이미지의 zero-copy view)
     """
+    ctx = as_context(row_image)
+    row_image = ctx.image
     h, w = row_image.shape[:2]
     
     meta = {
@@ -306,13 +259,13 @@ def segment_sub_questions(
             sub_number=1,
             y_start=0,
             y_end=h,
-            image=row_image.copy()
+            image=row_image
         )
         meta["single_segment"] = True
         return [segment], meta
     
     # Step 1: Y축 Projection Profile 계산
-    y_profile = compute_y_projection_profile(row_image)
+    y_profile = compute_y_projection_profile(ctx)
     
     # Step 2: Smoothing
     if smoothing_kernel is None:
@@ -387,7 +340,7 @@ def segment_sub_questions(
             sub_number=len(segments) + 1,
             y_start=y_start,
             y_end=y_end,
-            image=row_image[y_start:y_end, :].copy(),
+            image=row_image[y_start:y_end, :],
             valley_depth=depth
         )
         segments.append(segment)
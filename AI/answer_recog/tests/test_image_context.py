@@ -0,0 +1,76 @@
+"""
+tests/test_image_context.py - 시험지 단위 전처리 캐시(ImageContext) 유닛 테스트
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+# answer_recog 디렉토리를 path에 추가
+# (패키지 __init__은 PaddleOCR을 import하므로 모듈을 직접 import)
+ANSWER_RECOG_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ANSWER_RECOG_DIR)
+
+from image_context import ImageContext, as_context
+import row_segmentation
+
+SECTION_IMAGE = os.path.join(ANSWER_RECOG_DIR, "test_output", "module_test", "m3_answer_section.jpg")
+
+
+@pytest.fixture(scope="module")
+def section():
+    return cv2.imread(SECTION_IMAGE)
+
+
+class TestImageContext:
+    """ImageContext 테스트"""
+
+    def test_view_gray_is_zero_copy_slice(self, section):
+        ctx = ImageContext(section)
+        view = ctx.view(100, 300, 20, 200)
+
+        expected = cv2.cvtColor(section[100:300, 20:200], cv2.COLOR_BGR2GRAY)
+        np.testing.assert_array_equal(view.gray, expected)
+        assert np.shares_memory(view.image, section)
+        assert np.shares_memory(view.gray, ctx.gray)
+
+    def test_binary_memoized_per_region(self, section):
+        ctx = ImageContext(section)
+        view = ctx.view(100, 300)
+
+        assert ctx.otsu_binary() is ctx.otsu_binary()
+        # Otsu 임계값은 영역마다 다르므로 view는 자기 영역으로 다시 계산
+        gray = cv2.cvtColor(section[100:300], cv2.COLOR_BGR2GRAY)
+        expected = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1]
+        np.testing.assert_array_equal(view.otsu_binary(), expected)
+
+    def test_memo_computes_once(self):
+        ctx = as_context(np.zeros((4, 4), dtype=np.uint8))
+        calls = []
+        for _ in range(3):
+            ctx.memo("key", lambda: calls.append(1))
+        assert len(calls) == 1
+        assert as_context(ctx) is ctx
+
+
+class TestSegmentRowsWithContext:
+    """segment_rows의 context 입력 / Row view 테스트"""
+
+    def test_same_rows_as_array_input(self, section):
+        from_array = row_segmentation.segment_rows(section, min_line_length_ratio=0.3)
+        from_context = row_segmentation.segment_rows(ImageContext(section), min_line_length_ratio=0.3)
+
+        assert [(r.y_start, r.y_end) for r in from_context.rows] == [(r.y_start, r.y_end) for r in from_array.rows]
+        np.testing.assert_array_equal(from_context.y_profile, from_array.y_profile)
+
+    def test_rows_are_views_with_context(self, section):
+        result = row_segmentation.segment_rows(section, min_line_length_ratio=0.3)
+
+        for row in result.rows:
+            assert np.shares_memory(row.row_image, section)
+            assert row.context.image is row.row_image
+            np.testing.assert_array_equal(row.context.gray, cv2.cvtColor(row.row_image, cv2.COLOR_BGR2GRAY))
@@ -0,0 +1,233 @@
+"""
+tests/test_profile_analysis.py - profile_analysis 벡터화 구현 동등성 테스트
+
+row_segmentation / sub_question_segmentation / find_answer_section에 있던
+스칼라 루프 구현(기준 구현)과 profile_analysis 결과가 같은지 임의 profile로 비교합니다.
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+# answer_recog 디렉토리를 path에 추가
+# (패키지 __init__은 PaddleOCR을 import하므로 모듈을 직접 import)
+ANSWER_RECOG_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ANSWER_RECOG_DIR)
+
+import profile_analysis
+
+SAMPLE_IMAGES = [
+    os.path.join(ANSWER_RECOG_DIR, "test_output", "module_test", "m3_answer_section.jpg"),
+    os.path.join(ANSWER_RECOG_DIR, "test_output", "pipeline_final", "01_answer_section.jpg"),
+    os.path.join(ANSWER_RECOG_DIR, "test_output", "pipeline_test", "01_answer_section.jpg"),
+]
+
+
+# =============================================================================
+# 기준 구현 (벡터화 이전 루프)
+# =============================================================================
+
+def _ref_find_peaks(profile, min_distance, min_height_ratio):
+    if len(profile) < 3:
+        return []
+    min_height = profile.max() * min_height_ratio
+    peaks = []
+    for i in range(1, len(profile) - 1):
+        if profile[i] >= profile[i-1] and profile[i] >= profile[i+1]:
+            if profile[i] >= min_height:
+                if len(peaks) == 0 or i - peaks[-1] >= min_distance:
+                    peaks.append(i)
+                elif profile[i] > profile[peaks[-1]]:
+                    peaks[-1] = i
+    return peaks
+
+
+def _ref_find_peaks_simple(arr, min_distance):
+    peaks = []
+    for i in range(1, len(arr) - 1):
+        if arr[i] > arr[i-1] and arr[i] > arr[i+1]:
+            if len(peaks) == 0 or i - peaks[-1] >= min_distance:
+                peaks.append(i)
+    return peaks
+
+
+def _ref_find_valleys(profile, peaks):
+    if len(peaks) < 2:
+        return [], []
+    valleys, depths = [], []
+    for i in range(len(peaks) - 1):
+        y_start, y_end = peaks[i], peaks[i + 1]
+        valley_y = y_start + np.argmin(profile[y_start:y_end+1])
+        peak_min = min(profile[y_start], profile[y_end])
+        valleys.append(valley_y)
+        depths.append(profile[valley_y] / peak_min if peak_min > 0 else 1.0)
+    return valleys, depths
+
+
+def _ref_vertical_line_peaks(x_profile, min_height, min_prominence, max_width):
+    n = len(x_profile)
+    peaks = []
+    for i in range(1, n - 1):
+        if x_profile[i] > x_profile[i-1] and x_profile[i] > x_profile[i+1]:
+            if x_profile[i] < min_height:
+                continue
+            half_height = x_profile[i] / 2
+            left = right = i
+            while left > 0 and x_profile[left] > half_height:
+                left -= 1
+            while right < n - 1 and x_profile[right] > half_height:
+                right += 1
+            search_range = min(50, i, n - i - 1)
+            local_min_left = min(x_profile[max(0, i-search_range):i])
+            local_min_right = min(x_profile[i+1:min(n, i+1+search_range)])
+            prominence = x_profile[i] - max(local_min_left, local_min_right)
+            if right - left <= max_width and prominence >= min_prominence:
+                peaks.append(i)
+    return peaks
+
+
+def _ref_line_separators(y_projection, threshold, min_row_height):
+    h = len(y_projection)
+    separators = []
+    in_line = False
+    line_start = 0
+    for y in range(h):
+        if y_projection[y] >= threshold:
+            if not in_line:
+                in_line = True
+                line_start = y
+        elif in_line:
+            in_line = False
+            line_center = (line_start + y) // 2
+            if len(separators) == 0 or line_center - separators[-1] >= min_row_height:
+                separators.append(line_center)
+            else:
+                separators[-1] = (separators[-1] + line_center) // 2
+    if in_line:
+        line_center = (line_start + h) // 2
+        if len(separators) == 0 or line_center - separators[-1] >= min_row_height:
+            separators.append(line_center)
+    return separators
+
+
+def _ref_row_separators_morphological(image, min_line_length_ratio, min_row_height):
+    """find_row_separators_morphological 기준 구현 (전처리는 본 구현과 동일)"""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    h, w = gray.shape[:2]
+    binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 31, 10)
+    open_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (int(w * 0.2), 1))
+    opened = cv2.morphologyEx(binary, cv2.MORPH_OPEN, open_kernel, iterations=1)
+    dilate_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (int(w * 0.05), 1))
+    dilated = cv2.dilate(opened, dilate_kernel, iterations=2)
+    y_projection = np.sum(dilated, axis=1) / 255
+    return _ref_line_separators(y_projection, w * min_line_length_ratio, min_row_height)
+
+
+def _profiles(seed=0, count=30):
+    """plateau(동일값)가 많은 정수형 profile과 연속값 profile을 섞어서 생성"""
+    rng = np.random.default_rng(seed)
+    for k in range(count):
+        n = int(rng.integers(3, 400))
+        if k % 2 == 0:
+            yield rng.integers(0, 5, n).astype(np.float32)
+        else:
+            yield rng.random(n).astype(np.float32)
+
+
+# =============================================================================
+# 테스트
+# =============================================================================
+
+class TestFindRuns:
+    """find_runs / find_row_runs 테스트"""
+
+    def test_runs_touching_edges(self):
+        starts, ends = profile_analysis.find_runs(np.array([1, 1, 0, 1, 0, 0, 1, 1], dtype=bool))
+        assert starts.tolist() == [0, 3, 6]
+        assert ends.tolist() == [2, 4, 8]
+
+    def test_row_runs(self):
+        mask = np.array([[0, 1, 1, 0], [1, 1, 1, 1], [0, 0, 0, 0]], dtype=bool)
+        rows, starts, ends = profile_analysis.find_row_runs(mask)
+        assert list(zip(rows.tolist(), starts.tolist(), ends.tolist())) == [(0, 1, 3), (1, 0, 4)]
+
+    @pytest.mark.parametrize("min_line_length_ratio,min_row_height", [(0.6, 30), (0.3, 5)])
+    def test_row_separators_match_reference(self, min_line_length_ratio, min_row_height):
+        import row_segmentation
+
+        for path in SAMPLE_IMAGES:
+            image = cv2.imread(path)
+            assert row_segmentation.find_row_separators_morphological(
+                image, min_line_length_ratio, min_row_height
+            ) == _ref_row_separators_morphological(image, min_line_length_ratio, min_row_height)
+
+
+    def test_row_separator_at_bottom_edge_not_merged(self):
+        import row_segmentation
+
+        # 맨 아래까지 이어진 선이 이전 선과 가까우면 병합하지 않고 버림
+        image = np.full((200, 300, 3), 255, dtype=np.uint8)
+        for y in (50, 184):
+            image[y:y + 4] = 0
+        image[196:] = 0
+
+        separators = row_segmentation.find_row_separators_morphological(image, 0.6, 30)
+        assert separators == _ref_row_separators_morphological(image, 0.6, 30)
+        assert len(separators) == 2
+
+
+class TestPeaks:
+    """find_peaks / suppress_close_peaks 테스트"""
+
+    @pytest.mark.parametrize("min_distance,min_height_ratio", [(1, 0.0), (10, 0.1), (20, 0.05)])
+    def test_find_peaks_matches_reference(self, min_distance, min_height_ratio):
+        for profile in _profiles():
+            assert profile_analysis.find_peaks(profile, min_distance, min_height_ratio) == \
+                _ref_find_peaks(profile, min_distance, min_height_ratio)
+
+    @pytest.mark.parametrize("min_distance", [1, 10])
+    def test_simple_peaks_matches_reference(self, min_distance):
+        for profile in _profiles(seed=2):
+            candidates = profile_analysis.local_maxima(profile, strict=True)
+            assert profile_analysis.suppress_close_peaks(profile, candidates, min_distance, keep_higher=False) == \
+                _ref_find_peaks_simple(profile, min_distance)
+
+    def test_short_profile(self):
+        assert profile_analysis.find_peaks(np.array([1.0, 2.0])) == []
+
+
+class TestValleys:
+    """find_valleys_between_peaks 테스트"""
+
+    def test_matches_reference(self):
+        for profile in _profiles(seed=3):
+            peaks = _ref_find_peaks(profile, 5, 0.1)
+            valleys, depths = profile_analysis.find_valleys_between_peaks(profile, peaks)
+            ref_valleys, ref_depths = _ref_find_valleys(profile, peaks)
+            assert valleys == ref_valleys
+            assert depths == ref_depths
+
+    def test_zero_peak_depth_is_one(self):
+        profile = np.array([0, 0, 0, 5, 1, 5], dtype=np.float32)
+        assert profile_analysis.find_valleys_between_peaks(profile, [1, 3, 5]) == ([1, 4], [1.0, pytest.approx(0.2)])
+
+
+class TestVerticalLinePeaks:
+    """peak_half_widths / peak_prominences (find_vertical_line_peaks) 테스트"""
+
+    @pytest.mark.parametrize("min_height,min_prominence,max_width", [(0.3, 0.1, 30), (0.2, 0.05, 50), (0.0, 0.0, 2)])
+    def test_matches_reference(self, min_height, min_prominence, max_width):
+        for profile in _profiles(seed=4):
+            profile = profile / max(1.0, float(profile.max()))
+            candidates = profile_analysis.local_maxima(profile, strict=True)
+            candidates = candidates[profile[candidates] >= min_height]
+            widths = profile_analysis.peak_half_widths(profile, candidates, max_width)
+            prominences = profile_analysis.peak_prominences(profile, candidates, window=50)
+            keep = (widths <= max_width) & (prominences >= min_prominence)
+
+            assert candidates[keep].tolist() == \
+                _ref_vertical_line_peaks(profile, min_height, min_prominence, max_width)
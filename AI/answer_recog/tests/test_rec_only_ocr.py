@@ -0,0 +1,145 @@
+"""
+tests/test_rec_only_ocr.py - 인식 전용(rec_only) Row OCR 경로 테스트
+
+실제 PaddleX 모델 대신 입력 이미지를 기록하는 가짜 인식 모델을 사용합니다.
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+# AI 디렉토리를 path에 추가 (answer_recog 패키지 / id_recog.ocr 사용)
+AI_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, AI_DIR)
+
+from answer_recog import answer_extraction
+from answer_recog.pipeline import AnswerRecognitionPipeline, PipelineConfig
+from answer_recog.schemas import ScoringType
+
+
+class _FakeResult:
+    def __init__(self, text, score):
+        self.json = {"res": {"rec_text": text, "rec_score": score}}
+
+
+class FakeRecModel:
+    """PP-OCRv5_mobile_rec 대역 (predict 입력 shape 기록)"""
+
+    def __init__(self, text="3", score=0.95):
+        self.text = text
+        self.score = score
+        self.inputs = []
+
+    def predict(self, x, batch_size=1):
+        self.inputs.append(x)
+        if isinstance(x, list):
+            return [_FakeResult(f"{self.text}{img.shape[1]}", self.score) for img in x]
+        return [_FakeResult(self.text, self.score)]
+
+
+def _row_with_digit(h=60, w=400, x=180):
+    row = np.full((h, w, 3), 255, dtype=np.uint8)
+    cv2.putText(row, "3", (x, h - 15), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 3)
+    return row
+
+
+class TestExtractTextFromRowRec:
+    """extract_text_from_row_rec 테스트"""
+
+    def test_tighten_roi_crops_blank_margin(self):
+        model = FakeRecModel()
+        text, conf = answer_extraction.extract_text_from_row_rec(_row_with_digit(), model)
+
+        assert (text, conf) == ("3", pytest.approx(0.95))
+        fed = model.inputs[0]
+        assert fed.ndim == 3 and fed.shape[2] == 3
+        assert fed.shape[1] < 400
+
+    def test_without_tighten_uses_whole_row(self):
+        model = FakeRecModel()
+        answer_extraction.extract_text_from_row_rec(_row_with_digit(), model, tighten_roi=False)
+        # 인식 모델 입력 높이로 정규화 (비율 유지)
+        assert model.inputs[0].shape[:2] == (48, 320)
+
+    def test_blank_row_falls_back_to_whole_row(self):
+        model = FakeRecModel(text="", score=0.0)
+        blank = np.full((60, 400, 3), 255, dtype=np.uint8)
+        assert answer_extraction.extract_text_from_row_rec(blank, model) == ("", 0.0)
+        assert model.inputs[0].shape[:2] == (48, 320)
+
+
+class TestExtractTextsFromRowsRec:
+    """extract_texts_from_rows_rec 배치 인식 테스트"""
+
+    def test_results_follow_input_order(self):
+        model = FakeRecModel()
+        rows = [_row_with_digit(w=w, x=w // 2) for w in (300, 900, 400, 1200)]
+        rows.insert(2, np.zeros((0, 0, 3), dtype=np.uint8))
+
+        results = answer_extraction.extract_texts_from_rows_rec(rows, model, tighten_roi=False)
+
+        # 빈 Row는 모델에 보내지 않고 ("", 0.0)
+        assert [text for text, _ in results] == ["3240", "3720", "", "3320", "3960"]
+        assert all(img.shape[0] == 48 for batch in model.inputs for img in batch)
+
+    def test_batch_size_limits_call_size(self):
+        model = FakeRecModel()
+        rows = [_row_with_digit() for _ in range(5)]
+
+        answer_extraction.extract_texts_from_rows_rec(rows, model, batch_size=2)
+        assert [len(batch) for batch in model.inputs] == [2, 2, 1]
+
+
+class TestPipelineOcrMode:
+    """PipelineConfig.ocr_mode 분기 테스트"""
+
+    def test_rec_only_uses_loaded_model(self, monkeypatch):
+        # full 모드 PaddleOCR이 로드되면 실패하도록
+        monkeypatch.setattr(answer_extraction, "get_ocr_model", lambda: pytest.fail("PaddleOCR loaded"))
+        model = FakeRecModel(text="a", score=0.9)
+        pipeline = AnswerRecognitionPipeline(ocr_model=model, config=PipelineConfig())
+
+        answer, conf, meta = pipeline._extract_answer_by_type(_row_with_digit(), ScoringType.OBJECTIVE)
+
+        assert (answer, meta["ocr_mode"]) == ("a", "rec_only")
+        assert len(model.inputs) == 1
+
+    def test_sheet_rows_recognized_in_one_call(self):
+        from answer_recog.schemas import AnswerSheetMeta, QuestionMeta
+        from answer_recog.row_segmentation import RowSegment
+
+        questions = [
+            QuestionMeta(question_number=1, scoring_type=ScoringType.OBJECTIVE),
+            QuestionMeta(question_number=2, scoring_type=ScoringType.BINARY),
+            QuestionMeta(question_number=3, sub_question_count=2, scoring_type=ScoringType.SHORT_ANSWER),
+        ]
+        metadata = AnswerSheetMeta(exam_code="T", questions=questions)
+        widths = (300, 400, 500, 600)
+        rows = [
+            RowSegment(row_number=i, y_start=0, y_end=60, row_image=_row_with_digit(w=w, x=w // 2))
+            for i, w in enumerate(widths)
+        ]
+        model = FakeRecModel(score=0.9)
+        pipeline = AnswerRecognitionPipeline(ocr_model=model, config=PipelineConfig(ocr_tighten_roi=False))
+
+        results = pipeline._extract_answers_with_metadata(rows, metadata)
+
+        assert len(model.inputs) == 1 and len(model.inputs[0]) == 3
+        keyed = {(r.question_number, r.sub_question_number): r for r in results}
+        assert keyed[(1, None)].meta["raw_ocr_text"] == "3240"
+        assert keyed[(2, None)].meta["mark_type"] == "check"
+        assert keyed[(3, 1)].meta["raw_ocr_text"] == "3400"
+        assert keyed[(3, 2)].meta["raw_ocr_text"] == "3480"
+
+    def test_full_mode_without_model(self, monkeypatch):
+        import answer_recog.pipeline as pipeline_module
+
+        monkeypatch.setattr(pipeline_module, "extract_text_from_row", lambda img: ("b", 0.8))
+        pipeline = AnswerRecognitionPipeline(ocr_model=None, config=PipelineConfig())
+
+        answer, _, meta = pipeline._extract_answer_by_type(_row_with_digit(), ScoringType.OBJECTIVE)
+        assert (answer, meta["ocr_mode"]) == ("b", "full")
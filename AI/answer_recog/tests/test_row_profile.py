@@ -0,0 +1,87 @@
+"""
+tests/test_row_profile.py - compute_horizontal_lines_profile 벡터화 회귀 테스트
+
+기존 행 단위 run-length 루프 구현과 벡터화 구현의 y-profile이 완전히 같은지
+저장된 샘플 시험지(test_output)와 임의 마스크로 비교합니다.
+"""
+
+import sys
+import os
+import glob
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+# answer_recog 디렉토리를 path에 추가
+# (패키지 __init__은 PaddleOCR을 import하므로 모듈을 직접 import)
+ANSWER_RECOG_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ANSWER_RECOG_DIR)
+
+import row_segmentation
+from row_segmentation import compute_horizontal_lines_profile
+
+SAMPLE_IMAGES = sorted(
+    glob.glob(os.path.join(ANSWER_RECOG_DIR, "test_output", "module_test", "m*_table_crop.jpg"))
+    + glob.glob(os.path.join(ANSWER_RECOG_DIR, "test_output", "module_test", "m3_answer_section.jpg"))
+    + glob.glob(os.path.join(ANSWER_RECOG_DIR, "test_output", "pipeline_*", "01_answer_section.jpg"))
+    + glob.glob(os.path.join(ANSWER_RECOG_DIR, "test_output", "pipeline_test", "02_row_0[1-3].jpg"))
+)
+
+
+def _reference_filter(horizontal_lines: np.ndarray, min_line_width: int) -> np.ndarray:
+    """벡터화 이전의 행 단위 run-length 루프 (기준 구현)"""
+    h, w = horizontal_lines.shape
+    filtered_lines = np.zeros_like(horizontal_lines)
+    for y in range(h):
+        row = horizontal_lines[y, :]
+        in_segment = False
+        seg_start = 0
+        for x in range(w + 1):
+            is_white = x < w and row[x] > 0
+            if is_white and not in_segment:
+                seg_start = x
+                in_segment = True
+            elif not is_white and in_segment:
+                if x - seg_start >= min_line_width:
+                    filtered_lines[y, seg_start:x] = 255
+                in_segment = False
+    return np.sum(filtered_lines, axis=1).astype(np.float32)
+
+
+def _reference_profile(image: np.ndarray, min_line_width_ratio: float = 0.5) -> np.ndarray:
+    """기준 구현으로 계산한 y-profile (전처리는 본 구현과 동일)"""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    h, w = binary.shape
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (max(w // 30, 15), 1))
+    horizontal_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=2)
+    return _reference_filter(horizontal_lines, int(w * min_line_width_ratio))
+
+
+class TestHorizontalLinesProfile:
+    """compute_horizontal_lines_profile 테스트"""
+
+    @pytest.mark.parametrize("path", SAMPLE_IMAGES, ids=lambda p: os.path.relpath(p, ANSWER_RECOG_DIR))
+    @pytest.mark.parametrize("ratio", [0.5, 0.2])
+    def test_matches_reference_on_samples(self, path, ratio):
+        image = cv2.imread(path)
+
+        profile = compute_horizontal_lines_profile(image, min_line_width_ratio=ratio)
+
+        assert profile.dtype == np.float32
+        np.testing.assert_array_equal(profile, _reference_profile(image, ratio))
+
+    def test_matches_reference_on_random_masks(self, monkeypatch):
+        # morphology를 통과시켜 임의 마스크의 세그먼트 경계(양 끝 포함)를 그대로 검증
+        monkeypatch.setattr(row_segmentation.cv2, "morphologyEx", lambda src, *args, **kwargs: src)
+        rng = np.random.default_rng(0)
+        for w, min_width in [(40, 1), (40, 7), (63, 20), (1, 0)]:
+            mask = (rng.random((30, w)) < 0.7).astype(np.uint8) * 255
+            gray = 255 - mask  # THRESH_BINARY_INV 후 mask가 되도록 반전
+            ratio = min_width / w
+
+            profile = compute_horizontal_lines_profile(gray, min_line_width_ratio=ratio)
+
+            np.testing.assert_array_equal(profile, _reference_filter(mask, int(w * ratio)))
@@ -15,6 +15,10 @@ import os
 import sys
 import io
 import json
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -26,7 +30,7 @@ load_dotenv()
 import numpy as np
 from PIL import Image
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
 import cv2
 
@@ -44,6 +48,7 @@ sys.path.insert(0, CURRENT_DIR)
 class ModelStore:
     """전역 모델 저장소"""
     layout_model = None
+    layout_batcher = None
     ocr_model = None
     vlm_client = None
     s3_manager = None
@@ -53,37 +58,109 @@ class ModelStore:
     # 답안 인식용
     answer_pipeline = None
     fallback_store = None
+    
+    # 멀티프로세스 추론 서버 (INFERENCE_WORKERS_* > 0일 때만)
+    inference_servers = []
+    
+    # 시작 준비 상태: 단계 이름 → loading / ok / failed / skipped
+    startup_thread = None
+    startup_status: Dict[str, str] = {}
+    ready = False
+    shutting_down = False
+
+
+def load_paddlex_model(model_name: str, workers_env: str):
+    """
+    PaddleX 모델 로드
+    
+    workers_env 환경변수가 1 이상이면 모델 사본을 가진 워커 프로세스 풀(InferenceServer)을 띄우고
+    같은 predict 인터페이스의 RemoteModel을 반환합니다. (0이면 기존처럼 현재 프로세스에 로드)
+    """
+    num_workers = int(os.environ.get(workers_env, "0"))
+    if num_workers <= 0:
+        from paddlex import create_model
+        return create_model(model_name=model_name)
+    
+    from id_recog.inference_server import InferenceServer, RemoteModel
+    server = InferenceServer(
+        model_name,
+        num_workers=num_workers,
+        request_timeout_s=float(os.environ.get("INFERENCE_TIMEOUT_S", "120"))
+    )
+    if not server.start(timeout=float(os.environ.get("INFERENCE_START_TIMEOUT_S", "300"))):
+        server.stop()
+        raise RuntimeError(f"{model_name} 추론 워커 준비 실패")
+    ModelStore.inference_servers.append(server)
+    print(f"  ✓ {model_name} 추론 서버 시작 (workers={num_workers})")
+    return RemoteModel(server)
 
 
 # =============================================================================
-# Lifespan (모델 로드 및 SQS Worker 시작)
+# 시작 단계 (모델 로드 → warm-up → S3 / SQS Worker)
 # =============================================================================
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """애플리케이션 시작 시 모델을 로드하고 SQS Worker를 시작합니다."""
-    print("=" * 60)
-    print("AI 통합 서버 시작 - 모델 로딩...")
-    print("=" * 60)
-    
-    # 1. PP-DocLayout_plus-L 모델 로드
+# 단계 상태 (/ready)
+STATUS_LOADING = "loading"
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+
+def _set_status(step: str, status: str):
+    ModelStore.startup_status[step] = status
+
+
+def _load_layout_model():
+    """PP-DocLayout_plus-L 모델 로드 (+ 마이크로 배처)"""
+    _set_status("layoutModel", STATUS_LOADING)
     print("[1/4] PP-DocLayout_plus-L 모델 로딩...")
     try:
-        from paddlex import create_model
-        ModelStore.layout_model = create_model(model_name="PP-DocLayout_plus-L")
+        ModelStore.layout_model = load_paddlex_model("PP-DocLayout_plus-L", "INFERENCE_WORKERS_LAYOUT")
         print("  ✓ Layout 모델 로드 완료")
+        _set_status("layoutModel", STATUS_OK)
+        
+        # 레이아웃 입력만 축소 (긴 변 픽셀 수 또는 A4 기준 목표 DPI, 결과 좌표는 원본 크기로 복원)
+        from id_recog.image_decode import max_side_for_dpi
+        from id_recog.layout import set_layout_max_side
+        layout_max_side = int(os.environ.get("LAYOUT_MAX_SIDE") or 0) or None
+        layout_target_dpi = int(os.environ.get("LAYOUT_TARGET_DPI") or 0)
+        if layout_max_side is None and layout_target_dpi:
+            layout_max_side = max_side_for_dpi(layout_target_dpi)
+        set_layout_max_side(layout_max_side)
+        if layout_max_side:
+            print(f"  ✓ Layout 입력 축소 (긴 변 ≤ {layout_max_side}px)")
+        
+        # 레이아웃 마이크로 배치 (여러 워커 스레드의 요청을 모아 한 번에 추론)
+        layout_batch_size = int(os.environ.get("LAYOUT_BATCH_SIZE", "1"))
+        if layout_batch_size > 1:
+            from id_recog.layout_batcher import LayoutMicroBatcher
+            ModelStore.layout_batcher = LayoutMicroBatcher(
+                ModelStore.layout_model,
+                max_batch=layout_batch_size,
+                max_wait_ms=float(os.environ.get("LAYOUT_BATCH_WAIT_MS", "50"))
+            )
+            ModelStore.layout_batcher.start()
+            print(f"  ✓ Layout 마이크로 배치 활성화 (batch={layout_batch_size})")
     except Exception as e:
         print(f"  ✗ Layout 모델 로드 실패: {e}")
-    
-    # 2. PP-OCRv5_mobile_rec 모델 로드
+        _set_status("layoutModel", STATUS_FAILED)
+
+
+def _load_ocr_model():
+    """PP-OCRv5_mobile_rec 모델 로드"""
+    _set_status("ocrModel", STATUS_LOADING)
     print("[2/4] PP-OCRv5_mobile_rec 모델 로딩...")
     try:
-        from paddlex import create_model
-        ModelStore.ocr_model = create_model(model_name="PP-OCRv5_mobile_rec")
+        ModelStore.ocr_model = load_paddlex_model("PP-OCRv5_mobile_rec", "INFERENCE_WORKERS_OCR")
         print("  ✓ PP-OCRv5 OCR 모델 로드 완료")
+        _set_status("ocrModel", STATUS_OK)
     except Exception as e:
         print(f"  ✗ PP-OCRv5 OCR 모델 로드 실패: {e}")
-    
-    # 3. VLM Client (OpenAI)
+        _set_status("ocrModel", STATUS_FAILED)
+
+
+def _init_vlm_client():
+    """VLM Client (OpenAI) 설정"""
+    _set_status("vlmClient", STATUS_LOADING)
     print("[3/4] VLM Client 설정...")
     api_key = os.environ.get("OPENAI_API_KEY")
     if api_key:
@@ -91,14 +168,20 @@ async def lifespan(app: FastAPI):
             from openai import OpenAI
             ModelStore.vlm_client = OpenAI(api_key=api_key)
             print("  ✓ VLM Client 설정 완료")
+            _set_status("vlmClient", STATUS_OK)
         except Exception as e:
             print(f"  ✗ VLM Client 설정 실패: {e}")
             ModelStore.vlm_client = None
+            _set_status("vlmClient", STATUS_FAILED)
     else:
         print("  - OPENAI_API_KEY 없음, VLM fallback 비활성화")
         ModelStore.vlm_client = None
-    
-    # 4. Answer Recognition Pipeline
+        _set_status("vlmClient", STATUS_SKIPPED)
+
+
+def _init_answer_pipeline():
+    """Answer Recognition Pipeline 초기화 (Layout / OCR 모델 로드 후)"""
+    _set_status("answerPipeline", STATUS_LOADING)
     print("[4/4] Answer Recognition Pipeline 초기화...")
     try:
         from answer_recog.pipeline import AnswerRecognitionPipeline, PipelineConfig
@@ -106,7 +189,9 @@ async def lifespan(app: FastAPI):
         
         config = PipelineConfig(
             debug_mode=os.environ.get("DEBUG_MODE", "").lower() == "true",
-            debug_output_dir=os.path.join(CURRENT_DIR, "debug_output")
+            debug_output_dir=os.path.join(CURRENT_DIR, "debug_output"),
+            ocr_mode=os.environ.get("ANSWER_OCR_MODE", "rec_only"),
+            ocr_tighten_roi=os.environ.get("ANSWER_OCR_TIGHTEN_ROI", "true").lower() == "true"
         )
         
         ModelStore.answer_pipeline = AnswerRecognitionPipeline(
@@ -116,16 +201,48 @@ async def lifespan(app: FastAPI):
         )
         ModelStore.fallback_store = get_fallback_store()
         print("  ✓ Answer Recognition Pipeline 초기화 완료")
+        _set_status("answerPipeline", STATUS_OK)
     except Exception as e:
         print(f"  ✗ Answer Recognition Pipeline 초기화 실패: {e}")
+        _set_status("answerPipeline", STATUS_FAILED)
         import traceback
         traceback.print_exc()
+
+
+def _warm_up_models():
+    """내장 warm-up 이미지로 각 모델을 한 번씩 추론 (첫 요청 지연 제거)"""
+    print("[WARMUP] 모델 warm-up...")
+    from id_recog.warmup import load_warmup_image, digit_row, warm_up_layout, warm_up_ocr
     
-    print("=" * 60)
-    print("모델 로딩 완료!")
-    print("=" * 60)
+    image = load_warmup_image()
+    # 레이아웃 / OCR warm-up은 서로 독립 → 병렬
+    model_steps = []
+    if ModelStore.layout_model is not None:
+        model_steps.append(("layoutWarmup", lambda: warm_up_layout(ModelStore.layout_model, image)))
+    if ModelStore.ocr_model is not None:
+        model_steps.append(("ocrWarmup", lambda: warm_up_ocr(ModelStore.ocr_model, image)))
     
-    # 5. S3 클라이언트 초기화
+    def run(step: str, fn) -> None:
+        _set_status(step, STATUS_LOADING)
+        start = time.perf_counter()
+        try:
+            fn()
+            _set_status(step, STATUS_OK)
+            print(f"  ✓ {step} 완료 ({time.perf_counter() - start:.2f}s)")
+        except Exception as e:
+            _set_status(step, STATUS_FAILED)
+            print(f"  ✗ {step} 실패: {e}")
+    
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="Warmup") as pool:
+        list(pool.map(lambda step: run(*step), model_steps))
+    
+    # 답안 파이프라인은 OCR 모델을 다시 쓰므로 마지막에 (full 모드면 여기서 PaddleOCR 로드)
+    if ModelStore.answer_pipeline is not None:
+        run("answerPipelineWarmup", lambda: ModelStore.answer_pipeline.warm_up(digit_row(image)))
+
+
+def _init_s3_client():
+    """S3 클라이언트 초기화"""
     print("\n[S3] S3 클라이언트 초기화...")
     try:
         from id_recog.s3_client import get_s3_manager
@@ -137,11 +254,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"  ✗ S3 클라이언트 초기화 실패: {e}")
         ModelStore.s3_manager = None
-    
-    # 6. SQS Worker 초기화 및 시작
+
+
+def _init_sqs_workers():
+    """SQS Worker 초기화 및 시작 (실패 시 sqsWorker 단계 failed → /ready 503)"""
     print("\n[SQS] SQS Worker 초기화...")
+    _set_status("sqsWorker", STATUS_LOADING)
     try:
         from id_recog.sqs_worker import init_sqs_worker
+        from id_recog.http_client import HttpClientConfig, configure_http_client
         from id_recog.schemas import Config
         from id_recog.student_id_pipeline import extract_student_id
         
@@ -155,6 +276,25 @@ async def lifespan(app: FastAPI):
         region = os.environ.get("AWS_DEFAULT_REGION", "ap-northeast-2")
         bucket = os.environ.get("S3_BUCKET", "mlpa-gradi")
         
+        # 병렬 처리 설정 (1이면 기존 단일 스레드 루프)
+        worker_concurrency = int(os.environ.get("SQS_WORKER_CONCURRENCY", "1"))
+        max_messages_per_poll = int(os.environ.get("SQS_MAX_MESSAGES", "10"))
+        # 큐 상태(/health) 샘플링 주기 (초, 0이면 비활성)
+        queue_stats_interval = float(os.environ.get("SQS_QUEUE_STATS_INTERVAL", "30"))
+        # 다운로드 prefetch / 업로드 I/O 스레드 수 (0이면 순차 처리)
+        io_workers = int(os.environ.get("SQS_IO_WORKERS", "0"))
+        # 배치 답안 인식 추론 스레드 수 (1이면 기존 순차 처리)
+        batch_concurrency = int(os.environ.get("ANSWER_BATCH_CONCURRENCY", "1"))
+        # 배치 manifest 로컬 저장 경로 (미설정 시 S3 batch_manifest/{examCode}.json)
+        manifest_dir = os.environ.get("ANSWER_BATCH_MANIFEST_DIR") or None
+        
+        # presigned URL 다운로드 연결 풀 (keep-alive 연결 수 ≥ 동시 다운로드 스레드 수)
+        default_pool_size = max(16, worker_concurrency + io_workers + batch_concurrency)
+        configure_http_client(HttpClientConfig(
+            pool_maxsize=int(os.environ.get("HTTP_POOL_MAXSIZE") or default_pool_size),
+            max_retries=int(os.environ.get("HTTP_MAX_RETRIES", "3"))
+        ))
+        
         if queue_url and aws_key and aws_secret:
             # 1. 메인 워커 (학번/답안 인식 전용)
             worker = init_sqs_worker(
@@ -164,7 +304,13 @@ async def lifespan(app: FastAPI):
                 region_name=region,
                 s3_bucket=bucket,
                 result_queue_url=result_queue_url,
-                fallback_queue_url=fallback_queue_url
+                fallback_queue_url=fallback_queue_url,
+                max_workers=worker_concurrency,
+                max_messages_per_poll=max_messages_per_poll,
+                queue_stats_interval=queue_stats_interval,
+                io_workers=io_workers,
+                batch_concurrency=batch_concurrency,
+                manifest_dir=manifest_dir
             )
             
             # 2. 출석부 전용 워커 (있을 경우)
@@ -196,36 +342,67 @@ async def lifespan(app: FastAPI):
                 print(f"  ✓ 출석부 전용 워커 시작됨 (Callback 설정 완료)")
             
             # 학번 추출 콜백 설정
-            def student_id_callback(image: np.ndarray, student_list: list) -> dict:
+            def student_id_callback(image: np.ndarray, student_list: list, exam_code: str = None) -> dict:
                 config = Config()
+                layout_boxes = None
+                if ModelStore.layout_batcher is not None:
+                    layout_boxes = ModelStore.layout_batcher.detect(image)
                 result = extract_student_id(
                     original_image=image,
                     student_id_list=student_list,
                     layout_model=ModelStore.layout_model,
                     ocr_model=ModelStore.ocr_model,
                     vlm_client=ModelStore.vlm_client,
-                    config=config
+                    config=config,
+                    layout_boxes=layout_boxes,
+                    template_key=exam_code  # 같은 시험 = 같은 양식 → 학번 위치 적중률 공유
                 )
                 return {
                     "student_id": result.student_id,
                     "header_image": result.header_image,
-                    "meta": result.meta
+                    "meta": result.meta,
+                    "layout_boxes": result.layout_boxes
                 }
             
             worker.set_student_id_callback(student_id_callback)
             
             # 답안 인식 콜백 설정
-            def answer_recognition_callback(image: np.ndarray, student_id: str, metadata_dict: dict, filename: str = "unknown.jpg") -> dict:
+            def answer_recognition_callback(
+                image: np.ndarray,
+                student_id: str,
+                metadata_dict: dict,
+                filename: str = "unknown.jpg",
+                defer_fallback_upload: bool = False,
+                exam_code: str = None
+            ) -> dict:
                 from answer_recog.schemas import AnswerSheetMeta
+                from id_recog.layout_cache import process_with_layout_cache
                 
                 metadata = AnswerSheetMeta.from_dict(metadata_dict)
-                result = ModelStore.answer_pipeline.process(image, metadata, student_id)
+                # 캐시 key는 워커가 넘긴 examCode (메타데이터 JSON에는 없을 수 있음)
+                exam_code = exam_code or metadata.exam_code
+                if not metadata.exam_code:
+                    metadata.exam_code = exam_code or ""
+                
+                # 학번 인식 단계의 레이아웃 결과 재사용 (layout 모델 재호출 방지)
+                sqs_worker = ModelStore.sqs_worker
+                result = process_with_layout_cache(
+                    ModelStore.answer_pipeline,
+                    sqs_worker.layout_cache if sqs_worker else None,
+                    image,
+                    metadata,
+                    student_id,
+                    exam_code,
+                    filename
+                )
                 
                 if not result.success:
                     print(f"  ✗ 답안 인식 실패: {result.error_message}")
                     return {"results": [], "fallback_rois": []}
                 
                 # Fallback 처리 (Low Confidence)
+                # defer_fallback_upload=True(배치)면 업로드 목록만 반환 → worker의 I/O 단계에서 업로드
+                fallback_rois = []
                 for res in result.results:
                     # 신뢰도가 낮거나 미채점이면 ROI 업로드 (필요 시)
                     is_low_conf = res.confidence < ModelStore.answer_pipeline.config.min_confidence
@@ -234,6 +411,10 @@ async def lifespan(app: FastAPI):
                         # User Request path: answer/{exam code}/{학번}/{문제 번호}/{꼬리문제 번호}/{파일명}
                         s3_key = f"answer/{metadata.exam_code}/{student_id}/{res.question_number}/{res.sub_question_number or 0}/{filename}"
                         
+                        if defer_fallback_upload:
+                            fallback_rois.append({"s3Key": s3_key, "image": res.roi_image, "result": res})
+                            continue
+                        
                         # S3 업로드 (sqs_worker의 메서드 활용)
                         success = ModelStore.sqs_worker.upload_image_to_s3(res.roi_image, s3_key)
                         if success:
@@ -241,31 +422,99 @@ async def lifespan(app: FastAPI):
                 
                 return {
                     "results": result.results,
-                    "fallback_rois": []  # sqs_worker에서 results를 순회하므로 빈 리스트 반환
+                    "fallback_rois": fallback_rois  # 즉시 업로드한 경우 빈 리스트 (sqs_worker에서 results를 순회)
                 }
             
             worker.set_answer_recognition_callback(answer_recognition_callback)
             
             worker.start()
             ModelStore.sqs_worker = worker
-            print(f"  ✓ SQS Worker 시작됨")
+            print(f"  ✓ SQS Worker 시작됨 (workers={worker_concurrency})")
             print(f"    - 입력 큐: {queue_url}")
             print(f"    - 결과 큐: {result_queue_url or queue_url}")
+            _set_status("sqsWorker", STATUS_OK)
         else:
             print("  - SQS 환경변수 미설정")
+            _set_status("sqsWorker", STATUS_SKIPPED)
     except Exception as e:
         print(f"  ✗ SQS Worker 초기화 실패: {e}")
+        _set_status("sqsWorker", STATUS_FAILED)
         import traceback
         traceback.print_exc()
+
+
+def _startup():
+    """
+    서버 시작 작업 (백그라운드 스레드)
+    
+    1. Layout / OCR 모델 로드와 VLM Client 설정을 동시에 진행
+    2. Answer Recognition Pipeline 초기화
+    3. warm-up (MODEL_WARMUP=false면 생략)
+    4. S3 / SQS Worker 시작 → 준비 완료 (/ready OK)
+    """
+    started = time.perf_counter()
+    print("=" * 60)
+    print("AI 통합 서버 시작 - 모델 로딩...")
+    print("=" * 60)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="ModelLoad") as pool:
+            for future in [pool.submit(fn) for fn in (_load_layout_model, _load_ocr_model, _init_vlm_client)]:
+                future.result()
+        _init_answer_pipeline()
+        
+        if os.environ.get("MODEL_WARMUP", "true").lower() == "true":
+            _warm_up_models()
+        
+        print("=" * 60)
+        print(f"모델 로딩 완료! ({time.perf_counter() - started:.1f}s)")
+        print("=" * 60)
+        
+        # 모델 로딩 중 종료가 시작됐으면 Worker를 띄우지 않음
+        if ModelStore.shutting_down:
+            return
+        _init_s3_client()
+        _init_sqs_workers()
+    except Exception as e:
+        print(f"  ✗ 서버 시작 작업 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return
+    
+    ModelStore.ready = all(
+        status in (STATUS_OK, STATUS_SKIPPED) for status in ModelStore.startup_status.values()
+    )
+    print(f"[READY] 준비 {'완료' if ModelStore.ready else '실패'}: {ModelStore.startup_status}")
+
+
+# =============================================================================
+# Lifespan (시작 작업 실행 및 종료 처리)
+# =============================================================================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 시작 시 모델 로드 / SQS Worker 시작을 백그라운드 스레드로 실행합니다.
+    
+    서버는 바로 요청을 받기 시작하고(/health), 모델 warm-up과 Worker 시작이 끝나면 /ready가 OK가 됩니다.
+    """
+    ModelStore.startup_thread = threading.Thread(target=_startup, daemon=True, name="Startup")
+    ModelStore.startup_thread.start()
     
     yield
     
     # Shutdown
     print("서버 종료...")
+    ModelStore.shutting_down = True
     if ModelStore.sqs_worker:
         ModelStore.sqs_worker.stop()
     if ModelStore.attendance_worker:
         ModelStore.attendance_worker.stop()
+    if ModelStore.layout_batcher:
+        ModelStore.layout_batcher.stop()
+    for server in ModelStore.inference_servers:
+        server.stop()
+    from id_recog.http_client import close_http_client
+    close_http_client()
 
 
 # =============================================================================
@@ -339,14 +588,34 @@ async def root():
     }
 
 
+@app.get("/ready")
+async def ready():
+    """
+    준비 상태 확인 (readiness probe)
+    
+    모델 로드 + warm-up + SQS Worker 시작이 모두 끝났으면 200, 아니면 503
+    """
+    return JSONResponse(
+        status_code=200 if ModelStore.ready else 503,
+        content={
+            "ready": ModelStore.ready,
+            "steps": dict(ModelStore.startup_status)
+        }
+    )
+
+
 @app.get("/health")
 async def health():
-    """서비스 상태 확인"""
+    """서비스 상태 확인 (모델 호출 없이 메모리 상태만 반환)"""
     worker_status = {}
     if ModelStore.sqs_worker:
         worker_status = {
             "running": ModelStore.sqs_worker.is_running,
-            "loadedExams": list(ModelStore.sqs_worker._student_id_lists.keys())
+            "loadedExams": list(ModelStore.sqs_worker._student_id_lists.keys()),
+            "queue": ModelStore.sqs_worker.get_queue_stats(),
+            "visibilityHeartbeat": ModelStore.sqs_worker.get_heartbeat_stats(),
+            "layoutCache": ModelStore.sqs_worker.get_layout_cache_stats(),
+            "batchJobs": ModelStore.sqs_worker.get_batch_progress()
         }
     
     att_worker_status = {}
@@ -357,16 +626,32 @@ async def health():
         }
     
     return {
+        "ready": ModelStore.ready,
         "layoutModel": ModelStore.layout_model is not None,
         "ocrModel": ModelStore.ocr_model is not None,
         "vlmClient": ModelStore.vlm_client is not None,
         "s3Client": ModelStore.s3_manager is not None and ModelStore.s3_manager.is_ready,
         "sqsWorker": worker_status,
         "attendanceWorker": att_worker_status,
-        "answerPipeline": ModelStore.answer_pipeline is not None
+        "answerPipeline": ModelStore.answer_pipeline is not None,
+        "inferenceServers": [server.get_stats() for server in ModelStore.inference_servers]
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """단계별 소요 시간 / 카운터 (Prometheus 텍스트 노출 형식)"""
+    from id_recog.metrics import REGISTRY
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/metrics/summary")
+async def metrics_summary():
+    """단계별 p50 / p95 / 최대 소요 시간 (최근 샘플 기준, ms)"""
+    from id_recog.metrics import REGISTRY
+    return REGISTRY.summary()
+
+
 # =============================================================================
 # Endpoints - 학번 인식
 # =============================================================================
@@ -542,16 +827,97 @@ async def start_answer_recognition(
     
     # 3. 배치 작업 시작 (Background)
     # process_batch_answer_recognition는 긴 작업이므로 백그라운드에서 실행
+    # job_id를 먼저 발급해 응답으로 반환 (진행 상황 조회용)
+    job = ModelStore.sqs_worker.create_batch_job(exam_code)
     background_tasks.add_task(
         ModelStore.sqs_worker.process_batch_answer_recognition,
         exam_code,
-        metadata
+        metadata,
+        job_id=job.job_id
     )
     
     return GenericResponse(
         success=True,
         message=f"답안 인식 배치 작업이 시작되었습니다. (Target: {exam_code})",
-        data={"examCode": exam_code}
+        data={"examCode": exam_code, "jobId": job.job_id}
+    )
+
+
+@app.post("/recognition/answer/resume/{exam_code}", response_model=GenericResponse)
+async def resume_answer_recognition(exam_code: str):
+    """
+    중단된 배치 답안 인식 재개
+    
+    - 저장된 manifest의 정답 메타데이터로 배치 처리를 다시 시작합니다.
+    - 같은 입력 ETag로 이미 처리된 시험지는 건너뛰고, 남은/실패한 시험지만 인식합니다.
+    """
+    if not ModelStore.sqs_worker:
+        raise HTTPException(status_code=503, detail="Worker가 초기화되지 않았습니다.")
+    
+    summary = ModelStore.sqs_worker.resume_batch_answer_recognition(exam_code)
+    if summary is None:
+        raise HTTPException(status_code=404, detail=f"저장된 배치 manifest가 없습니다: {exam_code}")
+    
+    return GenericResponse(
+        success=True,
+        message=f"답안 인식 배치 작업을 재개했습니다. (Target: {exam_code})",
+        data=summary
+    )
+
+
+def _get_batch_job_or_404(job_id: str):
+    if not ModelStore.sqs_worker:
+        raise HTTPException(status_code=503, detail="Worker가 초기화되지 않았습니다.")
+    job = ModelStore.sqs_worker.get_batch_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"배치 작업을 찾을 수 없습니다: {job_id}")
+    return job
+
+
+@app.get("/recognition/answer/jobs")
+async def list_answer_recognition_jobs():
+    """배치 답안 인식 작업 목록 (최근 순)"""
+    if not ModelStore.sqs_worker:
+        raise HTTPException(status_code=503, detail="Worker가 초기화되지 않았습니다.")
+    return {"jobs": ModelStore.sqs_worker.list_batch_jobs()}
+
+
+@app.get("/recognition/answer/jobs/{job_id}")
+async def get_answer_recognition_job(job_id: str):
+    """
+    배치 답안 인식 작업 진행 상황
+    
+    - discovered / processed / failed / skipped / fallbacks 카운터
+    - throughputPerMin, etaS (목록 순회가 끝난 뒤 계산)
+    - stages: download / infer / upload 단계별 소요 시간 (count, avgMs, maxMs, totalS)
+    """
+    return _get_batch_job_or_404(job_id).snapshot()
+
+
+@app.get("/recognition/answer/jobs/{job_id}/events")
+async def stream_answer_recognition_job(job_id: str, interval: float = 1.0):
+    """
+    배치 답안 인식 진행 상황 스트림 (Server-Sent Events)
+    
+    - interval초마다 `progress` 이벤트로 작업 상태 JSON 전송
+    - 작업이 끝나면 마지막 상태를 `done` 이벤트로 보내고 스트림 종료
+    """
+    job = _get_batch_job_or_404(job_id)
+    interval = min(max(interval, 0.2), 30.0)
+    
+    async def event_stream():
+        while True:
+            snapshot = job.snapshot()
+            event = "progress" if snapshot["running"] else "done"
+            yield f"event: {event}\ndata: {json.dumps(snapshot, ensure_ascii=False)}\n\n"
+            if not snapshot["running"]:
+                break
+            await asyncio.sleep(interval)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+run_benchmark.py - 오프라인 채점 파이프라인 벤치마크
+
+로컬 답안지 이미지(corpus)를 학번 인식(extract_student_id) → 답안 인식
+(AnswerRecognitionPipeline.process) 순서로 처리하면서 다음을 측정합니다.
+
+- 단계별 소요 시간 분포 (id_recog.metrics 히스토그램의 count / avg / p50 / p95 / max)
+- 처리량 (sheets/sec)
+- 최대 RSS (resource.getrusage, 모델 로딩 포함 프로세스 전체 최대치)
+
+S3/SQS 없이 동작합니다. 이미지는 LocalS3Client(로컬 디렉토리)에서 읽어
+워커와 같은 방식(PIL → RGB)으로 디코딩하고, 결과 JSON도 로컬 디렉토리에 씁니다.
+SQS 메시지 수신/전송은 파이프라인 시간과 무관하므로 생략합니다.
+
+모델:
+- stub (기본): benchmarks/stubs.py의 가짜 모델 (--layout-latency-ms / --ocr-latency-ms로 추론 비용 흉내)
+- real: PaddleX PP-DocLayout_plus-L / PP-OCRv5_mobile_rec
+
+기준선 비교:
+    결과를 --save-baseline으로 저장해 두고, 이후 --baseline으로 비교합니다.
+    처리량이 threshold 비율 이상 떨어지거나, 단계별 p50/p95 또는 최대 RSS가
+    threshold 비율 이상 늘어나면 회귀로 보고 종료 코드 1을 반환합니다.
+
+사용법:
+    python benchmarks/run_benchmark.py                                   # 기본 corpus, stub 모델
+    python benchmarks/run_benchmark.py --corpus ./sheets --repeat 5 --concurrency 4
+    python benchmarks/run_benchmark.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmark.py --baseline benchmarks/baseline.json --threshold 0.2
+    python benchmarks/run_benchmark.py --models real --output result.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+# AI 디렉토리를 path에 추가
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, AI_DIR)
+
+from benchmarks.stubs import StubLayoutModel, StubOcrModel
+from id_recog.image_decode import decode_image
+from id_recog.layout import set_layout_max_side
+from id_recog.local_transport import LocalS3Client
+from id_recog.metrics import REGISTRY, WORKER_STAGE_SECONDS
+from id_recog.schemas import Config
+from id_recog.student_id_pipeline import extract_student_id
+from answer_recog.pipeline import AnswerRecognitionPipeline
+from answer_recog.schemas import AnswerSheetMeta
+
+DEFAULT_CORPUS = os.path.join(AI_DIR, "answer_recog", "test_output", "module_test")
+DEFAULT_PATTERN = "m1_table_detection.jpg"
+DEFAULT_STRUCTURE = os.path.join(AI_DIR, "answer_recog", "answer_structure.json")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# stub OCR이 반환하는 학번 (answer_structure.json의 studentId와 동일)
+STUB_STUDENT_ID = "32204659"
+
+
+# =============================================================================
+# 입력 준비
+# =============================================================================
+def list_corpus(corpus_dir: str, pattern: Optional[str] = None) -> List[str]:
+    """corpus 디렉토리의 이미지 파일 이름 목록 (pattern은 fnmatch 형식)"""
+    import fnmatch
+
+    names = sorted(
+        name for name in os.listdir(corpus_dir)
+        if name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+    if pattern:
+        names = [name for name in names if fnmatch.fnmatch(name, pattern)]
+    return names
+
+
+def load_metadata(structure_path: str) -> AnswerSheetMeta:
+    """
+    answer_structure.json(결과 형식의 answers 목록)에서 정답지 메타데이터 생성
+
+    같은 questionNumber의 꼬리문제가 여러 개면 sub_question_count로 묶고,
+    꼬리문제가 있으면 case1 레이아웃으로 간주합니다.
+    """
+    with open(structure_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    questions = {}
+    for answer in data.get("answers", []):
+        number = answer["questionNumber"]
+        entry = questions.setdefault(number, {
+            "question_number": number,
+            "sub_question_count": 0,
+            "scoring_type": answer.get("answerType", "objective"),
+            "points": []
+        })
+        entry["sub_question_count"] += 1
+        entry["points"].append(answer.get("point", 0))
+
+    has_sub = any(q["sub_question_count"] > 1 for q in questions.values())
+    return AnswerSheetMeta.from_dict({
+        "exam_code": data.get("examCode", "BENCHMARK"),
+        "layout_type": "case1" if has_sub else "case2",
+        "questions": [questions[n] for n in sorted(questions)]
+    })
+
+
+def build_models(args):
+    """(layout_model, 학번 OCR 모델, 답안 OCR 모델)"""
+    if args.models == "real":
+        from id_recog.inference_server import load_paddlex_model
+
+        layout_model = load_paddlex_model("PP-DocLayout_plus-L")
+        ocr_model = load_paddlex_model("PP-OCRv5_mobile_rec")
+        return layout_model, ocr_model, ocr_model
+
+    layout_model = StubLayoutModel(latency_ms=args.layout_latency_ms)
+    id_ocr_model = StubOcrModel(STUB_STUDENT_ID, latency_ms=args.ocr_latency_ms)
+    answer_ocr_model = StubOcrModel("3", latency_ms=args.ocr_latency_ms)
+    return layout_model, id_ocr_model, answer_ocr_model
+
+
+# =============================================================================
+# 실행
+# =============================================================================
+def process_sheet(
+    key: str,
+    input_store: LocalS3Client,
+    output_store: LocalS3Client,
+    layout_model,
+    id_ocr_model,
+    answer_pipeline: AnswerRecognitionPipeline,
+    metadata: AnswerSheetMeta,
+    student_id_list: List[str]
+) -> dict:
+    """답안지 1장: download → 학번 인식 → 답안 인식(레이아웃 재사용) → 결과 upload"""
+    with WORKER_STAGE_SECONDS.time(stage="download"):
+        response = input_store.get_object(Bucket="", Key=key)
+        # 워커(download_image)와 같은 디코딩
+        image = decode_image(response["Body"].read())
+
+    id_result = extract_student_id(
+        original_image=image,
+        student_id_list=student_id_list,
+        layout_model=layout_model,
+        ocr_model=id_ocr_model,
+        config=Config(),
+        template_key=metadata.exam_code
+    )
+    answer_result = answer_pipeline.process(
+        image,
+        metadata,
+        id_result.student_id,
+        layout_boxes=id_result.layout_boxes
+    )
+
+    payload = answer_result.to_dict()
+    payload["file_name"] = key
+    with WORKER_STAGE_SECONDS.time(stage="upload"):
+        output_store.put_object(
+            Bucket="",
+            Key=f"{metadata.exam_code}/{os.path.splitext(key)[0]}.json",
+            Body=json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"),
+            ContentType="application/json"
+        )
+    return {"student_id": id_result.student_id, "answer_success": answer_result.success}
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB, Linux는 KB / macOS는 byte 단위)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if platform.system() == "Darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def run_benchmark(args) -> dict:
+    keys = list_corpus(args.corpus, args.pattern)
+    if not keys:
+        raise SystemExit(f"[BENCH] corpus에 이미지가 없습니다: {args.corpus} ({args.pattern})")
+
+    metadata = load_metadata(args.structure)
+    # app.py의 LAYOUT_MAX_SIDE와 같은 레이아웃 입력 축소
+    set_layout_max_side(args.layout_max_side)
+    layout_model, id_ocr_model, answer_ocr_model = build_models(args)
+    answer_pipeline = AnswerRecognitionPipeline(layout_model, answer_ocr_model)
+    student_id_list = [STUB_STUDENT_ID] if args.models == "stub" else args.student_ids
+    input_store = LocalS3Client(args.corpus)
+
+    with tempfile.TemporaryDirectory(prefix="mlpa_bench_") as out_dir:
+        output_store = LocalS3Client(args.output_dir or out_dir)
+        run_one = lambda key: process_sheet(
+            key, input_store, output_store, layout_model, id_ocr_model,
+            answer_pipeline, metadata, student_id_list
+        )
+
+        # warm-up (첫 호출 초기화 비용 제외)
+        for key in keys[:1] * args.warmup:
+            run_one(key)
+        REGISTRY.reset()
+
+        jobs = keys * args.repeat
+        print(f"[BENCH] {len(keys)}장 x {args.repeat}회 = {len(jobs)}장, concurrency={args.concurrency}, models={args.models}")
+        start = time.perf_counter()
+        if args.concurrency > 1:
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                outcomes = list(pool.map(run_one, jobs))
+        else:
+            outcomes = [run_one(key) for key in jobs]
+        elapsed = time.perf_counter() - start
+
+    stages = {}
+    for metric_name, series in REGISTRY.summary().items():
+        for label, stats in series.items():
+            if stats["count"]:
+                stages[f"{metric_name}{{{label}}}"] = stats
+
+    return {
+        "createdAt": datetime.now().isoformat(),
+        "models": args.models,
+        "corpus": os.path.relpath(args.corpus, AI_DIR),
+        "sheets": len(jobs),
+        "concurrency": args.concurrency,
+        "layoutMaxSide": args.layout_max_side,
+        "elapsedSec": round(elapsed, 3),
+        "sheetsPerSec": round(len(jobs) / elapsed, 3) if elapsed > 0 else None,
+        "peakRssMb": peak_rss_mb(),
+        "studentIdFound": sum(1 for o in outcomes if o["student_id"]),
+        "answerSuccess": sum(1 for o in outcomes if o["answer_success"]),
+        "stages": stages
+    }
+
+
+# =============================================================================
+# 기준선 비교
+# =============================================================================
+def compare_to_baseline(result: dict, baseline: dict, threshold: float, min_stage_ms: float) -> List[str]:
+    """
+    기준선 대비 회귀 항목 목록 (비어 있으면 통과)
+
+    min_stage_ms보다 짧은 단계는 측정 잡음이 커서 비교하지 않습니다.
+    """
+    regressions = []
+
+    base_tps, tps = baseline.get("sheetsPerSec"), result.get("sheetsPerSec")
+    if base_tps and tps is not None and tps < base_tps * (1 - threshold):
+        regressions.append(f"sheetsPerSec {base_tps} → {tps}")
+
+    base_rss, rss = baseline.get("peakRssMb"), result.get("peakRssMb")
+    if base_rss and rss is not None and rss > base_rss * (1 + threshold):
+        regressions.append(f"peakRssMb {base_rss} → {rss}")
+
+    for stage, base_stats in baseline.get("stages", {}).items():
+        stats = result["stages"].get(stage)
+        if stats is None:
+            continue
+        for field in ("p50Ms", "p95Ms"):
+            base_value, value = base_stats.get(field), stats.get(field)
+            if base_value is None or value is None or base_value < min_stage_ms:
+                continue
+            if value > base_value * (1 + threshold):
+                regressions.append(f"{stage} {field} {base_value} → {value}")
+
+    return regressions
+
+
+def print_report(result: dict):
+    print(f"\n[BENCH] {result['sheets']}장 / {result['elapsedSec']}s "
+          f"→ {result['sheetsPerSec']} sheets/sec, peak RSS {result['peakRssMb']} MB")
+    print(f"[BENCH] 학번 인식 {result['studentIdFound']}/{result['sheets']}, "
+          f"답안 인식 성공 {result['answerSuccess']}/{result['sheets']}")
+    print(f"\n{'stage':<50} {'count':>6} {'avg':>8} {'p50':>8} {'p95':>8} {'max':>8}  (ms)")
+    for stage, stats in result["stages"].items():
+        print(f"{stage:<50} {stats['count']:>6} {stats['avgMs']:>8} "
+              f"{stats['p50Ms']:>8} {stats['p95Ms']:>8} {stats['maxMs']:>8}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="오프라인 채점 파이프라인 벤치마크")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="답안지 이미지 디렉토리")
+    parser.add_argument("--pattern", default=None,
+                        help=f"파일 이름 패턴 (기본 corpus면 {DEFAULT_PATTERN}, 아니면 전체 이미지)")
+    parser.add_argument("--structure", default=DEFAULT_STRUCTURE, help="정답지 구조 JSON (answers 목록)")
+    parser.add_argument("--models", choices=("stub", "real"), default="stub")
+    parser.add_argument("--student-ids", nargs="*", default=[STUB_STUDENT_ID], help="real 모델용 학번 목록")
+    parser.add_argument("--repeat", type=int, default=3, help="corpus 반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 처리 스레드 수 (워커 동시성 흉내)")
+    parser.add_argument("--warmup", type=int, default=1, help="측정 전 warm-up 처리 장수")
+    parser.add_argument("--layout-latency-ms", type=float, default=0.0, help="stub layout 모델 1장당 지연")
+    parser.add_argument("--ocr-latency-ms", type=float, default=0.0, help="stub OCR 모델 crop 1개당 지연")
+    parser.add_argument("--layout-max-side", type=int, default=None,
+                        help="레이아웃 입력 긴 변 최대 픽셀 수 (LAYOUT_MAX_SIDE, 기본: 원본 해상도)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--output-dir", help="결과 업로드(LocalS3Client) 디렉토리 (기본: 임시 디렉토리)")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON")
+    parser.add_argument("--save-baseline", help="이번 결과를 기준선 JSON으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀 판정 비율 (0.2 = 20%%)")
+    parser.add_argument("--min-stage-ms", type=float, default=1.0, help="이보다 짧은 단계는 비교 제외")
+    args = parser.parse_args(argv)
+
+    if args.pattern is None and os.path.abspath(args.corpus) == DEFAULT_CORPUS:
+        args.pattern = DEFAULT_PATTERN
+
+    result = run_benchmark(args)
+    print_report(result)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            print(f"[BENCH] 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        for field in ("models", "concurrency", "corpus", "layoutMaxSide"):
+            if baseline.get(field) != result.get(field):
+                print(f"[BENCH] ⚠ 기준선과 {field}가 다릅니다: {baseline.get(field)} vs {result.get(field)}")
+        regressions = compare_to_baseline(result, baseline, args.threshold, args.min_stage_ms)
+        if regressions:
+            print(f"\n[BENCH] ✗ 기준선 대비 회귀 {len(regressions)}건 (threshold {args.threshold:.0%})")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"\n[BENCH] ✓ 기준선 대비 회귀 없음 (threshold {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+stubs.py - 오프라인 벤치마크용 가짜 모델
+
+PaddleX 모델과 AWS 없이 파이프라인 전체 흐름을 돌리기 위한 대체 구현입니다.
+
+- StubLayoutModel: 가로/세로선 형태학 연산으로 가장 큰 표를 Table bbox로,
+  표 위쪽(헤더)의 글자 덩어리를 text bbox로 반환 (PP-DocLayout 출력 형식)
+- StubOcrModel: 고정 텍스트를 반환 (PP-OCRv5_mobile_rec 출력 형식)
+
+모델 추론 비용은 latency_ms(입력 1장당 sleep)로 흉내낼 수 있습니다.
+"""
+
+import time
+from typing import Any, List
+
+import cv2
+import numpy as np
+
+
+class _StubResult:
+    """PaddleX 예측 결과와 같은 .json 속성만 가진 결과 객체"""
+
+    def __init__(self, json: dict):
+        self.json = json
+
+
+def _as_list(x: Any) -> list:
+    return list(x) if isinstance(x, (list, tuple)) else [x]
+
+
+def _load(x: Any) -> np.ndarray:
+    """배열 또는 파일 경로 입력을 배열로 변환 (파일 fallback 경로 대응)"""
+    if isinstance(x, str):
+        image = cv2.imread(x)
+        if image is None:
+            raise ValueError(f"cannot read image: {x}")
+        return image
+    return np.asarray(x)
+
+
+# =============================================================================
+# 가짜 모델
+# =============================================================================
+class StubLayoutModel:
+    """
+    표 테두리 선으로 Table bbox를 찾는 가짜 레이아웃 모델
+
+    실제 PP-DocLayout보다 훨씬 빠르므로 layout 단계 시간은 latency_ms로 보정합니다.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, max_text_boxes: int = 6):
+        self.latency_ms = latency_ms
+        self.max_text_boxes = max_text_boxes
+
+    def predict(self, x: Any, batch_size: int = 1) -> List[_StubResult]:
+        results = []
+        for item in _as_list(x):
+            image = _load(item)
+            if self.latency_ms:
+                time.sleep(self.latency_ms / 1000)
+            results.append(_StubResult({"res": {"boxes": self._detect(image)}}))
+        return results
+
+    def _detect(self, image: np.ndarray) -> List[dict]:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        height, width = gray.shape[:2]
+        binary = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, 15, 10
+        )
+
+        # 표 테두리: 긴 가로선 + 긴 세로선
+        h_lines = cv2.morphologyEx(
+            binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (max(1, width // 8), 1))
+        )
+        v_lines = cv2.morphologyEx(
+            binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (1, max(1, height // 16)))
+        )
+        contours, _ = cv2.findContours(cv2.bitwise_or(h_lines, v_lines), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        if not contours:
+            return []
+
+        x, y, w, h = cv2.boundingRect(max(contours, key=cv2.contourArea))
+        boxes = [{"label": "table", "score": 0.98, "coordinate": [x, y, x + w, y + h]}]
+
+        # 헤더(표 위쪽)의 글자 덩어리 → text bbox
+        if y > 0:
+            header = binary[:y]
+            merged = cv2.dilate(header, cv2.getStructuringElement(cv2.MORPH_RECT, (25, 5)))
+            text_contours, _ = cv2.findContours(merged, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            rects = [cv2.boundingRect(c) for c in text_contours]
+            rects = [r for r in rects if r[2] >= 20 and r[3] >= 10]
+            rects.sort(key=lambda r: r[2] * r[3], reverse=True)
+            for tx, ty, tw, th in rects[:self.max_text_boxes]:
+                boxes.append({"label": "text", "score": 0.9, "coordinate": [tx, ty, tx + tw, ty + th]})
+        return boxes
+
+
+class StubOcrModel:
+    """항상 같은 텍스트를 반환하는 가짜 인식 모델"""
+
+    def __init__(self, text: str, score: float = 0.97, latency_ms: float = 0.0):
+        self.text = text
+        self.score = score
+        self.latency_ms = latency_ms
+
+    def predict(self, x: Any, batch_size: int = 1) -> List[_StubResult]:
+        items = _as_list(x)
+        if self.latency_ms:
+            time.sleep(self.latency_ms * len(items) / 1000)
+        return [
+            _StubResult({"res": {"rec_text": self.text, "rec_score": self.score}})
+            for _ in items
+        ]
+
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+worker_load_test.py - SQSWorker 로컬 부하 테스트 (AWS 없이 end-to-end sheets/sec 측정)
+
+id_recog.local_transport의 로컬 SQS/S3로 SQSWorker를 실제 워커 루프 그대로 돌립니다.
+
+1. 시험(exam)마다 ATTENDANCE_UPLOAD(출석부) 메시지 전송
+2. STUDENT_ID_RECOGNITION 메시지 N개를 시험별 MessageGroupId로 나눠 전송
+3. 워커 시작 → 결과 큐에 N개 결과가 모일 때까지 대기
+4. 처리량(sheets/sec)과 워커 단계별(download / upload / sqs_send / sqs_ack) 소요 시간 출력
+
+max_workers / io_workers / 시험 수(그룹 수)를 바꿔 가며 동시성 설정을 조정할 때 사용합니다.
+같은 시험의 메시지는 FIFO 그룹 순서대로 처리되므로, 병렬도는 시험 수를 넘지 못합니다.
+
+사용법:
+    python benchmarks/worker_load_test.py --messages 200 --exams 4 --max-workers 4 --io-workers 2
+    python benchmarks/worker_load_test.py --messages 50 --s3-keys          # presigned URL 대신 S3 키 사용
+    python benchmarks/worker_load_test.py --models real --messages 20
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import contextlib
+from typing import List
+
+# AI 디렉토리를 path에 추가
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, AI_DIR)
+
+from benchmarks.run_benchmark import STUB_STUDENT_ID, build_models
+from id_recog.local_transport import LocalTransport, enqueue_student_id_recognition
+from id_recog.metrics import REGISTRY
+from id_recog.schemas import Config
+from id_recog.sqs_worker import SQSWorker
+from id_recog.student_id_pipeline import extract_student_id
+
+DEFAULT_IMAGE = os.path.join(AI_DIR, "answer_recog", "test_output", "module_test", "m1_table_detection.jpg")
+BUCKET = "mlpa-local"
+
+
+def enqueue_attendance(transport: LocalTransport, queue_url: str, exam_code: str, student_ids: List[str]):
+    """출석부 메시지 전송 (파일은 학번 한 줄씩, load_attendance 콜백이 읽음)"""
+    key = f"attendance/{exam_code}.txt"
+    transport.s3.put_object(Bucket=BUCKET, Key=key, Body="\n".join(student_ids), ContentType="text/plain")
+    url = transport.s3.generate_presigned_url("get_object", Params={"Bucket": BUCKET, "Key": key})
+    transport.sqs.send_message(
+        QueueUrl=queue_url,
+        MessageBody=json.dumps({
+            "eventType": "ATTENDANCE_UPLOAD",
+            "examCode": exam_code,
+            "downloadUrl": url,
+            "filename": f"{exam_code}.txt"
+        }),
+        MessageGroupId=exam_code,
+        MessageDeduplicationId=f"attendance-{exam_code}-{time.time_ns()}"
+    )
+
+
+def load_attendance(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def drain_results(transport: LocalTransport, result_queue_url: str, expected: int, timeout_s: float) -> List[dict]:
+    """결과 큐에서 STUDENT_ID_RECOGNITION 결과를 expected개 받을 때까지 수신 (BE 역할)"""
+    results = []
+    deadline = time.monotonic() + timeout_s
+    while len(results) < expected and time.monotonic() < deadline:
+        response = transport.sqs.receive_message(QueueUrl=result_queue_url, MaxNumberOfMessages=10, WaitTimeSeconds=1)
+        for message in response.get("Messages", []):
+            results.append(json.loads(message["Body"]))
+            transport.sqs.delete_message(QueueUrl=result_queue_url, ReceiptHandle=message["ReceiptHandle"])
+    return results
+
+
+def run_load_test(args) -> dict:
+    layout_model, id_ocr_model, _ = build_models(args)
+    with open(args.image, "rb") as f:
+        image_bytes = f.read()
+
+    transport = LocalTransport(visibility_timeout=args.visibility_timeout)
+    try:
+        queue_url = transport.create_queue("mlpa-input.fifo")
+        result_queue_url = transport.create_queue("mlpa-result.fifo")
+
+        worker = SQSWorker(
+            queue_url=queue_url,
+            aws_access_key_id="",
+            aws_secret_access_key="",
+            s3_bucket=BUCKET,
+            result_queue_url=result_queue_url,
+            max_workers=args.max_workers,
+            max_messages_per_poll=args.poll_batch,
+            queue_stats_interval=0,
+            io_workers=args.io_workers,
+            transport=transport
+        )
+        worker.set_attendance_callback(load_attendance)
+        worker.set_student_id_callback(lambda image, student_list, exam_code=None: _recognize(
+            image, student_list, exam_code, layout_model, id_ocr_model
+        ))
+
+        # 시험별로 메시지를 고르게 분배 (시험 = FIFO 그룹)
+        exam_codes = [f"LOAD{i:02d}" for i in range(args.exams)]
+        per_exam = [args.messages // args.exams + (1 if i < args.messages % args.exams else 0) for i in range(args.exams)]
+        for exam_code, count in zip(exam_codes, per_exam):
+            enqueue_attendance(transport, queue_url, exam_code, args.student_ids)
+            enqueue_student_id_recognition(
+                transport, queue_url, BUCKET, exam_code, image_bytes, count,
+                presigned=not args.s3_keys
+            )
+
+        REGISTRY.reset()
+        output = open(os.devnull, "w") if args.quiet else sys.stdout
+        if args.quiet:
+            logging.getLogger("id_recog.sqs_worker").setLevel(logging.WARNING)
+        with contextlib.redirect_stdout(output):
+            start = time.perf_counter()
+            worker.start()
+            results = drain_results(transport, result_queue_url, args.messages, args.timeout)
+            elapsed = time.perf_counter() - start
+            worker.stop()
+        if output is not sys.stdout:
+            output.close()
+
+        remaining = transport.sqs.get_queue_attributes(QueueUrl=queue_url)["Attributes"]
+    finally:
+        transport.close()
+
+    return {
+        "messages": args.messages,
+        "exams": args.exams,
+        "maxWorkers": args.max_workers,
+        "ioWorkers": args.io_workers,
+        "received": len(results),
+        "recognized": sum(1 for r in results if r.get("studentId")),
+        "elapsedSec": round(elapsed, 3),
+        "sheetsPerSec": round(len(results) / elapsed, 3) if elapsed > 0 else None,
+        "inputQueueLeft": int(remaining["ApproximateNumberOfMessages"]) + int(remaining["ApproximateNumberOfMessagesNotVisible"]),
+        "stages": REGISTRY.summary().get("mlpa_worker_stage_seconds", {})
+    }
+
+
+def _recognize(image, student_list, exam_code, layout_model, ocr_model) -> dict:
+    """app.py의 student_id_callback과 같은 형식의 결과"""
+    result = extract_student_id(
+        original_image=image,
+        student_id_list=student_list,
+        layout_model=layout_model,
+        ocr_model=ocr_model,
+        config=Config(),
+        template_key=exam_code
+    )
+    return {
+        "student_id": result.student_id,
+        "header_image": result.header_image,
+        "meta": result.meta,
+        "layout_boxes": result.layout_boxes
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="SQSWorker 로컬 부하 테스트")
+    parser.add_argument("--messages", type=int, default=100, help="STUDENT_ID_RECOGNITION 메시지 수")
+    parser.add_argument("--exams", type=int, default=1, help="시험 수 (= FIFO 그룹 수)")
+    parser.add_argument("--image", default=DEFAULT_IMAGE, help="메시지에 사용할 답안지 이미지")
+    parser.add_argument("--models", choices=("stub", "real"), default="stub")
+    parser.add_argument("--student-ids", nargs="*", default=[STUB_STUDENT_ID], help="출석부 학번 목록")
+    parser.add_argument("--layout-latency-ms", type=float, default=0.0, help="stub layout 모델 1장당 지연")
+    parser.add_argument("--ocr-latency-ms", type=float, default=0.0, help="stub OCR 모델 crop 1개당 지연")
+    parser.add_argument("--max-workers", type=int, default=1, help="SQSWorker max_workers")
+    parser.add_argument("--io-workers", type=int, default=0, help="SQSWorker io_workers")
+    parser.add_argument("--poll-batch", type=int, default=10, help="SQSWorker max_messages_per_poll")
+    parser.add_argument("--visibility-timeout", type=int, default=30, help="로컬 큐 기본 VisibilityTimeout (초)")
+    parser.add_argument("--s3-keys", action="store_true", help="downloadUrl에 presigned URL 대신 s3:// 키 사용")
+    parser.add_argument("--timeout", type=float, default=600, help="결과 대기 최대 시간 (초)")
+    parser.add_argument("--quiet", action="store_true", help="워커 로그 출력 숨김")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    args.exams = max(1, min(args.exams, args.messages))
+
+    result = run_load_test(args)
+
+    print(f"\n[LOAD] {result['received']}/{result['messages']}건 결과 수신 / {result['elapsedSec']}s "
+          f"→ {result['sheetsPerSec']} sheets/sec (exams={result['exams']}, "
+          f"max_workers={result['maxWorkers']}, io_workers={result['ioWorkers']})")
+    print(f"[LOAD] 학번 인식 {result['recognized']}건, 입력 큐 잔여 {result['inputQueueLeft']}건")
+    for label, stats in result["stages"].items():
+        print(f"  {label:<20} count={stats['count']:<6} p50={stats['p50Ms']}ms p95={stats['p95Ms']}ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"[LOAD] 저장: {args.output}")
+    return 0 if result["received"] == result["messages"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
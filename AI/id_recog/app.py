@@ -120,7 +120,7 @@ async def lifespan(app: FastAPI):
             )
             
             # 학번 추출 콜백 설정
-            def student_id_callback(image: np.ndarray, student_list: list) -> dict:
+            def student_id_callback(image: np.ndarray, student_list: list, exam_code: str = None) -> dict:
                 config = Config()
                 result = extract_student_id(
                     original_image=image,
@@ -128,7 +128,8 @@ async def lifespan(app: FastAPI):
                     layout_model=ModelStore.layout_model,
                     ocr_model=ModelStore.ocr_model,
                     vlm_client=ModelStore.vlm_client,
-                    config=config
+                    config=config,
+                    template_key=exam_code
                 )
                 return {
                     "student_id": result.student_id,
@@ -0,0 +1,358 @@
+"""
+batch_executor.py - 배치 답안 인식 병렬 실행기
+
+process_batch_answer_recognition에서 시험 전체 이미지를 단계별로 겹쳐 처리합니다.
+
+단계:
+1. download: I/O 스레드에서 이미지 prefetch
+2. infer: 추론 스레드 풀에서 답안 인식 (OpenCV / NumPy / Paddle 추론은 GIL을 놓고 실행)
+3. upload: 결과 JSON / Fallback ROI 업로드를 I/O 스레드에서 비동기 실행
+
+동시에 진행 중인 항목 수는 max_in_flight로 제한합니다.
+(목록 순회가 자리가 날 때까지 블로킹 → 다운로드한 이미지가 메모리에 무한히 쌓이지 않음)
+
+작업(job) 단위 진행 상황(BatchProgress)은 BatchJobRegistry에 job_id로 등록되어
+/recognition/answer/jobs/{id} 조회 및 SSE 진행 스트림에 사용됩니다.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# 진행 상황
+# =============================================================================
+
+class StageStats:
+    """단계별 소요 시간 집계 (count / 합계 / 최대)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total_s += seconds
+        self.max_s = max(self.max_s, seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avgMs": round(self.total_s / self.count * 1000, 1) if self.count else 0.0,
+            "maxMs": round(self.max_s * 1000, 1),
+            "totalS": round(self.total_s, 2)
+        }
+
+
+class BatchProgress:
+    """
+    배치 작업 진행 상황 (스레드 안전 카운터)
+
+    - total: 목록에서 처리 대상으로 확인된 이미지 수 (목록 순회 중에는 계속 증가)
+    - processed / failed: 업로드까지 끝난 수 / 단계 중 실패한 수
+    - skipped: 이전 실행에서 이미 처리되어 건너뛴 수 (total에 포함하지 않음)
+    - fallbacks: 업로드한 Fallback ROI 수
+    - stages: download / infer / upload 단계별 소요 시간
+    """
+
+    def __init__(self, exam_code: str, job_id: Optional[str] = None):
+        self.job_id = job_id or uuid.uuid4().hex[:12]
+        self.exam_code = exam_code
+        self.total = 0
+        self.processed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.fallbacks = 0
+        self.discovery_done = False  # 목록 순회 완료 여부 (완료 후에야 total이 확정됨)
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at = self.created_at
+        self.finished_at: Optional[float] = None
+        self.stages: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    def add_total(self, count: int = 1):
+        with self._lock:
+            self.total += count
+
+    def mark_processed(self):
+        with self._lock:
+            self.processed += 1
+
+    def mark_failed(self):
+        with self._lock:
+            self.failed += 1
+
+    def mark_skipped(self):
+        with self._lock:
+            self.skipped += 1
+
+    def add_fallbacks(self, count: int):
+        with self._lock:
+            self.fallbacks += count
+
+    def record_stage(self, stage: str, seconds: float):
+        with self._lock:
+            self.stages.setdefault(stage, StageStats()).add(seconds)
+
+    def start(self):
+        """실제 처리 시작 시각 기록 (등록 후 대기 시간은 처리량 계산에서 제외)"""
+        with self._lock:
+            self.started_at = time.time()
+
+    def finish_discovery(self):
+        with self._lock:
+            self.discovery_done = True
+
+    def finish(self, error: Optional[str] = None):
+        with self._lock:
+            self.finished_at = time.time()
+            self.error = error
+
+    @property
+    def is_running(self) -> bool:
+        return self.finished_at is None
+
+    @property
+    def status(self) -> str:
+        if self.finished_at is None:
+            return "running"
+        return "failed" if self.error else "completed"
+
+    def snapshot(self) -> dict:
+        """/health, 작업 조회 API에 노출할 진행 상황"""
+        with self._lock:
+            end = self.finished_at or time.time()
+            elapsed = max(end - self.started_at, 1e-6)
+            completed = self.processed + self.failed
+            pending = self.total - completed
+            # 처리량: 완료(성공+실패) 시트 / 분, ETA는 목록 순회가 끝나 total이 확정된 뒤에만 계산
+            throughput = completed / elapsed * 60
+            eta = None
+            if self.finished_at is None and self.discovery_done and completed > 0:
+                eta = round(pending / (completed / elapsed), 1)
+            return {
+                "jobId": self.job_id,
+                "examCode": self.exam_code,
+                "status": self.status,
+                "running": self.finished_at is None,
+                "discovered": self.total + self.skipped,
+                "discoveryDone": self.discovery_done,
+                "total": self.total,
+                "processed": self.processed,
+                "failed": self.failed,
+                "skipped": self.skipped,
+                "fallbacks": self.fallbacks,
+                "pending": pending,
+                "elapsedS": round(end - self.started_at, 1),
+                "throughputPerMin": round(throughput, 2),
+                "etaS": 0.0 if self.finished_at is not None else eta,
+                "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+                "error": self.error
+            }
+
+
+class ParallelBatchExecutor:
+    """
+    download → infer → upload 3단계 병렬 실행기
+
+    사용법:
+        executor = ParallelBatchExecutor(download_fn, infer_fn, upload_fn, infer_workers=4)
+        executor.run(items, progress)   # 모든 항목이 끝날 때까지 블로킹
+
+    - download_fn(item) -> payload (None이면 실패 처리)
+    - infer_fn(item, payload) -> result
+    - upload_fn(item, result) -> None
+    - on_done(item, ok, error)가 있으면 항목이 끝날 때마다 호출합니다. (체크포인트 기록용)
+    - 단계 중 예외가 나면 해당 항목만 실패로 집계하고 나머지는 계속 처리합니다.
+    - infer_workers <= 1이고 io_workers == 0이면 기존과 같은 순차 처리입니다.
+    """
+
+    def __init__(
+        self,
+        download_fn: Callable[[Any], Any],
+        infer_fn: Callable[[Any, Any], Any],
+        upload_fn: Callable[[Any, Any], None],
+        infer_workers: int = 1,
+        io_workers: int = 0,
+        max_in_flight: Optional[int] = None,
+        name: str = "Batch",
+        on_done: Optional[Callable[[Any, bool, Optional[BaseException]], None]] = None
+    ):
+        self.download_fn = download_fn
+        self.infer_fn = infer_fn
+        self.upload_fn = upload_fn
+        self.infer_workers = max(1, infer_workers)
+        self.io_workers = max(0, io_workers)
+        # 추론 대기 + I/O 진행 중인 항목까지 고려한 기본 상한
+        self.max_in_flight = max(1, max_in_flight or self.infer_workers * 2 + self.io_workers)
+        self.name = name
+        self.on_done = on_done
+
+    @property
+    def is_sequential(self) -> bool:
+        return self.infer_workers <= 1 and self.io_workers == 0
+
+    def run(self, items: Iterable[Any], progress: BatchProgress) -> BatchProgress:
+        """모든 항목 처리 (완료될 때까지 블로킹)"""
+        # 단계별 소요 시간을 progress에 기록하도록 감쌈
+        self._download = self._timed("download", self.download_fn, progress)
+        self._infer = self._timed("infer", self.infer_fn, progress)
+        self._upload = self._timed("upload", self.upload_fn, progress)
+        
+        error = None
+        progress.start()
+        try:
+            if self.is_sequential:
+                for item in items:
+                    progress.add_total()
+                    self._run_one(item, progress)
+                progress.finish_discovery()
+            else:
+                self._run_parallel(items, progress)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            progress.finish(error)
+        return progress
+
+    @staticmethod
+    def _timed(stage: str, fn: Callable, progress: BatchProgress) -> Callable:
+        def wrapper(*args):
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                progress.record_stage(stage, time.perf_counter() - start)
+        return wrapper
+
+    def _finish_item(self, item: Any, progress: BatchProgress, ok: bool, error: Optional[BaseException] = None):
+        if ok:
+            progress.mark_processed()
+        else:
+            if error is not None:
+                logger.error(f"[{self.name}] 처리 실패 ({item}): {error}")
+            progress.mark_failed()
+        if self.on_done is not None:
+            try:
+                self.on_done(item, ok, error)
+            except Exception as e:
+                logger.error(f"[{self.name}] on_done 실패 ({item}): {e}")
+
+    def _run_one(self, item: Any, progress: BatchProgress):
+        """순차 처리: 한 항목의 3단계를 현재 스레드에서 실행"""
+        try:
+            payload = self._download(item)
+            if payload is None:
+                self._finish_item(item, progress, False)
+                return
+            result = self._infer(item, payload)
+            self._upload(item, result)
+        except Exception as e:
+            self._finish_item(item, progress, False, e)
+            return
+        self._finish_item(item, progress, True)
+
+    def _run_parallel(self, items: Iterable[Any], progress: BatchProgress):
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+        io_pool = ThreadPoolExecutor(max_workers=max(1, self.io_workers), thread_name_prefix=f"{self.name}-IO")
+        infer_pool = ThreadPoolExecutor(max_workers=self.infer_workers, thread_name_prefix=f"{self.name}-Infer")
+
+        def done(item: Any, ok: bool, error: Optional[BaseException] = None):
+            try:
+                self._finish_item(item, progress, ok, error)
+            finally:
+                slots.release()
+
+        def on_uploaded(item: Any, future: Future):
+            error = future.exception()
+            done(item, error is None, error)
+
+        def on_inferred(item: Any, future: Future):
+            error = future.exception()
+            if error is not None:
+                done(item, False, error)
+                return
+            io_pool.submit(self._upload, item, future.result()).add_done_callback(
+                lambda f: on_uploaded(item, f)
+            )
+
+        def on_downloaded(item: Any, future: Future):
+            error = future.exception()
+            payload = None if error is not None else future.result()
+            if payload is None:
+                done(item, False, error)
+                return
+            infer_pool.submit(self._infer, item, payload).add_done_callback(
+                lambda f: on_inferred(item, f)
+            )
+
+        try:
+            for item in items:
+                slots.acquire()
+                progress.add_total()
+                io_pool.submit(self._download, item).add_done_callback(
+                    lambda f, item=item: on_downloaded(item, f)
+                )
+            progress.finish_discovery()
+        finally:
+            # 모든 자리가 반납될 때까지 대기 (= 시작한 항목 모두 완료, 목록 순회가 중간에 실패해도 동일)
+            for _ in range(self.max_in_flight):
+                slots.acquire()
+            infer_pool.shutdown(wait=True)
+            io_pool.shutdown(wait=True)
+
+
+# =============================================================================
+# 작업 레지스트리
+# =============================================================================
+
+class BatchJobRegistry:
+    """
+    배치 작업(job_id → BatchProgress) 레지스트리
+
+    실행 중인 작업은 항상 보관하고, 끝난 작업은 최근 max_finished개만 남깁니다.
+    """
+
+    def __init__(self, max_finished: int = 50):
+        self.max_finished = max(1, max_finished)
+        self._jobs: "OrderedDict[str, BatchProgress]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, exam_code: str) -> BatchProgress:
+        """새 작업 등록"""
+        progress = BatchProgress(exam_code)
+        with self._lock:
+            self._jobs[progress.job_id] = progress
+            self._evict()
+        return progress
+
+    def get(self, job_id: str) -> Optional[BatchProgress]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def latest(self, exam_code: str) -> Optional[BatchProgress]:
+        """시험의 가장 최근 작업"""
+        with self._lock:
+            for progress in reversed(self._jobs.values()):
+                if progress.exam_code == exam_code:
+                    return progress
+        return None
+
+    def list(self) -> List[BatchProgress]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def _evict(self):
+        finished = [job_id for job_id, p in self._jobs.items() if not p.is_running]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
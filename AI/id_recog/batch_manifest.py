@@ -0,0 +1,228 @@
+"""
+batch_manifest.py - 배치 답안 인식 작업 manifest (체크포인트 / 재개)
+
+process_batch_answer_recognition 도중 서버가 재시작되어도 처음부터 다시 인식하지 않도록
+시험(exam_code)별로 발견한 이미지 / 완료 / 실패 key를 입력 ETag와 함께 기록합니다.
+
+저장 위치:
+- local_dir가 있으면 로컬 디스크: {local_dir}/{exam_code}.json
+- 아니면 S3 JSON: batch_manifest/{exam_code}.json
+
+재개 시 규칙:
+- manifest에 같은 ETag로 완료된 key는 건너뜀
+- 저장된 manifest를 이어서 쓰는 경우, manifest에 완료 기록이 없는 key도
+  answer/{exam}/{student}/result.json의 입력 ETag 메타데이터가 같으면 건너뜀 (is_result_current,
+  마지막 체크포인트 이후 끝난 시험지). 저장된 manifest가 없으면(첫 실행) 시험지마다 HEAD 요청을
+  보내지 않고 전체 인식
+- ETag가 바뀐 이미지(재업로드)는 다시 인식
+- 정답 메타데이터가 바뀌면(fingerprint 불일치) 이전 완료 기록을 무시하고 전체 재인식
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# result.json S3 객체 메타데이터에 기록하는 입력 이미지 ETag / 정답 메타데이터 fingerprint 키
+RESULT_INPUT_ETAG_KEY = "input-etag"
+RESULT_METADATA_KEY = "metadata-fingerprint"
+
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+
+def metadata_fingerprint(metadata: dict) -> str:
+    """정답 메타데이터 fingerprint (키 순서와 무관)"""
+    body = json.dumps(metadata, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(body.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class BatchManifest:
+    """시험 단위 배치 답안 인식 진행 기록"""
+    exam_code: str
+    metadata: dict = field(default_factory=dict)         # 정답 메타데이터 (재개 시 재사용)
+    fingerprint: str = ""                                 # metadata_fingerprint(metadata)
+    status: str = STATUS_RUNNING
+    discovered: Dict[str, str] = field(default_factory=dict)  # S3 key → ETag
+    done: Dict[str, str] = field(default_factory=dict)        # S3 key → 처리한 입력 ETag
+    failed: Dict[str, str] = field(default_factory=dict)      # S3 key → 에러 메시지
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    updated_at: Optional[str] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @classmethod
+    def create(cls, exam_code: str, metadata: dict) -> "BatchManifest":
+        return cls(exam_code=exam_code, metadata=metadata, fingerprint=metadata_fingerprint(metadata))
+
+    def mark_discovered(self, key: str, etag: str):
+        with self._lock:
+            self.discovered[key] = etag
+
+    def mark_done(self, key: str, etag: str):
+        with self._lock:
+            self.done[key] = etag
+            self.failed.pop(key, None)
+
+    def mark_failed(self, key: str, error: str):
+        with self._lock:
+            self.failed[key] = error
+
+    def is_done(self, key: str, etag: str) -> bool:
+        """같은 ETag로 이미 처리했는지 여부"""
+        with self._lock:
+            return bool(etag) and self.done.get(key) == etag
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "examCode": self.exam_code,
+                "status": self.status,
+                "discovered": len(self.discovered),
+                "done": len(self.done),
+                "failed": len(self.failed),
+                "startedAt": self.started_at,
+                "updatedAt": self.updated_at
+            }
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "examCode": self.exam_code,
+                "metadata": self.metadata,
+                "fingerprint": self.fingerprint,
+                "status": self.status,
+                "discovered": dict(self.discovered),
+                "done": dict(self.done),
+                "failed": dict(self.failed),
+                "startedAt": self.started_at,
+                "updatedAt": self.updated_at
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BatchManifest":
+        return cls(
+            exam_code=data["examCode"],
+            metadata=data.get("metadata") or {},
+            fingerprint=data.get("fingerprint", ""),
+            status=data.get("status", STATUS_RUNNING),
+            discovered=dict(data.get("discovered", {})),
+            done=dict(data.get("done", {})),
+            failed=dict(data.get("failed", {})),
+            started_at=data.get("startedAt") or datetime.now().isoformat(),
+            updated_at=data.get("updatedAt")
+        )
+
+
+class BatchManifestStore:
+    """manifest 저장소 (로컬 디스크 또는 S3)"""
+
+    def __init__(
+        self,
+        s3_client: Any = None,
+        bucket: Optional[str] = None,
+        local_dir: Optional[str] = None,
+        prefix: str = "batch_manifest"
+    ):
+        """
+        Args:
+            s3_client: boto3 S3 클라이언트 (local_dir가 없을 때 사용)
+            bucket: S3 버킷
+            local_dir: 로컬 저장 디렉토리 (있으면 S3 대신 사용)
+            prefix: S3 key prefix
+        """
+        self.s3 = s3_client
+        self.bucket = bucket
+        self.local_dir = local_dir
+        self.prefix = prefix
+        # 체크포인트 저장은 여러 배치 스레드(on_done)에서 호출됨 → 저장 순서 직렬화
+        self._save_lock = threading.Lock()
+        if self.local_dir:
+            os.makedirs(self.local_dir, exist_ok=True)
+
+    def s3_key(self, exam_code: str) -> str:
+        return f"{self.prefix}/{exam_code}.json"
+
+    def _local_path(self, exam_code: str) -> str:
+        return os.path.join(self.local_dir, f"{exam_code}.json")
+
+    def load(self, exam_code: str) -> Optional[BatchManifest]:
+        """저장된 manifest 조회 (없거나 읽기 실패 시 None)"""
+        try:
+            if self.local_dir:
+                path = self._local_path(exam_code)
+                if not os.path.exists(path):
+                    return None
+                with open(path, "r", encoding="utf-8") as f:
+                    return BatchManifest.from_dict(json.load(f))
+            if self.s3 is None or not self.bucket:
+                return None
+            response = self.s3.get_object(Bucket=self.bucket, Key=self.s3_key(exam_code))
+            return BatchManifest.from_dict(json.loads(response['Body'].read()))
+        except Exception:
+            # NoSuchKey 등 → manifest 없음
+            return None
+
+    def save(self, manifest: BatchManifest) -> bool:
+        """manifest 체크포인트 저장 (실패해도 처리는 계속, 스레드 안전)"""
+        with self._save_lock:
+            # lock 안에서 직렬화 → 나중에 저장된 체크포인트가 항상 더 최신 상태
+            manifest.updated_at = datetime.now().isoformat()
+            body = json.dumps(manifest.to_dict(), ensure_ascii=False)
+            try:
+                if self.local_dir:
+                    # 쓰는 도중 종료돼도 이전 체크포인트가 남도록 임시 파일 → rename
+                    path = self._local_path(manifest.exam_code)
+                    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+                    try:
+                        with open(tmp_path, "w", encoding="utf-8") as f:
+                            f.write(body)
+                        os.replace(tmp_path, path)
+                    finally:
+                        if os.path.exists(tmp_path):
+                            os.unlink(tmp_path)
+                    return True
+                if self.s3 is None or not self.bucket:
+                    return False
+                self.s3.put_object(
+                    Bucket=self.bucket,
+                    Key=self.s3_key(manifest.exam_code),
+                    Body=body,
+                    ContentType='application/json'
+                )
+                return True
+            except Exception as e:
+                logger.warning(f"[BATCH_MANIFEST] 저장 실패: {manifest.exam_code}: {e}")
+                return False
+
+
+def is_result_current(
+    s3_client: Any,
+    bucket: str,
+    result_key: str,
+    etag: str,
+    fingerprint: str
+) -> bool:
+    """
+    result.json이 이미 있고 같은 입력 ETag + 정답 메타데이터로 만들어졌는지 확인 (HEAD 요청)
+
+    Returns:
+        True면 다시 인식할 필요 없음
+    """
+    if not etag:
+        return False
+    try:
+        response = s3_client.head_object(Bucket=bucket, Key=result_key)
+    except Exception:
+        # 404 등 → 결과 없음
+        return False
+    meta = response.get("Metadata", {})
+    return meta.get(RESULT_INPUT_ETAG_KEY) == etag and meta.get(RESULT_METADATA_KEY) == fingerprint
@@ -0,0 +1,175 @@
+"""
+candidate_ranking.py - 학번 후보 bbox 우선순위 결정
+
+학번이 있을 가능성이 높은 bbox부터 OCR하기 위해 non-table bbox에 점수를 매깁니다.
+
+점수 요소:
+1. 라벨 (text/number/header 등 텍스트 계열 우대, image/seal/chart 등 감점)
+2. 위치 (가장 큰 Table 위쪽 = 헤더 영역 우대)
+3. 가로세로 비율 (8자리 숫자 필드에 가까운 비율 우대)
+4. 시험(템플릿)별 과거 매칭 위치 적중률
+"""
+
+import threading
+from dataclasses import dataclass
+
+try:
+    from .layout import LayoutBox
+    from .schemas import BBox
+except ImportError:
+    from id_recog.layout import LayoutBox
+    from id_recog.schemas import BBox
+
+
+# 라벨별 가중치 (명시되지 않은 라벨은 DEFAULT_LABEL_WEIGHT)
+LABEL_WEIGHTS = {
+    "text": 1.0,
+    "number": 1.0,
+    "header": 0.9,
+    "paragraph_title": 0.8,
+    "doc_title": 0.6,
+    "content": 0.6,
+    "figure_title": 0.4,
+    "image": 0.2,
+    "chart": 0.1,
+    "seal": 0.1,
+    "formula": 0.1,
+}
+DEFAULT_LABEL_WEIGHT = 0.5
+
+# 8자리 숫자 필드의 일반적인 가로세로 비율 범위 (w / h)
+ID_ASPECT_MIN = 2.5
+ID_ASPECT_MAX = 15.0
+
+
+@dataclass
+class RankedBox:
+    """우선순위가 매겨진 후보 bbox"""
+    layout_box: LayoutBox
+    score: float
+    signature: str
+
+
+class TemplateHitStats:
+    """
+    시험(템플릿)별 학번 매칭 위치 통계
+
+    같은 시험의 답안지는 양식이 같으므로, 이전에 학번이 매칭된 위치(signature)를
+    기억해 두었다가 다음 답안지에서 해당 위치의 bbox를 먼저 OCR합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 키: template_key, 값: {signature: 적중 횟수}
+        self._hits: dict[str, dict[str, int]] = {}
+        self._totals: dict[str, int] = {}
+
+    def record_hit(self, template_key: str, signature: str):
+        """매칭 성공 위치 기록"""
+        if not template_key:
+            return
+        with self._lock:
+            hits = self._hits.setdefault(template_key, {})
+            hits[signature] = hits.get(signature, 0) + 1
+            self._totals[template_key] = self._totals.get(template_key, 0) + 1
+
+    def hit_rate(self, template_key: str | None, signature: str) -> float:
+        """해당 위치의 적중률 (0~1, 기록 없으면 0)"""
+        if not template_key:
+            return 0.0
+        with self._lock:
+            total = self._totals.get(template_key, 0)
+            if total == 0:
+                return 0.0
+            return self._hits.get(template_key, {}).get(signature, 0) / total
+
+    def reset(self, template_key: str | None = None):
+        """통계 초기화 (template_key가 None이면 전체)"""
+        with self._lock:
+            if template_key is None:
+                self._hits.clear()
+                self._totals.clear()
+            else:
+                self._hits.pop(template_key, None)
+                self._totals.pop(template_key, None)
+
+
+_template_stats = TemplateHitStats()
+
+
+def get_template_stats() -> TemplateHitStats:
+    """전역 템플릿 적중 통계 반환"""
+    return _template_stats
+
+
+def box_signature(box: LayoutBox, image_shape: tuple) -> str:
+    """
+    bbox 위치 시그니처 (라벨 + 이미지 대비 중심 좌표를 10칸 격자로 양자화)
+
+    해상도가 조금 달라도 같은 양식의 같은 필드는 같은 시그니처가 됩니다.
+    """
+    h, w = image_shape[:2]
+    cx = (box.bbox.x1 + box.bbox.x2) / 2.0 / max(1, w)
+    cy = (box.bbox.y1 + box.bbox.y2) / 2.0 / max(1, h)
+    return f"{box.label.lower()}:{int(cy * 10)}:{int(cx * 10)}"
+
+
+def score_box(
+    box: LayoutBox,
+    table_bbox: BBox | None,
+    hit_rate: float = 0.0
+) -> float:
+    """
+    후보 bbox 점수 계산 (높을수록 먼저 OCR)
+
+    Args:
+        box: 후보 LayoutBox
+        table_bbox: 가장 큰 Table의 BBox (없으면 None)
+        hit_rate: 템플릿 적중률 (0~1)
+
+    Returns:
+        점수
+    """
+    score = LABEL_WEIGHTS.get(box.label.lower(), DEFAULT_LABEL_WEIGHT)
+
+    # 학번은 보통 답안 Table 위쪽 헤더 영역에 위치
+    if table_bbox is not None and box.bbox.y2 <= table_bbox.y_top + 5:
+        score += 1.0
+
+    # 8자리 숫자 필드 비율
+    aspect = box.bbox.width / max(1.0, box.bbox.height)
+    if ID_ASPECT_MIN <= aspect <= ID_ASPECT_MAX:
+        score += 0.5
+
+    # 같은 시험에서 학번이 매칭되었던 위치 (가장 강한 신호)
+    score += 2.0 * hit_rate
+
+    return score
+
+
+def rank_candidate_boxes(
+    boxes: list[LayoutBox],
+    image_shape: tuple,
+    table_bbox: BBox | None = None,
+    template_key: str | None = None
+) -> list[RankedBox]:
+    """
+    후보 bbox를 학번이 있을 가능성이 높은 순으로 정렬합니다.
+
+    Args:
+        boxes: non-table LayoutBox 리스트
+        image_shape: 원본 이미지 shape (h, w, ...)
+        table_bbox: 가장 큰 Table의 BBox
+        template_key: 템플릿 키 (보통 examCode, None이면 적중률 미사용)
+
+    Returns:
+        점수 내림차순 RankedBox 리스트 (동점이면 탐지 순서 유지)
+    """
+    ranked = []
+    for box in boxes:
+        signature = box_signature(box, image_shape)
+        rate = _template_stats.hit_rate(template_key, signature)
+        ranked.append(RankedBox(layout_box=box, score=score_box(box, table_bbox, rate), signature=signature))
+
+    ranked.sort(key=lambda r: r.score, reverse=True)
+    return ranked
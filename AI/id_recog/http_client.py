@@ -0,0 +1,284 @@
+"""
+http_client.py - presigned URL 다운로드용 공용 HTTP 클라이언트 (연결 재사용 + 재시도)
+
+요청마다 requests.get을 호출하면 매번 TCP + TLS 연결을 새로 맺습니다.
+PooledHttpClient는 하나의 requests.Session(HTTPAdapter 연결 풀)을 공유하여
+같은 S3 엔드포인트로 가는 presigned URL 다운로드가 keep-alive 연결을 재사용하도록 합니다.
+
+- 재시도: 연결 오류 / 타임아웃 / 408·429·5xx 응답을 지수 백오프 + full jitter로 재시도
+  (Retry-After 헤더가 있으면 그 값 이상 대기, 만료된 presigned URL의 403 등은 재시도하지 않음)
+- 스트리밍 읽기: Content-Length 크기의 버퍼를 미리 잡고 chunk를 그대로 채움 (응답 본문 재복사 없음)
+- 비동기: fetch_async / fetch_many_async는 같은 연결 풀을 전용 스레드에서 사용
+
+사용법:
+    from id_recog.http_client import get_http_client
+
+    data = get_http_client().fetch(url)            # bytearray
+    data = await get_http_client().fetch_async(url)
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+try:
+    from .metrics import HTTP_FETCH_RETRIES
+except ImportError:
+    from id_recog.metrics import HTTP_FETCH_RETRIES
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HttpClientConfig:
+    """공용 HTTP 클라이언트 설정"""
+    pool_connections: int = 4               # 호스트별 연결 풀 개수
+    pool_maxsize: int = 16                  # 호스트당 최대 keep-alive 연결 수 (동시 다운로드 스레드 수 이상 권장)
+    max_retries: int = 3                    # 첫 시도 제외 재시도 횟수
+    backoff_base_s: float = 0.2             # 재시도 대기: uniform(0, min(backoff_max_s, base * 2^attempt))
+    backoff_max_s: float = 5.0
+    connect_timeout_s: float = 5.0
+    read_timeout_s: float = 60.0
+    chunk_size: int = 256 * 1024
+    max_bytes: int = 64 * 1024 * 1024       # 이보다 큰 응답은 거부 (잘못된 URL로 대용량 파일을 받는 경우 방지)
+    retry_statuses: tuple = (408, 429, 500, 502, 503, 504)
+    async_workers: int = 8                  # fetch_async용 스레드 수
+
+
+class HttpFetchError(Exception):
+    """다운로드 실패 (재시도 후에도 실패했거나 재시도 대상이 아닌 응답)"""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        url: str = "",
+        retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.url = url
+        self.retry_after = retry_after  # Retry-After 헤더 (초)
+
+
+def _short_url(url: str) -> str:
+    """로그용 URL (presigned 서명 쿼리 제외)"""
+    return url.split("?", 1)[0]
+
+
+class PooledHttpClient:
+    """
+    연결 풀을 공유하는 HTTP GET 클라이언트 (스레드 안전)
+
+    session을 주지 않으면 requests.Session + HTTPAdapter를 생성합니다.
+    (테스트에서는 get(url, stream=, timeout=)을 가진 가짜 session 사용)
+    """
+
+    def __init__(
+        self,
+        config: Optional[HttpClientConfig] = None,
+        session: Any = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None
+    ):
+        self.config = config or HttpClientConfig()
+        self._session = session if session is not None else self._build_session(self.config)
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build_session(config: HttpClientConfig):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # 재시도는 fetch()에서 직접 처리 (jitter / Retry-After / 스트리밍 중 끊김 포함)
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            max_retries=0
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    # =========================================================================
+    # 동기
+    # =========================================================================
+    def fetch(self, url: str) -> bytearray:
+        """
+        URL 본문을 bytearray로 다운로드 (재시도 포함)
+
+        Raises:
+            HttpFetchError
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._fetch_once(url)
+            except HttpFetchError as e:
+                retryable = e.status_code is None or e.status_code in self.config.retry_statuses
+                if not retryable or attempt >= self.config.max_retries:
+                    raise
+                reason = str(e.status_code) if e.status_code is not None else "connection"
+                delay = self._backoff(attempt, e.retry_after)
+            attempt += 1
+            HTTP_FETCH_RETRIES.inc(reason=reason)
+            logger.warning(
+                f"[HTTP] 다운로드 재시도 {attempt}/{self.config.max_retries} ({reason}, {delay:.2f}s 후): {_short_url(url)}"
+            )
+            self._sleep(delay)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        cap = min(self.config.backoff_max_s, self.config.backoff_base_s * (2 ** attempt))
+        delay = self._rng.uniform(0, cap)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.config.backoff_max_s))
+        return delay
+
+    def _fetch_once(self, url: str) -> bytearray:
+        try:
+            response = self._session.get(
+                url,
+                stream=True,
+                timeout=(self.config.connect_timeout_s, self.config.read_timeout_s)
+            )
+        except Exception as e:
+            raise HttpFetchError(f"request failed: {e}", url=url) from e
+
+        try:
+            status = response.status_code
+            if status >= 400:
+                retry_after = response.headers.get("Retry-After")
+                raise HttpFetchError(
+                    f"HTTP {status}: {_short_url(url)}",
+                    status_code=status,
+                    url=url,
+                    retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None
+                )
+            return self._read_body(response, url)
+        finally:
+            response.close()
+
+    def _read_body(self, response: Any, url: str) -> bytearray:
+        """Content-Length가 있으면 미리 할당한 버퍼에 chunk를 채우고, 없으면 이어 붙임"""
+        length_header = response.headers.get("Content-Length")
+        expected = int(length_header) if length_header and length_header.isdigit() else None
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            # 압축 응답은 풀린 크기가 Content-Length와 다름
+            expected = None
+        if expected is not None and expected > self.config.max_bytes:
+            raise HttpFetchError(f"response too large: {expected} bytes", status_code=response.status_code, url=url)
+
+        try:
+            chunks = response.iter_content(chunk_size=self.config.chunk_size)
+            if expected is not None:
+                buffer = bytearray(expected)
+                view = memoryview(buffer)
+                offset = 0
+                for chunk in chunks:
+                    end = offset + len(chunk)
+                    if end > expected:
+                        raise HttpFetchError("body longer than Content-Length", url=url)
+                    view[offset:end] = chunk
+                    offset = end
+                view.release()
+                if offset != expected:
+                    # 연결이 중간에 끊김 → 재시도 대상 (status_code=None)
+                    raise HttpFetchError(f"incomplete body: {offset}/{expected} bytes", url=url)
+                return buffer
+
+            buffer = bytearray()
+            for chunk in chunks:
+                buffer += chunk
+                if len(buffer) > self.config.max_bytes:
+                    raise HttpFetchError(f"response too large: > {self.config.max_bytes} bytes", status_code=response.status_code, url=url)
+            return buffer
+        except HttpFetchError:
+            raise
+        except Exception as e:
+            raise HttpFetchError(f"read failed: {e}", url=url) from e
+
+    # =========================================================================
+    # 비동기
+    # =========================================================================
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.async_workers,
+                    thread_name_prefix="HTTP-Fetch"
+                )
+            return self._executor
+
+    async def fetch_async(self, url: str) -> bytearray:
+        """fetch()의 asyncio 버전 (같은 연결 풀을 전용 스레드에서 사용)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.fetch, url)
+
+    async def fetch_many_async(
+        self,
+        urls: Sequence[str],
+        concurrency: Optional[int] = None
+    ) -> List[Union[bytearray, Exception]]:
+        """
+        여러 URL을 최대 concurrency개씩 동시에 다운로드 (입력 순서대로, 실패는 예외 객체로 반환)
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.config.async_workers)
+
+        async def one(url: str):
+            async with semaphore:
+                return await self.fetch_async(url)
+
+        return await asyncio.gather(*(one(url) for url in urls), return_exceptions=True)
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        close = getattr(self._session, "close", None)
+        if close is not None:
+            close()
+
+
+# =============================================================================
+# 공용 인스턴스
+# =============================================================================
+_client: Optional[PooledHttpClient] = None
+_client_lock = threading.Lock()
+
+
+def configure_http_client(config: HttpClientConfig) -> PooledHttpClient:
+    """공용 클라이언트를 주어진 설정으로 교체 (서버 시작 시 호출)"""
+    global _client
+    with _client_lock:
+        previous, _client = _client, PooledHttpClient(config)
+    if previous is not None:
+        previous.close()
+    return _client
+
+
+def get_http_client() -> PooledHttpClient:
+    """공용 클라이언트 (설정 전이면 기본값으로 생성)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = PooledHttpClient()
+        return _client
+
+
+def close_http_client():
+    """공용 클라이언트 종료 (서버 종료 시)"""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
@@ -0,0 +1,177 @@
+"""
+image_decode.py - 답안지 이미지 디코딩 (cv2.imdecode) + 레이아웃 입력용 축소
+
+워커가 받은 이미지 바이트를 두 파이프라인(학번 인식 / 답안 인식)이 함께 쓰는
+하나의 전체 해상도 배열로 디코딩합니다.
+
+기존: PIL.Image.open → convert("RGB") → np.array
+    (디코딩 버퍼 + RGB 변환본 + numpy 복사본, 전체 해상도 사본이 최대 3개)
+변경: cv2.imdecode로 바로 uint8 배열 디코딩 → 같은 버퍼에서 BGR → RGB 제자리 변환
+    - 입력 bytes / bytearray는 np.frombuffer로 복사 없이 전달
+    - cv2가 읽지 못하는 형식은 PIL로 fallback
+    - max_side 지정 시 JPEG은 IMREAD_REDUCED_COLOR_2/4/8로 축소 디코딩 (미리보기 등 축소본만 필요한 경우)
+
+표준 표현 (CANONICAL_CHANNEL_ORDER):
+    RGB uint8 (H, W, 3) C-contiguous 배열
+    - 학번 파이프라인(ocr._to_model_array, header/ROI 업로드의 Image.fromarray)이 RGB를 가정
+    - 답안 파이프라인도 같은 배열을 그대로 사용하지만 grayscale 변환(ImageContext.gray 등)이
+      COLOR_BGR2GRAY라 R/B 가중치가 바뀐 채 계산됨 → 기존 PIL 경로(RGB 전달)와 같은 결과이며,
+      채널 순서와 무관하지는 않음 (BGR 배열을 넘기면 grayscale 값이 달라짐)
+    - EXIF 회전은 적용하지 않음 (기존 PIL 경로와 같은 픽셀 배치, 기울기 보정은 파이프라인이 담당)
+
+레이아웃 입력 축소 (downscale_max_side):
+    표준 표현은 항상 전체 해상도로 유지하고 (S3 업로드 / crop / 답안 인식),
+    레이아웃 탐지에만 긴 변을 줄인 사본을 넘긴 뒤 box 좌표를 원본 크기로 되돌립니다. (layout.py)
+
+사용법:
+    from id_recog.image_decode import decode_image, downscale_max_side, max_side_for_dpi
+
+    image = decode_image(data)                                                   # 전체 해상도
+    small, scale = downscale_max_side(image, max_side_for_dpi(150))              # 레이아웃 입력
+"""
+
+import io
+from typing import Optional, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+CANONICAL_CHANNEL_ORDER = "RGB"
+
+# A4 긴 변 (inch) - 목표 DPI → 최대 변 길이 환산용
+A4_LONG_SIDE_INCH = 11.69
+
+# JPEG 축소 디코딩 배율 → imdecode 플래그
+_REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+_JPEG_MAGIC = b"\xff\xd8\xff"
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+class ImageDecodeError(Exception):
+    """이미지 바이트를 디코딩할 수 없음"""
+
+
+def max_side_for_dpi(dpi: int, long_side_inch: float = A4_LONG_SIDE_INCH) -> int:
+    """목표 DPI에서 용지 긴 변의 픽셀 수 (A4 200dpi ≈ 2338px, 300dpi ≈ 3507px)"""
+    return int(round(dpi * long_side_inch))
+
+
+def _is_jpeg(data) -> bool:
+    return bytes(data[:3]) == _JPEG_MAGIC
+
+
+def image_content_type(data) -> str:
+    """인코딩된 이미지 바이트의 Content-Type (S3 원본 업로드용)"""
+    if _is_jpeg(data):
+        return "image/jpeg"
+    if bytes(data[:8]) == _PNG_MAGIC:
+        return "image/png"
+    return "application/octet-stream"
+
+
+def _reduce_factor(width: int, height: int, max_side: Optional[int]) -> int:
+    """축소 후에도 긴 변이 max_side 이상으로 남는 가장 큰 JPEG 축소 배율"""
+    if not max_side:
+        return 1
+    long_side = max(width, height)
+    factor = 1
+    for candidate in (2, 4, 8):
+        if long_side // candidate >= max_side:
+            factor = candidate
+    return factor
+
+
+def _fit_max_side(image: np.ndarray, max_side: Optional[int]) -> np.ndarray:
+    """긴 변이 max_side보다 크면 비율 유지 축소 (작으면 그대로)"""
+    if not max_side:
+        return image
+    # 2배 이상 남았으면 INTER_AREA 1/2 축소 반복 (정수 배율은 빠름, 비정수 INTER_AREA는 10배 이상 느림)
+    while max(image.shape[:2]) // 2 >= max_side:
+        h, w = image.shape[:2]
+        image = cv2.resize(image, (w // 2, h // 2), interpolation=cv2.INTER_AREA)
+    h, w = image.shape[:2]
+    long_side = max(h, w)
+    if long_side <= max_side:
+        return image
+    # 남은 2배 미만 축소는 INTER_LINEAR로 충분
+    scale = max_side / long_side
+    size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+    return cv2.resize(image, size, interpolation=cv2.INTER_LINEAR)
+
+
+def downscale_max_side(image: np.ndarray, max_side: Optional[int]) -> Tuple[np.ndarray, float]:
+    """
+    긴 변이 max_side 이하가 되도록 축소한 사본 (원본은 그대로)
+
+    Returns:
+        (축소 이미지, 배율) - 배율은 축소 이미지 폭 / 원본 폭 (축소하지 않았으면 원본과 1.0)
+        축소 이미지 좌표 / 배율 = 원본 좌표
+    """
+    resized = _fit_max_side(image, max_side)
+    if resized is image:
+        return image, 1.0
+    return resized, resized.shape[1] / image.shape[1]
+
+
+def _decode_cv2(buffer: np.ndarray, factor: int) -> Optional[np.ndarray]:
+    flags = _REDUCED_FLAGS[factor] | cv2.IMREAD_IGNORE_ORIENTATION
+    return cv2.imdecode(buffer, flags)
+
+
+def _decode_pil(data, max_side: Optional[int]) -> np.ndarray:
+    """cv2가 읽지 못하는 형식 (예: 일부 TIFF/GIF 변형) → PIL 디코딩 (RGB)"""
+    pil_image = Image.open(io.BytesIO(data))
+    if max_side and pil_image.format == "JPEG":
+        # draft: JPEG을 1/2~1/8 크기로 바로 디코딩 (요청 크기 이상 유지)
+        w, h = pil_image.size
+        scale = max_side / max(w, h)
+        if scale < 1:
+            pil_image.draft("RGB", (int(w * scale), int(h * scale)))
+    return _fit_max_side(np.array(pil_image.convert("RGB")), max_side)
+
+
+def decode_image(
+    data: Union[bytes, bytearray, memoryview],
+    max_side: Optional[int] = None
+) -> np.ndarray:
+    """
+    이미지 바이트 → 표준 표현(RGB uint8, C-contiguous) 배열
+
+    Args:
+        data: 인코딩된 이미지 (JPEG / PNG / ...)
+        max_side: 긴 변 최대 픽셀 수 (None이면 원본 해상도, 더 작은 이미지는 확대하지 않음)
+
+    Raises:
+        ImageDecodeError
+    """
+    if not data:
+        raise ImageDecodeError("empty image data")
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    factor = 1
+    if max_side and _is_jpeg(data):
+        # 헤더만 읽어 원본 크기 확인 (픽셀 디코딩 없음)
+        try:
+            with Image.open(io.BytesIO(data)) as probe:
+                factor = _reduce_factor(*probe.size, max_side)
+        except Exception:
+            factor = 1
+
+    image = _decode_cv2(buffer, factor)
+    if image is None:
+        try:
+            return np.ascontiguousarray(_decode_pil(data, max_side))
+        except Exception as e:
+            raise ImageDecodeError(f"cannot decode image ({len(data)} bytes): {e}") from e
+
+    image = _fit_max_side(image, max_side)
+    # imdecode 결과(BGR)를 같은 버퍼에서 RGB로 변환 (추가 사본 없음)
+    cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+    return image
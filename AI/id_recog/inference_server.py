@@ -0,0 +1,427 @@
+"""
+inference_server.py - PaddleX 모델 멀티프로세스 추론 서버
+
+FastAPI 프로세스 안에서 여러 스레드(SQS 워커 2개, HTTP 엔드포인트)가 같은 모델 객체를
+동시에 호출하는 대신, 모델 사본을 가진 워커 프로세스 풀에 추론 요청을 보냅니다.
+
+구성:
+- InferenceServer: 워커 프로세스 관리 + 요청 분배 + 응답 수집
+  - 워커마다 전용 요청 큐 (진행 중 요청이 가장 적은 워커에 배정)
+  - 입력 이미지는 shared_memory 블록으로 전달 (pickle 복사 없음), 응답 후 해제
+    (응답 대기 타임아웃 시 RemoteModel이 cancel()로 즉시 해제)
+  - 워커가 죽으면 해당 워커의 진행 중 요청을 실패 처리하고 워커를 재시작
+- RemoteModel: 기존 PaddleX 모델과 같은 predict(x, batch_size) 인터페이스의 얇은 클라이언트
+  (결과는 .json 속성만 가진 RemoteResult, layout.py / ocr.py 파서가 그대로 사용)
+
+워커는 spawn 방식으로 시작합니다. (Paddle 스레드가 있는 부모 프로세스를 fork하지 않음)
+"""
+
+import itertools
+import logging
+import multiprocessing as mp
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceError(RuntimeError):
+    """워커 추론 실패 / 워커 비정상 종료 / 서버 중지"""
+
+
+def load_paddlex_model(model_name: str):
+    """워커 프로세스에서 PaddleX 모델 로드 (기본 loader)"""
+    from paddlex import create_model
+    return create_model(model_name=model_name)
+
+
+class RemoteResult:
+    """워커가 돌려준 결과 1건 (PaddleX 결과 객체의 res.json과 동일한 dict)"""
+
+    def __init__(self, json_data: dict):
+        self.json = json_data
+
+
+# =============================================================================
+# 공유 메모리 입력 전달
+# =============================================================================
+
+def _share_array(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, dict]:
+    """배열을 새 공유 메모리 블록에 복사하고 (블록, 워커 전달용 spec) 반환"""
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, {"kind": "array", "shm": shm.name, "shape": array.shape, "dtype": array.dtype.str}
+
+
+def _encode_inputs(x: Any) -> Tuple[Any, List[shared_memory.SharedMemory]]:
+    """
+    predict 입력(배열 / PIL / 경로 / 리스트)을 워커 전달용 spec으로 변환
+
+    Returns:
+        (spec 또는 spec 리스트, 생성한 공유 메모리 블록 리스트)
+    """
+    blocks: List[shared_memory.SharedMemory] = []
+
+    def encode_one(item: Any) -> dict:
+        if isinstance(item, str):
+            return {"kind": "path", "path": item}
+        if isinstance(item, Image.Image):
+            item = np.array(item)
+        shm, spec = _share_array(np.asarray(item))
+        blocks.append(shm)
+        return spec
+
+    try:
+        if isinstance(x, (list, tuple)):
+            return [encode_one(item) for item in x], blocks
+        return encode_one(x), blocks
+    except Exception:
+        _release(blocks)
+        raise
+
+
+def _release(blocks: List[shared_memory.SharedMemory]):
+    for shm in blocks:
+        try:
+            shm.close()
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# =============================================================================
+# 워커 프로세스
+# =============================================================================
+
+def _worker_main(
+    worker_idx: int,
+    model_name: str,
+    loader: Callable[[str], Any],
+    request_q: "mp.Queue",
+    response_q: "mp.Queue"
+):
+    """워커 프로세스: 모델 로드 후 요청 큐를 처리 (None 수신 시 종료)"""
+    try:
+        model = loader(model_name)
+    except Exception as e:
+        response_q.put(("load_error", worker_idx, None, f"{type(e).__name__}: {e}"))
+        return
+    response_q.put(("ready", worker_idx, None, None))
+
+    while True:
+        msg = request_q.get()
+        if msg is None:
+            break
+        req_id, spec, batch_size = msg
+        attached: List[shared_memory.SharedMemory] = []
+
+        def decode_one(item: dict) -> Any:
+            if item["kind"] == "path":
+                return item["path"]
+            shm = shared_memory.SharedMemory(name=item["shm"])
+            attached.append(shm)
+            return np.ndarray(tuple(item["shape"]), dtype=np.dtype(item["dtype"]), buffer=shm.buf)
+
+        inputs = None
+        try:
+            inputs = [decode_one(item) for item in spec] if isinstance(spec, list) else decode_one(spec)
+            outputs = [res.json for res in model.predict(inputs, batch_size=batch_size)]
+            response_q.put(("ok", worker_idx, req_id, outputs))
+        except Exception as e:
+            response_q.put(("error", worker_idx, req_id, f"{type(e).__name__}: {e}"))
+        finally:
+            # 공유 메모리 view를 모두 놓은 뒤 close (해제는 부모가 unlink)
+            inputs = None
+            for shm in attached:
+                shm.close()
+
+
+# =============================================================================
+# 서버 (부모 프로세스)
+# =============================================================================
+
+class InferenceServer:
+    """
+    모델 하나를 서빙하는 워커 프로세스 풀
+
+    사용법:
+        server = InferenceServer("PP-OCRv5_mobile_rec", num_workers=2)
+        server.start()
+        model = RemoteModel(server)
+        outputs = model.predict(image, batch_size=1)
+        server.stop()
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        num_workers: int = 1,
+        loader: Callable[[str], Any] = load_paddlex_model,
+        request_timeout_s: float = 120.0,
+        start_method: str = "spawn"
+    ):
+        """
+        Args:
+            model_name: PaddleX 모델 이름 (loader에 전달)
+            num_workers: 워커 프로세스 수 (= 모델 사본 수)
+            loader: 워커에서 모델을 만드는 함수 (pickle 가능한 모듈 최상위 함수)
+            request_timeout_s: RemoteModel.predict 대기 시간
+            start_method: multiprocessing 시작 방식
+        """
+        self.model_name = model_name
+        self.num_workers = max(1, num_workers)
+        self.loader = loader
+        self.request_timeout_s = request_timeout_s
+        self._ctx = mp.get_context(start_method)
+
+        self._lock = threading.Lock()
+        self._response_q = None
+        self._request_qs: List[Any] = []
+        self._procs: List[Any] = []
+        self._ready: List[bool] = []
+        self._in_flight: Dict[int, Tuple[int, Future, List[shared_memory.SharedMemory]]] = {}
+        self._req_ids = itertools.count()
+        self._ready_event = threading.Event()
+        self._running = False
+        self._threads: List[threading.Thread] = []
+
+        # 통계
+        self.completed = 0
+        self.failed = 0
+        self.restarts = 0
+
+    # -------------------------------------------------------------------------
+    # 수명 주기
+    # -------------------------------------------------------------------------
+    def start(self, wait_ready: bool = True, timeout: Optional[float] = 300.0) -> bool:
+        """
+        워커 시작
+
+        Args:
+            wait_ready: True면 최소 1개 워커의 모델 로드가 끝날 때까지 대기
+            timeout: 대기 시간 (초)
+
+        Returns:
+            준비 완료 여부 (wait_ready=False면 True)
+        """
+        if self._running:
+            return True
+        self._running = True
+        self._response_q = self._ctx.Queue()
+        for idx in range(self.num_workers):
+            self._request_qs.append(self._ctx.Queue())
+            self._procs.append(None)
+            self._ready.append(False)
+            self._spawn(idx)
+
+        for target, name in ((self._collect_loop, "Collector"), (self._monitor_loop, "Monitor")):
+            t = threading.Thread(target=target, daemon=True, name=f"Inference-{self.model_name}-{name}")
+            t.start()
+            self._threads.append(t)
+
+        if not wait_ready:
+            return True
+        ready = self._ready_event.wait(timeout)
+        if not ready:
+            logger.error(f"[INFERENCE] {self.model_name} 워커 준비 시간 초과 ({timeout}s)")
+        return ready
+
+    def stop(self, timeout: float = 10.0):
+        """워커 종료 (진행 중 요청은 실패 처리)"""
+        if not self._running:
+            return
+        self._running = False
+        for q in self._request_qs:
+            q.put(None)
+        deadline = time.time() + timeout
+        for proc in self._procs:
+            if proc is None:
+                continue
+            proc.join(max(0.0, deadline - time.time()))
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(1.0)
+        self._fail_in_flight(lambda worker_idx: True, "inference server stopped")
+        self._response_q.put(None)
+        for t in self._threads:
+            t.join(timeout=2)
+        self._threads = []
+
+    def _spawn(self, idx: int):
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(idx, self.model_name, self.loader, self._request_qs[idx], self._response_q),
+            daemon=True,
+            name=f"Inference-{self.model_name}-{idx}"
+        )
+        proc.start()
+        self._procs[idx] = proc
+        self._ready[idx] = False
+
+    @property
+    def is_ready(self) -> bool:
+        return self._running and any(self._ready)
+
+    # -------------------------------------------------------------------------
+    # 요청
+    # -------------------------------------------------------------------------
+    def submit(self, x: Any, batch_size: int = 1) -> Future:
+        """
+        추론 요청 (결과: res.json dict 리스트)
+
+        반환한 Future의 req_id 속성으로 cancel()할 수 있습니다.
+        """
+        if not self._running:
+            raise InferenceError("inference server is not running")
+
+        spec, blocks = _encode_inputs(x)
+        future: Future = Future()
+        req_id = next(self._req_ids)
+        future.req_id = req_id
+        with self._lock:
+            try:
+                worker_idx = self._pick_worker()
+            except InferenceError:
+                _release(blocks)
+                raise
+            self._in_flight[req_id] = (worker_idx, future, blocks)
+            # 배정과 같은 lock 안에서 큐를 고름 → 워커 재시작으로 큐가 교체되면
+            # 이 요청은 _monitor_loop가 lost로 함께 수집해 실패 처리
+            request_q = self._request_qs[worker_idx]
+        request_q.put((req_id, spec, batch_size))
+        return future
+
+    def cancel(self, req_id: int, reason: str = "cancelled") -> bool:
+        """
+        진행 중 요청 포기 (타임아웃 등): 공유 메모리 블록을 해제하고 Future를 실패 처리
+
+        나중에 워커 응답이 와도 무시됩니다.
+
+        Returns:
+            요청이 아직 진행 중이었는지 여부
+        """
+        return self._resolve(req_id, error=reason)
+
+    def _pick_worker(self) -> int:
+        """진행 중 요청이 가장 적은 워커 (준비된 워커 우선)"""
+        load = [0] * self.num_workers
+        for worker_idx, _, _ in self._in_flight.values():
+            load[worker_idx] += 1
+        # 모델 로드 실패로 종료된 워커(None)는 제외
+        candidates = [i for i in range(self.num_workers) if self._procs[i] is not None]
+        if not candidates:
+            raise InferenceError(f"no inference worker available for {self.model_name}")
+        return min(candidates, key=lambda i: (not self._ready[i], load[i]))
+
+    def _resolve(self, req_id: int, result: Any = None, error: Optional[str] = None) -> bool:
+        """진행 중 요청 완료 처리 (이미 완료/취소된 요청이면 False)"""
+        with self._lock:
+            entry = self._in_flight.pop(req_id, None)
+        if entry is None:
+            return False
+        _, future, blocks = entry
+        _release(blocks)
+        if error is None:
+            self.completed += 1
+            future.set_result(result)
+        else:
+            self.failed += 1
+            future.set_exception(InferenceError(error))
+        return True
+
+    def _fail_in_flight(self, match: Callable[[int], bool], reason: str):
+        with self._lock:
+            req_ids = [req_id for req_id, (worker_idx, _, _) in self._in_flight.items() if match(worker_idx)]
+        for req_id in req_ids:
+            self._resolve(req_id, error=reason)
+
+    # -------------------------------------------------------------------------
+    # 백그라운드 스레드
+    # -------------------------------------------------------------------------
+    def _collect_loop(self):
+        """워커 응답 수집"""
+        while True:
+            msg = self._response_q.get()
+            if msg is None:
+                break
+            kind, worker_idx, req_id, payload = msg
+            if kind == "ready":
+                self._ready[worker_idx] = True
+                self._ready_event.set()
+                logger.info(f"[INFERENCE] {self.model_name} 워커 {worker_idx} 준비 완료")
+            elif kind == "load_error":
+                logger.error(f"[INFERENCE] {self.model_name} 워커 {worker_idx} 모델 로드 실패: {payload}")
+            elif kind == "ok":
+                self._resolve(req_id, result=[RemoteResult(data) for data in payload])
+            else:
+                self._resolve(req_id, error=payload)
+
+    def _monitor_loop(self, interval: float = 1.0):
+        """죽은 워커 감지 → 진행 중 요청 실패 처리 후 재시작"""
+        while self._running:
+            time.sleep(interval)
+            for idx, proc in enumerate(self._procs):
+                if not self._running or proc is None or proc.is_alive():
+                    continue
+                restart = proc.exitcode != 0
+                # 사용 불가 표시 + 큐 교체 + 진행 중 요청 수집을 submit()과 같은 lock 안에서 한 번에 처리
+                # (그 사이 죽은 워커의 이전 큐에 들어가 영원히 응답받지 못하는 요청이 없도록)
+                with self._lock:
+                    self._ready[idx] = False
+                    if restart:
+                        # 죽은 워커 큐에 남은 요청은 아래에서 실패 처리 → 새 큐로 교체
+                        self._request_qs[idx] = self._ctx.Queue()
+                    else:
+                        # 모델 로드 실패 등으로 정상 종료한 워커는 재시작해도 같은 결과
+                        self._procs[idx] = None
+                    lost = [req_id for req_id, (worker_idx, _, _) in self._in_flight.items() if worker_idx == idx]
+                if restart:
+                    logger.warning(f"[INFERENCE] {self.model_name} 워커 {idx} 비정상 종료 "
+                                   f"(code={proc.exitcode}) → 재시작")
+                    self.restarts += 1
+                    self._spawn(idx)
+                for req_id in lost:
+                    self._resolve(req_id, error=f"inference worker {idx} exited (code={proc.exitcode})")
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            in_flight = len(self._in_flight)
+        return {
+            "model": self.model_name,
+            "workers": self.num_workers,
+            "alive": sum(1 for p in self._procs if p is not None and p.is_alive()),
+            "ready": sum(1 for r in self._ready if r),
+            "inFlight": in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "restarts": self.restarts
+        }
+
+
+class RemoteModel:
+    """
+    InferenceServer 클라이언트 (PaddleX 모델과 같은 predict 인터페이스)
+
+    layout.py / ocr.py / answer_extraction.py에 모델 대신 그대로 전달할 수 있습니다.
+    """
+
+    def __init__(self, server: InferenceServer, timeout_s: Optional[float] = None):
+        self.server = server
+        self.timeout_s = timeout_s if timeout_s is not None else server.request_timeout_s
+
+    def predict(self, x: Any, batch_size: int = 1) -> List[RemoteResult]:
+        """추론 (결과가 올 때까지 블로킹, 실패 시 InferenceError)"""
+        future = self.server.submit(x, batch_size=batch_size)
+        try:
+            return future.result(timeout=self.timeout_s)
+        except TimeoutError as e:
+            # 응답을 더 기다리지 않음 → 진행 중 목록 / 공유 메모리 정리
+            self.server.cancel(future.req_id, reason=f"inference timeout ({self.timeout_s}s)")
+            raise InferenceError(f"inference timeout ({self.timeout_s}s)") from e
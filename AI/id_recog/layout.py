@@ -3,16 +3,33 @@ layout.py - 레이아웃 탐지 및 bbox crop
 
 PP-DocLayout_plus-L 모델을 사용하여 모든 bbox를 탐지하고,
 Table을 제외한 각 bbox를 crop하여 OCR에 전달합니다.
+
+set_layout_max_side(n)을 설정하면 레이아웃 모델에는 긴 변을 n픽셀로 줄인 사본만 넘기고,
+결과 좌표는 원본 이미지 크기로 되돌려 반환합니다. (crop / 업로드 / 답안 인식은 원본 해상도 유지)
 """
 
+from typing import Optional
+
 import numpy as np
 from PIL import Image
 from dataclasses import dataclass
 
 try:
     from .schemas import BBox
+    from .image_decode import downscale_max_side
 except ImportError:
     from id_recog.schemas import BBox
+    from id_recog.image_decode import downscale_max_side
+
+
+# 레이아웃 모델 입력 긴 변 최대 픽셀 수 (None이면 원본 그대로 전달)
+_LAYOUT_MAX_SIDE: Optional[int] = None
+
+
+def set_layout_max_side(max_side: Optional[int]):
+    """레이아웃 입력 축소 설정 (서버 시작 시 호출, None/0이면 비활성)"""
+    global _LAYOUT_MAX_SIDE
+    _LAYOUT_MAX_SIDE = max_side or None
 
 
 @dataclass
@@ -22,6 +39,94 @@ class LayoutBox:
     label: str
     score: float
 
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 딕셔너리 (PP-DocLayout 결과와 같은 키 사용)"""
+        return {
+            "label": self.label,
+            "score": float(self.score),
+            "coordinate": [float(self.bbox.x1), float(self.bbox.y1), float(self.bbox.x2), float(self.bbox.y2)]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LayoutBox":
+        """to_dict() 결과에서 복원"""
+        return cls(
+            bbox=BBox.from_coordinate(data["coordinate"]),
+            label=data.get("label", ""),
+            score=data.get("score", 0.0)
+        )
+
+
+def _parse_layout_result(res) -> list[LayoutBox]:
+    """
+    레이아웃 모델 결과 1건(이미지 1장)을 LayoutBox 리스트로 변환합니다.
+    
+    Args:
+        res: layout_model.predict()가 yield한 결과 객체 (res.json 사용)
+        
+    Returns:
+        LayoutBox 리스트
+    """
+    result_data = res.json
+    
+    # PP-DocLayout_plus-L 모델의 결과 구조: res.json['res']['boxes']
+    # 또는 PP-StructureV3 파이프라인: res.json['boxes']
+    boxes = None
+    if 'res' in result_data and isinstance(result_data['res'], dict):
+        boxes = result_data['res'].get('boxes', [])
+    elif 'boxes' in result_data:
+        boxes = result_data['boxes']
+    
+    layout_boxes = []
+    if not boxes:
+        return layout_boxes
+        
+    for box in boxes:
+        label = box.get('label', '')
+        score = box.get('score', 0.0)
+        coord = box.get('coordinate', [])
+        
+        if len(coord) == 4:
+            bbox = BBox.from_coordinate(coord)
+            layout_boxes.append(LayoutBox(bbox=bbox, label=label, score=score))
+    
+    return layout_boxes
+
+
+def _layout_input(image: np.ndarray | Image.Image) -> tuple[np.ndarray | Image.Image, float, float]:
+    """
+    레이아웃 모델 입력 (_LAYOUT_MAX_SIDE 설정 시 축소 사본)
+
+    Returns:
+        (모델 입력, x 배율, y 배율) - 배율은 모델 입력 크기 / 원본 크기
+    """
+    if _LAYOUT_MAX_SIDE is None:
+        return image, 1.0, 1.0
+    array = np.asarray(image) if isinstance(image, Image.Image) else image
+    resized, _ = downscale_max_side(array, _LAYOUT_MAX_SIDE)
+    if resized is array:
+        return image, 1.0, 1.0
+    return resized, resized.shape[1] / array.shape[1], resized.shape[0] / array.shape[0]
+
+
+def _to_original_scale(boxes: list[LayoutBox], scale_x: float, scale_y: float) -> list[LayoutBox]:
+    """축소 입력 기준 좌표 → 원본 이미지 좌표"""
+    if scale_x == 1.0 and scale_y == 1.0:
+        return boxes
+    return [
+        LayoutBox(
+            bbox=BBox(
+                x1=box.bbox.x1 / scale_x,
+                y1=box.bbox.y1 / scale_y,
+                x2=box.bbox.x2 / scale_x,
+                y2=box.bbox.y2 / scale_y
+            ),
+            label=box.label,
+            score=box.score
+        )
+        for box in boxes
+    ]
+
 
 def detect_all_bboxes(image: np.ndarray | Image.Image, layout_model) -> list[LayoutBox]:
     """
@@ -32,36 +137,52 @@ def detect_all_bboxes(image: np.ndarray | Image.Image, layout_model) -> list[Lay
         layout_model: PP-DocLayout_plus-L 모델 객체
         
     Returns:
-        모든 LayoutBox 리스트
+        모든 LayoutBox 리스트 (원본 image 좌표)
     """
-    outputs = layout_model.predict(image, batch_size=1)
+    model_input, scale_x, scale_y = _layout_input(image)
+    outputs = layout_model.predict(model_input, batch_size=1)
     
     all_boxes = []
-    
     for res in outputs:
-        result_data = res.json
-        
-        # PP-DocLayout_plus-L 모델의 결과 구조: res.json['res']['boxes']
-        # 또는 PP-StructureV3 파이프라인: res.json['boxes']
-        boxes = None
-        if 'res' in result_data and isinstance(result_data['res'], dict):
-            boxes = result_data['res'].get('boxes', [])
-        elif 'boxes' in result_data:
-            boxes = result_data['boxes']
+        all_boxes.extend(_parse_layout_result(res))
+    
+    return _to_original_scale(all_boxes, scale_x, scale_y)
+
+
+def detect_all_bboxes_batch(
+    images: list[np.ndarray | Image.Image],
+    layout_model,
+    batch_size: int = 8
+) -> list[list[LayoutBox]]:
+    """
+    여러 시험지 이미지를 한 번의 predict 호출로 배치 추론합니다.
+    
+    Args:
+        images: 입력 이미지 리스트
+        layout_model: PP-DocLayout_plus-L 모델 객체
+        batch_size: 모델 배치 크기
         
-        if not boxes:
-            continue
-            
-        for box in boxes:
-            label = box.get('label', '')
-            score = box.get('score', 0.0)
-            coord = box.get('coordinate', [])
-            
-            if len(coord) == 4:
-                bbox = BBox.from_coordinate(coord)
-                all_boxes.append(LayoutBox(bbox=bbox, label=label, score=score))
-    
-    return all_boxes
+    Returns:
+        이미지별 LayoutBox 리스트 (입력 순서와 동일, 각 원본 image 좌표)
+    """
+    if not images:
+        return []
+    if len(images) == 1:
+        return [detect_all_bboxes(images[0], layout_model)]
+    
+    # PIL Image는 numpy array로 통일 (PaddleX 리스트 입력)
+    prepared = [_layout_input(np.array(img) if isinstance(img, Image.Image) else img) for img in images]
+    inputs = [model_input for model_input, _, _ in prepared]
+    
+    outputs = list(layout_model.predict(inputs, batch_size=batch_size))
+    if len(outputs) != len(inputs):
+        # 결과 개수가 맞지 않으면 이미지별 매핑을 보장할 수 없으므로 개별 추론
+        return [detect_all_bboxes(img, layout_model) for img in images]
+    
+    return [
+        _to_original_scale(_parse_layout_result(res), scale_x, scale_y)
+        for res, (_, scale_x, scale_y) in zip(outputs, prepared)
+    ]
 
 
 def get_non_table_boxes(layout_boxes: list[LayoutBox]) -> list[LayoutBox]:
@@ -0,0 +1,127 @@
+"""
+layout_batcher.py - 레이아웃 추론 마이크로 배치
+
+여러 워커 스레드가 동시에 요청한 레이아웃 탐지를 모아서
+detect_all_bboxes_batch() 한 번으로 처리합니다.
+
+- 최대 max_batch장 또는 첫 요청 이후 max_wait_ms가 지나면 배치 실행
+- 각 요청자는 Future로 자신의 LayoutBox 리스트를 받음
+- 배처를 거치는 요청(학번 인식 콜백)끼리는 배처 스레드 하나에서만 모델을 호출
+- 배처를 거치지 않는 호출(답안 파이프라인이 레이아웃 캐시 miss 시 find_answer_section →
+  detect_all_bboxes로 layout_model 직접 호출)과는 동시에 실행될 수 있음
+  → layout_model 동시 호출 방지는 보장하지 않음
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from queue import Queue, Empty
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from id_recog.layout import LayoutBox, detect_all_bboxes_batch
+
+logger = logging.getLogger(__name__)
+
+
+class LayoutMicroBatcher:
+    """레이아웃 탐지 마이크로 배처"""
+
+    def __init__(self, layout_model: Any, max_batch: int = 8, max_wait_ms: float = 50.0):
+        """
+        Args:
+            layout_model: PP-DocLayout_plus-L 모델 객체
+            max_batch: 한 번에 추론할 최대 이미지 수
+            max_wait_ms: 첫 요청 이후 추가 요청을 기다리는 최대 시간 (ms)
+        """
+        self.layout_model = layout_model
+        self.max_batch = max(1, max_batch)
+        self.max_wait_ms = max_wait_ms
+
+        self._queue: "Queue[Optional[Tuple[Any, Future]]]" = Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # 통계
+        self.batch_count = 0
+        self.image_count = 0
+
+    def start(self):
+        """배처 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="Layout-Batcher")
+        self._thread.start()
+
+    def stop(self):
+        """배처 스레드 종료 (대기 중인 요청은 처리 후 종료)"""
+        if not self._running:
+            return
+        self._running = False
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout=30)
+            self._thread = None
+
+    def submit(self, image: np.ndarray | Image.Image) -> Future:
+        """레이아웃 탐지 요청 (Future[list[LayoutBox]] 반환)"""
+        future: Future = Future()
+        if not self._running:
+            future.set_exception(RuntimeError("LayoutMicroBatcher가 시작되지 않았습니다."))
+            return future
+        self._queue.put((image, future))
+        return future
+
+    def detect(self, image: np.ndarray | Image.Image) -> list[LayoutBox]:
+        """레이아웃 탐지 (배치 결과가 나올 때까지 블로킹)"""
+        return self.submit(image).result()
+
+    @property
+    def avg_batch_size(self) -> float:
+        """평균 배치 크기"""
+        return self.image_count / self.batch_count if self.batch_count else 0.0
+
+    def _collect(self, first: Tuple[Any, Future]) -> Tuple[List[Tuple[Any, Future]], bool]:
+        """첫 요청 이후 max_batch개 또는 max_wait_ms까지 요청 수집 (종료 신호 여부 함께 반환)"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch, stop_requested = self._collect(item)
+            images = [image for image, _ in batch]
+            try:
+                results = detect_all_bboxes_batch(images, self.layout_model, batch_size=len(images))
+                for (_, future), boxes in zip(batch, results):
+                    future.set_result(boxes)
+            except Exception as e:
+                logger.error(f"[LAYOUT_BATCH] 배치 레이아웃 추론 실패 ({len(batch)}장): {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+            self.batch_count += 1
+            self.image_count += len(batch)
+
+            if stop_requested:
+                return
@@ -0,0 +1,217 @@
+"""
+layout_cache.py - 시험지별 레이아웃 결과 캐시
+
+같은 시험지가 학번 인식(extract_student_id)과 답안 인식(find_answer_section)에서
+PP-DocLayout_plus-L을 두 번 거치지 않도록 레이아웃 결과를 (exam_code, filename) 단위로 저장합니다.
+
+저장 위치:
+- 메모리 LRU (같은 프로세스에서 바로 재사용)
+- S3 JSON sidecar: layout/{exam_code}/{filename}.json (프로세스 재시작/다른 노드에서도 재사용)
+
+이미지 크기가 저장 당시와 다르면 캐시를 사용하지 않습니다.
+답안 인식 콜백은 process_with_layout_cache로 조회 → pipeline.process → 기울기 각도 기록을 수행합니다.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+try:
+    from .layout import LayoutBox, get_table_boxes
+except ImportError:
+    from id_recog.layout import LayoutBox, get_table_boxes
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LayoutCacheEntry:
+    """캐시된 레이아웃 결과"""
+    boxes: list[LayoutBox]
+    image_size: tuple[int, int]              # (width, height)
+    rotation_angle: Optional[float] = None   # 답안 섹션 기울기 보정 각도 (답안 인식 후 기록)
+
+    @property
+    def table_box(self) -> Optional[LayoutBox]:
+        """가장 큰 Table bbox"""
+        tables = get_table_boxes(self.boxes)
+        return max(tables, key=lambda b: b.bbox.area) if tables else None
+
+    def to_dict(self) -> dict:
+        table = self.table_box
+        return {
+            "imageSize": list(self.image_size),
+            "boxes": [box.to_dict() for box in self.boxes],
+            "tableBox": table.to_dict() if table else None,
+            "rotationAngle": self.rotation_angle
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LayoutCacheEntry":
+        return cls(
+            boxes=[LayoutBox.from_dict(b) for b in data.get("boxes", [])],
+            image_size=tuple(data.get("imageSize", (0, 0))),
+            rotation_angle=data.get("rotationAngle")
+        )
+
+
+class LayoutCache:
+    """메모리 LRU + S3 sidecar 레이아웃 캐시"""
+
+    def __init__(
+        self,
+        s3_client: Any = None,
+        bucket: Optional[str] = None,
+        max_items: int = 512,
+        prefix: str = "layout"
+    ):
+        """
+        Args:
+            s3_client: boto3 S3 클라이언트 (None이면 메모리 캐시만 사용)
+            bucket: S3 버킷
+            max_items: 메모리에 보관할 최대 시험지 수
+            prefix: S3 key prefix
+        """
+        self.s3 = s3_client
+        self.bucket = bucket
+        self.max_items = max(1, max_items)
+        self.prefix = prefix
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple[str, str], LayoutCacheEntry]" = OrderedDict()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    def s3_key(self, exam_code: str, filename: str) -> str:
+        return f"{self.prefix}/{exam_code}/{filename}.json"
+
+    def put(
+        self,
+        exam_code: str,
+        filename: str,
+        boxes: list[LayoutBox],
+        image_size: tuple[int, int],
+        rotation_angle: Optional[float] = None
+    ):
+        """레이아웃 결과 저장 (메모리 + S3)"""
+        entry = LayoutCacheEntry(boxes=list(boxes), image_size=tuple(image_size), rotation_angle=rotation_angle)
+        self._remember((exam_code, filename), entry)
+        self._upload(exam_code, filename, entry)
+
+    def get(
+        self,
+        exam_code: str,
+        filename: str,
+        image_size: Optional[tuple[int, int]] = None
+    ) -> Optional[LayoutCacheEntry]:
+        """
+        캐시된 레이아웃 조회 (메모리 → S3 순)
+
+        Args:
+            image_size: 현재 이미지 크기 (width, height), 주어지면 저장 당시 크기와 비교
+
+        Returns:
+            LayoutCacheEntry (없거나 크기가 다르면 None)
+        """
+        key = (exam_code, filename)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            entry = self._download(exam_code, filename)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None or (image_size is not None and tuple(entry.image_size) != tuple(image_size)):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def set_rotation_angle(self, exam_code: str, filename: str, rotation_angle: float):
+        """답안 인식에서 계산한 기울기 각도를 캐시에 추가"""
+        with self._lock:
+            entry = self._entries.get((exam_code, filename))
+        if entry is None or entry.rotation_angle == rotation_angle:
+            return
+        entry.rotation_angle = rotation_angle
+        self._upload(exam_code, filename, entry)
+
+    def get_stats(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _remember(self, key: tuple[str, str], entry: LayoutCacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+
+    def _upload(self, exam_code: str, filename: str, entry: LayoutCacheEntry):
+        if self.s3 is None or not self.bucket:
+            return
+        try:
+            self.s3.put_object(
+                Bucket=self.bucket,
+                Key=self.s3_key(exam_code, filename),
+                Body=json.dumps(entry.to_dict()),
+                ContentType='application/json'
+            )
+        except Exception as e:
+            # 캐시 저장 실패는 처리 결과에 영향 없음
+            logger.warning(f"[LAYOUT_CACHE] S3 저장 실패: {exam_code}/{filename}: {e}")
+
+    def _download(self, exam_code: str, filename: str) -> Optional[LayoutCacheEntry]:
+        if self.s3 is None or not self.bucket:
+            return None
+        try:
+            response = self.s3.get_object(Bucket=self.bucket, Key=self.s3_key(exam_code, filename))
+            return LayoutCacheEntry.from_dict(json.loads(response['Body'].read()))
+        except Exception:
+            # NoSuchKey 등 → 캐시 없음
+            return None
+
+
+def process_with_layout_cache(
+    pipeline: Any,
+    cache: Optional[LayoutCache],
+    image: Any,
+    metadata: Any,
+    student_id: Optional[str],
+    exam_code: Optional[str],
+    filename: str
+):
+    """
+    캐시된 레이아웃으로 답안 인식 (AnswerRecognitionPipeline.process 래퍼)
+
+    Args:
+        pipeline: AnswerRecognitionPipeline
+        cache: LayoutCache (None이면 캐시 없이 처리)
+        metadata: AnswerSheetMeta
+        exam_code: 캐시 key (학번 인식 단계에서 저장한 메시지의 examCode, 비어 있으면 캐시 조회 생략)
+
+    Returns:
+        AnswerSheetResult
+    """
+    entry = None
+    if cache is not None and exam_code:
+        entry = cache.get(exam_code, filename, (image.shape[1], image.shape[0]))
+
+    result = pipeline.process(
+        image,
+        metadata,
+        student_id,
+        layout_boxes=entry.boxes if entry else None,
+        rotation_angle=entry.rotation_angle if entry else None
+    )
+    if entry and entry.rotation_angle is None and result.rotation_angle is not None:
+        cache.set_rotation_angle(exam_code, filename, result.rotation_angle)
+    return result
@@ -0,0 +1,688 @@
+"""
+local_transport.py - AWS 없이 SQSWorker를 돌리기 위한 로컬 SQS / S3 대체 구현
+
+SQSWorker는 transport 인자로 sqs / s3 속성을 가진 객체를 받습니다.
+(None이면 기존처럼 boto3 클라이언트 생성) 여기의 클라이언트는 워커가 호출하는
+boto3 메서드와 같은 이름 / 인자 / 응답 형식을 따릅니다.
+
+- LocalSQSClient: 프로세스 내부 큐
+    - .fifo 큐: MessageGroupId 단위 순서 보장 (처리 중인 메시지가 있는 그룹은 수신 대상에서 제외),
+      MessageDeduplicationId 5분 중복 제거
+    - VisibilityTimeout / ChangeMessageVisibility, Long Polling(WaitTimeSeconds)
+    - ReceiveMessage 최대 10개, DeleteMessageBatch
+- LocalS3Client: 디렉토리 기반 객체 저장소 ({root}/{bucket}/{key}, 메타데이터는 {root}/.s3meta/)
+    - get/put/head/delete/copy_object, list_objects_v2 (+ paginator), upload_file
+    - generate_presigned_url: 서명 + 만료 시간이 붙은 http://127.0.0.1 URL (LocalObjectServer가 응답)
+- LocalTransport: 두 클라이언트 묶음
+- enqueue_student_id_recognition: 부하 테스트용 STUDENT_ID_RECOGNITION 메시지 N개 생성
+
+사용법:
+    transport = LocalTransport()
+    queue_url = transport.create_queue("mlpa-input.fifo")
+    worker = SQSWorker(queue_url, "", "", transport=transport, ...)
+"""
+
+import hashlib
+import hmac
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import parse_qs, quote, unquote, urlparse
+
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    class ClientError(Exception):
+        """botocore 미설치 환경용 ClientError (response['Error']['Code'] 형식 동일)"""
+
+        def __init__(self, error_response: dict, operation_name: str):
+            self.response = error_response
+            self.operation_name = operation_name
+            error = error_response.get("Error", {})
+            super().__init__(f"An error occurred ({error.get('Code')}) when calling the {operation_name} operation: {error.get('Message')}")
+
+
+# SQS 제한 (AWS와 동일)
+MAX_RECEIVE_MESSAGES = 10
+MAX_VISIBILITY_TIMEOUT = 12 * 60 * 60
+DEDUP_WINDOW_S = 5 * 60
+
+LOCAL_QUEUE_URL_PREFIX = "local://sqs/"
+
+
+def _error(code: str, message: str, operation: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+
+def _md5(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()
+
+
+# =============================================================================
+# SQS
+# =============================================================================
+@dataclass
+class _LocalMessage:
+    message_id: str
+    body: str
+    group_id: Optional[str]
+    sent_at: float
+    visible_at: float = 0.0                 # time.monotonic() 기준, 이 시각 이후 수신 가능
+    receive_count: int = 0
+    receipt_handle: Optional[str] = None    # 마지막 수신 시 발급된 handle
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def in_flight(self, now: float) -> bool:
+        return self.receipt_handle is not None and self.visible_at > now
+
+
+class _LocalQueue:
+    def __init__(self, name: str, visibility_timeout: int):
+        self.name = name
+        self.url = LOCAL_QUEUE_URL_PREFIX + name
+        self.fifo = name.endswith(".fifo")
+        self.visibility_timeout = visibility_timeout
+        self.messages: List[_LocalMessage] = []   # 전송 순서
+        self.by_handle: Dict[str, _LocalMessage] = {}
+        self.dedup: Dict[str, tuple] = {}         # dedup_id → (message_id, 만료 시각)
+
+    def take(self, max_messages: int, visibility_timeout: int, now: float) -> List[_LocalMessage]:
+        """수신 가능한 메시지를 최대 max_messages개 꺼내 in-flight로 전환"""
+        taken = []
+        blocked_groups = set()
+        if self.fifo:
+            blocked_groups = {m.group_id for m in self.messages if m.in_flight(now)}
+
+        for message in self.messages:
+            if len(taken) >= max_messages:
+                break
+            if self.fifo and message.group_id in blocked_groups:
+                continue
+            if message.visible_at > now:
+                # FIFO: 앞 메시지가 아직 안 보이면(지연 등) 같은 그룹의 뒤 메시지도 건너뜀
+                if self.fifo:
+                    blocked_groups.add(message.group_id)
+                continue
+            taken.append(message)
+
+        for message in taken:
+            if message.receipt_handle:
+                self.by_handle.pop(message.receipt_handle, None)
+            message.receipt_handle = uuid.uuid4().hex
+            message.receive_count += 1
+            message.visible_at = now + visibility_timeout
+            self.by_handle[message.receipt_handle] = message
+        return taken
+
+    def next_visible_in(self, now: float) -> Optional[float]:
+        """다음 메시지가 보이게 될 때까지 남은 시간 (없으면 None)"""
+        pending = [m.visible_at - now for m in self.messages if m.visible_at > now]
+        return min(pending) if pending else None
+
+    def remove(self, message: _LocalMessage):
+        self.messages.remove(message)
+        self.by_handle.pop(message.receipt_handle, None)
+
+
+class LocalSQSClient:
+    """
+    프로세스 내부 SQS 대체 (boto3 SQS 클라이언트와 같은 호출 형식)
+
+    스레드 안전하며, receive_message의 WaitTimeSeconds 동안 새 메시지 / 가시성 복귀를 기다립니다.
+    """
+
+    def __init__(self, default_visibility_timeout: int = 30):
+        self.default_visibility_timeout = default_visibility_timeout
+        self._queues: Dict[str, _LocalQueue] = {}
+        self._cond = threading.Condition()
+
+    def _queue(self, url: str, operation: str) -> _LocalQueue:
+        queue = self._queues.get(url)
+        if queue is None:
+            raise _error("AWS.SimpleQueueService.NonExistentQueue", f"queue does not exist: {url}", operation)
+        return queue
+
+    # -------------------------------------------------------------------------
+    # 큐 관리
+    # -------------------------------------------------------------------------
+    def create_queue(self, QueueName: str, Attributes: Optional[dict] = None) -> dict:
+        attributes = Attributes or {}
+        visibility = int(attributes.get("VisibilityTimeout", self.default_visibility_timeout))
+        with self._cond:
+            url = LOCAL_QUEUE_URL_PREFIX + QueueName
+            if url not in self._queues:
+                self._queues[url] = _LocalQueue(QueueName, visibility)
+        return {"QueueUrl": url}
+
+    def get_queue_url(self, QueueName: str) -> dict:
+        url = LOCAL_QUEUE_URL_PREFIX + QueueName
+        with self._cond:
+            self._queue(url, "GetQueueUrl")
+        return {"QueueUrl": url}
+
+    def get_queue_attributes(self, QueueUrl: str, AttributeNames: Optional[List[str]] = None) -> dict:
+        with self._cond:
+            queue = self._queue(QueueUrl, "GetQueueAttributes")
+            now = time.monotonic()
+            in_flight = sum(1 for m in queue.messages if m.in_flight(now))
+            delayed = sum(1 for m in queue.messages if m.receipt_handle is None and m.visible_at > now)
+            return {"Attributes": {
+                "ApproximateNumberOfMessages": str(len(queue.messages) - in_flight - delayed),
+                "ApproximateNumberOfMessagesNotVisible": str(in_flight),
+                "ApproximateNumberOfMessagesDelayed": str(delayed),
+                "VisibilityTimeout": str(queue.visibility_timeout),
+                "FifoQueue": str(queue.fifo).lower()
+            }}
+
+    def purge_queue(self, QueueUrl: str) -> dict:
+        with self._cond:
+            queue = self._queue(QueueUrl, "PurgeQueue")
+            queue.messages.clear()
+            queue.by_handle.clear()
+        return {}
+
+    # -------------------------------------------------------------------------
+    # 전송
+    # -------------------------------------------------------------------------
+    def send_message(
+        self,
+        QueueUrl: str,
+        MessageBody: str,
+        MessageGroupId: Optional[str] = None,
+        MessageDeduplicationId: Optional[str] = None,
+        DelaySeconds: int = 0,
+        MessageAttributes: Optional[dict] = None
+    ) -> dict:
+        with self._cond:
+            queue = self._queue(QueueUrl, "SendMessage")
+            now = time.monotonic()
+            if queue.fifo:
+                if not MessageGroupId:
+                    raise _error("MissingParameter", "MessageGroupId is required for FIFO queues", "SendMessage")
+                dedup_id = MessageDeduplicationId or _md5(MessageBody.encode("utf-8"))
+                queue.dedup = {k: v for k, v in queue.dedup.items() if v[1] > now}
+                if dedup_id in queue.dedup:
+                    # 중복 전송: 같은 MessageId를 돌려주고 큐에는 넣지 않음
+                    return {"MessageId": queue.dedup[dedup_id][0], "MD5OfMessageBody": _md5(MessageBody.encode("utf-8"))}
+
+            message = _LocalMessage(
+                message_id=str(uuid.uuid4()),
+                body=MessageBody,
+                group_id=MessageGroupId,
+                sent_at=time.time(),
+                visible_at=now + DelaySeconds if DelaySeconds else 0.0,
+                attributes=MessageAttributes or {}
+            )
+            queue.messages.append(message)
+            if queue.fifo:
+                queue.dedup[dedup_id] = (message.message_id, now + DEDUP_WINDOW_S)
+            self._cond.notify_all()
+        return {"MessageId": message.message_id, "MD5OfMessageBody": _md5(MessageBody.encode("utf-8"))}
+
+    def send_message_batch(self, QueueUrl: str, Entries: List[dict]) -> dict:
+        successful, failed = [], []
+        for entry in Entries[:MAX_RECEIVE_MESSAGES]:
+            try:
+                response = self.send_message(
+                    QueueUrl=QueueUrl,
+                    MessageBody=entry["MessageBody"],
+                    MessageGroupId=entry.get("MessageGroupId"),
+                    MessageDeduplicationId=entry.get("MessageDeduplicationId"),
+                    DelaySeconds=entry.get("DelaySeconds", 0),
+                    MessageAttributes=entry.get("MessageAttributes")
+                )
+                successful.append({"Id": entry["Id"], "MessageId": response["MessageId"]})
+            except ClientError as e:
+                failed.append({"Id": entry["Id"], "Code": e.response["Error"]["Code"], "SenderFault": True})
+        return {"Successful": successful, "Failed": failed}
+
+    # -------------------------------------------------------------------------
+    # 수신 / 삭제 / 가시성
+    # -------------------------------------------------------------------------
+    def receive_message(
+        self,
+        QueueUrl: str,
+        MaxNumberOfMessages: int = 1,
+        WaitTimeSeconds: int = 0,
+        VisibilityTimeout: Optional[int] = None,
+        AttributeNames: Optional[List[str]] = None,
+        MessageAttributeNames: Optional[List[str]] = None
+    ) -> dict:
+        if not 1 <= MaxNumberOfMessages <= MAX_RECEIVE_MESSAGES:
+            raise _error("InvalidParameterValue", f"MaxNumberOfMessages must be 1..{MAX_RECEIVE_MESSAGES}", "ReceiveMessage")
+        deadline = time.monotonic() + max(0, WaitTimeSeconds)
+
+        with self._cond:
+            queue = self._queue(QueueUrl, "ReceiveMessage")
+            visibility = queue.visibility_timeout if VisibilityTimeout is None else VisibilityTimeout
+            while True:
+                now = time.monotonic()
+                taken = queue.take(MaxNumberOfMessages, visibility, now)
+                if taken or now >= deadline:
+                    break
+                # 새 메시지(notify) 또는 가시성 복귀 시각까지 대기
+                wait = deadline - now
+                next_visible = queue.next_visible_in(now)
+                if next_visible is not None:
+                    wait = min(wait, next_visible)
+                self._cond.wait(timeout=wait)
+
+        messages = []
+        for message in taken:
+            body = message.body.encode("utf-8")
+            item = {
+                "MessageId": message.message_id,
+                "ReceiptHandle": message.receipt_handle,
+                "MD5OfBody": _md5(body),
+                "Body": message.body,
+                "Attributes": {
+                    "ApproximateReceiveCount": str(message.receive_count),
+                    "SentTimestamp": str(int(message.sent_at * 1000))
+                }
+            }
+            if message.group_id is not None:
+                item["Attributes"]["MessageGroupId"] = message.group_id
+            if message.attributes:
+                item["MessageAttributes"] = message.attributes
+            messages.append(item)
+        return {"Messages": messages} if messages else {}
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str) -> dict:
+        with self._cond:
+            queue = self._queue(QueueUrl, "DeleteMessage")
+            message = queue.by_handle.get(ReceiptHandle)
+            if message is None:
+                raise _error("ReceiptHandleIsInvalid", f"invalid receipt handle: {ReceiptHandle}", "DeleteMessage")
+            queue.remove(message)
+            # FIFO 그룹이 풀렸으므로 대기 중인 수신자를 깨움
+            self._cond.notify_all()
+        return {"ResponseMetadata": {"RequestId": uuid.uuid4().hex, "HTTPStatusCode": 200}}
+
+    def delete_message_batch(self, QueueUrl: str, Entries: List[dict]) -> dict:
+        successful, failed = [], []
+        for entry in Entries:
+            try:
+                self.delete_message(QueueUrl=QueueUrl, ReceiptHandle=entry["ReceiptHandle"])
+                successful.append({"Id": entry["Id"]})
+            except ClientError as e:
+                error = e.response["Error"]
+                failed.append({"Id": entry["Id"], "Code": error["Code"], "Message": error["Message"], "SenderFault": True})
+        return {"Successful": successful, "Failed": failed}
+
+    def change_message_visibility(self, QueueUrl: str, ReceiptHandle: str, VisibilityTimeout: int) -> dict:
+        if not 0 <= VisibilityTimeout <= MAX_VISIBILITY_TIMEOUT:
+            raise _error("InvalidParameterValue", "VisibilityTimeout out of range", "ChangeMessageVisibility")
+        with self._cond:
+            queue = self._queue(QueueUrl, "ChangeMessageVisibility")
+            message = queue.by_handle.get(ReceiptHandle)
+            now = time.monotonic()
+            if message is None or not message.in_flight(now):
+                raise _error("MessageNotInflight", f"message is not in flight: {ReceiptHandle}", "ChangeMessageVisibility")
+            message.visible_at = now + VisibilityTimeout
+            self._cond.notify_all()
+        return {}
+
+
+# =============================================================================
+# S3
+# =============================================================================
+class _StreamingBody(io.BytesIO):
+    """botocore StreamingBody처럼 read()를 지원하는 응답 본문"""
+
+
+class LocalS3Client:
+    """
+    디렉토리 기반 S3 대체 (boto3 S3 클라이언트와 같은 호출 형식)
+
+    객체는 {root}/{Bucket}/{Key} 파일, ContentType / Metadata / ETag는
+    {root}/.s3meta/{Bucket}/{Key}.json에 저장합니다. (Bucket이 빈 문자열이면 root 바로 아래)
+    generate_presigned_url은 처음 호출될 때 로컬 HTTP 서버(LocalObjectServer)를 띄웁니다.
+    """
+
+    META_DIR = ".s3meta"
+
+    def __init__(self, root: str, presign_secret: Optional[bytes] = None):
+        self.root = os.path.abspath(root)
+        self._secret = presign_secret or os.urandom(16)
+        self._server: Optional["LocalObjectServer"] = None
+        self._lock = threading.Lock()
+
+    def _path(self, bucket: str, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, bucket, key))
+        if not path.startswith(self.root + os.sep):
+            raise _error("InvalidObjectName", f"key escapes root: {key}", "GetObject")
+        return path
+
+    def _meta_path(self, bucket: str, key: str) -> str:
+        return os.path.join(self.root, self.META_DIR, bucket, key + ".json")
+
+    def _read_meta(self, bucket: str, key: str, data_path: str) -> dict:
+        meta_path = self._meta_path(bucket, key)
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        # put_object를 거치지 않고 직접 넣은 파일
+        with open(data_path, "rb") as f:
+            return {"ETag": f'"{_md5(f.read())}"', "ContentType": "binary/octet-stream", "Metadata": {}}
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    # -------------------------------------------------------------------------
+    # 객체 API
+    # -------------------------------------------------------------------------
+    def put_object(
+        self,
+        Bucket: str,
+        Key: str,
+        Body: Any = b"",
+        ContentType: Optional[str] = None,
+        Metadata: Optional[dict] = None,
+        **kwargs
+    ) -> dict:
+        if isinstance(Body, str):
+            data = Body.encode("utf-8")
+        elif hasattr(Body, "read"):
+            data = Body.read()
+        else:
+            data = bytes(Body)
+        etag = f'"{_md5(data)}"'
+        self._write_atomic(self._path(Bucket, Key), data)
+        meta = {"ETag": etag, "ContentType": ContentType or "binary/octet-stream", "Metadata": dict(Metadata or {})}
+        self._write_atomic(self._meta_path(Bucket, Key), json.dumps(meta).encode("utf-8"))
+        return {"ETag": etag}
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        path = self._path(Bucket, Key)
+        if not os.path.isfile(path):
+            raise _error("404", f"Not Found: {Bucket}/{Key}", "HeadObject")
+        meta = self._read_meta(Bucket, Key, path)
+        stat = os.stat(path)
+        return {
+            "ContentLength": stat.st_size,
+            "LastModified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            **meta
+        }
+
+    def get_object(self, Bucket: str, Key: str, **kwargs) -> dict:
+        path = self._path(Bucket, Key)
+        if not os.path.isfile(path):
+            raise _error("NoSuchKey", f"The specified key does not exist: {Bucket}/{Key}", "GetObject")
+        with open(path, "rb") as f:
+            data = f.read()
+        response = self.head_object(Bucket, Key)
+        response["Body"] = _StreamingBody(data)
+        return response
+
+    def delete_object(self, Bucket: str, Key: str) -> dict:
+        for path in (self._path(Bucket, Key), self._meta_path(Bucket, Key)):
+            if os.path.exists(path):
+                os.unlink(path)
+        return {}
+
+    def copy_object(self, Bucket: str, Key: str, CopySource: Any, **kwargs) -> dict:
+        if isinstance(CopySource, str):
+            src_bucket, src_key = CopySource.lstrip("/").split("/", 1)
+        else:
+            src_bucket, src_key = CopySource["Bucket"], CopySource["Key"]
+        source = self.get_object(src_bucket, src_key)
+        response = self.put_object(
+            Bucket, Key, source["Body"].read(),
+            ContentType=kwargs.get("ContentType", source.get("ContentType")),
+            Metadata=kwargs.get("Metadata", source.get("Metadata"))
+        )
+        return {"CopyObjectResult": {"ETag": response["ETag"]}}
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str, ExtraArgs: Optional[dict] = None):
+        extra = ExtraArgs or {}
+        with open(Filename, "rb") as f:
+            self.put_object(Bucket, Key, f.read(), ContentType=extra.get("ContentType"), Metadata=extra.get("Metadata"))
+
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        MaxKeys: int = 1000,
+        ContinuationToken: Optional[str] = None,
+        StartAfter: Optional[str] = None
+    ) -> dict:
+        bucket_dir = os.path.join(self.root, Bucket)
+        keys = []
+        for dirpath, dirnames, filenames in os.walk(bucket_dir):
+            if dirpath == self.root:
+                dirnames[:] = [d for d in dirnames if d != self.META_DIR]
+            for name in filenames:
+                if name.endswith(".tmp"):
+                    continue
+                key = os.path.relpath(os.path.join(dirpath, name), bucket_dir).replace(os.sep, "/")
+                if key.startswith(Prefix):
+                    keys.append(key)
+        keys.sort()
+
+        after = ContinuationToken or StartAfter
+        if after:
+            keys = [k for k in keys if k > after]
+        page, rest = keys[:MaxKeys], keys[MaxKeys:]
+
+        contents = []
+        for key in page:
+            head = self.head_object(Bucket, key)
+            contents.append({
+                "Key": key,
+                "Size": head["ContentLength"],
+                "ETag": head["ETag"],
+                "LastModified": head["LastModified"]
+            })
+        response = {"Contents": contents, "KeyCount": len(contents), "IsTruncated": bool(rest)}
+        if rest:
+            response["NextContinuationToken"] = page[-1]
+        return response
+
+    def get_paginator(self, operation_name: str) -> "_ListObjectsPaginator":
+        if operation_name != "list_objects_v2":
+            raise NotImplementedError(f"paginator not supported: {operation_name}")
+        return _ListObjectsPaginator(self)
+
+    # -------------------------------------------------------------------------
+    # presigned URL
+    # -------------------------------------------------------------------------
+    def _signature(self, bucket: str, key: str, expires: int) -> str:
+        return hmac.new(self._secret, f"{bucket}/{key}:{expires}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def verify_presigned(self, bucket: str, key: str, expires: int, signature: str) -> bool:
+        """서명이 맞고 만료되지 않았는지 확인"""
+        if expires < time.time():
+            return False
+        return hmac.compare_digest(self._signature(bucket, key, expires), signature)
+
+    def generate_presigned_url(self, ClientMethod: str, Params: dict, ExpiresIn: int = 3600) -> str:
+        """get_object용 presigned URL (LocalObjectServer가 서명/만료를 확인 후 응답)"""
+        if ClientMethod != "get_object":
+            raise NotImplementedError(f"presigned URL not supported: {ClientMethod}")
+        bucket, key = Params["Bucket"], Params["Key"]
+        expires = int(time.time() + ExpiresIn)
+        with self._lock:
+            if self._server is None:
+                self._server = LocalObjectServer(self)
+                self._server.start()
+        return (
+            f"{self._server.base_url}/{quote(bucket)}/{quote(key)}"
+            f"?X-Amz-Expires={expires}&X-Amz-Signature={self._signature(bucket, key, expires)}"
+        )
+
+    def close(self):
+        with self._lock:
+            if self._server is not None:
+                self._server.stop()
+                self._server = None
+
+
+class _ListObjectsPaginator:
+    def __init__(self, client: LocalS3Client):
+        self.client = client
+
+    def paginate(self, Bucket: str, Prefix: str = "", PaginationConfig: Optional[dict] = None) -> Iterator[dict]:
+        page_size = (PaginationConfig or {}).get("PageSize", 1000)
+        token = None
+        while True:
+            page = self.client.list_objects_v2(Bucket=Bucket, Prefix=Prefix, MaxKeys=page_size, ContinuationToken=token)
+            yield page
+            token = page.get("NextContinuationToken")
+            if not token:
+                return
+
+
+class LocalObjectServer:
+    """presigned URL GET 요청에 응답하는 로컬 HTTP 서버 (127.0.0.1, 임의 포트)"""
+
+    def __init__(self, client: LocalS3Client, host: str = "127.0.0.1", port: int = 0):
+        self.client = client
+        handler = self._make_handler(client)
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def _make_handler(client: LocalS3Client):
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive (클라이언트 연결 풀 재사용 측정용)
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                parts = parsed.path.lstrip("/").split("/", 1)
+                query = parse_qs(parsed.query)
+                if len(parts) != 2:
+                    self.send_error(400, "expected /{bucket}/{key}")
+                    return
+                bucket, key = unquote(parts[0]), unquote(parts[1])
+                try:
+                    expires = int(query.get("X-Amz-Expires", ["0"])[0])
+                except ValueError:
+                    expires = 0
+                signature = query.get("X-Amz-Signature", [""])[0]
+                if not client.verify_presigned(bucket, key, expires, signature):
+                    self.send_error(403, "signature mismatch or expired")
+                    return
+                try:
+                    response = client.get_object(Bucket=bucket, Key=key)
+                except ClientError:
+                    self.send_error(404, "NoSuchKey")
+                    return
+                data = response["Body"].read()
+                self.send_response(200)
+                self.send_header("Content-Type", response.get("ContentType", "binary/octet-stream"))
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("ETag", response["ETag"])
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True, name="Local-S3-Server")
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+# =============================================================================
+# Transport / 부하 생성
+# =============================================================================
+class LocalTransport:
+    """
+    SQSWorker(transport=...)에 넘기는 로컬 SQS + S3 묶음
+
+    root_dir를 주지 않으면 임시 디렉토리를 만들고 close()에서 삭제합니다.
+    """
+
+    def __init__(self, root_dir: Optional[str] = None, visibility_timeout: int = 30):
+        self._owns_root = root_dir is None
+        self.root_dir = root_dir or tempfile.mkdtemp(prefix="mlpa_local_s3_")
+        self.sqs = LocalSQSClient(default_visibility_timeout=visibility_timeout)
+        self.s3 = LocalS3Client(self.root_dir)
+
+    def create_queue(self, name: str, visibility_timeout: Optional[int] = None) -> str:
+        attributes = {"VisibilityTimeout": str(visibility_timeout)} if visibility_timeout is not None else None
+        return self.sqs.create_queue(QueueName=name, Attributes=attributes)["QueueUrl"]
+
+    def close(self):
+        self.s3.close()
+        if self._owns_root:
+            shutil.rmtree(self.root_dir, ignore_errors=True)
+
+
+def enqueue_student_id_recognition(
+    transport: Any,
+    queue_url: str,
+    bucket: str,
+    exam_code: str,
+    image_bytes: bytes,
+    count: int,
+    presigned: bool = True,
+    filename_prefix: str = "sheet",
+    group_id: Optional[str] = None
+) -> List[str]:
+    """
+    부하 테스트용 STUDENT_ID_RECOGNITION 메시지 count개 전송
+
+    답안지 이미지를 uploads/{exam_code}/{filename}에 한 번만 올리고, 파일명만 다른 메시지를 보냅니다.
+    presigned=True면 downloadUrl에 presigned URL을, False면 S3 키를 넣습니다.
+    (BE Lambda와 같은 형식, MessageGroupId 기본값은 exam_code)
+
+    Returns:
+        전송한 메시지의 filename 목록
+    """
+    source_key = f"uploads/{exam_code}/{filename_prefix}_source.jpg"
+    transport.s3.put_object(Bucket=bucket, Key=source_key, Body=image_bytes, ContentType="image/jpeg")
+    if presigned:
+        download_url = transport.s3.generate_presigned_url(
+            "get_object", Params={"Bucket": bucket, "Key": source_key}, ExpiresIn=24 * 3600
+        )
+    else:
+        download_url = f"s3://{bucket}/{source_key}"
+
+    filenames = [f"{filename_prefix}_{i:05d}.jpg" for i in range(count)]
+    for start in range(0, count, MAX_RECEIVE_MESSAGES):
+        entries = []
+        for i, filename in enumerate(filenames[start:start + MAX_RECEIVE_MESSAGES]):
+            body = {
+                "eventType": "STUDENT_ID_RECOGNITION",
+                "examCode": exam_code,
+                "downloadUrl": download_url,
+                "filename": filename
+            }
+            entries.append({
+                "Id": str(i),
+                "MessageBody": json.dumps(body),
+                "MessageGroupId": group_id or exam_code,
+                "MessageDeduplicationId": str(uuid.uuid4())
+            })
+        transport.sqs.send_message_batch(QueueUrl=queue_url, Entries=entries)
+    return filenames
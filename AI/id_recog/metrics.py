@@ -0,0 +1,304 @@
+"""
+metrics.py - 단계별 소요 시간 / 카운터 계측 (Prometheus 텍스트 형식)
+
+학번 인식, 답안 인식, SQS 워커의 단계별 소요 시간을 히스토그램으로 모아
+/metrics 엔드포인트에서 Prometheus 텍스트 노출 형식(text/plain; version=0.0.4)으로 반환합니다.
+외부 라이브러리 없이 표준 라이브러리만 사용합니다.
+
+사용법:
+    from id_recog.metrics import ANSWER_STAGE_SECONDS
+
+    with ANSWER_STAGE_SECONDS.time(stage="rows"):
+        ...
+
+    @STUDENT_ID_STAGE_SECONDS.time(stage="total")   # 데코레이터로도 사용 가능
+    def extract_student_id(...): ...
+
+p50 / p95는 Prometheus에서 histogram_quantile로 계산하거나,
+/metrics/summary(JSON)에서 최근 샘플 기준 값을 바로 확인할 수 있습니다.
+"""
+
+import bisect
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 초 단위 기본 버킷 (crop OCR 수 ms ~ 시험 전체 배치 수십 초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 분위수 계산용으로 label 조합마다 보관하는 최근 샘플 수
+QUANTILE_WINDOW = 1024
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{_escape(extra[1])}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _quantile(sorted_samples: List[float], q: float) -> float:
+    """정렬된 샘플의 nearest-rank 분위수"""
+    idx = min(len(sorted_samples) - 1, max(0, int(round(q * (len(sorted_samples) - 1)))))
+    return sorted_samples[idx]
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """label 이름 목록을 가진 지표 공통 부분"""
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: labels {sorted(labels)} != {sorted(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def reset(self):
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class _HistogramSeries:
+    def __init__(self, bucket_count: int):
+        self.bucket_counts = [0] * bucket_count
+        self.count = 0
+        self.sum = 0.0
+        self.recent: deque = deque(maxlen=QUANTILE_WINDOW)
+
+
+class Histogram(_Metric):
+    """소요 시간 히스토그램 (누적 버킷 + 합계 + 개수, 분위수용 최근 샘플)"""
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets))
+            idx = bisect.bisect_left(self.buckets, value)
+            if idx < len(self.buckets):
+                series.bucket_counts[idx] += 1
+            series.count += 1
+            series.sum += value
+            series.recent.append(value)
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """블록(또는 데코레이트한 함수) 실행 시간을 기록 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return series.count if series else 0
+
+    def quantile(self, q: float, **labels) -> Optional[float]:
+        """최근 QUANTILE_WINDOW개 샘플 기준 분위수 (샘플이 없으면 None)"""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            samples = sorted(series.recent) if series else []
+        return _quantile(samples, q) if samples else None
+
+    def summary(self) -> Dict[str, dict]:
+        """label 조합별 count / 평균 / p50 / p95 / 최대 (ms, 최근 샘플 기준)"""
+        with self._lock:
+            items = [(key, s.count, s.sum, sorted(s.recent)) for key, s in self._series.items()]
+        result = {}
+        for key, count, total, samples in sorted(items):
+            label = ",".join(f"{name}={value}" for name, value in zip(self.labelnames, key))
+            result[label] = {
+                "count": count,
+                "avgMs": round(total / count * 1000, 1) if count else 0.0,
+                "p50Ms": round(_quantile(samples, 0.5) * 1000, 1) if samples else None,
+                "p95Ms": round(_quantile(samples, 0.95) * 1000, 1) if samples else None,
+                "maxMs": round(samples[-1] * 1000, 1) if samples else None
+            }
+        return result
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, series.bucket_counts):
+                    cumulative += bucket_count
+                    labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key, ("le", "+Inf"))
+                lines.append(f"{self.name}_bucket{labels} {series.count}")
+                plain = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{plain} {_format_value(series.sum)}")
+                lines.append(f"{self.name}_count{plain} {series.count}")
+        return lines
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """지표 등록소 (이름 중복 등록 시 기존 지표 반환)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"metric {metric.name} already registered with different type/labels")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, dict]:
+        """히스토그램별 p50 / p95 요약 (JSON용)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {m.name: m.summary() for m in metrics if isinstance(m, Histogram)}
+
+    def reset(self):
+        """모든 값 초기화 (테스트 / 벤치마크용)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+# =============================================================================
+# 기본 등록소 및 공용 지표
+# =============================================================================
+REGISTRY = MetricsRegistry()
+
+# 학번 인식 (extract_student_id): layout / ocr / ocr_crop(crop 1개 평균) / matching / vlm / total
+STUDENT_ID_STAGE_SECONDS = REGISTRY.histogram(
+    "mlpa_student_id_stage_seconds",
+    "Student ID extraction stage latency in seconds",
+    ("stage",)
+)
+STUDENT_ID_OCR_CROPS = REGISTRY.counter(
+    "mlpa_student_id_ocr_crops_total",
+    "Number of layout crops passed to OCR during student ID extraction"
+)
+
+# 답안 인식 (AnswerRecognitionPipeline.process):
+# section / layout / deskew / rows / sub_rows / ocr / grading / total
+ANSWER_STAGE_SECONDS = REGISTRY.histogram(
+    "mlpa_answer_stage_seconds",
+    "Answer recognition pipeline stage latency in seconds",
+    ("stage",)
+)
+ANSWER_OCR_ROWS = REGISTRY.counter(
+    "mlpa_answer_ocr_rows_total",
+    "Number of answer rows passed to OCR"
+)
+
+# SQS 워커: download / upload / sqs_send / sqs_ack
+WORKER_STAGE_SECONDS = REGISTRY.histogram(
+    "mlpa_worker_stage_seconds",
+    "SQS worker I/O stage latency in seconds",
+    ("stage",)
+)
+WORKER_STAGE_ERRORS = REGISTRY.counter(
+    "mlpa_worker_stage_errors_total",
+    "SQS worker I/O stage failures",
+    ("stage",)
+)
+
+# presigned URL 등 HTTP 다운로드 재시도 (reason: HTTP 상태 코드 또는 connection)
+HTTP_FETCH_RETRIES = REGISTRY.counter(
+    "mlpa_http_fetch_retries_total",
+    "HTTP download retries",
+    ("reason",)
+)
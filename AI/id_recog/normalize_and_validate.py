@@ -5,6 +5,8 @@ normalize_and_validate.py - 학번 정규화, 검증, 매칭 로직
 """
 
 import re
+from collections import Counter
+from typing import Iterator
 
 
 def normalize_candidate(text: str) -> str | None:
@@ -130,9 +132,77 @@ def _edit_distance(s1: str, s2: str) -> int:
     return previous_row[-1]
 
 
+def _deletions(s: str) -> set[str]:
+    """한 글자를 삭제해서 만들 수 있는 모든 문자열"""
+    return {s[:i] + s[i + 1:] for i in range(len(s))}
+
+
+class StudentIdIndex:
+    """
+    시험별 학번 매칭 인덱스 (출석부 로드 시 1회 생성, 답안지마다 재사용)
+    
+    - Exact: 해시셋 조회
+    - 편집거리 1: deletion-neighborhood 인덱스
+      (학번과 학번에서 한 글자를 지운 문자열 → 학번 집합)
+      후보와 후보의 1-삭제 문자열로 조회한 뒤 _edit_distance로 검증하므로
+      선형 탐색과 같은 결과를 내면서 비교 대상은 소수로 줄어듭니다.
+    - 출석부에 같은 학번이 중복되면 학번별 개수만큼 후보로 세어 선형 탐색처럼 모호(None)로 처리
+    
+    list처럼 len / in / iter / bool을 지원하므로 기존 student_id_list 자리에 그대로 사용할 수 있습니다.
+    """
+    
+    def __init__(self, student_ids: list[str]):
+        self._ids = list(student_ids)
+        self._counts = Counter(self._ids)  # 학번별 등장 횟수 (중복 학번 → 편집거리 1 후보도 중복)
+        self._exact = set(self._counts)
+        self._neighbors: dict[str, set[str]] = {}
+        for student_id in self._exact:
+            for key in _deletions(student_id) | {student_id}:
+                self._neighbors.setdefault(key, set()).add(student_id)
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+    
+    def __contains__(self, student_id: object) -> bool:
+        return student_id in self._exact
+    
+    def __repr__(self) -> str:
+        return f"StudentIdIndex({len(self._ids)} ids)"
+    
+    def distance_1_matches(self, candidate: str) -> list[str]:
+        """편집거리가 정확히 1인 학번 리스트 (정렬됨, 중복 학번은 등장 횟수만큼 반복)"""
+        found: set[str] = set()
+        for key in _deletions(candidate) | {candidate}:
+            found |= self._neighbors.get(key, set())
+        return [
+            s
+            for s in sorted(found)
+            if _edit_distance(candidate, s) == 1
+            for _ in range(self._counts[s])
+        ]
+    
+    def match(self, candidate: str, allow_edit_distance_1: bool = True) -> str | None:
+        """match_to_student_list와 같은 정책으로 매칭"""
+        if not candidate or not self._ids:
+            return None
+        
+        if candidate in self._exact:
+            return candidate
+        
+        if allow_edit_distance_1:
+            matches = self.distance_1_matches(candidate)
+            if len(matches) == 1:
+                return matches[0]
+        
+        return None
+
+
 def match_to_student_list(
     candidate: str,
-    student_id_list: list[str],
+    student_id_list: list[str] | StudentIdIndex,
     allow_edit_distance_1: bool = True
 ) -> str | None:
     """
@@ -145,7 +215,7 @@ def match_to_student_list(
     
     Args:
         candidate: 후보 학번
-        student_id_list: 유효한 학번 리스트
+        student_id_list: 유효한 학번 리스트 (StudentIdIndex면 인덱스 조회)
         allow_edit_distance_1: 편집거리 1 허용 여부
         
     Returns:
@@ -154,6 +224,9 @@ def match_to_student_list(
     if not candidate or not student_id_list:
         return None
     
+    if isinstance(student_id_list, StudentIdIndex):
+        return student_id_list.match(candidate, allow_edit_distance_1)
+    
     # 1. Exact match
     if candidate in student_id_list:
         return candidate
@@ -9,12 +9,126 @@ import base64
 import io
 import os
 import tempfile
+import weakref
 from typing import Any
 
 import numpy as np
 from PIL import Image
 
 
+# 모델 객체별 numpy 입력 지원 여부 (True: 확인됨, False: 미지원 → 파일 경로 fallback, 없음: 미확인)
+_ARRAY_INPUT_SUPPORT: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+# 배열 입력 미지원으로 판단하는 예외 (모델 입력 reader의 형식 오류)
+# 추론 오류 / 메모리 부족 / 원격 추론 타임아웃 등은 일시적일 수 있으므로 fallback 전환 안 함
+_INPUT_TYPE_ERRORS = (TypeError, ValueError)
+
+# 파일 fallback 시 임시 파일 위치 (tmpfs가 있으면 메모리 기반 /dev/shm 사용)
+_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _array_input_supported(ocr_model) -> bool | None:
+    """모델의 numpy 입력 지원 여부 (미확인이면 None)"""
+    try:
+        return _ARRAY_INPUT_SUPPORT.get(ocr_model)
+    except TypeError:
+        # weakref 미지원 객체 → 기록하지 않음
+        return None
+
+
+def _set_array_input_supported(ocr_model, supported: bool):
+    try:
+        _ARRAY_INPUT_SUPPORT[ocr_model] = supported
+    except TypeError:
+        pass
+
+
+def _to_model_array(image: np.ndarray | Image.Image) -> np.ndarray:
+    """
+    이미지를 PaddleX 입력용 BGR uint8 배열로 변환합니다.
+    (파일 경로 입력 시 cv2.imread가 BGR로 읽으므로 동일한 채널 순서를 맞춤)
+    """
+    if isinstance(image, Image.Image):
+        image = np.array(image.convert("RGB"))
+    
+    if image.dtype != np.uint8:
+        image = np.clip(image, 0, 255).astype(np.uint8)
+    
+    if image.ndim == 2:
+        return np.ascontiguousarray(np.repeat(image[:, :, None], 3, axis=2))
+    if image.shape[2] == 4:
+        image = image[:, :, :3]
+    # RGB → BGR
+    return np.ascontiguousarray(image[:, :, ::-1])
+
+
+def _parse_ocr_result(result_data: dict) -> tuple[str, float]:
+    """PP-OCRv5 결과(res.json)에서 (텍스트, confidence) 추출"""
+    ocr_text = ""
+    confidence = 0.0
+    
+    # 결과 구조 확인 및 텍스트 추출
+    if 'res' in result_data:
+        res_data = result_data['res']
+        if isinstance(res_data, dict):
+            ocr_text = res_data.get('rec_text', res_data.get('text', ''))
+            confidence = res_data.get('rec_score', res_data.get('score', 0.0))
+        elif isinstance(res_data, list) and len(res_data) > 0:
+            first = res_data[0]
+            if isinstance(first, dict):
+                ocr_text = first.get('rec_text', first.get('text', ''))
+                confidence = first.get('rec_score', first.get('score', 0.0))
+            else:
+                ocr_text = str(first)
+    elif 'rec_text' in result_data:
+        ocr_text = result_data['rec_text']
+        confidence = result_data.get('rec_score', 0.0)
+    elif 'text' in result_data:
+        ocr_text = result_data['text']
+        confidence = result_data.get('score', 0.0)
+    
+    return ocr_text, confidence
+
+
+def _predict_via_file(image: np.ndarray | Image.Image, ocr_model) -> list:
+    """파일 경로 입력만 지원하는 모델용 fallback (tmpfs 임시 PNG)"""
+    # numpy array를 PIL Image로 변환
+    if isinstance(image, np.ndarray):
+        pil_image = Image.fromarray(image)
+    else:
+        pil_image = image
+    
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False, dir=_TMP_DIR) as tmp:
+        pil_image.save(tmp.name)
+        tmp_path = tmp.name
+    
+    try:
+        return list(ocr_model.predict(tmp_path, batch_size=1))
+    finally:
+        # 임시 파일 정리
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _predict(image: np.ndarray | Image.Image, ocr_model) -> list:
+    """numpy 배열을 모델에 직접 전달 (입력 형식 오류가 나는 모델이면 파일 fallback으로 전환)"""
+    supported = _array_input_supported(ocr_model)
+    
+    if supported is not False:
+        try:
+            outputs = list(ocr_model.predict(_to_model_array(image), batch_size=1))
+            _set_array_input_supported(ocr_model, True)
+            return outputs
+        except _INPUT_TYPE_ERRORS as e:
+            if supported:
+                # 배열 입력이 동작했던 모델 → 입력 형식 문제가 아니므로 그대로 전파
+                raise
+            print(f"[PP-OCR] numpy 입력 미지원, 파일 경로 입력으로 전환: {e}")
+            _set_array_input_supported(ocr_model, False)
+    
+    return _predict_via_file(image, ocr_model)
+
+
 def ppocr_extract(
     image: np.ndarray | Image.Image,
     ocr_model
@@ -22,8 +136,10 @@ def ppocr_extract(
     """
     PP-OCRv5_mobile_rec 모델로 이미지에서 텍스트를 추출합니다.
     
+    crop 이미지를 numpy 배열 그대로 모델에 전달합니다. (임시 PNG 파일 저장 없음)
+    
     Args:
-        image: 입력 이미지 (numpy array 또는 PIL Image)
+        image: 입력 이미지 (numpy array 또는 PIL Image, RGB)
         ocr_model: PaddleX OCR 모델 객체 (create_model로 생성)
         
     Returns:
@@ -31,59 +147,97 @@ def ppocr_extract(
         실패 시 ("", 0.0) 반환
     """
     try:
-        # numpy array를 PIL Image로 변환
-        if isinstance(image, np.ndarray):
-            pil_image = Image.fromarray(image)
-        else:
-            pil_image = image
+        outputs = _predict(image, ocr_model)
         
-        # 임시 파일로 저장하여 PaddleX에 전달
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            pil_image.save(tmp.name)
-            tmp_path = tmp.name
+        ocr_text = ""
+        confidence = 0.0
+        for res in outputs:
+            ocr_text, confidence = _parse_ocr_result(res.json)
         
-        try:
-            # PP-OCRv5 예측 수행
-            outputs = ocr_model.predict(tmp_path, batch_size=1)
-            
-            ocr_text = ""
-            confidence = 0.0
-            
-            for res in outputs:
-                result_data = res.json
-                
-                # 결과 구조 확인 및 텍스트 추출
-                if 'res' in result_data:
-                    res_data = result_data['res']
-                    if isinstance(res_data, dict):
-                        ocr_text = res_data.get('rec_text', res_data.get('text', ''))
-                        confidence = res_data.get('rec_score', res_data.get('score', 0.0))
-                    elif isinstance(res_data, list) and len(res_data) > 0:
-                        first = res_data[0]
-                        if isinstance(first, dict):
-                            ocr_text = first.get('rec_text', first.get('text', ''))
-                            confidence = first.get('rec_score', first.get('score', 0.0))
-                        else:
-                            ocr_text = str(first)
-                elif 'rec_text' in result_data:
-                    ocr_text = result_data['rec_text']
-                    confidence = result_data.get('rec_score', 0.0)
-                elif 'text' in result_data:
-                    ocr_text = result_data['text']
-                    confidence = result_data.get('score', 0.0)
-            
-            return ocr_text.strip(), float(confidence)
-            
-        finally:
-            # 임시 파일 정리
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        return ocr_text.strip(), float(confidence)
         
     except Exception as e:
         print(f"[PP-OCR Error] {e}")
         return "", 0.0
 
 
+def _width_buckets(
+    images: list[np.ndarray],
+    batch_size: int,
+    max_ratio_spread: float = 4.0
+) -> list[list[int]]:
+    """
+    crop을 가로세로 비율 순으로 정렬해 배치 단위로 묶습니다.
+    
+    인식 모델은 높이를 고정하고 배치 내 최대 폭으로 padding하므로,
+    비율이 비슷한 crop끼리 묶어야 padding 낭비가 적습니다.
+    
+    Returns:
+        원본 인덱스 리스트의 리스트 (배치별)
+    """
+    ratios = [img.shape[1] / max(1, img.shape[0]) for img in images]
+    order = sorted(range(len(images)), key=lambda i: ratios[i])
+    
+    buckets: list[list[int]] = []
+    current: list[int] = []
+    for idx in order:
+        if current and (
+            len(current) >= batch_size
+            or ratios[idx] > ratios[current[0]] * max_ratio_spread
+        ):
+            buckets.append(current)
+            current = []
+        current.append(idx)
+    if current:
+        buckets.append(current)
+    return buckets
+
+
+def ppocr_extract_batch(
+    images: list[np.ndarray | Image.Image],
+    ocr_model,
+    batch_size: int = 16
+) -> list[tuple[str, float]]:
+    """
+    여러 crop을 비율별 배치로 묶어 PP-OCRv5_mobile_rec로 한꺼번에 인식합니다.
+    
+    Args:
+        images: crop 이미지 리스트 (numpy array 또는 PIL Image, RGB)
+        ocr_model: PaddleX OCR 모델 객체
+        batch_size: 한 번에 인식할 최대 crop 수
+        
+    Returns:
+        입력 순서와 동일한 (텍스트, confidence) 리스트
+        실패한 crop은 ("", 0.0)
+    """
+    if not images:
+        return []
+    
+    # 배열 입력 미지원 모델이거나 배치가 의미 없으면 개별 호출
+    if batch_size <= 1 or len(images) == 1 or _array_input_supported(ocr_model) is False:
+        return [ppocr_extract(img, ocr_model) for img in images]
+    
+    arrays = [_to_model_array(img) for img in images]
+    results: list[tuple[str, float]] = [("", 0.0)] * len(images)
+    
+    for bucket in _width_buckets(arrays, batch_size):
+        try:
+            outputs = list(ocr_model.predict([arrays[i] for i in bucket], batch_size=len(bucket)))
+            if len(outputs) != len(bucket):
+                raise ValueError(f"결과 개수 불일치: {len(outputs)} != {len(bucket)}")
+            _set_array_input_supported(ocr_model, True)
+            for idx, res in zip(bucket, outputs):
+                text, conf = _parse_ocr_result(res.json)
+                results[idx] = (text.strip(), float(conf))
+        except Exception as e:
+            # 배치 실패 시 해당 배치만 개별 호출로 재시도
+            print(f"[PP-OCR] 배치 인식 실패, 개별 인식으로 재시도: {e}")
+            for idx in bucket:
+                results[idx] = ppocr_extract(images[idx], ocr_model)
+    
+    return results
+
+
 def _image_to_base64(image: np.ndarray | Image.Image) -> str:
     """이미지를 base64 문자열로 변환"""
     if isinstance(image, np.ndarray):
@@ -15,6 +15,9 @@ class Config:
     margin_px: int = 2                 # Header crop margin (위 여백)
     allow_edit_distance_1: bool = True # 편집거리 1 허용 여부
     vlm_timeout_s: float = 10.0        # VLM 호출 timeout (초)
+    ocr_batch_size: int = 16           # bbox crop 배치 OCR 크기 (1이면 crop별 개별 호출)
+    ocr_first_batch: int = 2           # 우선순위 상위 몇 개 bbox를 먼저 OCR할지 (0이면 전체 한 번에)
+    early_exit_conf: float = 0.9       # exact match + 이 confidence 이상이면 나머지 bbox OCR 생략
 
 
 @dataclass
@@ -24,6 +27,7 @@ class StudentIdExtractionResult:
     header_image: Any | None           # 헤더 이미지 (레이아웃 실패 시 None)
     student_id: str | None             # 추출된 학번 (실패 시 None)
     meta: dict = field(default_factory=dict)  # 디버깅/로그용 메타정보
+    layout_boxes: list | None = None   # 레이아웃 탐지 결과 (답안 인식 단계 재사용용)
 
     # meta 권장 필드:
     # - stage: "layout" | "ocr" | "vlm" | "match"
@@ -67,6 +67,7 @@ class SQSInputMessage:
     filename: str
     download_url: str
     receipt_handle: Optional[str] = None  # SQS 메시지 삭제용 (내부 사용)
+    message_group_id: Optional[str] = None  # 수신 시 Attributes.MessageGroupId (워커 풀 순서 보장 단위, 내부 사용)
     
     @classmethod
     def from_sqs_message(cls, body: dict, receipt_handle: str = None) -> "SQSInputMessage":
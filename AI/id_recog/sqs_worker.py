@@ -15,15 +15,33 @@ import time
 import logging
 import threading
 import tempfile
-from typing import Optional, Callable, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Callable, Dict, Any, List, Tuple, Union
 from dataclasses import dataclass
 
 import boto3
-import requests
 import numpy as np
 from PIL import Image
 from botocore.exceptions import ClientError
 
+from id_recog.worker_pool import GroupOrderedWorkerPool, BatchAckBuffer, SQS_MAX_BATCH_SIZE
+from id_recog.batch_executor import BatchProgress, BatchJobRegistry, ParallelBatchExecutor
+from id_recog.batch_manifest import (
+    BatchManifest,
+    BatchManifestStore,
+    is_result_current,
+    RESULT_INPUT_ETAG_KEY,
+    RESULT_METADATA_KEY,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_RUNNING
+)
+from id_recog.visibility_heartbeat import VisibilityHeartbeat
+from id_recog.metrics import WORKER_STAGE_SECONDS, WORKER_STAGE_ERRORS
+from id_recog.http_client import get_http_client
+from id_recog.image_decode import decode_image, image_content_type
+from id_recog.normalize_and_validate import StudentIdIndex
+from id_recog.layout_cache import LayoutCache
 from id_recog.sqs_schemas import (
     SQSInputMessage, 
     SQSOutputMessage,
@@ -46,6 +64,25 @@ from id_recog.sqs_schemas import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class _AckDeferred:
+    """핸들러 반환값 sentinel: 후처리(결과 전송/S3 업로드)가 I/O 스테이지에서 끝난 뒤 ACK"""
+
+    def __repr__(self) -> str:
+        return "ACK_DEFERRED"
+
+
+ACK_DEFERRED = _AckDeferred()
+
+# 핸들러 반환값: True(ACK) / False(NACK) / ACK_DEFERRED(I/O 스테이지가 ACK)
+HandlerResult = Union[bool, _AckDeferred]
+
+
+@dataclass
+class DownloadedImage:
+    """다운로드한 답안지 (디코딩한 표준 표현 + 받은 원본 바이트)"""
+    image: np.ndarray   # RGB uint8 전체 해상도 (학번 / 답안 파이프라인 공용)
+    data: bytes         # 원본 인코딩 바이트 (original/ 업로드에 재인코딩 없이 사용)
+
 
 class SQSWorker:
     """
@@ -67,39 +104,93 @@ class SQSWorker:
         region_name: str = "ap-northeast-2",
         s3_bucket: str = "mlpa-gradi",
         result_queue_url: str = None,  # AI → BE 결과 전송용 큐 (None이면 queue_url 사용)
-        fallback_queue_url: str = None  # AI → BE Fallback 알림용 큐
+        fallback_queue_url: str = None,  # AI → BE Fallback 알림용 큐
+        max_workers: int = 1,  # 메시지 병렬 처리 스레드 수 (1이면 기존 단일 스레드 루프)
+        max_messages_per_poll: int = SQS_MAX_BATCH_SIZE,  # 병렬 모드에서 한 번에 수신할 메시지 수 (최대 10)
+        queue_stats_interval: float = 30.0,  # 큐 상태(대기/처리중) 샘플링 주기 (초, 0이면 비활성)
+        io_workers: int = 0,  # 이미지 prefetch / 결과 전송·S3 업로드 I/O 스레드 수 (0이면 순차 처리)
+        batch_concurrency: int = 1,  # 배치 답안 인식 추론 스레드 수 (1이면 기존 순차 처리)
+        manifest_dir: Optional[str] = None,  # 배치 manifest 로컬 저장 경로 (None이면 S3 batch_manifest/)
+        transport: Optional[Any] = None  # sqs / s3 클라이언트 제공 객체 (None이면 boto3, 로컬 테스트: LocalTransport)
     ):
         self.queue_url = queue_url  # BE → AI 입력 큐
         self.result_queue_url = result_queue_url if result_queue_url else queue_url  # AI → BE 결과 큐
         self.fallback_queue_url = fallback_queue_url  # AI → BE Fallback 알림 큐
         self.s3_bucket = s3_bucket
         
-        # SQS 클라이언트
-        self.sqs = boto3.client(
-            'sqs',
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
-        
-        # S3 클라이언트 (이미지 다운로드/업로드용)
-        self.s3 = boto3.client(
-            's3',
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
+        if transport is not None:
+            # 로컬 SQS/S3 대체 구현 등 (boto3와 같은 호출 형식)
+            self.sqs = transport.sqs
+            self.s3 = transport.s3
+        else:
+            # SQS 클라이언트
+            self.sqs = boto3.client(
+                'sqs',
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name
+            )
+            
+            # S3 클라이언트 (이미지 다운로드/업로드용)
+            self.s3 = boto3.client(
+                's3',
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name
+            )
         
         # 워커 상태
         self._running = False
         self._worker_thread: Optional[threading.Thread] = None
         
+        # 병렬 처리 설정 (max_workers > 1일 때 워커 풀 + 배치 ACK 사용)
+        self.max_workers = max(1, max_workers)
+        self.max_messages_per_poll = min(max(1, max_messages_per_poll), SQS_MAX_BATCH_SIZE)
+        self._pool: Optional[GroupOrderedWorkerPool] = None
+        self._ack_buffer: Optional[BatchAckBuffer] = None
+        
+        # 단계별 파이프라인 (download → infer → upload)
+        # - _io_executor: 수신 즉시 이미지 다운로드 (추론 중 다음 메시지 prefetch)
+        # - _io_stage: 결과 전송 + S3 업로드 (MessageGroupId 단위 FIFO, bounded → backpressure)
+        self.io_workers = max(0, io_workers)
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._io_stage: Optional[GroupOrderedWorkerPool] = None
+        self._prefetched: Dict[str, Future] = {}
+        
+        # 배치 답안 인식 병렬도 + 작업(job_id)별 진행 상황
+        self.batch_concurrency = max(1, batch_concurrency)
+        self._batch_jobs = BatchJobRegistry()
+        
+        # 배치 manifest 체크포인트 (재시작 후 완료된 시험지 건너뛰기 / 재개)
+        self._manifest_store = BatchManifestStore(self.s3, self.s3_bucket, local_dir=manifest_dir)
+        self.manifest_checkpoint_every = 10  # 완료 N건마다 manifest 저장
+        
+        # 큐 상태 샘플러 (워커 루프와 분리된 저빈도 백그라운드 조회)
+        self.queue_stats_interval = queue_stats_interval
+        self._queue_stats: Dict[str, object] = {
+            "available": -1,
+            "inFlight": -1,
+            "sampledAt": None
+        }
+        self._stats_thread: Optional[threading.Thread] = None
+        self._stats_stop = threading.Event()
+        
+        # 수신 시 VisibilityTimeout + 처리 중 연장 하트비트 (중복 처리 방지)
+        self.visibility_timeout = 60
+        self._heartbeat = VisibilityHeartbeat(
+            extend_fn=self._extend_visibility,
+            visibility_timeout=self.visibility_timeout
+        )
+        
+        # 레이아웃 결과 캐시 (학번 인식 → 답안 인식 단계 재사용)
+        self._layout_cache = LayoutCache(self.s3, self.s3_bucket)
+        
         # 콜백 함수
         self._student_id_callback: Optional[Callable] = None
         self._attendance_callback: Optional[Callable] = None
         
         # ExamCode별 학번 리스트 저장소
-        self._student_id_lists: Dict[str, List[str]] = {}
+        self._student_id_lists: Dict[str, StudentIdIndex] = {}
         
         # ExamCode별 index 카운터 (AI 서버에서 0부터 카운트)
         self._index_counters: Dict[str, int] = {}
@@ -120,12 +211,12 @@ class SQSWorker:
         
         logger.info(f"SQS Worker 초기화 완료: 입력={queue_url}, 결과={self.result_queue_url}")
     
-    def set_student_id_callback(self, callback: Callable[[np.ndarray, List[str]], dict]):
+    def set_student_id_callback(self, callback: Callable[[np.ndarray, List[str], str], dict]):
         """
         학번 추출 콜백 함수 설정
         
         Args:
-            callback: (image, student_id_list) -> {"student_id": str | None, "meta": dict}
+            callback: (image, student_id_list, exam_code) -> {"student_id": str | None, "meta": dict}
         """
         self._student_id_callback = callback
     
@@ -143,9 +234,10 @@ class SQSWorker:
         답안 인식 콜백 함수 설정
         
         Args:
-            callback: (image, student_id, metadata) -> {
+            callback: (image, student_id, metadata, filename, defer_fallback_upload=False, exam_code=None) -> {
                 "results": List[AnswerRecognitionResult],
-                "fallback_rois": List[AnswerROI]
+                "fallback_rois": List[dict]  # defer_fallback_upload=True일 때
+                                             # 업로드할 {"s3Key", "image", "result"} 목록
             }
         """
         self._answer_recognition_callback = callback
@@ -154,16 +246,26 @@ class SQSWorker:
         """특정 시험의 정답 메타데이터 반환"""
         return self._answer_metadata.get(exam_code)
     
+    @property
+    def layout_cache(self) -> LayoutCache:
+        """학번 인식 단계에서 저장한 레이아웃 결과 캐시 (key: 메시지 examCode, filename)"""
+        return self._layout_cache
+    
+    def get_layout_cache_stats(self) -> dict:
+        """레이아웃 캐시 통계 반환"""
+        return self._layout_cache.get_stats()
+    
     def get_student_list(self, exam_code: str) -> List[str]:
         """특정 시험의 학번 리스트 반환"""
         return self._student_id_lists.get(exam_code, [])
     
     def get_next_index(self, exam_code: str) -> int:
-        """특정 시험의 다음 index 반환 (1부터 시작, 호출 시 자동 증가)"""
-        if exam_code not in self._index_counters:
-            self._index_counters[exam_code] = 0
-        self._index_counters[exam_code] += 1
-        return self._index_counters[exam_code]
+        """특정 시험의 다음 index 반환 (1부터 시작, 호출 시 자동 증가, Thread-safe)"""
+        with self._lock:
+            if exam_code not in self._index_counters:
+                self._index_counters[exam_code] = 0
+            self._index_counters[exam_code] += 1
+            return self._index_counters[exam_code]
     
     def reset_index(self, exam_code: str):
         """특정 시험의 index 카운터 리셋 (출석부 업로드 시 호출)"""
@@ -181,29 +283,35 @@ class SQSWorker:
         - s3://bucket/key
         - S3 키 (bucket은 기본값 사용)
         - http/https URL
+        
+        Returns:
+            RGB uint8 전체 해상도 배열 (학번 / 답안 파이프라인 공용, image_decode.decode_image)
         """
+        sheet = self.download_sheet(image_path)
+        return sheet.image if sheet is not None else None
+    
+    def download_sheet(self, image_path: str) -> Optional[DownloadedImage]:
+        """download_image와 같지만 받은 원본 바이트도 함께 반환 (실패 시 None)"""
         try:
-            if image_path.startswith("s3://"):
-                # s3://bucket/key 형식
-                parts = image_path[5:].split("/", 1)
-                bucket = parts[0]
-                key = parts[1] if len(parts) > 1 else ""
-                response = self.s3.get_object(Bucket=bucket, Key=key)
-            elif image_path.startswith("http://") or image_path.startswith("https://"):
-                # HTTP URL (presigned URL 등)
-                resp = requests.get(image_path, timeout=60)
-                resp.raise_for_status()
-                pil_image = Image.open(io.BytesIO(resp.content)).convert("RGB")
-                return np.array(pil_image)
-            else:
-                # S3 키로 간주
-                response = self.s3.get_object(Bucket=self.s3_bucket, Key=image_path)
-            
-            image_data = response['Body'].read()
-            pil_image = Image.open(io.BytesIO(image_data)).convert("RGB")
-            return np.array(pil_image)
+            with WORKER_STAGE_SECONDS.time(stage="download"):
+                if image_path.startswith("s3://"):
+                    # s3://bucket/key 형식
+                    parts = image_path[5:].split("/", 1)
+                    bucket = parts[0]
+                    key = parts[1] if len(parts) > 1 else ""
+                    image_data = self.s3.get_object(Bucket=bucket, Key=key)['Body'].read()
+                elif image_path.startswith("http://") or image_path.startswith("https://"):
+                    # HTTP URL (presigned URL 등, 공용 연결 풀 재사용 + 재시도)
+                    image_data = get_http_client().fetch(image_path)
+                else:
+                    # S3 키로 간주
+                    image_data = self.s3.get_object(Bucket=self.s3_bucket, Key=image_path)['Body'].read()
+                
+                # 두 파이프라인이 공유하는 표준 표현 (RGB uint8, 항상 원본 해상도)
+                return DownloadedImage(image=decode_image(image_data), data=bytes(image_data))
             
         except Exception as e:
+            WORKER_STAGE_ERRORS.inc(stage="download")
             logger.error(f"이미지 다운로드 실패 ({image_path}): {e}")
             return None
     
@@ -215,11 +323,10 @@ class SQSWorker:
             임시 파일 경로 (실패 시 None)
         """
         try:
-            resp = requests.get(url, timeout=60)
-            resp.raise_for_status()
+            data = get_http_client().fetch(url)
             
             with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                tmp.write(resp.content)
+                tmp.write(data)
                 return tmp.name
         except Exception as e:
             logger.error(f"파일 다운로드 실패 ({url}): {e}")
@@ -234,21 +341,33 @@ class SQSWorker:
         s3_key: str,
         quality: int = 95
     ) -> bool:
-        """이미지를 S3에 업로드"""
+        """이미지를 JPEG으로 인코딩하여 S3에 업로드"""
         try:
             buffer = io.BytesIO()
             Image.fromarray(image).save(buffer, format='JPEG', quality=quality)
-            buffer.seek(0)
-            
-            self.s3.put_object(
-                Bucket=self.s3_bucket,
-                Key=s3_key,
-                Body=buffer.getvalue(),
-                ContentType='image/jpeg'
-            )
+        except Exception as e:
+            WORKER_STAGE_ERRORS.inc(stage="upload")
+            logger.error(f"S3 업로드 실패 (인코딩): {e}")
+            return False
+        return self._put_image_bytes(buffer.getvalue(), s3_key, 'image/jpeg')
+    
+    def upload_original_to_s3(self, data: bytes, s3_key: str) -> bool:
+        """받은 원본 이미지 바이트를 재인코딩 없이 S3에 업로드"""
+        return self._put_image_bytes(data, s3_key, image_content_type(data))
+    
+    def _put_image_bytes(self, data: bytes, s3_key: str, content_type: str) -> bool:
+        try:
+            with WORKER_STAGE_SECONDS.time(stage="upload"):
+                self.s3.put_object(
+                    Bucket=self.s3_bucket,
+                    Key=s3_key,
+                    Body=data,
+                    ContentType=content_type
+                )
             logger.info(f"S3 업로드 성공: {s3_key}")
             return True
         except Exception as e:
+            WORKER_STAGE_ERRORS.inc(stage="upload")
             logger.error(f"S3 업로드 실패: {e}")
             return False
     
@@ -257,47 +376,79 @@ class SQSWorker:
     # =========================================================================
     def receive_message(self, wait_time_seconds: int = 20) -> Optional[SQSInputMessage]:
         """SQS에서 메시지 하나를 수신 (Long Polling + VisibilityTimeout 최적화)"""
+        messages = self.receive_messages(max_messages=1, wait_time_seconds=wait_time_seconds)
+        return messages[0] if messages else None
+    
+    def receive_messages(
+        self,
+        max_messages: int = SQS_MAX_BATCH_SIZE,
+        wait_time_seconds: int = 20
+    ) -> List[SQSInputMessage]:
+        """SQS에서 최대 max_messages(최대 10)개의 메시지를 한 번의 Long Polling으로 수신"""
         try:
             response = self.sqs.receive_message(
                 QueueUrl=self.queue_url,
-                MaxNumberOfMessages=1,
+                MaxNumberOfMessages=min(max(1, max_messages), SQS_MAX_BATCH_SIZE),
                 WaitTimeSeconds=wait_time_seconds,
                 # ✅ 중요: AI 처리 시간(모델 로딩 및 추론)을 고려하여 5분(300초) 설정
                 # 이 시간 동안은 다른 컨슈머가 이 메시지를 가져가지 못해 중복 수신을 방지합니다.
-                VisibilityTimeout=60,
+                VisibilityTimeout=self.visibility_timeout,
                 AttributeNames=['All'],
                 MessageAttributeNames=['All']
             )
             
-            messages = response.get('Messages', [])
-            if not messages:
-                return None
-            
-            msg = messages[0]
-            raw_body = msg['Body']
-            
-            body = json.loads(raw_body)
-            # 디버깅: 수신된 모든 메시지 로깅 (Raw body 포함)
-            print(f"[SQS_RECEIVE] ✅ 메시지 수신 성공")
-            print(f"[SQS_RAW] {raw_body[:500]}")  # 처음 500자만
-            logger.info(f"[SQS_RECEIVED] Raw body: {raw_body}")
-            print(f"[SQS_RECEIVE] eventType={body.get('eventType')}, examCode={body.get('examCode')}, filename={body.get('filename')}")
-            
-            # 자신이 보낸 결과 메시지인지 확인 (결과 메시지에는 studentId가 있음)
-            if "studentId" in body and body.get("eventType") == EVENT_STUDENT_ID_RECOGNITION:
-                logger.info(f"[SQS_DROP] AI가 생성한 결과 메시지를 무시합니다: {body.get('studentId')}")
-                print(f"[SQS_DROP] Ignoring own result message for {body.get('studentId')}")
-                # ⚠️ 중요: 결과 메시지도 큐에서 삭제해야 FIFO 큐가 블로킹되지 않음
-                self.delete_message(msg['ReceiptHandle'])
-                print(f"[SQS_DROP] ✅ 결과 메시지 삭제 완료")
-                return None
-
-            return SQSInputMessage.from_sqs_message(body, msg['ReceiptHandle'])
+            received = []
+            for msg in response.get('Messages', []):
+                try:
+                    parsed = self._parse_received_message(msg)
+                except Exception as e:
+                    print(f"[SQS_RECEIVE] ❌ 메시지 파싱 실패: {e}")
+                    logger.error(f"SQS 메시지 파싱 실패: {e}")
+                    continue
+                if parsed is not None:
+                    # 워커 풀 대기 시간까지 포함하여 처리 완료 전까지 VisibilityTimeout 연장
+                    self._heartbeat.track(parsed.receipt_handle, label=f"{parsed.exam_code}/{parsed.filename}")
+                    received.append(parsed)
+            return received
             
         except Exception as e:
             print(f"[SQS_RECEIVE] ❌ 메시지 수신 실패: {e}")
             logger.error(f"SQS 메시지 수신 실패: {e}")
+            return []
+    
+    def _parse_received_message(self, msg: dict) -> Optional[SQSInputMessage]:
+        """수신한 SQS 메시지를 SQSInputMessage로 변환 (AI 자신의 결과 메시지는 삭제 후 None)"""
+        raw_body = msg['Body']
+        
+        body = json.loads(raw_body)
+        # 디버깅: 수신된 모든 메시지 로깅 (Raw body 포함)
+        print(f"[SQS_RECEIVE] ✅ 메시지 수신 성공")
+        print(f"[SQS_RAW] {raw_body[:500]}")  # 처음 500자만
+        logger.info(f"[SQS_RECEIVED] Raw body: {raw_body}")
+        print(f"[SQS_RECEIVE] eventType={body.get('eventType')}, examCode={body.get('examCode')}, filename={body.get('filename')}")
+        
+        # 자신이 보낸 결과 메시지인지 확인 (결과 메시지에는 studentId가 있음)
+        if "studentId" in body and body.get("eventType") == EVENT_STUDENT_ID_RECOGNITION:
+            logger.info(f"[SQS_DROP] AI가 생성한 결과 메시지를 무시합니다: {body.get('studentId')}")
+            print(f"[SQS_DROP] Ignoring own result message for {body.get('studentId')}")
+            # ⚠️ 중요: 결과 메시지도 큐에서 삭제해야 FIFO 큐가 블로킹되지 않음
+            self.delete_message(msg['ReceiptHandle'])
+            print(f"[SQS_DROP] ✅ 결과 메시지 삭제 완료")
             return None
+        
+        parsed = SQSInputMessage.from_sqs_message(body, msg['ReceiptHandle'])
+        parsed.message_group_id = msg.get('Attributes', {}).get('MessageGroupId')
+        return parsed
+    
+    @staticmethod
+    def _group_key(msg: SQSInputMessage) -> str:
+        """
+        워커 풀 / I/O 스테이지의 순서 보장 단위
+        
+        SQS FIFO가 실제로 순서를 보장하는 MessageGroupId를 그대로 사용합니다.
+        한 시험의 메시지라도 그룹 ID가 다르면 병렬 처리 (없으면 examCode로 대체)
+        """
+        return msg.message_group_id or msg.exam_code or "default"
     
     def send_result_message(self, message: SQSOutputMessage, group_id: str = "default") -> Optional[str]:
         """결과 메시지를 결과 큐(AI → BE)로 전송"""
@@ -309,17 +460,19 @@ class SQSWorker:
             print(f"[SQS_SEND] 결과 큐로 전송할 JSON:\n{body}")
             logger.info(f"[SQS_SEND] Sending result to {self.result_queue_url}: {body}")
             
-            response = self.sqs.send_message(
-                QueueUrl=self.result_queue_url,  # ✅ 결과 전용 큐 사용
-                MessageBody=body,
-                MessageGroupId=group_id,
-                MessageDeduplicationId=str(uuid.uuid4())
-            )
+            with WORKER_STAGE_SECONDS.time(stage="sqs_send"):
+                response = self.sqs.send_message(
+                    QueueUrl=self.result_queue_url,  # ✅ 결과 전용 큐 사용
+                    MessageBody=body,
+                    MessageGroupId=group_id,
+                    MessageDeduplicationId=str(uuid.uuid4())
+                )
             msg_id = response.get('MessageId')
             print(f"[SQS_SEND] ✅ 결과 전송 완료 (MessageId: {msg_id})")
             logger.info(f"SQS 결과 전송 완료: {msg_id}")
             return msg_id
         except ClientError as e:
+            WORKER_STAGE_ERRORS.inc(stage="sqs_send")
             print(f"[SQS_SEND] ❌ 결과 전송 실패: {e}")
             logger.error(f"SQS 메시지 전송 실패: {e}")
             return None
@@ -337,39 +490,80 @@ class SQSWorker:
             print(f"[SQS_FALLBACK] Fallback 큐로 전송할 JSON:\n{body}")
             logger.info(f"[SQS_FALLBACK] Sending to {self.fallback_queue_url}: {body}")
             
-            response = self.sqs.send_message(
-                QueueUrl=self.fallback_queue_url,
-                MessageBody=body,
-                MessageGroupId=group_id,
-                MessageDeduplicationId=str(uuid.uuid4())
-            )
+            with WORKER_STAGE_SECONDS.time(stage="sqs_send"):
+                response = self.sqs.send_message(
+                    QueueUrl=self.fallback_queue_url,
+                    MessageBody=body,
+                    MessageGroupId=group_id,
+                    MessageDeduplicationId=str(uuid.uuid4())
+                )
             msg_id = response.get('MessageId')
             print(f"[SQS_FALLBACK] ✅ Fallback 전송 완료 (MessageId: {msg_id})")
             logger.info(f"SQS Fallback 전송 완료: {msg_id}")
             return msg_id
         except ClientError as e:
+            WORKER_STAGE_ERRORS.inc(stage="sqs_send")
             print(f"[SQS_FALLBACK] ❌ Fallback 전송 실패: {e}")
             logger.error(f"SQS Fallback 메시지 전송 실패: {e}")
             return None
     
     def delete_message(self, receipt_handle: str) -> bool:
         """처리 완료된 메시지 삭제 (입력 큐에서)"""
+        self._heartbeat.untrack(receipt_handle)
         try:
-            response = self.sqs.delete_message(
-                QueueUrl=self.queue_url,
-                ReceiptHandle=receipt_handle
-            )
+            with WORKER_STAGE_SECONDS.time(stage="sqs_ack"):
+                response = self.sqs.delete_message(
+                    QueueUrl=self.queue_url,
+                    ReceiptHandle=receipt_handle
+                )
             request_id = response.get('ResponseMetadata', {}).get('RequestId', 'unknown')
             print(f"[SQS_DELETE] ✅ 입력 큐에서 메시지 삭제 완료 (RequestId: {request_id})")
             logger.info(f"SQS 메시지 삭제 완료: RequestId={request_id}")
             return True
         except ClientError as e:
+            WORKER_STAGE_ERRORS.inc(stage="sqs_ack")
             print(f"[SQS_DELETE] ❌ 메시지 삭제 실패: {e}")
             logger.error(f"SQS 메시지 삭제 실패: {e}")
             return False
+    
+    def delete_messages_batch(self, receipt_handles: List[str]) -> List[str]:
+        """
+        처리 완료된 메시지 일괄 삭제 (DeleteMessageBatch, 최대 10개)
+        
+        Returns:
+            삭제에 실패한 receipt_handle 리스트
+        """
+        if not receipt_handles:
+            return []
+        
+        entries = [
+            {"Id": str(i), "ReceiptHandle": handle}
+            for i, handle in enumerate(receipt_handles[:SQS_MAX_BATCH_SIZE])
+        ]
+        try:
+            with WORKER_STAGE_SECONDS.time(stage="sqs_ack"):
+                response = self.sqs.delete_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=entries
+                )
+        except ClientError as e:
+            WORKER_STAGE_ERRORS.inc(stage="sqs_ack")
+            print(f"[SQS_DELETE_BATCH] ❌ 일괄 삭제 실패: {e}")
+            logger.error(f"SQS 일괄 삭제 실패: {e}")
+            return list(receipt_handles)
+        
+        failed = []
+        for f in response.get('Failed', []):
+            failed.append(receipt_handles[int(f['Id'])])
+            logger.error(f"SQS 일괄 삭제 항목 실패: Id={f['Id']}, Code={f.get('Code')}, Message={f.get('Message')}")
+        
+        print(f"[SQS_DELETE_BATCH] ✅ {len(entries) - len(failed)}/{len(entries)}개 메시지 삭제 완료")
+        return failed
 
     def change_message_visibility(self, receipt_handle: str, visibility_timeout: int) -> bool:
         """메시지의 Visibility Timeout 변경 (NACK 시 빠른 재시도용)"""
+        # NACK으로 지정한 타임아웃을 하트비트가 덮어쓰지 않도록 추적 중단
+        self._heartbeat.untrack(receipt_handle)
         try:
             self.sqs.change_message_visibility(
                 QueueUrl=self.queue_url,
@@ -383,6 +577,24 @@ class SQSWorker:
             logger.error(f"SQS VisibilityTimeout 변경 실패: {e}")
             return False
     
+    def _extend_visibility(self, receipt_handle: str, visibility_timeout: int) -> bool:
+        """하트비트용 VisibilityTimeout 연장 (추적 상태는 건드리지 않음)"""
+        try:
+            self.sqs.change_message_visibility(
+                QueueUrl=self.queue_url,
+                ReceiptHandle=receipt_handle,
+                VisibilityTimeout=visibility_timeout
+            )
+            logger.info(f"[SQS_HEARTBEAT] VisibilityTimeout 연장: {visibility_timeout}초")
+            return True
+        except ClientError as e:
+            logger.error(f"[SQS_HEARTBEAT] VisibilityTimeout 연장 실패: {e}")
+            return False
+    
+    def get_heartbeat_stats(self) -> dict:
+        """VisibilityTimeout 연장 통계 반환"""
+        return self._heartbeat.get_stats()
+    
     # =========================================================================
     # 이벤트 핸들러
     # =========================================================================
@@ -413,7 +625,8 @@ class SQSWorker:
             
             # 3. 메모리에 저장 (Thread-safe)
             with self._lock:
-                self._student_id_lists[msg.exam_code] = student_ids
+                # 답안지마다 재사용할 매칭 인덱스를 미리 생성
+                self._student_id_lists[msg.exam_code] = StudentIdIndex(student_ids)
                 self.reset_index(msg.exam_code)
             logger.info(f"[ATTENDANCE_UPLOAD] {msg.exam_code}: {len(student_ids)}명 로드 완료")
             
@@ -424,7 +637,7 @@ class SQSWorker:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
     
-    def handle_student_id_recognition(self, msg: SQSInputMessage) -> bool:
+    def handle_student_id_recognition(self, msg: SQSInputMessage) -> HandlerResult:
         """이미지 학번 추출 이벤트 처리"""
         
         # =====================================================================
@@ -436,8 +649,9 @@ class SQSWorker:
         if not student_list:
             # NACK 추적 키 생성
             nack_key = f"{msg.exam_code}:{msg.filename}"
-            self._nack_tracker[nack_key] = self._nack_tracker.get(nack_key, 0) + 1
-            nack_count = self._nack_tracker[nack_key]
+            with self._lock:
+                self._nack_tracker[nack_key] = self._nack_tracker.get(nack_key, 0) + 1
+                nack_count = self._nack_tracker[nack_key]
             
             loaded_exams = list(self._student_id_lists.keys())
             msg_text = f"[NACK] ⏳ 출석부가 아직 로드되지 않음 (exam={msg.exam_code}, loaded={loaded_exams})"
@@ -464,7 +678,8 @@ class SQSWorker:
                 self.send_result_message(error_result, group_id=msg.exam_code)
                 
                 # 추적에서 제거
-                del self._nack_tracker[nack_key]
+                with self._lock:
+                    self._nack_tracker.pop(nack_key, None)
                 
                 # True 반환 → 메시지 삭제 (더 이상 재시도 안 함)
                 return True
@@ -484,10 +699,10 @@ class SQSWorker:
             logger.error(f"[STUDENT_ID_RECOGNITION ERROR] downloadUrl이 누락되었습니다. 이 메시지를 큐에서 삭제합니다. 메시지: {msg}")
             return True  # True를 반환하여 큐에서 메시지를 삭제하도록 함
         
-        # 1. 이미지 다운로드 (downloadUrl 사용)
+        # 1. 이미지 다운로드 (downloadUrl 사용, prefetch된 경우 결과만 대기)
         print(f"[STEP 1/4] 이미지 다운로드 중... URL: {msg.download_url[:100]}...")
-        image = self.download_image(msg.download_url)
-        if image is None:
+        sheet = self._take_sheet(msg)
+        if sheet is None:
             print(f"[STEP 1/4] ❌ 이미지 다운로드 실패!")
             # 실패해도 결과는 전송
             result_msg = SQSOutputMessage.create(
@@ -498,20 +713,50 @@ class SQSWorker:
             )
             self.send_result_message(result_msg, group_id=msg.exam_code)
             return False
+        image = sheet.image
         print(f"[STEP 1/4] ✅ 이미지 다운로드 완료! shape={image.shape}")
         
         # 2. 학번 추출
         print(f"[STEP 2/4] AI 학번 추출 중...")
         student_id = None
         header_image = None
+        layout_boxes = None
         if self._student_id_callback:
             # student_list는 NACK 체크에서 이미 조회됨
             print(f"[STEP 2/4] 학번 리스트 {len(student_list)}명 로드됨")
-            result = self._student_id_callback(image, student_list)
+            result = self._student_id_callback(image, student_list, msg.exam_code)
             student_id = result.get("student_id")
             header_image = result.get("header_image")  # 헤더 이미지 추출
+            layout_boxes = result.get("layout_boxes")  # 답안 인식 단계에서 재사용
         print(f"[STEP 2/4] ✅ AI 추출 완료! student_id={student_id}")
         
+        # 3~4. 결과 전송 + S3 업로드
+        # I/O 스테이지가 있으면 넘기고 바로 다음 메시지 추론으로 진행 (ACK는 업로드 완료 후)
+        if self._io_stage is not None:
+            self._io_stage.submit(
+                self._group_key(msg),
+                lambda: self._publish_and_ack(msg, sheet, header_image, student_id, current_index, layout_boxes)
+            )
+            return ACK_DEFERRED
+        
+        return self._publish_student_id_result(msg, sheet, header_image, student_id, current_index, layout_boxes)
+    
+    def _publish_student_id_result(
+        self,
+        msg: SQSInputMessage,
+        sheet: DownloadedImage,
+        header_image: Optional[np.ndarray],
+        student_id: Optional[str],
+        current_index: int,
+        layout_boxes: Optional[list] = None
+    ) -> bool:
+        """
+        학번 인식 결과 전송 및 S3 업로드 (STEP 3~4)
+        
+        Returns:
+            결과 전송과 업로드가 모두 성공하면 True (False면 ACK하지 않음 → 재시도)
+        """
+        image = sheet.image
         # 3. 결과 메시지 전송
         print(f"[STEP 3/4] SQS 결과 메시지 전송 중...")
         result_msg = SQSOutputMessage.create(
@@ -520,7 +765,9 @@ class SQSWorker:
             filename=msg.filename,
             index=current_index
         )
-        self.send_result_message(result_msg, group_id=msg.exam_code)
+        if self.send_result_message(result_msg, group_id=msg.exam_code) is None:
+            print(f"[STEP 3/4] ❌ 결과 전송 실패: {msg.filename}")
+            return False
         print(f"[STEP 3/4] ✅ 결과 전송 완료!")
         
         # 4. S3 업로드
@@ -528,35 +775,98 @@ class SQSWorker:
         # - 실패 시: 
         #    1. header/{exam_code}/unknown_id/{filename} (헤더 확인용)
         #    2. original/{exam_code}/unknown_id/{filename} (나중에 답안 인식 Fallback용 원본)
+        # original/은 받은 바이트를 그대로 업로드 (재인코딩 화질 손실 없음, 배치 답안 인식 / 프론트 검토용 보관본)
         
         if student_id:
             s3_key = f"original/{msg.exam_code}/{student_id}/{msg.filename}"
             print(f"[STEP 4/4] S3 업로드 중 (original)... key={s3_key}")
-            self.upload_image_to_s3(image, s3_key)
+            uploaded = self.upload_original_to_s3(sheet.data, s3_key)
         else:
             # 1. 헤더 이미지 업로드 (프론트엔드 확인용)
             header_key = f"header/{msg.exam_code}/{UNKNOWN_ID}/{msg.filename}"
             upload_header = header_image if header_image is not None else image
             print(f"[STEP 4/4] S3 업로드 중 (header)... key={header_key}")
-            self.upload_image_to_s3(upload_header, header_key)
+            uploaded = self.upload_image_to_s3(upload_header, header_key)
             
             # 2. 원본 이미지 업로드 (unknown_id 폴더에 저장 -> 추후 Fallback 시 사용)
             original_unknown_key = f"original/{msg.exam_code}/{UNKNOWN_ID}/{msg.filename}"
             print(f"[STEP 4/4] S3 업로드 중 (original_unknown)... key={original_unknown_key}")
-            self.upload_image_to_s3(image, original_unknown_key)
+            uploaded = self.upload_original_to_s3(sheet.data, original_unknown_key) and uploaded
         
+        if not uploaded:
+            print(f"[STEP 4/4] ❌ S3 업로드 실패: {msg.filename}")
+            return False
         print(f"[STEP 4/4] ✅ S3 업로드 완료!")
         
+        # 레이아웃 결과 캐시 (답안 인식 시 layout 모델 재호출 방지)
+        if layout_boxes is not None:
+            self._layout_cache.put(msg.exam_code, msg.filename, layout_boxes, (image.shape[1], image.shape[0]))
+        
         print(f"[DONE] 이미지 처리 완료: {msg.filename} → {student_id or 'unknown_id'}")
         
         # 성공 시 NACK 트래커에서 제거 (메모리 정리)
         nack_key = f"{msg.exam_code}:{msg.filename}"
-        if nack_key in self._nack_tracker:
-            del self._nack_tracker[nack_key]
-        
+        with self._lock:
+            self._nack_tracker.pop(nack_key, None)
         return True
     
-    def process_message(self, msg: SQSInputMessage) -> bool:
+    def _publish_and_ack(
+        self,
+        msg: SQSInputMessage,
+        sheet: DownloadedImage,
+        header_image: Optional[np.ndarray],
+        student_id: Optional[str],
+        current_index: int,
+        layout_boxes: Optional[list] = None
+    ):
+        """I/O 스테이지 작업: 결과 전송 + 업로드 후 ACK (실패 시 NACK → 재시도)"""
+        try:
+            published = self._publish_student_id_result(msg, sheet, header_image, student_id, current_index, layout_boxes)
+            error = "send/upload returned failure"
+        except Exception as e:
+            published = False
+            error = e
+        if not published:
+            self._heartbeat.untrack(msg.receipt_handle)
+            print(f"[SQS_NACK] 결과 전송/업로드 실패 → 메시지 삭제 안 함: {msg.filename}, {error}")
+            logger.error(f"[SQS_IO_STAGE] 결과 전송/업로드 실패: {msg.exam_code}/{msg.filename}: {error}")
+            return
+        self._ack(msg)
+    
+    # =========================================================================
+    # 이미지 prefetch
+    # =========================================================================
+    def _prefetch_images(self, messages: List[SQSInputMessage]):
+        """수신한 학번 인식 메시지의 이미지를 I/O 스레드에서 미리 다운로드"""
+        if self._io_executor is None:
+            return
+        for msg in messages:
+            if msg.event_type != EVENT_STUDENT_ID_RECOGNITION:
+                continue
+            if not msg.download_url or not msg.receipt_handle:
+                continue
+            self._prefetched[msg.receipt_handle] = self._io_executor.submit(self.download_sheet, msg.download_url)
+    
+    def _take_sheet(self, msg: SQSInputMessage) -> Optional[DownloadedImage]:
+        """prefetch된 이미지가 있으면 결과를 기다려 반환, 없으면 직접 다운로드"""
+        future = self._prefetched.pop(msg.receipt_handle, None) if msg.receipt_handle else None
+        if future is None:
+            return self.download_sheet(msg.download_url)
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"[SQS_PREFETCH] 이미지 prefetch 실패: {e}")
+            return None
+    
+    def _discard_prefetch(self, msg: SQSInputMessage):
+        """사용되지 않은 prefetch 결과 정리 (NACK 등)"""
+        if not msg.receipt_handle:
+            return
+        future = self._prefetched.pop(msg.receipt_handle, None)
+        if future is not None:
+            future.cancel()
+    
+    def process_message(self, msg: SQSInputMessage) -> HandlerResult:
         """메시지 타입에 따라 적절한 핸들러 호출"""
         print(f"[SQS_PROCESSING] event_type={msg.event_type}, exam_code={msg.exam_code}")
         if msg.event_type == EVENT_ATTENDANCE_UPLOAD:
@@ -588,11 +898,7 @@ class SQSWorker:
         
         try:
             # 1. JSON 파일 다운로드
-            import requests
-            resp = requests.get(msg.download_url, timeout=60)
-            resp.raise_for_status()
-            
-            metadata = resp.json()
+            metadata = json.loads(get_http_client().fetch(msg.download_url))
             
             # 2. 메모리에 저장
             self._answer_metadata[msg.exam_code] = metadata
@@ -614,10 +920,24 @@ class SQSWorker:
             print(f"[ANSWER_METADATA_UPLOAD] ❌ 실패: {e}")
             return False
 
-    def process_batch_answer_recognition(self, exam_code: str, metadata: dict):
+    def create_batch_job(self, exam_code: str) -> BatchProgress:
+        """배치 작업 등록 (job_id를 먼저 발급해 API 응답으로 돌려주고 처리는 나중에 시작)"""
+        return self._batch_jobs.create(exam_code)
+    
+    def process_batch_answer_recognition(
+        self,
+        exam_code: str,
+        metadata: dict,
+        resume: bool = True,
+        job_id: Optional[str] = None
+    ):
         """
         [배치 처리] 해당 시험의 모든 이미지를 S3에서 가져와 답안 인식 수행
         
+        resume=True면 저장된 manifest / result.json 메타데이터를 확인하여
+        같은 입력 ETag + 정답 메타데이터로 이미 처리된 시험지는 건너뜁니다.
+        job_id가 있으면 create_batch_job으로 등록한 작업에 진행 상황을 기록합니다.
+        
         Input S3: original/{exam_code}/{student_id}/{filename}
         
         Logic:
@@ -633,7 +953,7 @@ class SQSWorker:
           - Result: answer/{exam_code}/{student_id}/result.json
           - Fallback IMG: answer/{exam_code}/{student_id}/{q}/{sub_q}/{filename}
         """
-        print(f"[BATCH] 🏁 배치 작업 시작: {exam_code}")
+        print(f"[BATCH] 🏁 배치 작업 시작: {exam_code} (workers={self.batch_concurrency})")
         
         # 0. Fallback 매핑 정보 생성 (unknown_id 처리용)
         # metadata = { "examCode": "...", "images": [ {"fileName": "...", "studentId": "..."}, ... ] }
@@ -645,73 +965,222 @@ class SQSWorker:
                 if fname and sid:
                     fallback_map[fname] = sid
         
-        prefix = f"original/{exam_code}/"
-        paginator = self.s3.get_paginator('list_objects_v2')
+        progress = (self._batch_jobs.get(job_id) if job_id else None) or self.create_batch_job(exam_code)
         
-        processed_count = 0
-        error_count = 0
+        if not getattr(self, '_answer_recognition_callback', None):
+            print(f"[BATCH] ⚠️ 콜백이 설정되지 않음")
+            progress.finish("answer recognition callback not set")
+            return
         
-        try:
-            for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=prefix):
-                for obj in page.get('Contents', []):
-                    key = obj['Key']
-                    # key format: original/{exam_code}/{student_id}/{filename}
-                    parts = key.split('/')
-                    if len(parts) < 4:
-                        continue
-                        
-                    folder_student_id = parts[2]
-                    filename = parts[3]
-                    
-                    target_student_id = folder_student_id
-                    
-                    # Unknown ID 처리 로직
-                    if folder_student_id == "unknown_id":
-                        if filename in fallback_map:
-                            target_student_id = fallback_map[filename]
-                            print(f"[BATCH] 🔄 Fallback 매핑: {filename} -> {target_student_id}")
-                        else:
-                            # 매핑 정보가 없으면 스킵 (혹은 로그)
-                            # print(f"[BATCH] ⚠️ Unknown image skipped (no mapping): {filename}")
-                            continue
-                    
-                    # 이미지 다운로드
-                    image = self.download_image(key)
-                    if image is None:
-                        print(f"[BATCH] ❌ 이미지 다운로드 실패: {key}")
-                        error_count += 1
-                        continue
-                        
-                    # 콜백 실행 (답안 인식 + Fallback 업로드)
-                    if self._answer_recognition_callback:
-                        try:
-                            # filename 인자 추가 전달
-                            # 주의: target_student_id를 전달해야 함
-                            result = self._answer_recognition_callback(image, target_student_id, metadata, filename)
-                            
-                            # 결과 포맷팅 및 S3 업로드 (result.json)
-                            self._format_and_upload_result(exam_code, target_student_id, result, metadata)
-                            processed_count += 1
-                            
-                            if processed_count % 10 == 0:
-                                print(f"[BATCH] 진행 중... {processed_count}건 완료")
-                                
-                        except Exception as e:
-                            print(f"[BATCH] ❌ 처리 중 에러 ({key}): {e}")
-                            import traceback
-                            traceback.print_exc()
-                            error_count += 1
+        manifest, resumed = self._open_manifest(exam_code, metadata, resume)
+        completed_since_checkpoint = [0]
+        checkpoint_lock = threading.Lock()
+        
+        def skip_if_done(target: tuple) -> bool:
+            key, target_student_id, _, etag = target
+            manifest.mark_discovered(key, etag)
+            if not resume:
+                return False
+            if not manifest.is_done(key, etag):
+                if not resumed:
+                    # 저장된 manifest 없음(첫 실행) → 시험지마다 HEAD 요청을 보내지 않음
+                    return False
+                # 마지막 체크포인트 이후에 끝난 시험지는 result.json 메타데이터로 확인
+                result_key = f"answer/{exam_code}/{target_student_id}/result.json"
+                if not is_result_current(self.s3, self.s3_bucket, result_key, etag, manifest.fingerprint):
+                    return False
+                manifest.mark_done(key, etag)
+            progress.mark_skipped()
+            return True
+        
+        def on_done(target: tuple, ok: bool, error: Optional[BaseException]):
+            key, _, _, etag = target
+            if ok:
+                manifest.mark_done(key, etag)
+            else:
+                manifest.mark_failed(key, str(error) if error else "download failed")
+            with checkpoint_lock:
+                completed_since_checkpoint[0] += 1
+                if completed_since_checkpoint[0] < self.manifest_checkpoint_every:
+                    return
+                completed_since_checkpoint[0] = 0
+            self._manifest_store.save(manifest)
+        
+        def download(target: tuple) -> Optional[np.ndarray]:
+            key = target[0]
+            image = self.download_image(key)
+            if image is None:
+                print(f"[BATCH] ❌ 이미지 다운로드 실패: {key}")
+            return image
+        
+        def infer(target: tuple, image: np.ndarray) -> dict:
+            # 콜백 실행 (답안 인식, Fallback ROI 업로드는 upload 단계로 미룸)
+            # 주의: target_student_id를 전달해야 함
+            _, target_student_id, filename, _ = target
+            return self._answer_recognition_callback(
+                image, target_student_id, metadata, filename,
+                defer_fallback_upload=True, exam_code=exam_code
+            )
+        
+        def upload(target: tuple, result: dict):
+            _, target_student_id, _, etag = target
+            # Fallback ROI 업로드 후 결과 포맷팅 및 S3 업로드 (result.json)
+            fallback_rois = result.get("fallback_rois", [])
+            for roi in fallback_rois:
+                if self.upload_image_to_s3(roi["image"], roi["s3Key"]):
+                    roi["result"].s3_key = roi["s3Key"]
+            progress.add_fallbacks(len(fallback_rois))
+            uploaded = self._format_and_upload_result(
+                exam_code, target_student_id, result, metadata,
+                input_etag=etag, metadata_fingerprint=manifest.fingerprint
+            )
+            if not uploaded:
+                # manifest에 완료로 기록되지 않도록 실패 처리 (재개 시 다시 인식)
+                raise RuntimeError(f"result.json 업로드 실패: {target_student_id}")
             
-            print(f"[BATCH] ✅ 배치 작업 완료: 성공 {processed_count}, 실패 {error_count}")
+            done = progress.processed + 1
+            if done % 10 == 0:
+                snapshot = progress.snapshot()
+                print(f"[BATCH] 진행 중... {done}건 완료 (job={progress.job_id}, "
+                      f"{snapshot['throughputPerMin']}건/분, ETA={snapshot['etaS']}s)")
+        
+        executor = ParallelBatchExecutor(
+            download_fn=download,
+            infer_fn=infer,
+            upload_fn=upload,
+            infer_workers=self.batch_concurrency,
+            io_workers=0 if self.batch_concurrency <= 1 else max(2, self.batch_concurrency),
+            name="BATCH",
+            on_done=on_done
+        )
+        
+        targets = (
+            target for target in self._iter_batch_targets(exam_code, fallback_map)
+            if not skip_if_done(target)
+        )
+        
+        try:
+            executor.run(targets, progress)
+            manifest.status = STATUS_COMPLETED
+            print(f"[BATCH] ✅ 배치 작업 완료: 성공 {progress.processed}, 실패 {progress.failed}, "
+                  f"건너뜀 {progress.skipped}")
             
         except Exception as e:
+            manifest.status = STATUS_FAILED
             print(f"[BATCH] ❌ 배치 루프 에러: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            self._manifest_store.save(manifest)
+    
+    def _open_manifest(self, exam_code: str, metadata: dict, resume: bool) -> Tuple[BatchManifest, bool]:
+        """
+        저장된 manifest를 이어서 사용 (정답 메타데이터가 바뀌었거나 resume=False면 새로 생성)
+        
+        Returns:
+            (manifest, 저장된 manifest를 이어서 쓰는지 여부)
+        """
+        fresh = BatchManifest.create(exam_code, metadata)
+        stored = self._manifest_store.load(exam_code) if resume else None
+        if stored is None or stored.fingerprint != fresh.fingerprint:
+            return fresh, False
+        
+        stored.metadata = metadata
+        stored.status = STATUS_RUNNING
+        print(f"[BATCH] ♻️ 이전 manifest 이어서 처리: 완료 {len(stored.done)}건, 실패 {len(stored.failed)}건")
+        return stored, True
+    
+    def resume_batch_answer_recognition(self, exam_code: str) -> Optional[dict]:
+        """
+        저장된 manifest의 정답 메타데이터로 배치 답안 인식을 백그라운드에서 재개
+        
+        Returns:
+            manifest 요약 + jobId (manifest가 없으면 None)
+            이미 실행 중인 작업이 있으면 그 작업의 jobId를 반환
+        """
+        manifest = self._manifest_store.load(exam_code)
+        if manifest is None or not manifest.metadata:
+            return None
+        
+        progress = self._batch_jobs.latest(exam_code)
+        if progress is not None and progress.is_running:
+            print(f"[BATCH] ⚠️ 이미 실행 중인 배치 작업: {exam_code} (job={progress.job_id})")
+            return {**manifest.summary(), "jobId": progress.job_id}
+        
+        self._answer_metadata[exam_code] = manifest.metadata
+        progress = self.create_batch_job(exam_code)
+        threading.Thread(
+            target=self.process_batch_answer_recognition,
+            args=(exam_code, manifest.metadata),
+            kwargs={"job_id": progress.job_id},
+            daemon=True
+        ).start()
+        return {**manifest.summary(), "jobId": progress.job_id}
+    
+    def get_batch_manifest(self, exam_code: str) -> Optional[dict]:
+        """저장된 manifest 요약 (없으면 None)"""
+        manifest = self._manifest_store.load(exam_code)
+        return manifest.summary() if manifest else None
+    
+    def _iter_batch_targets(self, exam_code: str, fallback_map: Dict[str, str]):
+        """
+        original/{exam_code}/ 하위 이미지 중 인식 대상을 (key, student_id, filename, etag)로 순회
+        
+        unknown_id 폴더는 fallback_map에 매핑된 파일만 대상으로 포함합니다.
+        """
+        prefix = f"original/{exam_code}/"
+        paginator = self.s3.get_paginator('list_objects_v2')
+        
+        for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+                # key format: original/{exam_code}/{student_id}/{filename}
+                parts = key.split('/')
+                if len(parts) < 4:
+                    continue
+                    
+                folder_student_id = parts[2]
+                filename = parts[3]
+                
+                target_student_id = folder_student_id
+                
+                # Unknown ID 처리 로직
+                if folder_student_id == "unknown_id":
+                    if filename in fallback_map:
+                        target_student_id = fallback_map[filename]
+                        print(f"[BATCH] 🔄 Fallback 매핑: {filename} -> {target_student_id}")
+                    else:
+                        # 매핑 정보가 없으면 스킵
+                        continue
+                
+                yield key, target_student_id, filename, obj.get('ETag', '').strip('"')
+    
+    def get_batch_progress(self) -> Dict[str, dict]:
+        """examCode별 가장 최근 배치 답안 인식 진행 상황"""
+        return {p.exam_code: p.snapshot() for p in self._batch_jobs.list()}
+    
+    def get_batch_job(self, job_id: str) -> Optional[BatchProgress]:
+        """job_id로 배치 작업 조회"""
+        return self._batch_jobs.get(job_id)
+    
+    def list_batch_jobs(self) -> List[dict]:
+        """등록된 배치 작업 목록 (최근 순)"""
+        return [p.snapshot() for p in reversed(self._batch_jobs.list())]
 
-    def _format_and_upload_result(self, exam_code: str, student_id: str, result_data: dict, metadata: dict):
+    def _format_and_upload_result(
+        self,
+        exam_code: str,
+        student_id: str,
+        result_data: dict,
+        metadata: dict,
+        input_etag: Optional[str] = None,
+        metadata_fingerprint: Optional[str] = None
+    ) -> bool:
         """
-        결과 JSON 포맷팅 및 S3 업로드
+        결과 JSON 포맷팅 및 S3 업로드 (업로드 성공 여부 반환)
+        
+        input_etag / metadata_fingerprint가 있으면 result.json 객체 메타데이터로 기록합니다.
+        (배치 재실행 시 같은 입력으로 만든 결과인지 HEAD로 확인하는 용도)
         
         Metadata 필드: questionId, questionNumber, questionType, answer, answerCount, point
         Result 필드: questionNumber, subQuestionNumber, recAnswer, confidence, rawText
@@ -785,16 +1254,27 @@ class SQSWorker:
         # S3 업로드: answer/{exam code}/{학번}/result.json
         s3_key = f"answer/{exam_code}/{student_id}/result.json"
         
+        object_metadata = {}
+        if input_etag:
+            object_metadata[RESULT_INPUT_ETAG_KEY] = input_etag
+        if metadata_fingerprint:
+            object_metadata[RESULT_METADATA_KEY] = metadata_fingerprint
+        
         try:
-            self.s3.put_object(
-                Bucket=self.s3_bucket,
-                Key=s3_key,
-                Body=json.dumps(final_json, ensure_ascii=False, indent=2),
-                ContentType='application/json'
-            )
+            with WORKER_STAGE_SECONDS.time(stage="upload"):
+                self.s3.put_object(
+                    Bucket=self.s3_bucket,
+                    Key=s3_key,
+                    Body=json.dumps(final_json, ensure_ascii=False, indent=2),
+                    ContentType='application/json',
+                    Metadata=object_metadata
+                )
             # print(f"  [UPLOAD] 결과 JSON 업로드: {s3_key}")
+            return True
         except Exception as e:
+            WORKER_STAGE_ERRORS.inc(stage="upload")
             print(f"  [UPLOAD FAIL] 결과 JSON 업로드 실패: {s3_key}, {e}")
+            return False
 
     def handle_answer_recognition(self, msg: SQSInputMessage) -> bool:
         """답안 인식 이벤트 처리 (개별 메시지)"""
@@ -828,7 +1308,9 @@ class SQSWorker:
                 result = self._answer_recognition_callback(
                     image, 
                     answer_msg.student_id,
-                    metadata
+                    metadata,
+                    msg.filename or "unknown.jpg",
+                    exam_code=msg.exam_code
                 )
                 
                 # 결과 메시지 생성
@@ -893,16 +1375,18 @@ class SQSWorker:
             body = message.to_json()
             print(f"[SQS_SEND] 결과 전송: {message.event_type}")
             
-            response = self.sqs.send_message(
-                QueueUrl=self.result_queue_url,
-                MessageBody=body,
-                MessageGroupId=group_id,
-                MessageDeduplicationId=str(uuid.uuid4())
-            )
+            with WORKER_STAGE_SECONDS.time(stage="sqs_send"):
+                response = self.sqs.send_message(
+                    QueueUrl=self.result_queue_url,
+                    MessageBody=body,
+                    MessageGroupId=group_id,
+                    MessageDeduplicationId=str(uuid.uuid4())
+                )
             msg_id = response.get('MessageId')
             print(f"[SQS_SEND] ✅ 전송 완료 (MessageId: {msg_id})")
             return msg_id
         except ClientError as e:
+            WORKER_STAGE_ERRORS.inc(stage="sqs_send")
             print(f"[SQS_SEND] ❌ 전송 실패: {e}")
             logger.error(f"SQS 메시지 전송 실패: {e}")
             return None
@@ -925,9 +1409,26 @@ class SQSWorker:
             print(f"[SQS_STATUS_ERROR] 큐 상태 조회 실패: {e}")
             return (-1, -1)
     
+    def _sample_queue_status_loop(self):
+        """큐 상태를 queue_stats_interval 주기로 조회하여 캐시 (워커 루프와 별도 스레드)"""
+        while not self._stats_stop.is_set():
+            available, in_flight = self._get_queue_status()
+            self._queue_stats = {
+                "available": available,
+                "inFlight": in_flight,
+                "sampledAt": time.time()
+            }
+            self._stats_stop.wait(self.queue_stats_interval)
+    
+    def get_queue_stats(self) -> dict:
+        """마지막으로 샘플링된 큐 상태 반환 (SQS 호출 없음)"""
+        return dict(self._queue_stats)
+    
     def _worker_loop(self):
         """워커 메인 루프"""
-        import datetime
+        if self._pool is not None:
+            self._pooled_worker_loop()
+            return
         
         with open("debug_worker.log", "a") as f:
             f.write(f"[{time.ctime()}] SQS Worker Loop Started\n")
@@ -936,67 +1437,66 @@ class SQSWorker:
         print(f"[SQS_LOOP] 결과 큐: {self.result_queue_url}")
         logger.info(f"SQS Worker 시작 - 입력={self.queue_url}, 결과={self.result_queue_url}")
         
-        poll_count = 0
+        q_name = self.queue_url.split('/')[-1]
         
         while self._running:
             try:
-                poll_count += 1
-                timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                
-                q_name = self.queue_url.split('/')[-1]
-                timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                
-                # =========================================================
-                # [POLL_START] 폴링 시작 전 상태
-                # =========================================================
-                before_available, before_in_flight = self._get_queue_status()
-                print(f"\n[{q_name}] {'='*40}")
-                print(f"[{q_name}] [POLL #{poll_count}] {timestamp} 폴링 시작")
-                print(f"[{q_name}] [POLL_BEFORE] 대기: {before_available}, 처리중: {before_in_flight}")
-                
-                # =========================================================
-                # [POLL_WAIT] Long Polling 수행 (최대 20초)
-                # =========================================================
-                print(f"[{q_name}] [POLL_WAIT] Long Polling 대기 중... (최대 20초)")
-                msg = self.receive_message(wait_time_seconds=20)
-                
-                poll_end_timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                
-                # =========================================================
-                # [POLL_RESULT] 폴링 결과
-                # =========================================================
-                if msg is None:
-                    print(f"[{q_name}] [POLL_RESULT] {poll_end_timestamp} 메시지 없음")
-                else:
-                    print(f"[{q_name}] [POLL_RESULT] {poll_end_timestamp} ✅ 메시지 수신! ({msg.event_type})")
-                
-                # =========================================================
-                # [POLL_AFTER] 폴링 후 상태 비교
-                # =========================================================
-                after_available, after_in_flight = self._get_queue_status()
-                delta_in_flight = after_in_flight - before_in_flight
-                
-                print(f"[{q_name}] [POLL_AFTER] 대기: {after_available}, 처리중: {after_in_flight} ({delta_in_flight:+d})")
-                
-                if msg is None and delta_in_flight > 0:
-                    print(f"[{q_name}] [⚠️ ANOMALY] AI가 안 받았는데 처리중 +{delta_in_flight} 증가! (외부 간섭)")
-                
-                print(f"[{q_name}] {'='*40}")
-                
-                if msg is None:
+                # 큐 상태 조회는 _sample_queue_status_loop에서 별도로 수행
+                # (여기서는 receive → process → ack에 필요한 호출만)
+                # 파이프라인 모드에서는 여러 개를 받아 다운로드를 미리 시작하고 순서대로 추론
+                messages = self.receive_messages(
+                    max_messages=self.max_messages_per_poll if self._io_executor is not None else 1,
+                    wait_time_seconds=20
+                )
+                if not messages:
                     continue
                 
-                # =========================================================
-                # 메시지 처리
-                # =========================================================
-                success = self.process_message(msg)
+                self._prefetch_images(messages)
+                for msg in messages:
+                    print(f"[{q_name}] [POLL_RESULT] ✅ 메시지 수신! ({msg.event_type})")
+                    
+                    # =====================================================
+                    # 메시지 처리 (성공 시 ACK, 실패 시 삭제 안 함 → 재시도)
+                    # =====================================================
+                    self._process_and_ack(msg)
+                    
+            except Exception as e:
+                print(f"[SQS_WORKER_ERROR] Worker 에러: {e}")
+                logger.error(f"Worker 에러: {e}")
+                time.sleep(5)
+        
+        logger.info("SQS Worker 종료")
+    
+    def _pooled_worker_loop(self):
+        """
+        병렬 워커 루프 (max_workers > 1)
+        
+        1. Long Polling으로 최대 max_messages_per_poll개 수신
+        2. MessageGroupId 단위 FIFO를 유지하며 워커 풀에 분배 (없으면 examCode)
+        3. 처리 성공한 메시지는 BatchAckBuffer를 통해 DeleteMessageBatch로 일괄 삭제
+        
+        워커 풀의 대기 작업이 가득 차면 submit()이 블로킹되므로
+        처리 속도 이상으로 메시지를 가져가지 않습니다. (backpressure)
+        """
+        q_name = self.queue_url.split('/')[-1]
+        print(f"[SQS_LOOP] SQS Worker 시작 (병렬 모드: workers={self.max_workers}, batch={self.max_messages_per_poll})")
+        print(f"[SQS_LOOP] 입력 큐: {self.queue_url}")
+        print(f"[SQS_LOOP] 결과 큐: {self.result_queue_url}")
+        logger.info(f"SQS Worker 시작 (병렬) - 입력={self.queue_url}, 결과={self.result_queue_url}, workers={self.max_workers}")
+        
+        while self._running:
+            try:
+                messages = self.receive_messages(
+                    max_messages=self.max_messages_per_poll,
+                    wait_time_seconds=20
+                )
+                if not messages:
+                    continue
                 
-                # 처리 완료 시 메시지 삭제 (ACK), 실패 시 삭제 안 함 (NACK → 재시도)
-                if success and msg.receipt_handle:
-                    print(f"[SQS_ACK] 처리 성공 → 메시지 삭제 진행")
-                    self.delete_message(msg.receipt_handle)
-                elif not success:
-                    print(f"[SQS_NACK] 처리 실패/보류 → 메시지 삭제 안 함 (VisibilityTimeout 후 재시도)")
+                print(f"[{q_name}] [POLL_RESULT] ✅ {len(messages)}개 메시지 수신 (처리중: {self._pool.in_flight})")
+                self._prefetch_images(messages)
+                for msg in messages:
+                    self._pool.submit(self._group_key(msg), lambda m=msg: self._process_and_ack(m))
                     
             except Exception as e:
                 print(f"[SQS_WORKER_ERROR] Worker 에러: {e}")
@@ -1005,12 +1505,74 @@ class SQSWorker:
         
         logger.info("SQS Worker 종료")
     
+    def _process_and_ack(self, msg: SQSInputMessage):
+        """메시지 1개 처리 후 성공 시 ACK (ACK_DEFERRED면 I/O 스테이지가 ACK)"""
+        deferred = False
+        try:
+            success = self.process_message(msg)
+            deferred = success is ACK_DEFERRED
+        finally:
+            self._discard_prefetch(msg)
+            if not deferred:
+                self._heartbeat.untrack(msg.receipt_handle)
+        
+        if deferred:
+            return
+        if success and msg.receipt_handle:
+            self._ack(msg)
+        elif not success:
+            print(f"[SQS_NACK] 처리 실패/보류 → 메시지 삭제 안 함 (VisibilityTimeout 후 재시도): {msg.filename}")
+    
+    def _ack(self, msg: SQSInputMessage):
+        """메시지 ACK (병렬 모드는 배치 삭제 버퍼, 아니면 즉시 삭제)"""
+        if not msg.receipt_handle:
+            return
+        if self._ack_buffer is not None:
+            self._heartbeat.untrack(msg.receipt_handle)
+            self._ack_buffer.add(msg.receipt_handle)
+        else:
+            print(f"[SQS_ACK] 처리 성공 → 메시지 삭제 진행")
+            self.delete_message(msg.receipt_handle)
+    
     def start(self):
         """워커 백그라운드 실행 시작"""
         if self._running:
             logger.warning("Worker가 이미 실행 중입니다.")
             return
         
+        if self.max_workers > 1:
+            self._pool = GroupOrderedWorkerPool(
+                num_workers=self.max_workers,
+                max_pending=self.max_workers + self.max_messages_per_poll,
+                name="SQS-Pool"
+            )
+            self._pool.start()
+            self._ack_buffer = BatchAckBuffer(self.delete_messages_batch)
+            self._ack_buffer.start()
+        
+        if self.io_workers > 0:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=self.io_workers,
+                thread_name_prefix="SQS-Prefetch"
+            )
+            self._io_stage = GroupOrderedWorkerPool(
+                num_workers=self.io_workers,
+                max_pending=self.io_workers * 2,
+                name="SQS-IO"
+            )
+            self._io_stage.start()
+        
+        self._heartbeat.start()
+        
+        if self.queue_stats_interval > 0:
+            self._stats_stop.clear()
+            self._stats_thread = threading.Thread(
+                target=self._sample_queue_status_loop,
+                daemon=True,
+                name="SQS-Queue-Sampler"
+            )
+            self._stats_thread.start()
+        
         self._running = True
         self._worker_thread = threading.Thread(
             target=self._worker_loop,
@@ -1023,8 +1585,25 @@ class SQSWorker:
     def stop(self):
         """워커 종료"""
         self._running = False
+        self._stats_stop.set()
+        if self._stats_thread is not None:
+            self._stats_thread.join(timeout=5)
+            self._stats_thread = None
         if self._worker_thread:
             self._worker_thread.join(timeout=25)
+        if self._pool is not None:
+            self._pool.stop()
+            self._pool = None
+        if self._io_stage is not None:
+            self._io_stage.stop()
+            self._io_stage = None
+        if self._ack_buffer is not None:
+            self._ack_buffer.stop()
+            self._ack_buffer = None
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+        self._heartbeat.stop()
         logger.info("SQS Worker가 종료되었습니다.")
     
     @property
@@ -1051,7 +1630,14 @@ def init_sqs_worker(
     region_name: str = "ap-northeast-2",
     s3_bucket: str = "mlpa-gradi",
     result_queue_url: str = None,
-    fallback_queue_url: str = None
+    fallback_queue_url: str = None,
+    max_workers: int = 1,
+    max_messages_per_poll: int = SQS_MAX_BATCH_SIZE,
+    queue_stats_interval: float = 30.0,
+    io_workers: int = 0,
+    batch_concurrency: int = 1,
+    manifest_dir: Optional[str] = None,
+    transport: Optional[Any] = None
 ) -> SQSWorker:
     """SQS Worker 초기화 및 싱글톤 설정"""
     global _worker_instance
@@ -1062,6 +1648,13 @@ def init_sqs_worker(
         region_name=region_name,
         s3_bucket=s3_bucket,
         result_queue_url=result_queue_url,
-        fallback_queue_url=fallback_queue_url
+        fallback_queue_url=fallback_queue_url,
+        max_workers=max_workers,
+        max_messages_per_poll=max_messages_per_poll,
+        queue_stats_interval=queue_stats_interval,
+        io_workers=io_workers,
+        batch_concurrency=batch_concurrency,
+        manifest_dir=manifest_dir,
+        transport=transport
     )
     return _worker_instance
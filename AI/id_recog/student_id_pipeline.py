@@ -9,8 +9,13 @@ student_id_pipeline.py - 학번 추출 파이프라인 오케스트레이션
 3. 각 crop에 PP-OCRv5 수행 → 8자리 숫자 패턴 찾기
 4. student_id_list와 매칭
 5. (필요 시) VLM fallback
+
+bbox는 학번 가능성이 높은 순서(candidate_ranking)로 OCR하며,
+확실한 매칭(exact + 높은 confidence)이 나오면 나머지 bbox는 건너뜁니다.
 """
 
+import time
+
 import numpy as np
 from PIL import Image
 from typing import Any
@@ -24,7 +29,9 @@ from id_recog.layout import (
     make_header_image,
     LayoutBox
 )
-from id_recog.ocr import ppocr_extract, vlm_extract_student_id
+from id_recog.ocr import ppocr_extract_batch, vlm_extract_student_id
+from id_recog.candidate_ranking import rank_candidate_boxes, get_template_stats
+from id_recog.metrics import STUDENT_ID_STAGE_SECONDS, STUDENT_ID_OCR_CROPS
 from id_recog.normalize_and_validate import (
     normalize_candidate,
     is_valid_format,
@@ -33,13 +40,16 @@ from id_recog.normalize_and_validate import (
 )
 
 
+@STUDENT_ID_STAGE_SECONDS.time(stage="total")
 def extract_student_id(
     original_image: np.ndarray | Image.Image,
     student_id_list: list[str],
     layout_model: Any,
     ocr_model: Any,
     vlm_client: Any = None,
-    config: Config | None = None
+    config: Config | None = None,
+    layout_boxes: list[LayoutBox] | None = None,
+    template_key: str | None = None
 ) -> StudentIdExtractionResult:
     """
     답안지 이미지에서 학번을 추출합니다.
@@ -58,6 +68,8 @@ def extract_student_id(
         ocr_model: PP-OCRv5_mobile_rec 모델 객체 (PaddleX)
         vlm_client: Optional. OpenAI 클라이언트
         config: 파이프라인 설정 (None이면 기본값 사용)
+        layout_boxes: Optional. 이미 탐지된 레이아웃 결과 (배치 추론 등, 주어지면 Step 1 생략)
+        template_key: Optional. 양식 구분 키 (보통 examCode, 학번 위치 적중률 학습용)
         
     Returns:
         StudentIdExtractionResult
@@ -72,13 +84,19 @@ def extract_student_id(
         "used_vlm": False,
         "vlm_error_type": None,
         "ocr_candidates": [],  # 각 bbox에서 추출된 후보들
-        "matched_from_label": None  # 어느 라벨에서 매칭되었는지
+        "matched_from_label": None,  # 어느 라벨에서 매칭되었는지
+        "ocr_boxes": 0,  # 실제로 OCR한 bbox 수
+        "early_exit": False  # 확실한 매칭으로 나머지 bbox를 건너뛰었는지
     }
     
     # =========================================================================
     # Step 1) Layout detect - 모든 bbox 탐지
     # =========================================================================
-    all_boxes = detect_all_bboxes(original_image, layout_model)
+    if layout_boxes is not None:
+        all_boxes = layout_boxes
+    else:
+        with STUDENT_ID_STAGE_SECONDS.time(stage="layout"):
+            all_boxes = detect_all_bboxes(original_image, layout_model)
     
     if not all_boxes:
         meta["stage"] = "layout"
@@ -87,7 +105,8 @@ def extract_student_id(
             original_image=original_image,
             header_image=None,
             student_id=None,
-            meta=meta
+            meta=meta,
+            layout_boxes=all_boxes
         )
     
     # Table과 Non-table 분리
@@ -96,6 +115,7 @@ def extract_student_id(
     
     # Header 이미지 생성 (사용자 fallback용)
     header_image = None
+    largest_table = None
     if table_boxes:
         # 가장 큰 Table bbox 기준
         largest_table = max(table_boxes, key=lambda b: b.bbox.area)
@@ -108,62 +128,113 @@ def extract_student_id(
             original_image=original_image,
             header_image=header_image,
             student_id=None,
-            meta=meta
+            meta=meta,
+            layout_boxes=all_boxes
         )
     
     # =========================================================================
-    # Step 2 & 3) 각 non-table bbox를 crop하여 PP-OCRv5 수행
+    # Step 2 & 3) 후보 bbox를 우선순위대로 crop하여 PP-OCRv5 배치 수행
     # =========================================================================
-    best_match = None
-    best_conf = 0.0
+    if isinstance(original_image, Image.Image):
+        image_shape = (original_image.height, original_image.width)
+    else:
+        image_shape = original_image.shape
+    
+    ranked = rank_candidate_boxes(
+        non_table_boxes,
+        image_shape,
+        table_bbox=largest_table.bbox if largest_table is not None else None,
+        template_key=template_key
+    )
     
-    for layout_box in non_table_boxes:
+    entries = []
+    for ranked_box in ranked:
         # bbox crop
-        cropped = crop_bbox(original_image, layout_box.bbox, padding=2)
+        cropped = crop_bbox(original_image, ranked_box.layout_box.bbox, padding=2)
         if cropped is None:
             continue
-        
-        # PP-OCRv5 수행
-        raw_text, conf = ppocr_extract(cropped, ocr_model)
-        
-        # 후보 정규화
-        candidate = normalize_candidate(raw_text)
-        
-        # 결과 기록 (디버깅용)
-        meta["ocr_candidates"].append({
-            "label": layout_box.label,
-            "raw_text": raw_text,
-            "normalized": candidate,
-            "conf": conf,
-            "bbox": [layout_box.bbox.x1, layout_box.bbox.y1, layout_box.bbox.x2, layout_box.bbox.y2]
-        })
-        
-        # 유효성 검사
-        if not candidate:
-            continue
-        
-        regex_ok = is_valid_format(candidate)
-        length_ok = (len(candidate) == 8)
-        
-        if not regex_ok or not length_ok:
-            continue
-        
-        # Confidence threshold 체크
-        if conf < config.conf_threshold:
-            continue
-        
-        # student_id_list 매칭
-        matched = match_to_student_list(
-            candidate,
-            student_id_list,
-            config.allow_edit_distance_1
+        entries.append((ranked_box, cropped))
+    
+    # 상위 ocr_first_batch개를 먼저 인식하고, 확실한 매칭이 없을 때만 나머지를 인식
+    if 0 < config.ocr_first_batch < len(entries):
+        stages = [entries[:config.ocr_first_batch], entries[config.ocr_first_batch:]]
+    else:
+        stages = [entries]
+    
+    best_match = None
+    best_conf = 0.0
+    best_exact = False
+    best_signature = None
+    
+    for stage in stages:
+        ocr_start = time.perf_counter()
+        ocr_results = ppocr_extract_batch(
+            [cropped for _, cropped in stage],
+            ocr_model,
+            batch_size=config.ocr_batch_size
         )
+        ocr_elapsed = time.perf_counter() - ocr_start
+        STUDENT_ID_STAGE_SECONDS.observe(ocr_elapsed, stage="ocr")
+        if stage:
+            # crop 1개당 평균 (배치 인식이므로 crop별 시간은 따로 잴 수 없음)
+            STUDENT_ID_STAGE_SECONDS.observe(ocr_elapsed / len(stage), stage="ocr_crop")
+        STUDENT_ID_OCR_CROPS.inc(len(stage))
+        meta["ocr_boxes"] += len(stage)
+        
+        match_start = time.perf_counter()
+        for (ranked_box, _), (raw_text, conf) in zip(stage, ocr_results):
+            layout_box = ranked_box.layout_box
+            
+            # 후보 정규화
+            candidate = normalize_candidate(raw_text)
+            
+            # 결과 기록 (디버깅용)
+            meta["ocr_candidates"].append({
+                "label": layout_box.label,
+                "raw_text": raw_text,
+                "normalized": candidate,
+                "conf": conf,
+                "rank_score": ranked_box.score,
+                "bbox": [layout_box.bbox.x1, layout_box.bbox.y1, layout_box.bbox.x2, layout_box.bbox.y2]
+            })
+            
+            # 유효성 검사
+            if not candidate:
+                continue
+            
+            regex_ok = is_valid_format(candidate)
+            length_ok = (len(candidate) == 8)
+            
+            if not regex_ok or not length_ok:
+                continue
+            
+            # Confidence threshold 체크
+            if conf < config.conf_threshold:
+                continue
+            
+            # student_id_list 매칭
+            matched = match_to_student_list(
+                candidate,
+                student_id_list,
+                config.allow_edit_distance_1
+            )
+            
+            if matched and conf > best_conf:
+                best_match = matched
+                best_conf = conf
+                best_exact = (matched == candidate)
+                best_signature = ranked_box.signature
+                meta["matched_from_label"] = layout_box.label
+                meta["ocr_conf"] = conf
+        STUDENT_ID_STAGE_SECONDS.observe(time.perf_counter() - match_start, stage="matching")
         
-        if matched and conf > best_conf:
-            best_match = matched
-            best_conf = conf
-            meta["matched_from_label"] = layout_box.label
-            meta["ocr_conf"] = conf
+        # Early exit: 리스트와 정확히 일치 + 충분한 confidence
+        if best_match and best_exact and best_conf >= config.early_exit_conf:
+            meta["early_exit"] = True
+            break
+    
+    if best_match:
+        get_template_stats().record_hit(template_key, best_signature)
     
     # =========================================================================
     # Step 4) OCR 성공 시 반환
@@ -175,7 +246,8 @@ def extract_student_id(
             original_image=original_image,
             header_image=header_image,
             student_id=best_match,
-            meta=meta
+            meta=meta,
+            layout_boxes=all_boxes
         )
     
     # =========================================================================
@@ -184,11 +256,12 @@ def extract_student_id(
     if vlm_client is not None and header_image is not None:
         meta["used_vlm"] = True
         
-        vlm_result = vlm_extract_student_id(
-            header_image,
-            vlm_client,
-            config.vlm_timeout_s
-        )
+        with STUDENT_ID_STAGE_SECONDS.time(stage="vlm"):
+            vlm_result = vlm_extract_student_id(
+                header_image,
+                vlm_client,
+                config.vlm_timeout_s
+            )
         
         if vlm_result and vlm_result.get("text"):
             vlm_candidate = normalize_candidate(vlm_result["text"])
@@ -210,7 +283,8 @@ def extract_student_id(
                         original_image=original_image,
                         header_image=header_image,
                         student_id=matched,
-                        meta=meta
+                        meta=meta,
+                        layout_boxes=all_boxes
                     )
                 else:
                     meta["stage"] = "match"
@@ -234,5 +308,6 @@ def extract_student_id(
         original_image=original_image,
         header_image=header_image,
         student_id=None,
-        meta=meta
+        meta=meta,
+        layout_boxes=all_boxes
     )
@@ -0,0 +1,133 @@
+"""
+ocr_input_benchmark.py - OCR 입력 방식 벤치마크 (임시 PNG 파일 vs numpy 배열)
+
+ppocr_extract가 crop마다 수행하던 PNG 인코딩 + 디스크 쓰기/읽기 + 삭제 비용과
+numpy 배열을 그대로 전달할 때의 변환 비용을 비교합니다.
+
+- 기본: 모델 없이 입력 준비 비용만 측정 (모델이 파일을 읽는 cv2.imread 포함)
+- --with-model: PP-OCRv5_mobile_rec를 로드하여 end-to-end 시간까지 측정
+
+사용법:
+    python id_recog/test/ocr_input_benchmark.py --crops 20 --repeat 10
+    python id_recog/test/ocr_input_benchmark.py --with-model
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# AI 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.ocr import _to_model_array, _TMP_DIR
+
+
+# =============================================================================
+# 입력 준비 방식
+# =============================================================================
+def prepare_via_png(crop: np.ndarray, tmp_dir=None) -> np.ndarray:
+    """기존 방식: PNG 저장 → (모델 내부) cv2.imread → 삭제"""
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False, dir=tmp_dir) as tmp:
+        Image.fromarray(crop).save(tmp.name)
+        tmp_path = tmp.name
+    try:
+        return cv2.imread(tmp_path)
+    finally:
+        os.unlink(tmp_path)
+
+
+def prepare_via_array(crop: np.ndarray) -> np.ndarray:
+    """신규 방식: RGB → BGR 배열 변환만 수행"""
+    return _to_model_array(crop)
+
+
+def make_crops(n: int, seed: int = 0) -> list:
+    """학번 영역 크기와 비슷한 합성 crop 생성"""
+    rng = np.random.default_rng(seed)
+    crops = []
+    for _ in range(n):
+        h = int(rng.integers(40, 120))
+        w = int(rng.integers(200, 900))
+        crop = np.full((h, w, 3), 255, dtype=np.uint8)
+        for _ in range(8):
+            x = int(rng.integers(0, max(1, w - 20)))
+            cv2.putText(crop, str(rng.integers(0, 10)), (x, h - 10), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+        crops.append(crop)
+    return crops
+
+
+def bench(fn, crops: list, repeat: int) -> float:
+    """crop 1개당 평균 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for crop in crops:
+            fn(crop)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000.0 / (repeat * len(crops))
+
+
+# =============================================================================
+# 메인
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="OCR 입력 방식 벤치마크")
+    parser.add_argument("--crops", type=int, default=20, help="시험지 1장당 crop 수")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    parser.add_argument("--with-model", action="store_true", help="PP-OCRv5 모델 포함 측정")
+    args = parser.parse_args()
+
+    crops = make_crops(args.crops)
+
+    # 결과 동일성 확인 (PNG 경유와 배열 변환 결과가 같아야 함)
+    for crop in crops:
+        assert np.array_equal(prepare_via_png(crop), prepare_via_array(crop))
+
+    print("=" * 60)
+    print(f"OCR 입력 준비 비용 (crop {args.crops}개 x {args.repeat}회)")
+    print("=" * 60)
+
+    png_disk = bench(lambda c: prepare_via_png(c), crops, args.repeat)
+    print(f"  임시 PNG (디스크)      : {png_disk:8.3f} ms/crop")
+    if _TMP_DIR:
+        png_shm = bench(lambda c: prepare_via_png(c, _TMP_DIR), crops, args.repeat)
+        print(f"  임시 PNG ({_TMP_DIR})   : {png_shm:8.3f} ms/crop")
+    array = bench(prepare_via_array, crops, args.repeat)
+    print(f"  numpy 배열 직접 전달   : {array:8.3f} ms/crop")
+    print(f"  → 시험지 1장당 절감    : {(png_disk - array) * args.crops:8.1f} ms")
+
+    if args.with_model:
+        os.environ["DISABLE_MODEL_SOURCE_CHECK"] = "True"
+        from paddlex import create_model
+
+        print("\n[MODEL] PP-OCRv5_mobile_rec 로딩...")
+        model = create_model(model_name="PP-OCRv5_mobile_rec")
+
+        def run_png(crop):
+            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
+                Image.fromarray(crop).save(tmp.name)
+                tmp_path = tmp.name
+            try:
+                list(model.predict(tmp_path, batch_size=1))
+            finally:
+                os.unlink(tmp_path)
+
+        def run_array(crop):
+            list(model.predict(_to_model_array(crop), batch_size=1))
+
+        # warm-up
+        run_array(crops[0])
+
+        e2e_png = bench(run_png, crops, args.repeat)
+        e2e_array = bench(run_array, crops, args.repeat)
+        print(f"  end-to-end (PNG)       : {e2e_png:8.3f} ms/crop")
+        print(f"  end-to-end (배열)      : {e2e_array:8.3f} ms/crop")
+
+
+if __name__ == "__main__":
+    main()
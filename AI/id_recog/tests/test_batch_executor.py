@@ -0,0 +1,175 @@
+"""
+tests/test_batch_executor.py - 배치 답안 인식 병렬 실행기 유닛 테스트
+"""
+
+import sys
+import os
+import threading
+import time
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.batch_executor import BatchProgress, BatchJobRegistry, ParallelBatchExecutor
+
+
+def _make_executor(log, infer_workers=4, io_workers=4, fail_download=(), fail_infer=(), **kwargs):
+    lock = threading.Lock()
+
+    def download(item):
+        if item in fail_download:
+            return None
+        time.sleep(0.005)
+        return item * 10
+
+    def infer(item, payload):
+        if item in fail_infer:
+            raise ValueError("infer failed")
+        time.sleep(0.005)
+        return payload + 1
+
+    def upload(item, result):
+        with lock:
+            log[item] = result
+
+    return ParallelBatchExecutor(
+        download, infer, upload,
+        infer_workers=infer_workers, io_workers=io_workers, **kwargs
+    )
+
+
+class TestParallelBatchExecutor:
+    """ParallelBatchExecutor 테스트"""
+
+    def test_all_items_uploaded(self):
+        log = {}
+        progress = _make_executor(log).run(range(30), BatchProgress("E"))
+
+        assert log == {i: i * 10 + 1 for i in range(30)}
+        snapshot = progress.snapshot()
+        assert (snapshot["total"], snapshot["processed"], snapshot["failed"]) == (30, 30, 0)
+        assert snapshot["running"] is False
+
+    def test_failures_counted_and_others_continue(self):
+        log = {}
+        progress = _make_executor(log, fail_download={3}, fail_infer={5, 7}).run(range(10), BatchProgress("E"))
+
+        assert sorted(log) == [0, 1, 2, 4, 6, 8, 9]
+        assert (progress.processed, progress.failed) == (7, 3)
+
+    def test_sequential_mode(self):
+        log = {}
+        executor = _make_executor(log, infer_workers=1, io_workers=0, fail_infer={2})
+        assert executor.is_sequential
+
+        progress = executor.run(range(5), BatchProgress("E"))
+        assert list(log) == [0, 1, 3, 4]
+        assert (progress.processed, progress.failed) == (4, 1)
+
+    def test_in_flight_bounded(self):
+        active = []
+        peak = [0]
+        lock = threading.Lock()
+
+        def download(item):
+            with lock:
+                active.append(item)
+                peak[0] = max(peak[0], len(active))
+            time.sleep(0.002)
+            return item
+
+        def upload(item, result):
+            time.sleep(0.002)
+            with lock:
+                active.remove(item)
+
+        executor = ParallelBatchExecutor(
+            download, lambda item, payload: payload, upload,
+            infer_workers=2, io_workers=4, max_in_flight=3
+        )
+        progress = executor.run(range(40), BatchProgress("E"))
+
+        assert progress.processed == 40
+        assert peak[0] <= 3
+
+    def test_listing_error_waits_for_started_items(self):
+        log = {}
+
+        def items():
+            yield from range(5)
+            raise RuntimeError("list failed")
+
+        progress = BatchProgress("E")
+        try:
+            _make_executor(log).run(items(), progress)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("listing error must propagate")
+
+        assert sorted(log) == list(range(5))
+        assert progress.processed == 5 and not progress.is_running
+        assert progress.snapshot()["status"] == "failed"
+
+
+class TestBatchProgress:
+    """BatchProgress 집계 테스트"""
+
+    def test_stage_timings_recorded(self):
+        log = {}
+        progress = _make_executor(log, fail_infer={1}).run(range(6), BatchProgress("E"))
+
+        stages = progress.snapshot()["stages"]
+        assert stages["download"]["count"] == 6
+        assert stages["infer"]["count"] == 6
+        assert stages["upload"]["count"] == 5
+        assert stages["infer"]["avgMs"] > 0
+
+    def test_eta_only_after_discovery(self):
+        progress = BatchProgress("E")
+        progress.start()
+        progress.add_total(10)
+        for _ in range(4):
+            progress.mark_processed()
+        progress.mark_skipped()
+        progress.add_fallbacks(3)
+
+        snapshot = progress.snapshot()
+        assert snapshot["etaS"] is None
+        assert (snapshot["discovered"], snapshot["pending"], snapshot["fallbacks"]) == (11, 6, 3)
+
+        progress.finish_discovery()
+        assert progress.snapshot()["etaS"] is not None
+
+        progress.finish()
+        snapshot = progress.snapshot()
+        assert (snapshot["status"], snapshot["etaS"]) == ("completed", 0.0)
+
+
+class TestBatchJobRegistry:
+    """BatchJobRegistry 테스트"""
+
+    def test_lookup_and_latest(self):
+        registry = BatchJobRegistry()
+        first = registry.create("E1")
+        second = registry.create("E1")
+        other = registry.create("E2")
+
+        assert registry.get(first.job_id) is first
+        assert registry.get("missing") is None
+        assert registry.latest("E1") is second
+        assert registry.latest("E2") is other
+
+    def test_evicts_only_finished_jobs(self):
+        registry = BatchJobRegistry(max_finished=2)
+        running = registry.create("E")
+        finished = []
+        for _ in range(4):
+            job = registry.create("E")
+            job.finish()
+            finished.append(job)
+        registry.create("E")
+
+        job_ids = [p.job_id for p in registry.list()]
+        assert running.job_id in job_ids
+        assert [j.job_id for j in finished if j.job_id in job_ids] == [finished[2].job_id, finished[3].job_id]
@@ -0,0 +1,137 @@
+"""
+tests/test_batch_manifest.py - 배치 답안 인식 manifest 유닛 테스트
+"""
+
+import sys
+import os
+import threading
+import io
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.batch_manifest import (
+    BatchManifest,
+    BatchManifestStore,
+    is_result_current,
+    metadata_fingerprint,
+    RESULT_INPUT_ETAG_KEY,
+    RESULT_METADATA_KEY
+)
+
+
+class FakeS3:
+    """put_object / get_object / head_object만 흉내 내는 메모리 S3"""
+
+    def __init__(self):
+        self.objects = {}
+        self.metadata = {}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None, Metadata=None):
+        self.objects[(Bucket, Key)] = Body.encode() if isinstance(Body, str) else Body
+        self.metadata[(Bucket, Key)] = Metadata or {}
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise KeyError(Key)
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise KeyError(Key)
+        return {"Metadata": self.metadata[(Bucket, Key)]}
+
+
+METADATA = {"examCode": "EX1", "questions": [{"questionNumber": 1, "answer": "3"}]}
+
+
+def _manifest():
+    manifest = BatchManifest.create("EX1", METADATA)
+    manifest.mark_discovered("original/EX1/2020/a.jpg", "e1")
+    manifest.mark_discovered("original/EX1/2021/b.jpg", "e2")
+    manifest.mark_done("original/EX1/2020/a.jpg", "e1")
+    manifest.mark_failed("original/EX1/2021/b.jpg", "timeout")
+    return manifest
+
+
+class TestBatchManifest:
+    """BatchManifest 테스트"""
+
+    def test_is_done_requires_same_etag(self):
+        manifest = _manifest()
+        assert manifest.is_done("original/EX1/2020/a.jpg", "e1")
+        assert not manifest.is_done("original/EX1/2020/a.jpg", "changed")
+        assert not manifest.is_done("original/EX1/2021/b.jpg", "e2")
+
+    def test_done_clears_failure(self):
+        manifest = _manifest()
+        manifest.mark_done("original/EX1/2021/b.jpg", "e2")
+        assert manifest.summary()["failed"] == 0
+        assert manifest.summary()["done"] == 2
+
+    def test_fingerprint_ignores_key_order(self):
+        reordered = {"questions": METADATA["questions"], "examCode": "EX1"}
+        assert metadata_fingerprint(reordered) == metadata_fingerprint(METADATA)
+        assert metadata_fingerprint({**METADATA, "examCode": "EX2"}) != metadata_fingerprint(METADATA)
+
+
+class TestBatchManifestStore:
+    """로컬 / S3 저장소 테스트"""
+
+    def test_local_round_trip(self, tmp_path):
+        store = BatchManifestStore(local_dir=str(tmp_path))
+        assert store.load("EX1") is None
+
+        assert store.save(_manifest())
+        loaded = store.load("EX1")
+
+        assert loaded.to_dict() == {**_manifest().to_dict(), "startedAt": loaded.started_at, "updatedAt": loaded.updated_at}
+        assert loaded.fingerprint == metadata_fingerprint(METADATA)
+        assert os.listdir(str(tmp_path)) == ["EX1.json"]
+
+    def test_concurrent_saves_leave_valid_file(self, tmp_path):
+        store = BatchManifestStore(local_dir=str(tmp_path))
+        manifest = _manifest()
+
+        def checkpoint(i):
+            manifest.mark_done(f"original/EX1/{i}/x.jpg", f"e{i}")
+            assert store.save(manifest)
+
+        threads = [threading.Thread(target=checkpoint, args=(i,)) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert os.listdir(str(tmp_path)) == ["EX1.json"]
+        assert len(store.load("EX1").done) == 17
+
+    def test_s3_round_trip(self):
+        s3 = FakeS3()
+        store = BatchManifestStore(s3, "bucket")
+        store.save(_manifest())
+
+        assert ("bucket", "batch_manifest/EX1.json") in s3.objects
+        assert store.load("EX1").done == {"original/EX1/2020/a.jpg": "e1"}
+
+
+class TestIsResultCurrent:
+    """result.json 입력 ETag 확인 테스트"""
+
+    def test_matching_etag_and_fingerprint(self):
+        s3 = FakeS3()
+        fingerprint = metadata_fingerprint(METADATA)
+        s3.put_object("bucket", "answer/EX1/2020/result.json", "{}", Metadata={
+            RESULT_INPUT_ETAG_KEY: "e1", RESULT_METADATA_KEY: fingerprint
+        })
+
+        assert is_result_current(s3, "bucket", "answer/EX1/2020/result.json", "e1", fingerprint)
+        assert not is_result_current(s3, "bucket", "answer/EX1/2020/result.json", "e9", fingerprint)
+        assert not is_result_current(s3, "bucket", "answer/EX1/2020/result.json", "e1", "other")
+
+    def test_missing_result_or_metadata(self):
+        s3 = FakeS3()
+        s3.put_object("bucket", "answer/EX1/2021/result.json", "{}")
+
+        assert not is_result_current(s3, "bucket", "answer/EX1/2020/result.json", "e1", "f")
+        assert not is_result_current(s3, "bucket", "answer/EX1/2021/result.json", "e1", "f")
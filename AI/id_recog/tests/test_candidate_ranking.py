@@ -0,0 +1,101 @@
+"""
+tests/test_candidate_ranking.py - 학번 후보 bbox 우선순위 / early exit 유닛 테스트
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import id_recog.ocr as ocr
+from id_recog.schemas import BBox, Config
+from id_recog.layout import LayoutBox
+from id_recog.candidate_ranking import rank_candidate_boxes, get_template_stats
+from id_recog.student_id_pipeline import extract_student_id
+
+
+def _box(label, x1, y1, x2, y2):
+    return LayoutBox(bbox=BBox(x1=x1, y1=y1, x2=x2, y2=y2), label=label, score=0.9)
+
+
+class _FakeResult:
+    def __init__(self, json):
+        self.json = json
+
+
+class WidthTextModel:
+    """crop 폭에 따라 미리 정한 텍스트를 돌려주는 가짜 OCR 모델"""
+
+    def __init__(self, texts_by_width):
+        self.texts_by_width = texts_by_width
+        self.seen = 0
+
+    def predict(self, x, batch_size=1):
+        batch = x if isinstance(x, list) else [x]
+        for img in batch:
+            self.seen += 1
+            yield _FakeResult({"res": {"rec_text": self.texts_by_width.get(img.shape[1], ""), "rec_score": 0.95}})
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    get_template_stats().reset()
+    ocr._ARRAY_INPUT_SUPPORT.clear()
+    yield
+    get_template_stats().reset()
+
+
+class TestRankCandidateBoxes:
+    """rank_candidate_boxes 테스트"""
+
+    def test_header_text_ranked_before_image(self):
+        table = BBox(x1=0, y1=300, x2=1000, y2=1400)
+        boxes = [
+            _box("image", 0, 500, 300, 800),      # 표 아래 이미지
+            _box("text", 600, 100, 900, 150),     # 표 위 텍스트 (학번 필드 비율)
+        ]
+        ranked = rank_candidate_boxes(boxes, (1414, 1000, 3), table_bbox=table)
+        assert ranked[0].layout_box.label == "text"
+
+    def test_template_hit_rate_promotes_box(self):
+        boxes = [
+            _box("text", 100, 100, 400, 150),
+            _box("text", 600, 100, 900, 150),
+        ]
+        ranked = rank_candidate_boxes(boxes, (1000, 1000, 3), template_key="EXAM")
+        assert ranked[0].layout_box.bbox.x1 == 100  # 동점 → 탐지 순서 유지
+
+        get_template_stats().record_hit("EXAM", ranked[1].signature)
+        ranked = rank_candidate_boxes(boxes, (1000, 1000, 3), template_key="EXAM")
+        assert ranked[0].layout_box.bbox.x1 == 600
+
+
+class TestEarlyExit:
+    """extract_student_id 우선순위 탐색 / early exit 테스트"""
+
+    def test_stops_after_confident_exact_match(self):
+        image = np.full((1000, 1000, 3), 255, dtype=np.uint8)
+        table = _box("table", 0, 400, 1000, 990)
+        # 탐지 순서상 마지막인 표 위 text bbox에만 학번이 있음 (crop은 padding 2px씩 포함)
+        boxes = [table] + [_box("image", 10, 420 + i * 100, 110, 500 + i * 100) for i in range(4)]
+        boxes.append(_box("text", 600, 300, 800, 340))
+        model = WidthTextModel({204: "20231234"})
+
+        result = extract_student_id(
+            original_image=image,
+            student_id_list=["20231234"],
+            layout_model=None,
+            ocr_model=model,
+            config=Config(ocr_first_batch=1),
+            layout_boxes=boxes,
+        )
+
+        assert result.student_id == "20231234"
+        assert result.meta["early_exit"] is True
+        assert result.meta["ocr_boxes"] == 1
@@ -0,0 +1,140 @@
+"""
+tests/test_http_client.py - 공용 HTTP 클라이언트(재시도 / 스트리밍 / 비동기) 유닛 테스트
+"""
+
+import sys
+import os
+import asyncio
+import random
+
+import pytest
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.http_client import HttpClientConfig, HttpFetchError, PooledHttpClient
+
+
+class _FakeResponse:
+    def __init__(self, status_code=200, body=b"", headers=None, truncate_to=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = {"Content-Length": str(len(body))} if headers is None else headers
+        self.truncate_to = truncate_to
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        body = self.body if self.truncate_to is None else self.body[:self.truncate_to]
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """URL별로 준비된 응답(또는 예외)을 순서대로 돌려주는 가짜 requests.Session"""
+
+    def __init__(self, responses):
+        self.responses = {url: list(items) for url, items in responses.items()}
+        self.calls = []
+
+    def get(self, url, stream=False, timeout=None):
+        self.calls.append(url)
+        item = self.responses[url].pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def make_client(responses, **config):
+    sleeps = []
+    session = FakeSession(responses)
+    client = PooledHttpClient(
+        HttpClientConfig(chunk_size=4, **config),
+        session=session,
+        sleep=sleeps.append,
+        rng=random.Random(0)
+    )
+    return client, session, sleeps
+
+
+class TestFetch:
+    """동기 다운로드 테스트"""
+
+    def test_body_streamed_into_preallocated_buffer(self):
+        body = b"0123456789abcdef!"
+        response = _FakeResponse(body=body)
+        client, _, _ = make_client({"u": [response]})
+
+        data = client.fetch("u")
+
+        assert isinstance(data, bytearray)
+        assert bytes(data) == body
+        assert response.closed
+
+    def test_unknown_length_is_appended(self):
+        client, _, _ = make_client({"u": [_FakeResponse(body=b"hello world", headers={})]})
+        assert bytes(client.fetch("u")) == b"hello world"
+
+    def test_retries_transient_errors_with_jittered_backoff(self):
+        client, session, sleeps = make_client({"u": [
+            ConnectionError("reset"),
+            _FakeResponse(status_code=503),
+            _FakeResponse(body=b"ok")
+        ]}, backoff_base_s=0.5)
+
+        assert bytes(client.fetch("u")) == b"ok"
+        assert len(session.calls) == 3
+        # attempt 0: [0, 0.5], attempt 1: [0, 1.0]
+        assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+
+    def test_retry_after_and_truncated_body(self):
+        client, _, sleeps = make_client({"u": [
+            _FakeResponse(status_code=429, headers={"Retry-After": "2"}),
+            _FakeResponse(body=b"abcdefgh", truncate_to=5),
+            _FakeResponse(body=b"abcdefgh")
+        ]})
+
+        assert bytes(client.fetch("u")) == b"abcdefgh"
+        assert sleeps[0] >= 2.0
+
+    def test_client_errors_are_not_retried(self):
+        # 만료된 presigned URL
+        client, session, sleeps = make_client({"u": [_FakeResponse(status_code=403), _FakeResponse(body=b"x")]})
+
+        with pytest.raises(HttpFetchError) as exc_info:
+            client.fetch("u")
+        assert exc_info.value.status_code == 403
+        assert len(session.calls) == 1 and sleeps == []
+
+    def test_gives_up_after_max_retries(self):
+        client, session, _ = make_client({"u": [_FakeResponse(status_code=500)] * 3}, max_retries=2)
+
+        with pytest.raises(HttpFetchError):
+            client.fetch("u")
+        assert len(session.calls) == 3
+
+    def test_oversized_response_rejected(self):
+        client, _, _ = make_client({"u": [_FakeResponse(body=b"x" * 32)]}, max_bytes=16)
+        with pytest.raises(HttpFetchError):
+            client.fetch("u")
+
+
+class TestFetchAsync:
+    """비동기 다운로드 테스트"""
+
+    def test_fetch_many_keeps_order_and_returns_errors(self):
+        client, _, _ = make_client({
+            "a": [_FakeResponse(body=b"A")],
+            "b": [_FakeResponse(status_code=404)],
+            "c": [_FakeResponse(body=b"C")]
+        })
+        try:
+            results = asyncio.run(client.fetch_many_async(["a", "b", "c"], concurrency=2))
+        finally:
+            client.close()
+
+        assert bytes(results[0]) == b"A"
+        assert isinstance(results[1], HttpFetchError)
+        assert bytes(results[2]) == b"C"
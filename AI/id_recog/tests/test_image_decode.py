@@ -0,0 +1,95 @@
+"""
+tests/test_image_decode.py - 이미지 디코딩(cv2.imdecode / 축소 디코딩) 유닛 테스트
+"""
+
+import sys
+import os
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.image_decode import (
+    ImageDecodeError,
+    decode_image,
+    downscale_max_side,
+    image_content_type,
+    max_side_for_dpi
+)
+
+
+def _encode(image: np.ndarray, fmt: str, **kwargs) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(image).save(buffer, format=fmt, **kwargs)
+    return buffer.getvalue()
+
+
+def _sheet(h=800, w=600) -> np.ndarray:
+    """흰 바탕 + 빨강(왼쪽 위) / 파랑(오른쪽 아래) 블록 (RGB)"""
+    image = np.full((h, w, 3), 255, dtype=np.uint8)
+    image[: h // 4, : w // 4] = (255, 0, 0)
+    image[-h // 4:, -w // 4:] = (0, 0, 255)
+    return image
+
+
+class TestDecodeImage:
+    """표준 표현(RGB uint8) / 축소 디코딩 테스트"""
+
+    def test_matches_previous_pil_decode(self):
+        data = _encode(_sheet(), "JPEG", quality=95)
+
+        image = decode_image(bytearray(data))
+        expected = np.array(Image.open(io.BytesIO(data)).convert("RGB"))
+
+        assert image.dtype == np.uint8 and image.flags["C_CONTIGUOUS"] and image.flags["WRITEABLE"]
+        assert image.shape == expected.shape
+        assert np.abs(image.astype(int) - expected).mean() < 1.0
+        # 채널 순서: RGB
+        assert image[10, 10, 0] > 200 and image[10, 10, 2] < 50
+
+    def test_png_grayscale_and_alpha_become_rgb(self):
+        gray = np.full((40, 30), 128, dtype=np.uint8)
+        rgba = np.zeros((40, 30, 4), dtype=np.uint8)
+        rgba[..., 2] = 255
+        rgba[..., 3] = 255
+
+        assert decode_image(_encode(gray, "PNG")).shape == (40, 30, 3)
+        assert tuple(decode_image(_encode(rgba, "PNG"))[0, 0]) == (0, 0, 255)
+
+    def test_max_side_downscales_keeping_aspect(self):
+        data = _encode(_sheet(1600, 1200), "JPEG", quality=90)
+
+        image = decode_image(data, max_side=500)
+
+        assert image.shape == (500, 375, 3)
+        assert image[10, 10, 0] > 200 and image[-10, -10, 2] > 200
+
+    def test_small_image_is_not_upscaled(self):
+        assert decode_image(_encode(_sheet(200, 100), "PNG"), max_side=1000).shape == (200, 100, 3)
+
+    def test_invalid_data_raises(self):
+        with pytest.raises(ImageDecodeError):
+            decode_image(b"not an image")
+        with pytest.raises(ImageDecodeError):
+            decode_image(b"")
+
+    def test_max_side_for_dpi(self):
+        assert max_side_for_dpi(200) == 2338
+
+    def test_downscale_max_side_keeps_original(self):
+        image = _sheet(1600, 1200)
+
+        small, scale = downscale_max_side(image, 300)
+
+        assert small.shape == (300, 225, 3) and scale == 225 / 1200
+        assert image.shape == (1600, 1200, 3)
+        assert downscale_max_side(image, None) == (image, 1.0)
+
+    def test_image_content_type(self):
+        assert image_content_type(_encode(_sheet(20, 20), "JPEG")) == "image/jpeg"
+        assert image_content_type(_encode(_sheet(20, 20), "PNG")) == "image/png"
+        assert image_content_type(b"GIF89a") == "application/octet-stream"
@@ -0,0 +1,122 @@
+"""
+tests/test_inference_server.py - 멀티프로세스 추론 서버 유닛 테스트
+"""
+
+import sys
+import os
+import time
+from multiprocessing import shared_memory
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.inference_server import InferenceError, InferenceServer, RemoteModel
+
+
+class _FakeResult:
+    def __init__(self, json):
+        self.json = json
+
+
+class FakeModel:
+    """입력 배열의 shape / 합계를 돌려주는 가짜 모델 (워커 프로세스에서 생성)"""
+
+    def predict(self, x, batch_size=1):
+        items = x if isinstance(x, list) else [x]
+        results = []
+        for item in items:
+            if isinstance(item, str):
+                if item == "crash":
+                    os._exit(3)
+                if item == "slow":
+                    time.sleep(1.0)
+                    continue
+                raise ValueError(f"unknown path: {item}")
+            results.append(_FakeResult({"res": {"shape": list(item.shape), "sum": int(item.sum()),
+                                                "pid": os.getpid()}}))
+        return results
+
+
+def fake_loader(model_name):
+    return FakeModel()
+
+
+@pytest.fixture
+def server():
+    server = InferenceServer("fake", num_workers=2, loader=fake_loader, request_timeout_s=30)
+    assert server.start(timeout=60)
+    # start()는 첫 워커만 기다리므로 모든 워커 준비까지 대기
+    deadline = time.time() + 60
+    while server.get_stats()["ready"] < 2 and time.time() < deadline:
+        time.sleep(0.05)
+    yield server
+    server.stop()
+
+
+class TestInferenceServer:
+    """InferenceServer / RemoteModel 테스트"""
+
+    def test_predict_through_shared_memory(self, server):
+        model = RemoteModel(server)
+        image = np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3)
+
+        outputs = model.predict(image)
+
+        assert outputs[0].json["res"]["shape"] == [2, 3, 3]
+        assert outputs[0].json["res"]["sum"] == int(image.sum())
+        assert outputs[0].json["res"]["pid"] != os.getpid()
+
+    def test_batch_keeps_order(self, server):
+        model = RemoteModel(server)
+        images = [np.full((4, i + 1, 3), 1, dtype=np.uint8) for i in range(5)]
+
+        outputs = model.predict(images, batch_size=5)
+
+        assert [o.json["res"]["sum"] for o in outputs] == [int(img.sum()) for img in images]
+
+    def test_concurrent_requests_use_both_workers(self, server):
+        futures = [server.submit(np.ones((8, 8, 3), dtype=np.uint8)) for _ in range(20)]
+        pids = {f.result(timeout=30)[0].json["res"]["pid"] for f in futures}
+
+        assert len(pids) == 2
+        assert server.get_stats()["completed"] == 20
+        assert server.get_stats()["inFlight"] == 0
+
+    def test_worker_error_is_raised(self, server):
+        with pytest.raises(InferenceError, match="unknown path"):
+            RemoteModel(server).predict("missing.png")
+
+    def test_crashed_worker_is_restarted(self, server):
+        with pytest.raises(InferenceError, match="exited"):
+            RemoteModel(server).predict("crash")
+
+        # 재시작된 워커를 포함해 계속 처리
+        assert server._ready_event.wait(30)
+        outputs = RemoteModel(server).predict(np.ones((2, 2, 3), dtype=np.uint8))
+        assert outputs[0].json["res"]["sum"] == 12
+        assert server.get_stats()["restarts"] == 1
+
+    def test_timeout_releases_request_and_shared_memory(self, server):
+        with pytest.raises(InferenceError, match="timeout"):
+            RemoteModel(server, timeout_s=0.2).predict(["slow", np.ones((2, 2, 3), dtype=np.uint8)])
+        assert server.get_stats()["inFlight"] == 0
+
+        future = server.submit(["slow", np.ones((4, 4, 3), dtype=np.uint8)])
+        shm_names = [shm.name for shm in server._in_flight[future.req_id][2]]
+
+        assert server.cancel(future.req_id)
+        assert not server.cancel(future.req_id)
+        with pytest.raises(InferenceError, match="cancelled"):
+            future.result(timeout=1)
+        for name in shm_names:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+        # 취소된 요청의 늦은 응답은 무시되고 서버는 계속 처리
+        outputs = RemoteModel(server).predict(np.ones((2, 2, 3), dtype=np.uint8))
+        assert outputs[0].json["res"]["sum"] == 12
@@ -0,0 +1,120 @@
+"""
+tests/test_layout_batcher.py - 배치 레이아웃 추론 / 마이크로 배처 유닛 테스트
+"""
+
+import sys
+import os
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.layout import detect_all_bboxes, detect_all_bboxes_batch, set_layout_max_side
+from id_recog.layout_batcher import LayoutMicroBatcher
+
+
+class _FakeResult:
+    def __init__(self, json):
+        self.json = json
+
+
+class FakeLayoutModel:
+    """이미지 높이를 좌표로 돌려주는 가짜 레이아웃 모델 (predict 호출 기록)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, inputs, batch_size=1):
+        images = inputs if isinstance(inputs, list) else [inputs]
+        self.calls.append(len(images))
+        for img in images:
+            h = img.shape[0]
+            yield _FakeResult({"res": {"boxes": [
+                {"label": "text", "score": 0.9, "coordinate": [0, 0, 10, h]}
+            ]}})
+
+
+def _image(h):
+    return np.zeros((h, 20, 3), dtype=np.uint8)
+
+
+class TestLayoutInputScale:
+    """레이아웃 입력 축소 (LAYOUT_MAX_SIDE) 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def layout_max_side(self):
+        set_layout_max_side(100)
+        yield
+        set_layout_max_side(None)
+
+    def test_model_sees_reduced_copy_and_boxes_are_restored(self):
+        model = FakeLayoutModel()
+        shapes = []
+        predict = model.predict
+        model.predict = lambda inputs, batch_size=1: (
+            shapes.extend(img.shape for img in (inputs if isinstance(inputs, list) else [inputs])),
+            predict(inputs, batch_size)
+        )[1]
+        image = np.zeros((400, 200, 3), dtype=np.uint8)
+
+        single = detect_all_bboxes(image, model)
+        batched = detect_all_bboxes_batch([image, _image(60)], model)
+
+        assert shapes == [(100, 50, 3), (100, 50, 3), (60, 20, 3)]
+        assert (single[0].bbox.x2, single[0].bbox.y2) == (40, 400)
+        assert [b.bbox.y2 for boxes in batched for b in boxes] == [400, 60]
+        assert image.shape == (400, 200, 3)
+
+
+class TestDetectAllBboxesBatch:
+    """detect_all_bboxes_batch 테스트"""
+
+    def test_batch_matches_single(self):
+        model = FakeLayoutModel()
+        images = [_image(h) for h in (30, 40, 50)]
+
+        batched = detect_all_bboxes_batch(images, model)
+        single = [detect_all_bboxes(img, model) for img in images]
+
+        assert model.calls[0] == 3
+        assert [[b.bbox.y2 for b in boxes] for boxes in batched] == [[30], [40], [50]]
+        assert [[b.bbox.y2 for b in boxes] for boxes in single] == [[30], [40], [50]]
+
+    def test_empty(self):
+        assert detect_all_bboxes_batch([], FakeLayoutModel()) == []
+
+
+class TestLayoutMicroBatcher:
+    """LayoutMicroBatcher 테스트"""
+
+    def test_concurrent_requests_are_batched(self):
+        model = FakeLayoutModel()
+        batcher = LayoutMicroBatcher(model, max_batch=4, max_wait_ms=500)
+        batcher.start()
+
+        results = {}
+
+        def request(h):
+            results[h] = batcher.detect(_image(h))
+
+        threads = [threading.Thread(target=request, args=(h,)) for h in (11, 12, 13, 14)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+        batcher.stop()
+
+        assert {h: boxes[0].bbox.y2 for h, boxes in results.items()} == {11: 11, 12: 12, 13: 13, 14: 14}
+        assert batcher.image_count == 4
+        assert batcher.batch_count < 4
+
+    def test_submit_after_stop_fails(self):
+        batcher = LayoutMicroBatcher(FakeLayoutModel())
+        future = batcher.submit(_image(10))
+        with pytest.raises(RuntimeError):
+            future.result(timeout=1)
@@ -0,0 +1,144 @@
+"""
+tests/test_layout_cache.py - 레이아웃 결과 캐시 유닛 테스트
+"""
+
+import sys
+import os
+import io
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.schemas import BBox
+from id_recog.layout import LayoutBox
+from id_recog.layout_cache import LayoutCache, process_with_layout_cache
+from answer_recog.schemas import AnswerSheetMeta
+
+
+class FakeS3:
+    """put_object / get_object만 흉내 내는 메모리 S3"""
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[(Bucket, Key)] = Body.encode() if isinstance(Body, str) else Body
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise KeyError(Key)
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+
+class FakeAnswerPipeline:
+    """process 호출 인자를 기록하는 AnswerRecognitionPipeline 대역"""
+
+    def __init__(self, rotation_angle=0.5):
+        self.calls = []
+        self.rotation_angle = rotation_angle
+
+    def process(self, image, metadata, student_id=None, layout_boxes=None, rotation_angle=None):
+        self.calls.append({"metadata": metadata, "layout_boxes": layout_boxes, "rotation_angle": rotation_angle})
+        return types.SimpleNamespace(rotation_angle=self.rotation_angle)
+
+
+def _boxes():
+    return [
+        LayoutBox(bbox=BBox(x1=0, y1=300, x2=1000, y2=1400), label="table", score=0.98),
+        LayoutBox(bbox=BBox(x1=600, y1=100, x2=900, y2=150), label="text", score=0.9),
+    ]
+
+
+class TestLayoutCache:
+    """LayoutCache 테스트"""
+
+    def test_memory_hit(self):
+        cache = LayoutCache()
+        cache.put("EXAM", "a.jpg", _boxes(), (1000, 1414))
+        entry = cache.get("EXAM", "a.jpg", (1000, 1414))
+        assert entry is not None
+        assert entry.table_box.label == "table"
+        assert cache.hits == 1
+
+    def test_size_mismatch_is_miss(self):
+        cache = LayoutCache()
+        cache.put("EXAM", "a.jpg", _boxes(), (1000, 1414))
+        assert cache.get("EXAM", "a.jpg", (500, 707)) is None
+        assert cache.misses == 1
+
+    def test_s3_sidecar_round_trip(self):
+        s3 = FakeS3()
+        LayoutCache(s3, "bucket").put("EXAM", "a.jpg", _boxes(), (1000, 1414))
+        assert ("bucket", "layout/EXAM/a.jpg.json") in s3.objects
+
+        # 새 프로세스(빈 메모리 캐시)에서 S3로부터 복원
+        entry = LayoutCache(s3, "bucket").get("EXAM", "a.jpg", (1000, 1414))
+        assert [b.label for b in entry.boxes] == ["table", "text"]
+        assert entry.boxes[1].bbox.x1 == 600
+
+    def test_rotation_angle_persisted(self):
+        s3 = FakeS3()
+        cache = LayoutCache(s3, "bucket")
+        cache.put("EXAM", "a.jpg", _boxes(), (1000, 1414))
+        cache.set_rotation_angle("EXAM", "a.jpg", 1.25)
+
+        entry = LayoutCache(s3, "bucket").get("EXAM", "a.jpg")
+        assert entry.rotation_angle == 1.25
+
+    def test_lru_eviction(self):
+        cache = LayoutCache(max_items=2)
+        for name in ("a", "b", "c"):
+            cache.put("EXAM", name, _boxes(), (10, 10))
+        assert cache.get("EXAM", "a") is None
+        assert cache.get("EXAM", "c") is not None
+
+
+class TestProcessWithLayoutCache:
+    """답안 인식 콜백 경로 (배치 메타데이터는 camelCase) 테스트"""
+
+    def _image(self):
+        return np.zeros((1414, 1000, 3), dtype=np.uint8)
+
+    def test_camel_case_metadata_hits_cache(self):
+        s3 = FakeS3()
+        cache = LayoutCache(s3, "bucket")
+        # 학번 인식 단계: 메시지의 examCode로 저장
+        cache.put("EXAM", "a.jpg", _boxes(), (1000, 1414))
+        pipeline = FakeAnswerPipeline()
+        metadata = AnswerSheetMeta.from_dict({"examCode": "EXAM", "images": [{"fileName": "a.jpg"}]})
+
+        process_with_layout_cache(pipeline, cache, self._image(), metadata, "20201234", metadata.exam_code, "a.jpg")
+
+        assert metadata.exam_code == "EXAM"
+        assert [b.label for b in pipeline.calls[0]["layout_boxes"]] == ["table", "text"]
+        assert cache.hits == 1 and cache.misses == 0
+        # 답안 인식에서 계산한 기울기 각도를 같은 key로 기록
+        assert LayoutCache(s3, "bucket").get("EXAM", "a.jpg").rotation_angle == 0.5
+
+    def test_explicit_exam_code_used_when_metadata_has_none(self):
+        cache = LayoutCache()
+        cache.put("EXAM", "a.jpg", _boxes(), (1000, 1414))
+        pipeline = FakeAnswerPipeline()
+        metadata = AnswerSheetMeta.from_dict({"questions": []})
+
+        process_with_layout_cache(pipeline, cache, self._image(), metadata, None, "EXAM", "a.jpg")
+
+        assert pipeline.calls[0]["layout_boxes"] is not None
+        assert cache.hits == 1
+
+    def test_missing_exam_code_skips_lookup(self):
+        s3 = FakeS3()
+        s3.get_object = lambda **kwargs: pytest.fail("unexpected S3 GET")
+        pipeline = FakeAnswerPipeline()
+
+        metadata = AnswerSheetMeta.from_dict({})
+
+        process_with_layout_cache(pipeline, LayoutCache(s3, "bucket"), self._image(), metadata, None, "", "a.jpg")
+
+        assert pipeline.calls[0]["layout_boxes"] is None
@@ -0,0 +1,162 @@
+"""
+tests/test_local_transport.py - 로컬 SQS / S3 대체 구현 유닛 테스트
+"""
+
+import sys
+import os
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.local_transport import ClientError, LocalTransport, enqueue_student_id_recognition
+
+
+@pytest.fixture
+def transport(tmp_path):
+    t = LocalTransport(root_dir=str(tmp_path))
+    yield t
+    t.close()
+
+
+def _send(transport, url, body, group="A"):
+    return transport.sqs.send_message(
+        QueueUrl=url, MessageBody=body, MessageGroupId=group, MessageDeduplicationId=f"{group}-{body}"
+    )
+
+
+def _bodies(response):
+    return [m["Body"] for m in response.get("Messages", [])]
+
+
+class TestLocalSQS:
+    """FIFO 그룹 / 가시성 / 배치 삭제 테스트"""
+
+    def test_fifo_group_is_blocked_while_in_flight(self, transport):
+        url = transport.create_queue("input.fifo")
+        for body, group in (("a1", "A"), ("a2", "A"), ("b1", "B")):
+            _send(transport, url, body, group)
+
+        first = transport.sqs.receive_message(QueueUrl=url, MaxNumberOfMessages=1)
+        assert _bodies(first) == ["a1"]
+        # A 그룹은 a1 처리 중 → a2는 건너뛰고 B 그룹만
+        assert _bodies(transport.sqs.receive_message(QueueUrl=url, MaxNumberOfMessages=10)) == ["b1"]
+
+        transport.sqs.delete_message(QueueUrl=url, ReceiptHandle=first["Messages"][0]["ReceiptHandle"])
+        assert _bodies(transport.sqs.receive_message(QueueUrl=url, MaxNumberOfMessages=10)) == ["a2"]
+
+    def test_visibility_timeout_redelivers_with_new_handle(self, transport):
+        url = transport.create_queue("input.fifo")
+        _send(transport, url, "a1")
+
+        first = transport.sqs.receive_message(QueueUrl=url, VisibilityTimeout=30)["Messages"][0]
+        assert transport.sqs.receive_message(QueueUrl=url) == {}
+
+        # NACK (visibility 0) → 즉시 재수신, 이전 handle은 무효
+        transport.sqs.change_message_visibility(QueueUrl=url, ReceiptHandle=first["ReceiptHandle"], VisibilityTimeout=0)
+        second = transport.sqs.receive_message(QueueUrl=url)["Messages"][0]
+        assert second["Attributes"]["ApproximateReceiveCount"] == "2"
+        with pytest.raises(ClientError):
+            transport.sqs.delete_message(QueueUrl=url, ReceiptHandle=first["ReceiptHandle"])
+
+    def test_long_poll_wakes_on_send_and_dedup(self, transport):
+        url = transport.create_queue("input.fifo")
+        timer = threading.Timer(0.1, lambda: _send(transport, url, "late"))
+        timer.start()
+
+        start = time.monotonic()
+        response = transport.sqs.receive_message(QueueUrl=url, WaitTimeSeconds=5)
+        assert _bodies(response) == ["late"]
+        assert time.monotonic() - start < 2
+
+        # 같은 MessageDeduplicationId는 다시 큐에 들어가지 않음
+        _send(transport, url, "late")
+        attrs = transport.sqs.get_queue_attributes(QueueUrl=url)["Attributes"]
+        assert attrs["ApproximateNumberOfMessages"] == "0"
+        assert attrs["ApproximateNumberOfMessagesNotVisible"] == "1"
+
+    def test_delete_batch_reports_failures(self, transport):
+        url = transport.create_queue("input.fifo")
+        _send(transport, url, "a1")
+        _send(transport, url, "a2")
+        handles = [m["ReceiptHandle"] for m in transport.sqs.receive_message(QueueUrl=url, MaxNumberOfMessages=10)["Messages"]]
+
+        response = transport.sqs.delete_message_batch(QueueUrl=url, Entries=[
+            {"Id": "0", "ReceiptHandle": handles[0]},
+            {"Id": "1", "ReceiptHandle": "stale"},
+            {"Id": "2", "ReceiptHandle": handles[1]}
+        ])
+        assert [e["Id"] for e in response["Successful"]] == ["0", "2"]
+        assert response["Failed"][0]["Id"] == "1"
+        assert response["Failed"][0]["Code"] == "ReceiptHandleIsInvalid"
+
+    def test_unknown_queue_raises(self, transport):
+        with pytest.raises(ClientError):
+            transport.sqs.receive_message(QueueUrl="local://sqs/missing")
+
+
+class TestLocalS3:
+    """객체 저장 / 목록 / presigned URL 테스트"""
+
+    def test_put_head_get_and_paginate(self, transport):
+        s3 = transport.s3
+        s3.put_object(Bucket="b", Key="original/E1/1/a.jpg", Body=b"aaa", Metadata={"input-etag": "x"})
+        s3.put_object(Bucket="b", Key="original/E1/2/b.jpg", Body=b"bb")
+        s3.put_object(Bucket="b", Key="other/c.jpg", Body=b"c")
+
+        head = s3.head_object(Bucket="b", Key="original/E1/1/a.jpg")
+        assert head["Metadata"] == {"input-etag": "x"}
+        assert head["ContentLength"] == 3
+        assert s3.get_object(Bucket="b", Key="original/E1/2/b.jpg")["Body"].read() == b"bb"
+
+        pages = list(s3.get_paginator("list_objects_v2").paginate(
+            Bucket="b", Prefix="original/E1/", PaginationConfig={"PageSize": 1}
+        ))
+        assert [obj["Key"] for page in pages for obj in page["Contents"]] == [
+            "original/E1/1/a.jpg", "original/E1/2/b.jpg"
+        ]
+        with pytest.raises(ClientError):
+            s3.get_object(Bucket="b", Key="missing.jpg")
+
+    def test_presigned_url_fetch_and_tamper(self, transport):
+        transport.s3.put_object(Bucket="b", Key="uploads/E1/page 1.jpg", Body=b"image-bytes", ContentType="image/jpeg")
+        url = transport.s3.generate_presigned_url("get_object", Params={"Bucket": "b", "Key": "uploads/E1/page 1.jpg"})
+
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            assert resp.read() == b"image-bytes"
+            assert resp.headers["Content-Type"] == "image/jpeg"
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(url[:-4] + "0000", timeout=5)
+        assert exc_info.value.code == 403
+
+
+class TestLoadGenerator:
+    """부하 생성기 테스트"""
+
+    def test_enqueue_student_id_recognition(self, transport):
+        url = transport.create_queue("input.fifo")
+
+        filenames = enqueue_student_id_recognition(
+            transport, url, "b", "E1", b"jpeg", count=12, presigned=False
+        )
+
+        assert len(filenames) == 12
+        bodies = []
+        while True:
+            response = transport.sqs.receive_message(QueueUrl=url, MaxNumberOfMessages=10)
+            if not response:
+                break
+            for message in response["Messages"]:
+                bodies.append(json.loads(message["Body"]))
+                transport.sqs.delete_message(QueueUrl=url, ReceiptHandle=message["ReceiptHandle"])
+        assert [b["filename"] for b in bodies] == filenames
+        assert {b["eventType"] for b in bodies} == {"STUDENT_ID_RECOGNITION"}
+        assert bodies[0]["downloadUrl"] == "s3://b/uploads/E1/sheet_source.jpg"
+        assert transport.s3.get_object(Bucket="b", Key="uploads/E1/sheet_source.jpg")["Body"].read() == b"jpeg"
@@ -0,0 +1,97 @@
+"""
+tests/test_metrics.py - 단계별 계측 / Prometheus 텍스트 출력 유닛 테스트
+"""
+
+import sys
+import os
+
+import pytest
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestHistogram:
+    """Histogram 테스트"""
+
+    def test_exposition_has_cumulative_buckets_sum_count(self, registry):
+        hist = registry.histogram("stage_seconds", "Stage latency", ("stage",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            hist.observe(value, stage="ocr")
+
+        text = registry.render()
+
+        assert "# TYPE stage_seconds histogram" in text
+        assert 'stage_seconds_bucket{stage="ocr",le="0.1"} 2' in text
+        assert 'stage_seconds_bucket{stage="ocr",le="1"} 3' in text
+        assert 'stage_seconds_bucket{stage="ocr",le="+Inf"} 4' in text
+        assert 'stage_seconds_sum{stage="ocr"} 3.65' in text
+        assert 'stage_seconds_count{stage="ocr"} 4' in text
+
+    def test_quantiles_and_summary(self, registry):
+        hist = registry.histogram("stage_seconds", "Stage latency", ("stage",))
+        for ms in range(1, 101):
+            hist.observe(ms / 1000, stage="rows")
+
+        assert hist.quantile(0.5, stage="rows") == pytest.approx(0.051)
+        assert hist.quantile(0.95, stage="rows") == pytest.approx(0.095)
+        assert hist.quantile(0.5, stage="ocr") is None
+
+        summary = registry.summary()["stage_seconds"]["stage=rows"]
+        assert summary["count"] == 100
+        assert summary["p95Ms"] == 95.0
+        assert summary["maxMs"] == 100.0
+
+    def test_time_as_context_manager_and_decorator(self, registry):
+        hist = registry.histogram("stage_seconds", "Stage latency", ("stage",))
+
+        @hist.time(stage="total")
+        def work():
+            with hist.time(stage="inner"):
+                return 42
+
+        assert work() == 42
+        assert work() == 42
+        with pytest.raises(RuntimeError):
+            with hist.time(stage="inner"):
+                raise RuntimeError("boom")
+
+        assert hist.count(stage="total") == 2
+        # 예외가 나도 기록
+        assert hist.count(stage="inner") == 3
+
+    def test_wrong_labels_rejected(self, registry):
+        hist = registry.histogram("stage_seconds", "Stage latency", ("stage",))
+        with pytest.raises(ValueError):
+            hist.observe(0.1, step="ocr")
+
+
+class TestRegistry:
+    """Counter / MetricsRegistry 테스트"""
+
+    def test_counter_and_label_escaping(self, registry):
+        counter = registry.counter("errors_total", "Errors", ("stage",))
+        counter.inc(stage='s3 "get"')
+        counter.inc(2, stage='s3 "get"')
+
+        assert counter.value(stage='s3 "get"') == 3
+        assert 'errors_total{stage="s3 \\"get\\""} 3' in registry.render()
+
+    def test_register_is_idempotent(self, registry):
+        first = registry.counter("errors_total", "Errors", ("stage",))
+        assert registry.counter("errors_total", "Errors", ("stage",)) is first
+        with pytest.raises(ValueError):
+            registry.histogram("errors_total", "Errors", ("stage",))
+
+    def test_reset(self, registry):
+        counter = registry.counter("crops_total", "Crops")
+        counter.inc(5)
+        registry.reset()
+        assert counter.value() == 0
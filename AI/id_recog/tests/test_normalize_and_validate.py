@@ -4,6 +4,7 @@ tests/test_normalize_and_validate.py - 정규화/검증 함수 유닛 테스트
 
 import sys
 import os
+import random
 
 # 상위 디렉토리를 path에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,7 +14,8 @@ from normalize_and_validate import (
     is_valid_format,
     should_fallback,
     match_to_student_list,
-    _edit_distance
+    _edit_distance,
+    StudentIdIndex
 )
 
 
@@ -142,6 +144,63 @@ class TestMatchToStudentList:
         assert match_to_student_list(None, ["20231234"]) is None
 
 
+class TestStudentIdIndex:
+    """StudentIdIndex 테스트"""
+    
+    def test_list_like(self):
+        index = StudentIdIndex(["20231234", "20231235"])
+        assert len(index) == 2
+        assert "20231234" in index
+        assert "99999999" not in index
+        assert list(index) == ["20231234", "20231235"]
+        assert not StudentIdIndex([])
+    
+    def test_exact_and_distance_1(self):
+        index = StudentIdIndex(["20231234", "20239999", "20238888"])
+        assert match_to_student_list("20231234", index) == "20231234"
+        assert match_to_student_list("20231235", index) == "20231234"  # 대체
+        assert match_to_student_list("2023124", index) == "20231234"   # 삭제
+        assert match_to_student_list("202312345", index) == "20231234" # 삽입
+        assert match_to_student_list("20231235", index, allow_edit_distance_1=False) is None
+    
+    def test_ambiguous_returns_none(self):
+        index = StudentIdIndex(["11111111", "11111112"])
+        assert match_to_student_list("11111110", index) is None
+    
+    def test_transposition_is_not_distance_1(self):
+        # 한 글자씩 지우면 같아지지만 편집거리는 2 → 검증 단계에서 제외
+        index = StudentIdIndex(["20231234"])
+        assert match_to_student_list("20231243", index) is None
+    
+    def test_same_result_as_linear_scan(self):
+        rng = random.Random(0)
+        student_list = sorted({f"2023{rng.randint(0, 9999):04d}" for _ in range(300)})
+        index = StudentIdIndex(student_list)
+        
+        candidates = []
+        for _ in range(150):
+            base = list(rng.choice(student_list))
+            op = rng.randint(0, 3)
+            pos = rng.randrange(8)
+            if op == 0:
+                base[pos] = str(rng.randint(0, 9))
+            elif op == 1:
+                del base[pos]
+            elif op == 2:
+                base.insert(pos, str(rng.randint(0, 9)))
+            candidates.append("".join(base))
+        
+        for candidate in candidates:
+            assert match_to_student_list(candidate, index) == match_to_student_list(candidate, student_list)
+        
+        # 출석부에 중복 학번이 있으면 선형 탐색은 편집거리 1 후보 2개 → 모호(None)
+        duplicated = student_list + student_list[:20]
+        duplicated_index = StudentIdIndex(duplicated)
+        for candidate in candidates + [student_id[:-1] + "x" for student_id in student_list[:20]]:
+            assert match_to_student_list(candidate, duplicated_index) == match_to_student_list(candidate, duplicated)
+        assert match_to_student_list(student_list[0][:-1] + "x", duplicated_index) is None
+
+
 # 간단한 실행 테스트
 if __name__ == "__main__":
     print("=" * 60)
@@ -154,7 +213,8 @@ if __name__ == "__main__":
         TestIsValidFormat(),
         TestShouldFallback(),
         TestEditDistance(),
-        TestMatchToStudentList()
+        TestMatchToStudentList(),
+        TestStudentIdIndex()
     ]
     
     passed = 0
@@ -0,0 +1,145 @@
+"""
+tests/test_ocr.py - PP-OCR 입력 변환 / 결과 파싱 유닛 테스트
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import id_recog.ocr as ocr
+
+
+class _FakeResult:
+    def __init__(self, json):
+        self.json = json
+
+
+class ArrayModel:
+    """numpy 입력을 받는 가짜 OCR 모델"""
+
+    def __init__(self):
+        self.inputs = []
+
+    def predict(self, x, batch_size=1):
+        self.inputs.append(x)
+        yield _FakeResult({"res": {"rec_text": " 20231234 ", "rec_score": 0.97}})
+
+
+class BatchModel:
+    """리스트 입력 시 crop 폭을 텍스트로 돌려주는 가짜 OCR 모델"""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, x, batch_size=1):
+        batch = x if isinstance(x, list) else [x]
+        self.calls.append(len(batch))
+        for img in batch:
+            yield _FakeResult({"res": {"rec_text": str(img.shape[1]), "rec_score": 0.9}})
+
+
+class PathOnlyModel:
+    """파일 경로만 받는 가짜 OCR 모델"""
+
+    def __init__(self):
+        self.inputs = []
+
+    def predict(self, x, batch_size=1):
+        if not isinstance(x, str):
+            raise TypeError("path required")
+        self.inputs.append(x)
+        yield _FakeResult({"rec_text": "123", "rec_score": 0.5})
+
+
+@pytest.fixture(autouse=True)
+def reset_array_flag():
+    ocr._ARRAY_INPUT_SUPPORT.clear()
+    yield
+    ocr._ARRAY_INPUT_SUPPORT.clear()
+
+
+class TestToModelArray:
+    """_to_model_array 테스트"""
+
+    def test_rgb_to_bgr(self):
+        img = np.zeros((2, 2, 3), dtype=np.uint8)
+        img[..., 0] = 255  # R
+        out = ocr._to_model_array(img)
+        assert out[0, 0].tolist() == [0, 0, 255]
+        assert out.flags["C_CONTIGUOUS"]
+
+    def test_gray_expanded(self):
+        out = ocr._to_model_array(np.full((3, 4), 7, dtype=np.uint8))
+        assert out.shape == (3, 4, 3)
+
+
+class TestPpocrExtract:
+    """ppocr_extract 테스트"""
+
+    def test_array_input_no_temp_file(self):
+        model = ArrayModel()
+        text, conf = ocr.ppocr_extract(np.zeros((10, 20, 3), dtype=np.uint8), model)
+        assert (text, conf) == ("20231234", 0.97)
+        assert isinstance(model.inputs[0], np.ndarray)
+        assert ocr._array_input_supported(model) is True
+
+    def test_falls_back_to_file_path(self):
+        model = PathOnlyModel()
+        text, conf = ocr.ppocr_extract(np.zeros((10, 20, 3), dtype=np.uint8), model)
+        assert (text, conf) == ("123", 0.5)
+        assert ocr._array_input_supported(model) is False
+        assert not os.path.exists(model.inputs[0])
+
+    def test_transient_error_keeps_array_input(self):
+        class FlakyModel(ArrayModel):
+            def predict(self, x, batch_size=1):
+                if not self.inputs:
+                    self.inputs.append(None)
+                    raise RuntimeError("out of memory")
+                return super().predict(x, batch_size)
+
+        model = FlakyModel()
+        img = np.zeros((10, 20, 3), dtype=np.uint8)
+
+        assert ocr.ppocr_extract(img, model) == ("", 0.0)
+        assert ocr._array_input_supported(model) is None
+        assert ocr.ppocr_extract(img, model) == ("20231234", 0.97)
+        assert isinstance(model.inputs[-1], np.ndarray)
+
+        # 다른 모델의 fallback 전환은 영향 없음
+        ocr.ppocr_extract(img, PathOnlyModel())
+        assert ocr._array_input_supported(model) is True
+
+
+class TestPpocrExtractBatch:
+    """ppocr_extract_batch 테스트"""
+
+    def test_results_in_input_order(self):
+        model = BatchModel()
+        widths = [300, 40, 200, 45, 310]
+        crops = [np.zeros((40, w, 3), dtype=np.uint8) for w in widths]
+
+        results = ocr.ppocr_extract_batch(crops, model, batch_size=16)
+
+        assert [text for text, _ in results] == [str(w) for w in widths]
+        # 비율 차이가 큰 두 그룹 → 모델 호출 2회
+        assert model.calls == [2, 3]
+
+    def test_batch_size_limit(self):
+        model = BatchModel()
+        crops = [np.zeros((40, 100, 3), dtype=np.uint8) for _ in range(5)]
+        ocr.ppocr_extract_batch(crops, model, batch_size=2)
+        assert model.calls == [2, 2, 1]
+
+    def test_path_only_model_falls_back(self):
+        model = PathOnlyModel()
+        crops = [np.zeros((10, 20, 3), dtype=np.uint8) for _ in range(3)]
+        results = ocr.ppocr_extract_batch(crops, model)
+        assert results == [("123", 0.5)] * 3
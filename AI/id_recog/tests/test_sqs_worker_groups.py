@@ -0,0 +1,91 @@
+"""
+tests/test_sqs_worker_groups.py - 워커 풀 순서 보장 단위(MessageGroupId) 유닛 테스트
+"""
+
+import sys
+import os
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("boto3")
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.local_transport import LocalTransport
+from id_recog.sqs_worker import SQSWorker
+from id_recog.sqs_schemas import SQSInputMessage, EVENT_STUDENT_ID_RECOGNITION
+from id_recog.worker_pool import GroupOrderedWorkerPool
+
+
+@pytest.fixture
+def transport(tmp_path):
+    t = LocalTransport(root_dir=str(tmp_path))
+    yield t
+    t.close()
+
+
+def _worker(transport, queue_url, tmp_path):
+    return SQSWorker(
+        queue_url=queue_url,
+        aws_access_key_id="",
+        aws_secret_access_key="",
+        manifest_dir=str(tmp_path / "manifest"),
+        transport=transport
+    )
+
+
+def _send(transport, url, filename, group_id):
+    body = {
+        "eventType": EVENT_STUDENT_ID_RECOGNITION,
+        "examCode": "EXAM",
+        "downloadUrl": f"s3://bucket/{filename}",
+        "filename": filename
+    }
+    transport.sqs.send_message(
+        QueueUrl=url, MessageBody=json.dumps(body), MessageGroupId=group_id, MessageDeduplicationId=filename
+    )
+
+
+class TestMessageGroupKey:
+    """같은 시험이라도 MessageGroupId가 다르면 병렬 처리"""
+
+    def test_group_key_uses_message_group_id(self, transport, tmp_path):
+        url = transport.create_queue("input.fifo")
+        _send(transport, url, "a.jpg", "EXAM-0")
+        _send(transport, url, "b.jpg", "EXAM-1")
+        worker = _worker(transport, url, tmp_path)
+
+        messages = worker.receive_messages(max_messages=10, wait_time_seconds=0)
+
+        assert [m.message_group_id for m in messages] == ["EXAM-0", "EXAM-1"]
+        assert [SQSWorker._group_key(m) for m in messages] == ["EXAM-0", "EXAM-1"]
+
+    def test_group_key_falls_back_to_exam_code(self):
+        msg = SQSInputMessage(
+            event_type=EVENT_STUDENT_ID_RECOGNITION, exam_code="EXAM", filename="a.jpg", download_url=""
+        )
+        assert SQSWorker._group_key(msg) == "EXAM"
+
+    def test_same_exam_different_groups_run_concurrently(self, transport, tmp_path):
+        url = transport.create_queue("input.fifo")
+        _send(transport, url, "a.jpg", "EXAM-0")
+        _send(transport, url, "b.jpg", "EXAM-1")
+        worker = _worker(transport, url, tmp_path)
+        messages = worker.receive_messages(max_messages=10, wait_time_seconds=0)
+
+        # 두 작업이 동시에 실행 중이어야 barrier 통과 (직렬이면 timeout)
+        barrier = threading.Barrier(2, timeout=5)
+        passed = []
+        pool = GroupOrderedWorkerPool(num_workers=2, max_pending=4)
+        pool.start()
+        try:
+            for msg in messages:
+                pool.submit(SQSWorker._group_key(msg), lambda m=msg: passed.append((barrier.wait(), m.filename)))
+            assert pool.wait_idle(timeout=10)
+        finally:
+            pool.stop()
+
+        assert sorted(name for _, name in passed) == ["a.jpg", "b.jpg"]
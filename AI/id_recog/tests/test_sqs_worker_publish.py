@@ -0,0 +1,82 @@
+"""
+tests/test_sqs_worker_publish.py - 학번 인식 결과 전송/업로드 후 ACK 유닛 테스트
+"""
+
+import sys
+import os
+import types
+
+import numpy as np
+import pytest
+
+pytest.importorskip("boto3")
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.sqs_worker import SQSWorker, DownloadedImage
+from id_recog.sqs_schemas import SQSInputMessage, EVENT_STUDENT_ID_RECOGNITION
+
+
+@pytest.fixture
+def worker(tmp_path):
+    transport = types.SimpleNamespace(sqs=object(), s3=object())
+    w = SQSWorker(
+        queue_url="input.fifo",
+        aws_access_key_id="",
+        aws_secret_access_key="",
+        manifest_dir=str(tmp_path),
+        transport=transport
+    )
+    w.acked = []
+    w._ack = lambda msg: w.acked.append(msg.receipt_handle)
+    w.send_result_message = lambda message, group_id="default": "msg-1"
+    w.upload_original_to_s3 = lambda data, key: True
+    w.upload_image_to_s3 = lambda image, key, quality=95: True
+    return w
+
+
+def _msg():
+    return SQSInputMessage(
+        event_type=EVENT_STUDENT_ID_RECOGNITION,
+        exam_code="EXAM",
+        filename="a.jpg",
+        download_url="https://example/a.jpg",
+        receipt_handle="rh-1"
+    )
+
+
+def _sheet():
+    return DownloadedImage(image=np.zeros((20, 10, 3), dtype=np.uint8), data=b"\xff\xd8\xff")
+
+
+class TestPublishAndAck:
+    """결과 전송 / 업로드 실패 시 ACK하지 않음 (NACK → 재시도)"""
+
+    def test_success_acks(self, worker):
+        worker._publish_and_ack(_msg(), _sheet(), None, "20201234", 0)
+        assert worker.acked == ["rh-1"]
+
+    def test_original_upload_failure_is_not_acked(self, worker):
+        worker.upload_original_to_s3 = lambda data, key: False
+
+        worker._publish_and_ack(_msg(), _sheet(), None, "20201234", 0)
+
+        assert worker.acked == []
+        assert worker._publish_student_id_result(_msg(), _sheet(), None, "20201234", 0) is False
+
+    def test_header_upload_failure_is_not_acked(self, worker):
+        worker.upload_image_to_s3 = lambda image, key, quality=95: False
+
+        worker._publish_and_ack(_msg(), _sheet(), None, None, 0)
+
+        assert worker.acked == []
+
+    def test_result_send_failure_is_not_acked(self, worker):
+        uploads = []
+        worker.send_result_message = lambda message, group_id="default": None
+        worker.upload_original_to_s3 = lambda data, key: uploads.append(key) or True
+
+        worker._publish_and_ack(_msg(), _sheet(), None, "20201234", 0)
+
+        assert worker.acked == [] and uploads == []
@@ -0,0 +1,127 @@
+"""
+tests/test_visibility_heartbeat.py - VisibilityTimeout 하트비트 유닛 테스트
+"""
+
+import sys
+import os
+import threading
+import time
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.visibility_heartbeat import VisibilityHeartbeat
+
+
+class TestVisibilityHeartbeat:
+    """VisibilityHeartbeat 테스트"""
+
+    def _make(self, result=True, **kwargs):
+        calls = []
+
+        def extend(handle, timeout):
+            calls.append((handle, timeout))
+            return result
+
+        params = dict(visibility_timeout=60, extend_margin=20, check_interval=60)
+        params.update(kwargs)
+        return VisibilityHeartbeat(extend, **params), calls
+
+    def test_no_extension_before_margin(self):
+        hb, calls = self._make()
+        hb.track("rh-1")
+        hb.check()
+        assert calls == []
+        assert hb.active == 1
+
+    def test_extends_when_close_to_deadline(self):
+        hb, calls = self._make()
+        hb.track("rh-1")
+        # 만료 10초 전 상황으로 조작
+        hb._tracked["rh-1"]["deadline"] = time.time() + 10
+        hb.check()
+
+        assert calls == [("rh-1", 60)]
+        assert hb.extended_count == 1
+        assert hb._tracked["rh-1"]["deadline"] > time.time() + 50
+
+    def test_untrack_stops_extension_and_records_stats(self):
+        hb, calls = self._make()
+        hb.track("rh-1")
+        hb._tracked["rh-1"]["deadline"] = time.time()
+        hb.check()
+        hb.check()  # 방금 연장했으므로 추가 연장 없음
+        hb.untrack("rh-1")
+        hb.check()
+
+        stats = hb.get_stats()
+        assert len(calls) == 1
+        assert stats["active"] == 0
+        assert stats["messagesExtended"] == 1
+        assert stats["maxExtensions"] == 1
+
+    def test_failed_extension_drops_handle(self):
+        hb, calls = self._make(result=False)
+        hb.track("rh-1")
+        hb._tracked["rh-1"]["deadline"] = time.time()
+        hb.check()
+
+        assert hb.active == 0
+        assert hb.failed_count == 1
+
+    def test_max_lifetime_stops_extension(self):
+        hb, calls = self._make(max_lifetime=100)
+        hb.track("rh-1")
+        hb._tracked["rh-1"]["receivedAt"] = time.time() - 200
+        hb._tracked["rh-1"]["deadline"] = time.time()
+        hb.check()
+
+        assert calls == []
+        assert hb.expired_count == 1
+        assert hb.active == 0
+
+    def test_untrack_waits_for_in_flight_extension(self):
+        started, release = threading.Event(), threading.Event()
+        order = []
+
+        def extend(handle, timeout):
+            started.set()
+            release.wait(5)
+            order.append("extend")
+            return True
+
+        hb = VisibilityHeartbeat(extend, visibility_timeout=60, extend_margin=20, check_interval=60)
+        hb.track("rh-1")
+        hb._tracked["rh-1"]["deadline"] = time.time()
+        checker = threading.Thread(target=hb.check)
+        checker.start()
+        assert started.wait(5)
+
+        # NACK: untrack 후 짧은 VisibilityTimeout 설정 → 진행 중인 연장보다 뒤에 실행되어야 함
+        nack = threading.Thread(target=lambda: (hb.untrack("rh-1"), order.append("nack")))
+        nack.start()
+        time.sleep(0.1)
+        assert order == []
+        release.set()
+        checker.join(5)
+        nack.join(5)
+
+        assert order == ["extend", "nack"]
+        assert hb.active == 0
+
+    def test_untracked_before_extend_is_skipped(self):
+        hb, calls = self._make()
+        hb.track("rh-1")
+        hb._tracked["rh-1"]["deadline"] = time.time()
+        handle_lock = hb._tracked["rh-1"]["lock"]
+
+        # 목록 수집 직후 ACK/NACK된 상황: 메시지 lock을 잡은 채 untrack → check는 lock 대기 후 건너뜀
+        with handle_lock:
+            checker = threading.Thread(target=hb.check)
+            checker.start()
+            time.sleep(0.1)
+            with hb._lock:
+                hb._tracked.pop("rh-1")
+        checker.join(5)
+
+        assert calls == []
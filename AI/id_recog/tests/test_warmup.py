@@ -0,0 +1,68 @@
+"""
+tests/test_warmup.py - 시작 시 모델 warm-up 유닛 테스트
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog import ocr
+from id_recog.warmup import WARMUP_IMAGE_PATH, digit_row, load_warmup_image, warm_up_layout, warm_up_ocr
+
+
+class _FakeResult:
+    def __init__(self, json):
+        self.json = json
+
+
+class FakeModel:
+    """입력 shape를 기록하는 가짜 모델"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.shapes = []
+
+    def predict(self, x, batch_size=1):
+        if self.fail:
+            raise RuntimeError("model not initialized")
+        self.shapes.append(x.shape)
+        return [_FakeResult({"res": {"rec_text": "2024123456", "rec_score": 0.9, "boxes": []}})]
+
+
+@pytest.fixture(autouse=True)
+def reset_array_flag():
+    ocr._ARRAY_INPUT_SUPPORT.clear()
+    yield
+    ocr._ARRAY_INPUT_SUPPORT.clear()
+
+
+class TestWarmup:
+    """warm-up 이미지 / 모델 warm-up 테스트"""
+
+    def test_bundled_image_is_small_bgr(self):
+        assert os.path.exists(WARMUP_IMAGE_PATH)
+        image = load_warmup_image()
+        assert image.shape == (96, 320, 3)
+        assert image.dtype == np.uint8
+
+    def test_layout_gets_full_image_and_ocr_gets_digit_row(self):
+        layout, ocr = FakeModel(), FakeModel()
+
+        warm_up_layout(layout)
+        warm_up_ocr(ocr)
+
+        assert layout.shapes == [(96, 320, 3)]
+        assert ocr.shapes == [digit_row().shape]
+        # 숫자 줄에는 글자(어두운 픽셀)가 있어야 인식 경로 전체가 실행됨
+        assert digit_row().min() < 128
+
+    def test_failure_is_raised(self):
+        with pytest.raises(RuntimeError):
+            warm_up_ocr(FakeModel(fail=True))
@@ -0,0 +1,125 @@
+"""
+tests/test_worker_pool.py - 그룹 FIFO 워커 풀 / 배치 ACK 버퍼 유닛 테스트
+"""
+
+import sys
+import os
+import time
+import threading
+
+# AI 디렉토리를 path에 추가 (id_recog.* import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from id_recog.worker_pool import GroupOrderedWorkerPool, BatchAckBuffer
+
+
+class TestGroupOrderedWorkerPool:
+    """GroupOrderedWorkerPool 테스트"""
+
+    def test_fifo_within_group(self):
+        pool = GroupOrderedWorkerPool(num_workers=4, max_pending=50)
+        pool.start()
+        results = {"A": [], "B": []}
+
+        for i in range(20):
+            for group in ("A", "B"):
+                def task(g=group, n=i):
+                    time.sleep(0.001)
+                    results[g].append(n)
+                pool.submit(group, task)
+
+        assert pool.wait_idle(timeout=5)
+        pool.stop()
+        assert results["A"] == list(range(20))
+        assert results["B"] == list(range(20))
+
+    def test_groups_run_in_parallel(self):
+        pool = GroupOrderedWorkerPool(num_workers=2, max_pending=10)
+        pool.start()
+        barrier = threading.Barrier(2, timeout=2)
+        passed = []
+
+        # 두 그룹이 동시에 실행되어야만 barrier를 통과할 수 있음
+        for group in ("EXAM_1", "EXAM_2"):
+            pool.submit(group, lambda: passed.append(barrier.wait()))
+
+        assert pool.wait_idle(timeout=5)
+        pool.stop()
+        assert len(passed) == 2
+
+    def test_same_group_never_concurrent(self):
+        pool = GroupOrderedWorkerPool(num_workers=4, max_pending=20)
+        pool.start()
+        active = {"count": 0, "max": 0}
+        lock = threading.Lock()
+
+        def task():
+            with lock:
+                active["count"] += 1
+                active["max"] = max(active["max"], active["count"])
+            time.sleep(0.005)
+            with lock:
+                active["count"] -= 1
+
+        for _ in range(10):
+            pool.submit("SAME", task)
+
+        assert pool.wait_idle(timeout=5)
+        pool.stop()
+        assert active["max"] == 1
+
+    def test_exception_does_not_block_group(self):
+        pool = GroupOrderedWorkerPool(num_workers=1, max_pending=5)
+        pool.start()
+        done = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        pool.submit("A", fail)
+        pool.submit("A", lambda: done.append(True))
+
+        assert pool.wait_idle(timeout=5)
+        pool.stop()
+        assert done == [True]
+
+
+class TestBatchAckBuffer:
+    """BatchAckBuffer 테스트"""
+
+    def test_flush_when_full(self):
+        calls = []
+        buffer = BatchAckBuffer(lambda handles: calls.append(list(handles)) or [], flush_interval=60)
+
+        for i in range(25):
+            buffer.add(f"rh-{i}")
+
+        # 10개씩 두 번 자동 flush, 5개 남음
+        assert [len(c) for c in calls] == [10, 10]
+        assert buffer.pending == 5
+
+        buffer.stop()
+        assert [len(c) for c in calls] == [10, 10, 5]
+        assert buffer.acked_count == 25
+
+    def test_failed_handles_counted(self):
+        buffer = BatchAckBuffer(lambda handles: handles[:1], flush_interval=60)
+        buffer.add("rh-1")
+        buffer.add("rh-2")
+        buffer.flush()
+
+        assert buffer.acked_count == 1
+        assert buffer.failed_count == 1
+
+    def test_periodic_flush(self):
+        calls = []
+        buffer = BatchAckBuffer(lambda handles: calls.append(list(handles)) or [], flush_interval=0.05)
+        buffer.start()
+        buffer.add("rh-1")
+
+        deadline = time.time() + 2
+        while not calls and time.time() < deadline:
+            time.sleep(0.01)
+        buffer.stop()
+
+        assert calls == [["rh-1"]]
@@ -0,0 +1,186 @@
+"""
+visibility_heartbeat.py - 처리 중인 SQS 메시지의 VisibilityTimeout 연장
+
+수신 시 VisibilityTimeout(60초)보다 처리(레이아웃 + OCR + VLM + S3 업로드)가 오래 걸리면
+메시지가 다시 보이게 되어 같은 시험지가 중복 처리됩니다.
+VisibilityHeartbeat는 처리 중인 메시지를 추적하다가 만료가 가까워지면
+ChangeMessageVisibility로 연장하고, ACK/NACK 시 추적을 중단합니다.
+
+연장과 추적 중단은 메시지별 lock으로 직렬화합니다.
+untrack()은 진행 중인 연장이 끝난 뒤 반환하므로, 이후 NACK의 짧은 VisibilityTimeout 변경이
+하트비트의 연장에 덮어쓰이지 않습니다.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class VisibilityHeartbeat:
+    """
+    VisibilityTimeout 하트비트
+
+    - track(): 메시지 수신 직후 호출 (워커 풀 대기 시간도 포함하여 보호)
+    - untrack(): ACK/NACK 직전 호출 (진행 중인 연장이 있으면 끝날 때까지 대기)
+    - 백그라운드 스레드가 check_interval마다 만료 extend_margin초 이내의 메시지를 연장
+    - max_lifetime을 넘긴 메시지는 더 이상 연장하지 않음 (멈춘 핸들러가 메시지를 영구 점유하지 않도록)
+    """
+
+    def __init__(
+        self,
+        extend_fn: Callable[[str, int], bool],
+        visibility_timeout: int = 60,
+        extend_margin: float = 20.0,
+        check_interval: float = 5.0,
+        max_lifetime: float = 900.0
+    ):
+        """
+        Args:
+            extend_fn: (receipt_handle, visibility_timeout) -> 성공 여부
+            visibility_timeout: 연장 시 설정할 VisibilityTimeout (초)
+            extend_margin: 만료까지 남은 시간이 이 값 이하이면 연장 (초)
+            check_interval: 만료 검사 주기 (초)
+            max_lifetime: 메시지 하나를 연장할 수 있는 최대 시간 (초)
+        """
+        self._extend_fn = extend_fn
+        self.visibility_timeout = visibility_timeout
+        self.extend_margin = extend_margin
+        self.check_interval = check_interval
+        self.max_lifetime = max_lifetime
+
+        self._lock = threading.Lock()
+        # 키: receipt_handle, 값: {"deadline", "receivedAt", "extensions", "label", "lock"}
+        self._tracked: Dict[str, dict] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 통계
+        self.extended_count = 0          # ChangeMessageVisibility 성공 횟수
+        self.failed_count = 0            # 연장 실패 횟수
+        self.expired_count = 0           # max_lifetime 초과로 연장 포기한 메시지 수
+        self.tracked_count = 0           # 추적한 전체 메시지 수
+        self.messages_extended = 0       # 한 번 이상 연장된 메시지 수
+        self.max_extensions = 0          # 메시지 하나당 최대 연장 횟수
+
+    def start(self):
+        """하트비트 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="SQS-Visibility-Heartbeat")
+        self._thread.start()
+
+    def stop(self):
+        """하트비트 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def track(self, receipt_handle: str, label: str = ""):
+        """메시지 추적 시작 (수신 시점 기준으로 만료 시각 계산)"""
+        if not receipt_handle:
+            return
+        now = time.time()
+        with self._lock:
+            if receipt_handle in self._tracked:
+                return
+            self._tracked[receipt_handle] = {
+                "deadline": now + self.visibility_timeout,
+                "receivedAt": now,
+                "extensions": 0,
+                "label": label,
+                "lock": threading.Lock()  # 연장 / 추적 중단 직렬화
+            }
+            self.tracked_count += 1
+
+    def untrack(self, receipt_handle: str):
+        """메시지 추적 중단 (ACK/NACK)"""
+        if not receipt_handle:
+            return
+        with self._lock:
+            entry = self._tracked.pop(receipt_handle, None)
+            if entry is not None:
+                self._record_finished(entry)
+        if entry is not None:
+            # 진행 중인 연장이 끝날 때까지 대기 (self._lock은 잡지 않은 상태)
+            with entry["lock"]:
+                pass
+
+    @property
+    def active(self) -> int:
+        """현재 추적 중인 메시지 수"""
+        return len(self._tracked)
+
+    def get_stats(self) -> dict:
+        """연장 통계 반환"""
+        with self._lock:
+            return {
+                "active": len(self._tracked),
+                "tracked": self.tracked_count,
+                "extended": self.extended_count,
+                "messagesExtended": self.messages_extended,
+                "maxExtensions": self.max_extensions,
+                "failed": self.failed_count,
+                "expired": self.expired_count
+            }
+
+    def check(self):
+        """만료가 가까운 메시지 연장 (스레드 주기마다 호출)"""
+        now = time.time()
+        due = []
+        with self._lock:
+            for handle, entry in list(self._tracked.items()):
+                if entry["deadline"] - now > self.extend_margin:
+                    continue
+                if now - entry["receivedAt"] >= self.max_lifetime:
+                    # 처리가 비정상적으로 오래 걸림 → 연장 중단 (재배달 허용)
+                    del self._tracked[handle]
+                    self._record_finished(entry)
+                    self.expired_count += 1
+                    logger.warning(f"[SQS_HEARTBEAT] 최대 연장 시간 초과, 연장 중단: {entry['label']}")
+                    continue
+                due.append((handle, entry["lock"]))
+
+        for handle, handle_lock in due:
+            with handle_lock:
+                self._extend(handle)
+
+    def _extend(self, handle: str):
+        # 메시지별 lock을 잡은 상태에서 호출 (untrack과 직렬화)
+        with self._lock:
+            if handle not in self._tracked:
+                # 목록 수집 이후 ACK/NACK됨 → 연장하지 않음
+                return
+        try:
+            ok = self._extend_fn(handle, self.visibility_timeout)
+        except Exception as e:
+            logger.error(f"[SQS_HEARTBEAT] 연장 호출 실패: {e}")
+            ok = False
+
+        with self._lock:
+            entry = self._tracked.get(handle)
+            if entry is None:
+                return
+            if ok:
+                entry["deadline"] = time.time() + self.visibility_timeout
+                entry["extensions"] += 1
+                self.extended_count += 1
+            else:
+                # ReceiptHandle이 더 이상 유효하지 않음 → 추적 중단
+                del self._tracked[handle]
+                self._record_finished(entry)
+                self.failed_count += 1
+
+    def _record_finished(self, entry: dict):
+        # self._lock을 잡은 상태에서 호출
+        if entry["extensions"] > 0:
+            self.messages_extended += 1
+            self.max_extensions = max(self.max_extensions, entry["extensions"])
+
+    def _run(self):
+        while not self._stop_event.wait(self.check_interval):
+            self.check()
@@ -0,0 +1,54 @@
+"""
+warmup.py - 서버 시작 시 모델 warm-up
+
+모델을 로드한 직후 작은 내장 이미지(assets/warmup.png, 학번 칸 모양 96x320)로
+한 번씩 추론해서 첫 요청의 초기화 비용(그래프 준비, 메모리 할당, lazy 로딩)을 미리 치릅니다.
+
+/ready 엔드포인트는 warm-up이 모두 끝난 뒤에만 OK를 반환합니다.
+"""
+
+import os
+import time
+from typing import Any
+
+import cv2
+import numpy as np
+
+from .ocr import _predict
+
+WARMUP_IMAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "warmup.png")
+
+# warmup.png의 학번 숫자 줄 (y 범위)
+_DIGIT_ROW = (40, 90)
+
+
+def load_warmup_image() -> np.ndarray:
+    """warm-up 이미지 로드 (BGR, 파일이 없으면 흰 바탕에 숫자를 그린 이미지)"""
+    image = cv2.imread(WARMUP_IMAGE_PATH)
+    if image is None:
+        image = np.full((96, 320, 3), 255, dtype=np.uint8)
+        cv2.putText(image, "2024123456", (12, 76), cv2.FONT_HERSHEY_SIMPLEX, 1.1, (0, 0, 0), 2)
+    return image
+
+
+def warm_up_layout(layout_model: Any, image: np.ndarray = None) -> float:
+    """레이아웃 모델 warm-up (소요 시간 초 반환, 실패 시 예외)"""
+    image = load_warmup_image() if image is None else image
+    start = time.perf_counter()
+    list(layout_model.predict(image, batch_size=1))
+    return time.perf_counter() - start
+
+
+def warm_up_ocr(ocr_model: Any, image: np.ndarray = None) -> float:
+    """인식 모델 warm-up: 학번 숫자 줄 crop 인식 (소요 시간 초 반환, 실패 시 예외)"""
+    crop = digit_row(image)
+    start = time.perf_counter()
+    # ppocr_extract는 예외를 삼키므로 직접 호출 (array 입력 미지원 시 파일 fallback은 동일)
+    _predict(crop, ocr_model)
+    return time.perf_counter() - start
+
+
+def digit_row(image: np.ndarray = None) -> np.ndarray:
+    """답안 파이프라인 warm-up용 Row 이미지 (BGR)"""
+    image = load_warmup_image() if image is None else image
+    return np.ascontiguousarray(image[_DIGIT_ROW[0]:_DIGIT_ROW[1]])
@@ -0,0 +1,213 @@
+"""
+worker_pool.py - SQS 메시지 병렬 처리용 워커 풀
+
+한 번의 Long Polling으로 받은 여러 메시지를 제한된 개수의 스레드에서 병렬 처리합니다.
+같은 MessageGroupId(= examCode)의 메시지는 수신 순서대로 하나씩 처리하고(FIFO 유지),
+서로 다른 그룹의 메시지만 동시에 처리합니다.
+
+구성:
+- GroupOrderedWorkerPool: 그룹 단위 FIFO를 보장하는 bounded 스레드 풀
+- BatchAckBuffer: 처리 완료된 ReceiptHandle을 모아 DeleteMessageBatch(최대 10개)로 일괄 삭제
+"""
+
+import logging
+import threading
+from collections import deque
+from queue import Queue
+from typing import Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# SQS DeleteMessageBatch 한 번에 보낼 수 있는 최대 엔트리 수
+SQS_MAX_BATCH_SIZE = 10
+
+
+class GroupOrderedWorkerPool:
+    """
+    그룹 단위 FIFO 워커 풀
+
+    - 그룹마다 대기 큐(deque)를 두고, 한 그룹은 동시에 최대 1개의 워커만 점유합니다.
+    - 워커는 "실행 가능한 그룹" 큐에서 그룹을 꺼내 가장 앞의 작업 1개를 실행한 뒤,
+      남은 작업이 있으면 그룹을 다시 큐 뒤에 넣습니다. (그룹 간 공정성 확보)
+    - max_pending 개수만큼 작업이 쌓이면 submit()이 블로킹됩니다. (backpressure)
+    """
+
+    def __init__(self, num_workers: int = 4, max_pending: int = 20, name: str = "SQS-Pool"):
+        self.num_workers = max(1, num_workers)
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Deque[Callable[[], None]]] = {}
+        self._ready_groups: "Queue[Optional[str]]" = Queue()
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._threads: List[threading.Thread] = []
+        self._running = False
+
+    def start(self):
+        """워커 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        for i in range(self.num_workers):
+            t = threading.Thread(target=self._run, daemon=True, name=f"{self.name}-{i}")
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, group_key: str, fn: Callable[[], None]) -> None:
+        """
+        그룹에 작업 추가 (대기 작업이 max_pending개면 자리가 날 때까지 블로킹)
+
+        Args:
+            group_key: FIFO 순서를 유지할 그룹 키 (SQS MessageGroupId)
+            fn: 실행할 작업 (인자 없는 callable)
+        """
+        self._slots.acquire()
+        with self._lock:
+            self._in_flight += 1
+            queue = self._pending.get(group_key)
+            if queue is not None:
+                # 그룹이 이미 실행 중이거나 대기 중 → 뒤에 붙이기만 함
+                queue.append(fn)
+                return
+            self._pending[group_key] = deque([fn])
+        self._ready_groups.put(group_key)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """제출된 모든 작업이 끝날 때까지 대기"""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout=timeout)
+
+    def stop(self, timeout: float = 30.0):
+        """남은 작업 처리 후 워커 종료"""
+        self.wait_idle(timeout=timeout)
+        self._running = False
+        for _ in self._threads:
+            self._ready_groups.put(None)
+        for t in self._threads:
+            t.join(timeout=5)
+        self._threads = []
+
+    @property
+    def in_flight(self) -> int:
+        """제출되었지만 아직 끝나지 않은 작업 수"""
+        return self._in_flight
+
+    def _run(self):
+        while True:
+            group_key = self._ready_groups.get()
+            if group_key is None:
+                return
+
+            with self._lock:
+                fn = self._pending[group_key].popleft()
+
+            try:
+                fn()
+            except Exception as e:
+                logger.error(f"[{self.name}] 작업 실행 중 예외 (group={group_key}): {e}")
+            finally:
+                with self._lock:
+                    requeue = bool(self._pending[group_key])
+                    if not requeue:
+                        del self._pending[group_key]
+                    self._in_flight -= 1
+                    if self._in_flight == 0:
+                        self._idle.notify_all()
+                self._slots.release()
+                if requeue:
+                    self._ready_groups.put(group_key)
+
+
+class BatchAckBuffer:
+    """
+    ACK(메시지 삭제) 배치 버퍼
+
+    처리 완료된 ReceiptHandle을 모았다가 다음 조건 중 하나에서 일괄 삭제합니다.
+    - 버퍼에 max_batch(기본 10)개가 쌓였을 때
+    - flush_interval초가 지났을 때 (백그라운드 flusher 스레드)
+    - flush() / stop() 호출 시
+    """
+
+    def __init__(
+        self,
+        delete_batch_fn: Callable[[List[str]], List[str]],
+        max_batch: int = SQS_MAX_BATCH_SIZE,
+        flush_interval: float = 1.0
+    ):
+        """
+        Args:
+            delete_batch_fn: (receipt_handles) -> 삭제 실패한 receipt_handle 리스트
+            max_batch: 한 번에 삭제할 최대 개수 (SQS 제한 10)
+            flush_interval: 주기적 flush 간격 (초)
+        """
+        self._delete_batch_fn = delete_batch_fn
+        self.max_batch = min(max(1, max_batch), SQS_MAX_BATCH_SIZE)
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 통계
+        self.acked_count = 0
+        self.failed_count = 0
+        self.batch_calls = 0
+
+    def start(self):
+        """주기적 flush 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="SQS-Ack-Flusher")
+        self._thread.start()
+
+    def add(self, receipt_handle: str):
+        """ACK 대상 추가 (버퍼가 가득 차면 즉시 flush)"""
+        batch = None
+        with self._lock:
+            self._buffer.append(receipt_handle)
+            if len(self._buffer) >= self.max_batch:
+                batch = self._buffer[:self.max_batch]
+                self._buffer = self._buffer[self.max_batch:]
+        if batch:
+            self._delete(batch)
+
+    def flush(self):
+        """버퍼에 남은 ACK를 모두 삭제 요청"""
+        while True:
+            with self._lock:
+                if not self._buffer:
+                    return
+                batch = self._buffer[:self.max_batch]
+                self._buffer = self._buffer[self.max_batch:]
+            self._delete(batch)
+
+    def stop(self):
+        """flusher 종료 (남은 ACK는 flush)"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def _delete(self, batch: List[str]):
+        try:
+            failed = self._delete_batch_fn(batch) or []
+        except Exception as e:
+            logger.error(f"[SQS_ACK_BATCH] 일괄 삭제 호출 실패: {e}")
+            failed = list(batch)
+        with self._lock:
+            self.batch_calls += 1
+            self.acked_count += len(batch) - len(failed)
+            self.failed_count += len(failed)
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()